@@ -4,48 +4,55 @@ import os
 import json
 
 from quiz_data import ALL_QUIZ_DATA, FILL_IN_QUIZ_DATA
+from storage_backend import use_sqlite, get_sqlite_store
+from question_bank import question_id, get_bank
+from fill_answers import get_fill_answers
+from search_index import search_then_select
 
 LINKS_FILE = "answer_links.json"
+LINKS_COLLECTION = "answer_links"
 
+# Default links are keyed by stable question id (see question_bank.question_id),
+# so they stay attached to their question if the bank is reordered.
 DEFAULT_MCQ_LINKS = {
-    1: ["https://en.wikipedia.org/wiki/Periodic_table"],
-    2: ["https://en.wikipedia.org/wiki/Ostrich"],
-    3: ["https://en.wikipedia.org/wiki/Atmosphere_of_Earth"],
-    4: ["https://en.wikipedia.org/wiki/Human_skeleton"],
-    5: ["https://solarsystem.nasa.gov/planets/venus/overview/"],
-    6: ["https://en.wikipedia.org/wiki/Gold"],
-    7: ["https://en.wikipedia.org/wiki/Heart"],
-    8: ["https://en.wikipedia.org/wiki/Structure_of_the_Earth"],
-    9: ["https://en.wikipedia.org/wiki/Cell_nucleus"],
-    10: ["https://solarsystem.nasa.gov/planets/jupiter/overview/"],
-    11: ["https://en.wikipedia.org/wiki/Mitochondrion"],
-    12: ["https://en.wikipedia.org/wiki/Photosynthesis"],
-    13: ["https://solarsystem.nasa.gov/planets/jupiter/overview/"],
-    14: ["https://en.wikipedia.org/wiki/White_blood_cell"],
-    15: ["https://en.wikipedia.org/wiki/Mercury_(element)"],
-    16: ["https://en.wikipedia.org/wiki/Evaporation"],
-    17: ["https://solarsystem.nasa.gov/planets/mars/overview/"],
-    18: ["https://en.wikipedia.org/wiki/Diamond"],
-    19: ["https://en.wikipedia.org/wiki/Heart"],
-    20: ["https://en.wikipedia.org/wiki/Newton%27s_laws_of_motion"],
-    21: ["https://en.wikipedia.org/wiki/Cell_(biology)"],
-    22: ["https://solarsystem.nasa.gov/planets/uranus/overview/"],
-    23: ["https://en.wikipedia.org/wiki/Water#Boiling_point"],
-    24: ["https://en.wikipedia.org/wiki/Vitamin_D"],
-    25: ["https://en.wikipedia.org/wiki/Oxygen"],
-    26: ["https://en.wikipedia.org/wiki/Milky_Way"],
-    27: ["https://en.wikipedia.org/wiki/Oxygen"],
-    28: ["https://en.wikipedia.org/wiki/Femur"],
-    29: ["https://en.wikipedia.org/wiki/Rayleigh_scattering"],
-    30: ["https://solarsystem.nasa.gov/planets/saturn/overview/"],
+    "9ae38e352bf18f58": ["https://en.wikipedia.org/wiki/Periodic_table"],
+    "13ee5d97eab0344b": ["https://en.wikipedia.org/wiki/Ostrich"],
+    "fb4e29ec0583089d": ["https://en.wikipedia.org/wiki/Atmosphere_of_Earth"],
+    "deab99dc6b005b73": ["https://en.wikipedia.org/wiki/Human_skeleton"],
+    "a4489cf39949fd82": ["https://solarsystem.nasa.gov/planets/venus/overview/"],
+    "70a384f4a796cd09": ["https://en.wikipedia.org/wiki/Gold"],
+    "a9891962783142e5": ["https://en.wikipedia.org/wiki/Heart"],
+    "6baf31aee919eb57": ["https://en.wikipedia.org/wiki/Structure_of_the_Earth"],
+    "431847b8bd79eeac": ["https://en.wikipedia.org/wiki/Cell_nucleus"],
+    "a389dd8717f09604": ["https://solarsystem.nasa.gov/planets/jupiter/overview/"],
+    "7d05671877eacc80": ["https://en.wikipedia.org/wiki/Mitochondrion"],
+    "6034d2d761d0fe86": ["https://en.wikipedia.org/wiki/Photosynthesis"],
+    "a0f98a94444379b1": ["https://solarsystem.nasa.gov/planets/jupiter/overview/"],
+    "7692ded5e06212c2": ["https://en.wikipedia.org/wiki/White_blood_cell"],
+    "3418cf7008fcb9ee": ["https://en.wikipedia.org/wiki/Mercury_(element)"],
+    "a22e561063d72371": ["https://en.wikipedia.org/wiki/Evaporation"],
+    "d3bab60ccfbdf59b": ["https://solarsystem.nasa.gov/planets/mars/overview/"],
+    "2c393c6166f210fe": ["https://en.wikipedia.org/wiki/Diamond"],
+    "cc62145981f4e01d": ["https://en.wikipedia.org/wiki/Heart"],
+    "7e14c4e7aaf3d264": ["https://en.wikipedia.org/wiki/Newton%27s_laws_of_motion"],
+    "15d36f44e9b888f8": ["https://en.wikipedia.org/wiki/Cell_(biology)"],
+    "e09b4b750a76fe10": ["https://solarsystem.nasa.gov/planets/uranus/overview/"],
+    "7358fea129cb0284": ["https://en.wikipedia.org/wiki/Water#Boiling_point"],
+    "1c2a29c23d23eca8": ["https://en.wikipedia.org/wiki/Vitamin_D"],
+    "896b4a639657ba68": ["https://en.wikipedia.org/wiki/Oxygen"],
+    "3da5ab2e12dd59c0": ["https://en.wikipedia.org/wiki/Milky_Way"],
+    "000241129a42a8fa": ["https://en.wikipedia.org/wiki/Oxygen"],
+    "a3b502f0143661ad": ["https://en.wikipedia.org/wiki/Femur"],
+    "b78a7cbe383b1541": ["https://en.wikipedia.org/wiki/Rayleigh_scattering"],
+    "db762d035c9c2667": ["https://solarsystem.nasa.gov/planets/saturn/overview/"],
 }
 
 DEFAULT_FILL_LINKS = {
-    1: ["https://en.wikipedia.org/wiki/Gold"],
-    2: ["https://solarsystem.nasa.gov/planets/jupiter/overview/"],
-    3: ["https://en.wikipedia.org/wiki/Mitochondrion"],
-    4: ["https://en.wikipedia.org/wiki/Oxygen"],
-    5: ["https://en.wikipedia.org/wiki/Diamond"],
+    "a83bf26e4df9378f": ["https://en.wikipedia.org/wiki/Gold"],
+    "d82d3fe7b3e1252c": ["https://solarsystem.nasa.gov/planets/jupiter/overview/"],
+    "4b8347e5a5fac56e": ["https://en.wikipedia.org/wiki/Mitochondrion"],
+    "84ea3fa0f9bfe412": ["https://en.wikipedia.org/wiki/Oxygen"],
+    "007fea10b2f80177": ["https://en.wikipedia.org/wiki/Diamond"],
 }
 
 
@@ -68,23 +75,110 @@ def _save_links(data):
         json.dump(data, f, indent=2)
 
 
+def _legacy_key(key):
+    """(kind, position) for a positional "MCQ-<n>" / "FILL-<n>" key, else None.
+
+    Question ids are 16 hex digits, so a shorter all-digit suffix can
+    only be a 1-based position from before ids existed.
+    """
+    kind, _, suffix = key.partition("-")
+    if kind in ("MCQ", "FILL") and suffix.isdigit() and len(suffix) < 16:
+        return kind, int(suffix)
+    return None
+
+
+def _migrate_keys(data):
+    """Rewrite positional keys in a links map to question-id keys, in place.
+
+    Positions are resolved against the current question order. Links are
+    merged if both keys exist. Returns the number of keys moved.
+    """
+    moved = 0
+    for key in list(data):
+        legacy = _legacy_key(key)
+        if legacy is None:
+            continue
+        kind, index = legacy
+        source = ALL_QUIZ_DATA if kind == "MCQ" else FILL_IN_QUIZ_DATA
+        if not 1 <= index <= len(source):
+            continue
+        new_key = f"{kind}-{question_id(source[index - 1])}"
+        merged = data.setdefault(new_key, [])
+        for link in data.pop(key):
+            if link not in merged:
+                merged.append(link)
+        moved += 1
+    return moved
+
+
+def migrate_link_keys():
+    """Move positional link keys to question-id keys. Returns the number moved.
+
+    Run once after upgrading (python answer_links.py migrate); reads and
+    writes only use question-id keys.
+    """
+    if use_sqlite():
+        store = get_sqlite_store()
+        data = dict(store.iter_docs(LINKS_COLLECTION))
+        moved = _migrate_keys(data)
+        if moved:
+            store.replace_docs(LINKS_COLLECTION, list(data.items()))
+        return moved
+    data = _load_links()
+    moved = _migrate_keys(data)
+    if moved:
+        _save_links(data)
+    return moved
+
+
+def _get_user_links(key):
+    if use_sqlite():
+        return get_sqlite_store().get_doc(LINKS_COLLECTION, key, [])
+    return _load_links().get(key, [])
+
+
+def _set_user_links(key, links):
+    if use_sqlite():
+        if links:
+            get_sqlite_store().put_doc(LINKS_COLLECTION, key, links)
+        else:
+            get_sqlite_store().delete_doc(LINKS_COLLECTION, key)
+        return
+    links_data = _load_links()
+    if links:
+        links_data[key] = links
+    else:
+        links_data.pop(key, None)
+    _save_links(links_data)
+
+
+def _mcq_id(index):
+    if 1 <= index <= len(ALL_QUIZ_DATA):
+        return question_id(ALL_QUIZ_DATA[index - 1])
+    return None
+
+
+def _fill_id(index):
+    if 1 <= index <= len(FILL_IN_QUIZ_DATA):
+        return question_id(FILL_IN_QUIZ_DATA[index - 1])
+    return None
+
+
 def _key_for_mcq(index):
-    
-    return f"MCQ-{index}"
+    # Menus number questions from 1; storage uses the question's stable id.
+    return f"MCQ-{_mcq_id(index) or index}"
 
 
 def _key_for_fill(index):
     
-    return f"FILL-{index}"
+    return f"FILL-{_fill_id(index) or index}"
 
 
 
 def get_links_for_mcq(index):
     
-    links_data = _load_links()
-    key = _key_for_mcq(index)
-    user_links = links_data.get(key, [])
-    default_links = DEFAULT_MCQ_LINKS.get(index, [])
+    user_links = _get_user_links(_key_for_mcq(index))
+    default_links = DEFAULT_MCQ_LINKS.get(_mcq_id(index), [])
 
     merged = list(default_links)
     for link in user_links:
@@ -95,20 +189,17 @@ def get_links_for_mcq(index):
 
 def add_link_for_mcq(index, link):
     
-    links_data = _load_links()
     key = _key_for_mcq(index)
-    links_data.setdefault(key, [])
-    if link not in links_data[key]:
-        links_data[key].append(link)
-    _save_links(links_data)
+    user_links = _get_user_links(key)
+    if link not in user_links:
+        user_links.append(link)
+        _set_user_links(key, user_links)
 
 
 def get_links_for_fill(index):
    
-    links_data = _load_links()
-    key = _key_for_fill(index)
-    user_links = links_data.get(key, [])
-    default_links = DEFAULT_FILL_LINKS.get(index, [])
+    user_links = _get_user_links(_key_for_fill(index))
+    default_links = DEFAULT_FILL_LINKS.get(_fill_id(index), [])
 
     merged = list(default_links)
     for link in user_links:
@@ -119,42 +210,28 @@ def get_links_for_fill(index):
 
 def add_link_for_fill(index, link):
     
-    links_data = _load_links()
     key = _key_for_fill(index)
-    links_data.setdefault(key, [])
-    if link not in links_data[key]:
-        links_data[key].append(link)
-    _save_links(links_data)
+    user_links = _get_user_links(key)
+    if link not in user_links:
+        user_links.append(link)
+        _set_user_links(key, user_links)
 
 
 
-def _get_option_text(options, correct_letter):
-    
-    correct_letter = correct_letter.strip().upper()
-    for opt in options:
-        if opt.strip().upper().startswith(correct_letter + "."):
-            return opt
-    return f"{correct_letter} (option text not found)"
-
-
 def show_mcq_with_links(index):
     
     if not (1 <= index <= len(ALL_QUIZ_DATA)):
         print("Invalid MCQ number.")
         return
 
-    q = ALL_QUIZ_DATA[index - 1]
-    question = q["question"]
-    options = q["options"]
-    ans_letter = q["answer"]
+    q = get_bank(ALL_QUIZ_DATA).records[index - 1]
 
     print("\n===== MCQ ANSWER & LINKS =====")
-    print(f"Q{index}. {question}")
-    for opt in options:
+    print(f"Q{index}. {q.question}")
+    for opt in q.options:
         print("   " + opt)
 
-    correct_text = _get_option_text(options, ans_letter)
-    print(f"\nCorrect answer: {ans_letter} -> {correct_text}")
+    print(f"\nCorrect answer: {q.answer} -> {q.correct_text()}")
 
     links = get_links_for_mcq(index)
     if links:
@@ -173,12 +250,10 @@ def show_fill_with_links(index):
         return
 
     q = FILL_IN_QUIZ_DATA[index - 1]
-    question = q["question"]
-    raw_answer = q["answer"]
-    variants = [a.strip() for a in raw_answer.split("|")]
+    variants = get_fill_answers(FILL_IN_QUIZ_DATA)[index - 1].variants
 
     print("\n===== FILL-IN ANSWER & LINKS =====")
-    print(f"Q{index}. {question}")
+    print(f"Q{index}. {q['question']}")
     print("Accepted answer(s): " + " / ".join(variants))
 
     links = get_links_for_fill(index)
@@ -204,75 +279,50 @@ def links_menu():
         choice = input("Enter choice: ").strip()
 
         if choice == "1":
-            print("\n--- MCQ Questions ---")
-            for i, q in enumerate(ALL_QUIZ_DATA, start=1):
-                print(f"{i}. {q['question']}")
-            try:
-                idx = int(input("Enter MCQ number: "))
+            idx = search_then_select("Enter MCQ number", "MCQ")
+            if idx is not None:
                 show_mcq_with_links(idx)
-            except ValueError:
-                print("Please enter a valid number.")
         elif choice == "2":
-            print("\n--- MCQ Questions ---")
-            for i, q in enumerate(ALL_QUIZ_DATA, start=1):
-                print(f"{i}. {q['question']}")
-            try:
-                idx = int(input("Enter MCQ number to add link for: "))
+            idx = search_then_select("Enter MCQ number to add link for", "MCQ")
+            if idx is not None:
                 link = input("Enter reference link (URL or note): ").strip()
                 if link:
                     add_link_for_mcq(idx, link)
                     print("Link added.")
                 else:
                     print("Empty link, nothing saved.")
-            except ValueError:
-                print("Please enter a valid number.")
         elif choice == "3":
-            print("\n--- FILL-IN Questions ---")
-            for i, q in enumerate(FILL_IN_QUIZ_DATA, start=1):
-                print(f"{i}. {q['question']}")
-            try:
-                idx = int(input("Enter fill-in question number: "))
+            idx = search_then_select("Enter fill-in question number", "FILL")
+            if idx is not None:
                 show_fill_with_links(idx)
-            except ValueError:
-                print("Please enter a valid number.")
         elif choice == "4":
-            print("\n--- FILL-IN Questions ---")
-            for i, q in enumerate(FILL_IN_QUIZ_DATA, start=1):
-                print(f"{i}. {q['question']}")
-            try:
-                idx = int(input("Enter fill-in question number to add link for: "))
+            idx = search_then_select("Enter fill-in question number to add link for", "FILL")
+            if idx is not None:
                 link = input("Enter reference link (URL or note): ").strip()
                 if link:
                     add_link_for_fill(idx, link)
                     print("Link added.")
                 else:
                     print("Empty link, nothing saved.")
-            except ValueError:
-                print("Please enter a valid number.")
         elif choice == "5":
-            print("\n--- MCQ Questions ---")
-            for i, q in enumerate(ALL_QUIZ_DATA, start=1):
-                print(f"{i}. {q['question']}")
+            idx = search_then_select("Enter MCQ number to delete a link from", "MCQ")
+            if idx is None:
+                continue
+            show_mcq_with_links(idx)
+            user_links = _show_user_links_for_mcq(idx)
+            if not user_links:
+                continue
+            raw = input("Enter link number to delete (or paste exact link text): ").strip()
+            if not raw:
+                print("Nothing entered. Cancelled.")
+                continue
             try:
-                idx = int(input("Enter MCQ number to delete a link from: "))
-                show_mcq_with_links(idx)
-                user_links = _show_user_links_for_mcq(idx)
-                if not user_links:
-                    continue
-                raw = input("Enter link number to delete (or paste exact link text): ").strip()
-                if not raw:
-                    print("Nothing entered. Cancelled.")
-                    continue
-                try:
-                    num = int(raw)
-                    ok, msg = delete_link_for_mcq(idx, num)
-                except ValueError:
-                    ok, msg = delete_link_for_mcq(idx, raw)
-
-                print(msg)
-
+                num = int(raw)
+                ok, msg = delete_link_for_mcq(idx, num)
             except ValueError:
-                print("Please enter a valid number.")
+                ok, msg = delete_link_for_mcq(idx, raw)
+
+            print(msg)
         elif choice == "0":
             print("Returning to main quiz menu.")
             break
@@ -282,10 +332,9 @@ def links_menu():
 
 def delete_link_for_mcq(index, link_or_number):
 
-    links_data = _load_links()
     key = _key_for_mcq(index)
 
-    user_links = links_data.get(key, [])
+    user_links = _get_user_links(key)
     if not user_links:
         return False, "No user-added links to delete for this MCQ."
 
@@ -295,26 +344,14 @@ def delete_link_for_mcq(index, link_or_number):
         if pos < 1 or pos > len(user_links):
             return False, f"Invalid number. Enter 1 to {len(user_links)}."
         removed = user_links.pop(pos - 1)
-
-        if user_links:
-            links_data[key] = user_links
-        else:
-            links_data.pop(key, None)
-
-        _save_links(links_data)
+        _set_user_links(key, user_links)
         return True, f"Deleted: {removed}"
 
 
     target = str(link_or_number).strip()
     if target in user_links:
         user_links.remove(target)
-
-        if user_links:
-            links_data[key] = user_links
-        else:
-            links_data.pop(key, None)
-
-        _save_links(links_data)
+        _set_user_links(key, user_links)
         return True, f"Deleted: {target}"
 
     return False, "That link was not found in user-added links (defaults can't be deleted)."
@@ -322,9 +359,7 @@ def delete_link_for_mcq(index, link_or_number):
 
 def _show_user_links_for_mcq(index):
  
-    links_data = _load_links()
-    key = _key_for_mcq(index)
-    user_links = links_data.get(key, [])
+    user_links = _get_user_links(_key_for_mcq(index))
 
     if not user_links:
         print("\nNo user-added links stored for this MCQ yet.")
@@ -340,4 +375,8 @@ def _show_user_links_for_mcq(index):
 
 
 if __name__ == "__main__":
-    links_menu()
+    import sys
+    if sys.argv[1:] == ["migrate"]:
+        print(f"Migrated {migrate_link_keys()} positional link key(s) to question ids.")
+    else:
+        links_menu()
@@ -1,39 +1,25 @@
 from quiz_data import ALL_QUIZ_DATA, FILL_IN_QUIZ_DATA
-
-
-def _get_option_text(options, correct_letter):
-    correct_letter = correct_letter.strip().upper()
-    for opt in options:
-        if opt.strip().upper().startswith(correct_letter + "."):
-            return opt
-    return f"{correct_letter} (option text not found)"
+from question_bank import get_bank, option_text as _get_option_text
+from fill_answers import get_fill_answers
 
 
 def show_all_mcq_answers():
     print("\n===== ANSWER KEY: MULTIPLE-CHOICE QUESTIONS =====\n")
-    for idx, q in enumerate(ALL_QUIZ_DATA, start=1):
-        question = q["question"]
-        options = q["options"]
-        answer_letter = q["answer"]
-
-        print(f"Q{idx}. {question}")
-        for opt in options:
+    for r in get_bank(ALL_QUIZ_DATA).records:
+        print(f"Q{r.id + 1}. {r.question}")
+        for opt in r.options:
             print(f"   {opt}")
 
-        correct_option_text = _get_option_text(options, answer_letter)
-        print(f"   Correct answer: {answer_letter} -> {correct_option_text}")
+        print(f"   Correct answer: {r.answer} -> {r.correct_text()}")
         print()
 
 
 def show_all_fill_in_answers():
     print("\n===== ANSWER KEY: FILL-IN-THE-BLANKS QUESTIONS =====\n")
+    compiled = get_fill_answers(FILL_IN_QUIZ_DATA)
     for idx, q in enumerate(FILL_IN_QUIZ_DATA, start=1):
-        question = q["question"]
-        raw_answer = q["answer"]
-
-        print(f"Q{idx}. {question}")
-        accepted = [a.strip() for a in raw_answer.split("|")]
-        print("   Accepted answer(s): " + " / ".join(accepted))
+        print(f"Q{idx}. {q['question']}")
+        print("   Accepted answer(s): " + " / ".join(compiled[idx - 1].variants))
         print()
 
 
@@ -1,16 +1,16 @@
-from assessment_storage import load_custom_assessments, save_custom_assessments
+from assessment_storage import stored_assessments
 from mcq import take_quiz
-from attempts import can_attempt_quiz, record_quiz_attempt
+from attempts import try_start_quiz
 
 
 def open_assessment():
-    assessments = load_custom_assessments()
+    assessments = stored_assessments()
     if not assessments:
         print("No assessments saved yet.")
         return
     print("\nSaved assessments:")
     for idx, a in enumerate(assessments):
-        print(f"{idx + 1}. {a['name']}")
+        print(f"{idx + 1}. {a.name}")
     try:
          sel = int(input("Enter assessment number to open: ")) - 1
     except ValueError:
@@ -21,8 +21,7 @@ def open_assessment():
         print("Invalid selection.")
         return
 
-    assessment = assessments[sel]
-    assessment_name = assessment["name"]
+    assessment_name = assessments[sel].name
 
     user_name = input("Enter your name: ").strip()
     if not user_name:
@@ -31,7 +30,7 @@ def open_assessment():
 
     attempt_key = f"{user_name}::{assessment_name}"
 
-    can_attempt, remaining = can_attempt_quiz(attempt_key)
+    can_attempt, remaining = try_start_quiz(attempt_key)
     if not can_attempt:
         print(
             f"Sorry {user_name}, you have used all your attempts for "
@@ -44,7 +43,6 @@ def open_assessment():
         f"'{assessment_name}'."
     )
 
-    record_quiz_attempt(attempt_key)
-
+    assessment = assessments[sel].load()
     print(f"\nOpening assessment: {assessment_name}")
     take_quiz(assessment["questions"], assessment["options"], assessment["answers"], name=user_name)
\ No newline at end of file
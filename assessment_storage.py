@@ -1,9 +1,134 @@
 import os
+import sys
 import json
+import hashlib
+from datetime import datetime
 
+from storage_backend import use_sqlite, get_sqlite_store
+from utils import atomic_write_json, file_lock
+
+# Legacy single-file store; imported into the sharded layout on first use.
 ASSESSMENT_FILE = "custom_assessment.json"
 
-def load_custom_assessments():
+# One shard file per assessment plus a small catalog of headers
+# (id, name, question count, created/modified time, digest) that can be
+# listed without reading any questions.
+ASSESSMENT_DIR = "custom_assessments"
+ASSESSMENT_CATALOG = "catalog.json"
+
+ASSESSMENT_COLLECTION = "custom_assessments"
+ASSESSMENT_CATALOG_COLLECTION = "custom_assessment_catalog"
+
+
+class StoredAssessment:
+    """A catalog entry for one saved assessment; load() reads its questions.
+
+    Listing these never parses a question payload: name and header come
+    from the catalog, and the shard is only read (once) by load().
+    """
+
+    __slots__ = ("header", "_loader", "_body")
+
+    def __init__(self, header, loader):
+        self.header = header
+        self._loader = loader
+        self._body = None
+
+    @property
+    def assessment_id(self):
+        return self.header["id"]
+
+    @property
+    def name(self):
+        return self.header.get("name")
+
+    def load(self):
+        if self._body is None:
+            self._body = self._loader()
+        return self._body
+
+
+def _digest(assessment):
+    body = json.dumps(assessment, sort_keys=True)
+    return hashlib.sha1(body.encode("utf-8")).hexdigest()
+
+
+def _now():
+    return datetime.now().isoformat(timespec="seconds")
+
+
+def _header(assessment_id, assessment, digest, created):
+    return {
+        "id": assessment_id,
+        "name": assessment.get("name"),
+        "questions": len(assessment.get("questions") or []),
+        "created": created,
+        "modified": _now(),
+        "digest": digest,
+    }
+
+
+def _catalog_path():
+    return os.path.join(ASSESSMENT_DIR, ASSESSMENT_CATALOG)
+
+
+def _shard_path(assessment_id):
+    return os.path.join(ASSESSMENT_DIR, f"{assessment_id}.json")
+
+
+def _empty_catalog():
+    return {"next_id": 1, "assessments": []}
+
+
+def _read_catalog(store):
+    if store is not None:
+        return store.get_doc(ASSESSMENT_CATALOG_COLLECTION, "catalog")
+    if not os.path.exists(_catalog_path()):
+        return None
+    try:
+        with open(_catalog_path(), "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, json.JSONDecodeError):
+        return None
+
+
+def _write_catalog(catalog, store):
+    if store is not None:
+        store.put_doc(ASSESSMENT_CATALOG_COLLECTION, "catalog", catalog)
+        return
+    os.makedirs(ASSESSMENT_DIR, exist_ok=True)
+    atomic_write_json(_catalog_path(), catalog)
+
+
+def _read_shard(assessment_id, store):
+    if store is not None:
+        return store.get_doc(ASSESSMENT_COLLECTION, assessment_id, {})
+    try:
+        with open(_shard_path(assessment_id), "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, json.JSONDecodeError):
+        return {}
+
+
+def _write_shard(assessment_id, assessment, store):
+    if store is not None:
+        store.put_doc(ASSESSMENT_COLLECTION, assessment_id, assessment)
+        return
+    os.makedirs(ASSESSMENT_DIR, exist_ok=True)
+    atomic_write_json(_shard_path(assessment_id), assessment)
+
+
+def _delete_shard(assessment_id, store):
+    if store is not None:
+        store.delete_doc(ASSESSMENT_COLLECTION, assessment_id)
+    elif os.path.exists(_shard_path(assessment_id)):
+        os.remove(_shard_path(assessment_id))
+
+
+def _load_legacy_assessments(store):
+    if store is not None:
+        # Rows written before the catalog existed are keyed by list position.
+        return [a for _, a in store.iter_docs(ASSESSMENT_COLLECTION)]
     if not os.path.exists(ASSESSMENT_FILE):
         return []
     try:
@@ -12,6 +137,151 @@ def load_custom_assessments():
     except (OSError, json.JSONDecodeError):
         return []
 
+
+def _load_catalog(store):
+    catalog = _read_catalog(store)
+    if catalog is not None:
+        return catalog
+    legacy = _load_legacy_assessments(store)
+    if not legacy:
+        return _empty_catalog()
+    if store is not None:
+        store.replace_docs(ASSESSMENT_COLLECTION, [])
+    return _save_all(_empty_catalog(), legacy, store)
+
+
+def _save_all(catalog, assessments, store):
+    """Write the shards that changed and the catalog; returns the new catalog.
+
+    An assessment whose digest matches a catalog entry is left alone. Any
+    other one takes over the unmatched entry at its position (an edit keeps
+    its id and created time) or, past the end of the catalog, a new id.
+    """
+    old_entries = catalog["assessments"]
+    unmatched = {}
+    for entry in old_entries:
+        unmatched.setdefault(entry["digest"], []).append(entry)
+    digests = [_digest(a) for a in assessments]
+    entries = [unmatched[d].pop(0) if unmatched.get(d) else None for d in digests]
+    used = {entry["id"] for entry in entries if entry is not None}
+    next_id = catalog["next_id"]
+    for i, assessment in enumerate(assessments):
+        if entries[i] is not None:
+            continue
+        old = old_entries[i] if i < len(old_entries) else None
+        if old is not None and old["id"] not in used:
+            aid, created = old["id"], old.get("created")
+        else:
+            aid, created = f"a{next_id}", _now()
+            next_id += 1
+        used.add(aid)
+        _write_shard(aid, assessment, store)
+        entries[i] = _header(aid, assessment, digests[i], created)
+    for entry in old_entries:
+        if entry["id"] not in used:
+            _delete_shard(entry["id"], store)
+    new_catalog = {"next_id": next_id, "assessments": entries}
+    if new_catalog != catalog or _read_catalog(store) is None:
+        _write_catalog(new_catalog, store)
+    return new_catalog
+
+
+def _stored_assessments(store):
+    catalog = _load_catalog(store)
+    return [
+        StoredAssessment(entry, lambda aid=entry["id"]: _read_shard(aid, store))
+        for entry in catalog["assessments"]
+    ]
+
+
+def _load_assessments(store):
+    return [a.load() for a in _stored_assessments(store)]
+
+
+def _save_one(assessment_id, assessment, store):
+    """Write one assessment's shard and catalog entry; returns its id.
+
+    assessment_id None adds a new assessment. Nothing is written if the
+    assessment is unchanged, and no other shard is read.
+    """
+    catalog = _load_catalog(store)
+    entries = list(catalog["assessments"])
+    next_id = catalog["next_id"]
+    digest = _digest(assessment)
+    if assessment_id is None:
+        assessment_id, created = f"a{next_id}", _now()
+        pos = len(entries)
+        entries.append(None)
+        next_id += 1
+    else:
+        pos = next((i for i, entry in enumerate(entries) if entry["id"] == assessment_id), None)
+        if pos is None:
+            raise KeyError(f"no saved assessment with id {assessment_id!r}")
+        if entries[pos]["digest"] == digest:
+            return assessment_id
+        created = entries[pos].get("created")
+    _write_shard(assessment_id, assessment, store)
+    entries[pos] = _header(assessment_id, assessment, digest, created)
+    _write_catalog({"next_id": next_id, "assessments": entries}, store)
+    return assessment_id
+
+
+def _locked(func, *args, store):
+    # Catalog updates are read-modify-write; JSON files take the catalog lock.
+    if store is not None:
+        return func(*args, store)
+    os.makedirs(ASSESSMENT_DIR, exist_ok=True)
+    with file_lock(_catalog_path()):
+        return func(*args, store)
+
+
+def _save_assessments(assessments, store):
+    _locked(lambda store: _save_all(_load_catalog(store), assessments, store), store=store)
+
+
+def _current_store():
+    return get_sqlite_store() if use_sqlite() else None
+
+
+def list_assessment_headers():
+    """Return the catalog entries without reading any questions."""
+    return [dict(entry) for entry in _load_catalog(_current_store())["assessments"]]
+
+
+def load_assessment(assessment_id):
+    """Read one assessment's shard."""
+    return _read_shard(assessment_id, _current_store())
+
+
+def stored_assessments():
+    """Return a StoredAssessment per catalog entry, without reading shards."""
+    return _stored_assessments(_current_store())
+
+
+def load_custom_assessments():
+    """Return every assessment as a dict, for screens that edit them."""
+    return _load_assessments(_current_store())
+
+
 def save_custom_assessments(assessments):
-    with open(ASSESSMENT_FILE, "w") as f:
-        json.dump(assessments, f)
\ No newline at end of file
+    """Persist the list, rewriting only the assessments that changed."""
+    _save_assessments(assessments, _current_store())
+
+
+def add_custom_assessment(assessment):
+    """Save a new assessment in a shard of its own; returns its id."""
+    return _locked(_save_one, None, assessment, store=_current_store())
+
+
+def save_assessment(assessment_id, assessment):
+    """Rewrite one saved assessment's shard and catalog entry."""
+    _locked(_save_one, assessment_id, assessment, store=_current_store())
+
+
+if __name__ == "__main__":
+    if len(sys.argv) != 2 or sys.argv[1] != "list":
+        print("Usage: python assessment_storage.py list")
+        sys.exit(2)
+    for header in list_assessment_headers():
+        print(f"{header['id']:>6}  {header.get('questions', '?'):>4} questions  "
+              f"{header.get('modified') or '-':19}  {header['name']}")
@@ -1,6 +1,24 @@
 
 
-from storage import load_scores
+import os
+import sys
+import json
+import hashlib
+
+from utils import atomic_write_json, file_lock, migrate_scores, read_scores_from
+from storage_backend import use_sqlite, get_sqlite_store
+import score_buffer
+
+USER_INDEX_FILE = "high_scores_users.json"
+USER_SHARD_DIR = "high_scores_users"
+
+# The index is kept so that one new score only touches files whose size
+# does not depend on how many users there are:
+#   USER_INDEX_FILE           {"count", "offset"}: attempts indexed and how
+#                             far into the score journal the index has read
+#   <USER_INDEX_FILE>.jsonl   one {"key", "name"} line per user, appended
+#                             the first time that user scores
+#   USER_SHARD_DIR/<hash>.json  that user's attempts, in recording order
 
 
 def _normalize_name(name: str) -> str:
@@ -8,24 +26,190 @@ def _normalize_name(name: str) -> str:
     return " ".join(name.strip().lower().split())
 
 
+def _shard_path(key):
+    digest = hashlib.sha1(key.encode("utf-8")).hexdigest()[:16]
+    return os.path.join(USER_SHARD_DIR, f"{digest}.json")
+
+
+def _user_list_path():
+    # Derived rather than a constant of its own, so it always sits next to
+    # (and moves with) USER_INDEX_FILE.
+    return os.path.splitext(USER_INDEX_FILE)[0] + ".jsonl"
+
+
+def _add_to_index(catalog, shards, record):
+    raw_name = (record.get("name") or "").strip()
+    if not raw_name:
+        return None
+    key = _normalize_name(raw_name)
+    catalog["users"].setdefault(key, {"name": raw_name})
+    catalog["count"] += 1
+    if shards is not None:
+        shards.setdefault(key, []).append(record)
+    return key
+
+
+def build_user_index(scores):
+    catalog = {"count": 0, "offset": 0, "users": {}}
+    shards = {}
+    for record in scores:
+        _add_to_index(catalog, shards, record)
+    return catalog, shards
+
+
+def _write_shards(shards):
+    os.makedirs(USER_SHARD_DIR, exist_ok=True)
+    for key, attempts in shards.items():
+        atomic_write_json(_shard_path(key), attempts)
+
+
+def _rebuild_user_index():
+    records, offset = read_scores_from(0)
+    catalog, shards = build_user_index(records)
+    catalog["offset"] = offset
+    _write_shards(shards)
+    # Shards of users who are no longer in the score store would otherwise
+    # be picked up again if that name ever scores again.
+    keep = {os.path.basename(_shard_path(key)) for key in shards}
+    for entry in os.listdir(USER_SHARD_DIR):
+        if entry.endswith(".json") and entry not in keep:
+            os.remove(os.path.join(USER_SHARD_DIR, entry))
+    lines = "".join(json.dumps({"key": key, "name": entry["name"]}) + "\n" for key, entry in catalog["users"].items())
+    tmp = _user_list_path() + ".tmp"
+    with open(tmp, "w", encoding="utf-8") as f:
+        f.write(lines)
+    os.replace(tmp, _user_list_path())
+    atomic_write_json(USER_INDEX_FILE, {"count": catalog["count"], "offset": offset})
+    return catalog
+
+
+def rebuild_user_index():
+    migrate_scores()
+    with file_lock(USER_INDEX_FILE):
+        return _rebuild_user_index()
+
+
+def _read_user_index():
+    if not os.path.exists(USER_INDEX_FILE):
+        return None
+    try:
+        with open(USER_INDEX_FILE, "r", encoding="utf-8") as f:
+            state = json.load(f)
+    except (OSError, json.JSONDecodeError):
+        return None
+    if not isinstance(state, dict) or "offset" not in state or "users" in state:
+        # Missing, damaged, or the older single-file catalog.
+        return None
+    return state
+
+
+def _read_user_list():
+    users = {}
+    try:
+        with open(_user_list_path(), "r", encoding="utf-8") as f:
+            for line in f:
+                if not line.endswith("\n"):
+                    break
+                try:
+                    entry = json.loads(line)
+                    users.setdefault(entry["key"], {"name": entry["name"]})
+                except (json.JSONDecodeError, KeyError, TypeError):
+                    continue
+    except OSError:
+        return None
+    return users
+
+
+def _load_user_index():
+    """The whole catalog: {"count", "offset", "users": {key: {"name"}}}."""
+    state = _read_user_index()
+    users = _read_user_list() if state is not None else None
+    if users is None:
+        return rebuild_user_index()
+    return dict(state, users=users)
+
+
+def sync_user_index():
+    """Apply every journal line the index has not seen yet.
+
+    Like leaderboard.sync_leaderboard(), one lock holder applies the whole
+    batch. It rewrites the shard of each user in it, appends any new users
+    to the user list and rewrites the small state file, so the cost grows
+    with the batch and those users' attempts, not with the number of users.
+    """
+    migrate_scores()
+    with file_lock(USER_INDEX_FILE):
+        state = _read_user_index()
+        if state is None or not os.path.exists(_user_list_path()):
+            return _rebuild_user_index()
+        pending = read_scores_from(state["offset"])
+        if pending is None:
+            return _rebuild_user_index()
+        records, offset = pending
+        if offset == state["offset"]:
+            return state
+        batch = {"count": 0, "users": {}}
+        new_attempts = {}
+        for record in records:
+            _add_to_index(batch, new_attempts, record)
+        shards = {}
+        new_users = []
+        for key, attempts in new_attempts.items():
+            known = _read_shard(key)
+            if not known:
+                new_users.append({"key": key, "name": batch["users"][key]["name"]})
+            shards[key] = known + attempts
+        _write_shards(shards)
+        if new_users:
+            with open(_user_list_path(), "a", encoding="utf-8") as f:
+                f.write("".join(json.dumps(user) + "\n" for user in new_users))
+        state = {"count": state["count"] + batch["count"], "offset": offset}
+        atomic_write_json(USER_INDEX_FILE, state)
+        return state
+
+
+def _read_shard(key):
+    path = _shard_path(key)
+    if not os.path.exists(path):
+        return []
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def _ensure_user_index():
+    if _read_user_index() is None or not os.path.exists(_user_list_path()):
+        rebuild_user_index()
+
+
 def get_user_attempts(name: str):
   
-    scores = load_scores()
-    target = _normalize_name(name)
-    user_attempts = [s for s in scores if _normalize_name(s.get("name", "")) == target]
-    return user_attempts
+    score_buffer.flush()
+    if use_sqlite():
+        return get_sqlite_store().user_scores(name)
+    _ensure_user_index()
+    return _read_shard(_normalize_name(name))
+
+
+def get_first_and_latest_attempt(name: str):
+
+    score_buffer.flush()
+    if use_sqlite():
+        return get_sqlite_store().first_and_latest_score(name)
+    attempts = get_user_attempts(name)
+    if not attempts:
+        return None
+    return attempts[0], attempts[-1]
 
 
 def show_first_and_latest_attempt(name: str):
     
-    attempts = get_user_attempts(name)
+    pair = get_first_and_latest_attempt(name)
 
-    if not attempts:
+    if not pair:
         print(f"\nNo quiz attempts found for '{name}'.")
         return
 
-    first = attempts[0]
-    latest = attempts[-1]
+    first, latest = pair
 
     first_score = first.get("score", 0)
     latest_score = latest.get("score", 0)
@@ -48,18 +232,10 @@ def show_first_and_latest_attempt(name: str):
 
 def get_all_users():
     
-    scores = load_scores()
-    seen = set()
-    users = []
-    for s in scores:
-        raw_name = (s.get("name") or "").strip()
-        if not raw_name:
-            continue
-        key = _normalize_name(raw_name)
-        if key not in seen:
-            seen.add(key)
-            users.append(raw_name)
-    return users
+    score_buffer.flush()
+    if use_sqlite():
+        return get_sqlite_store().score_users()
+    return [entry["name"] for entry in _load_user_index()["users"].values()]
 
 
 def choose_user_from_list_and_compare():
@@ -112,3 +288,11 @@ def comparison_menu():
             break
         else:
             print("Invalid choice. Please try again.")
+
+
+if __name__ == "__main__":
+    if len(sys.argv) > 1 and sys.argv[1] == "rebuild":
+        catalog = rebuild_user_index()
+        print(f"User index rebuilt: {len(catalog['users'])} users, {catalog['count']} attempts.")
+    else:
+        comparison_menu()
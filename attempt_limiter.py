@@ -0,0 +1,322 @@
+import os
+import json
+from collections import deque
+from datetime import date, datetime, timedelta
+
+from storage_backend import use_sqlite, get_sqlite_store
+from utils import file_lock, atomic_write_json
+
+
+def window_start(today, window_days):
+    return (date.fromisoformat(today) - timedelta(days=window_days - 1)).isoformat()
+
+
+def split_counters(data, keep_from):
+    """Split a {name: {day: count}} map at keep_from (an ISO date).
+
+    Returns (hot, archived): the map of days on or after keep_from, and a
+    list of {"name", "day", "count"} rows for everything older.
+    """
+    hot = {}
+    archived = []
+    for name, days in data.items():
+        for day, count in days.items():
+            if day >= keep_from:
+                hot.setdefault(name, {})[day] = count
+            else:
+                archived.append({"name": name, "day": day, "count": count})
+    return hot, archived
+
+
+def append_archive(path, rows):
+    if not rows:
+        return
+    with open(path, "a", encoding="utf-8") as f:
+        f.write("".join(json.dumps(row) + "\n" for row in rows))
+
+
+# --- policies -----------------------------------------------------------
+#
+# A policy works on one key's entry (whatever JSON value it stores for a
+# user or user::assessment pair). remaining() and record() only look at
+# that entry, so both are O(1) in the size of the history. Both take the
+# caller's limit (max_attempts when None), so one stored entry can be
+# checked against different limits.
+
+
+class DailyPolicy:
+    """At most max_attempts per calendar day (or per window_days days)."""
+
+    name = "daily"
+
+    def __init__(self, max_attempts, window_days=1, today=None):
+        self.max_attempts = max_attempts
+        self.window_days = window_days
+        self._today = today or (lambda: date.today().isoformat())
+
+    def days(self):
+        today = self._today()
+        return [window_start(today, n + 1) for n in range(self.window_days)]
+
+    def used(self, entry):
+        entry = entry or {}
+        return sum(entry.get(day, 0) for day in self.days())
+
+    def remaining(self, entry, limit=None):
+        limit = self.max_attempts if limit is None else limit
+        return max(0, limit - self.used(entry))
+
+    def record(self, entry, limit=None):
+        entry = dict(entry or {})
+        today = self._today()
+        entry[today] = entry.get(today, 0) + 1
+        return entry
+
+    def compact(self, state):
+        return split_counters(state, window_start(self._today(), self.window_days))
+
+
+class SlidingWindowPolicy:
+    """At most max_attempts in any rolling window of `hours` hours."""
+
+    name = "sliding"
+
+    def __init__(self, max_attempts, hours, clock=None):
+        self.max_attempts = max_attempts
+        self.window = hours * 3600
+        self._clock = clock or (lambda: datetime.now().timestamp())
+
+    def _live(self, entry):
+        # Timestamps are kept oldest first and only those inside the window
+        # survive, so pruning is bounded by the attempts one window admits,
+        # not by the history.
+        cutoff = self._clock() - self.window
+        times = deque(entry or [])
+        while times and times[0] <= cutoff:
+            times.popleft()
+        return times
+
+    def remaining(self, entry, limit=None):
+        limit = self.max_attempts if limit is None else limit
+        return max(0, limit - len(self._live(entry)))
+
+    def record(self, entry, limit=None):
+        times = self._live(entry)
+        times.append(self._clock())
+        return list(times)
+
+    def compact(self, state):
+        hot = {}
+        for key, entry in state.items():
+            live = list(self._live(entry))
+            if live:
+                hot[key] = live
+        return hot, []
+
+
+class TokenBucketPolicy:
+    """A bucket of `capacity` attempts that refills `refill_per_hour` tokens per hour."""
+
+    name = "bucket"
+
+    def __init__(self, capacity, refill_per_hour, clock=None):
+        self.capacity = capacity
+        self.refill = refill_per_hour / 3600.0
+        self._clock = clock or (lambda: datetime.now().timestamp())
+
+    def _tokens(self, entry, now, capacity):
+        if not entry:
+            return float(capacity)
+        elapsed = max(0.0, now - entry["updated"])
+        return min(float(capacity), entry["tokens"] + elapsed * self.refill)
+
+    def remaining(self, entry, limit=None):
+        capacity = self.capacity if limit is None else limit
+        return int(self._tokens(entry, self._clock(), capacity))
+
+    def record(self, entry, limit=None):
+        # The capacity is stored so compact() knows when this bucket is full.
+        capacity = self.capacity if limit is None else limit
+        now = self._clock()
+        tokens = max(0.0, self._tokens(entry, now, capacity) - 1)
+        return {"tokens": tokens, "updated": now, "capacity": capacity}
+
+    def compact(self, state):
+        # A full bucket carries no information; drop it.
+        now = self._clock()
+        hot = {}
+        for key, entry in state.items():
+            capacity = entry.get("capacity", self.capacity)
+            if self._tokens(entry, now, capacity) < capacity:
+                hot[key] = entry
+        return hot, []
+
+
+def make_policy(spec, max_attempts, window_days=1, today=None):
+    """Build a policy from a spec string.
+
+    "daily" / "daily:<days>", "rolling:<hours>", "bucket:<refill per hour>".
+    max_attempts is the limit (or the bucket capacity).
+    """
+    kind, _, arg = (spec or "daily").strip().lower().partition(":")
+    if kind == "daily":
+        return DailyPolicy(max_attempts, int(arg or window_days), today=today)
+    if kind == "rolling":
+        return SlidingWindowPolicy(max_attempts, float(arg or 24))
+    if kind == "bucket":
+        return TokenBucketPolicy(max_attempts, float(arg or max_attempts / 24.0))
+    raise ValueError(f"Unknown attempt policy '{spec}'. Use daily[:days], rolling[:hours] or bucket[:per_hour].")
+
+
+# --- limiter ------------------------------------------------------------
+
+
+def _file_stamp(path):
+    try:
+        st = os.stat(path)
+    except FileNotFoundError:
+        return None
+    return st.st_mtime_ns, st.st_size, st.st_ino
+
+
+def _load_json_state(path):
+    if not os.path.exists(path):
+        return {}
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, json.JSONDecodeError):
+        return {}
+
+
+_sqlite_compacted = {}
+
+
+def compact_sqlite_counters(collection, keep_from):
+    # Once per process and day is enough: nothing older can appear later.
+    if _sqlite_compacted.get(collection) == keep_from:
+        return 0
+    moved = get_sqlite_store().archive_counters(collection, keep_from)
+    _sqlite_compacted[collection] = keep_from
+    return moved
+
+
+class AttemptLimiter:
+    """Admit/record attempts per key under a pluggable policy.
+
+    The parsed state is cached in-process and only re-read when the file
+    on disk changes (checked with one stat call), so a check followed by
+    a record costs one JSON parse at most. Writes go straight through to
+    disk under the file lock.
+
+    path, archive_path, load and save are callables so the owning module
+    can keep its own constants and _load/_save helpers; load and save
+    default to plain JSON at path.
+    """
+
+    def __init__(self, policy, collection, path, load=None, save=None, archive_path=None):
+        self.policy = policy
+        self.collection = collection
+        self._path = path
+        self._load = load or (lambda: _load_json_state(path()))
+        self._save = save or (lambda data: atomic_write_json(path(), data))
+        self._archive_path = archive_path
+        self._cache = None
+        self._cache_key = None
+
+    def _state(self):
+        path = self._path()
+        key = (path, _file_stamp(path))
+        if self._cache is None or self._cache_key != key:
+            self._cache = self._load()
+            self._cache_key = key
+        return self._cache
+
+    def _sqlite_entry(self, key):
+        store = get_sqlite_store()
+        if isinstance(self.policy, DailyPolicy):
+            return {day: store.get_counter(self.collection, key, day) for day in self.policy.days()}
+        return store.get_doc(self.collection, key)
+
+    def _sqlite_record(self, key, limit=None):
+        store = get_sqlite_store()
+        if isinstance(self.policy, DailyPolicy):
+            compact_sqlite_counters(self.collection, self.policy.days()[-1])
+            store.incr_counter(self.collection, key, self.policy.days()[0])
+        else:
+            store.put_doc(self.collection, key, self.policy.record(store.get_doc(self.collection, key), limit))
+
+    def remaining(self, key, limit=None):
+        if use_sqlite():
+            return self.policy.remaining(self._sqlite_entry(key), limit)
+        return self.policy.remaining(self._state().get(key), limit)
+
+    def admit(self, key, limit=None):
+        remaining = self.remaining(key, limit)
+        return remaining > 0, remaining
+
+    def _record_locked(self, key, limit=None):
+        state, archived = self.policy.compact(self._state())
+        if self._archive_path is not None:
+            append_archive(self._archive_path(), archived)
+        state[key] = self.policy.record(state.get(key), limit)
+        self._save(state)
+        self._cache = state
+        self._cache_key = (self._path(), _file_stamp(self._path()))
+
+    def record(self, key, limit=None):
+        if use_sqlite():
+            self._sqlite_record(key, limit)
+            return
+        with file_lock(self._path()):
+            self._record_locked(key, limit)
+
+    def try_acquire(self, key, limit=None):
+        """Check and record in one locked step. Returns (admitted, remaining_before).
+
+        On SQLite the check and the write share one BEGIN IMMEDIATE
+        transaction, so two processes cannot both take the last attempt.
+        """
+        if use_sqlite():
+            with get_sqlite_store().transaction():
+                allowed, remaining = self.admit(key, limit)
+                if allowed:
+                    self._sqlite_record(key, limit)
+            return allowed, remaining
+        with file_lock(self._path()):
+            remaining = self.policy.remaining(self._state().get(key), limit)
+            if remaining > 0:
+                self._record_locked(key, limit)
+            return remaining > 0, remaining
+
+    def compact(self):
+        """Drop or archive state outside the policy window. Returns rows archived."""
+        if use_sqlite():
+            if isinstance(self.policy, DailyPolicy):
+                return compact_sqlite_counters(self.collection, self.policy.days()[-1])
+            return 0
+        with file_lock(self._path()):
+            state, archived = self.policy.compact(self._state())
+            if self._archive_path is not None:
+                append_archive(self._archive_path(), archived)
+            if archived or state != self._cache:
+                self._save(state)
+                self._cache = state
+                self._cache_key = (self._path(), _file_stamp(self._path()))
+        return len(archived)
+
+
+def limiter_for(spec, max_attempts, collection, path, load, save, archive_path, window_days=1, today=None):
+    """Build the limiter for a policy spec string (see make_policy).
+
+    The daily policy keeps the owner's {name: {day: count}} file and
+    helpers. The other policies store a different entry shape, so they
+    get their own "<file>_<policy>.json" state file.
+    """
+    policy = make_policy(spec, max_attempts, window_days=window_days, today=today)
+    if isinstance(policy, DailyPolicy):
+        return AttemptLimiter(policy, collection, path, load=load, save=save, archive_path=archive_path)
+    return AttemptLimiter(
+        policy, f"{collection}_{policy.name}",
+        path=lambda: path().replace(".json", f"_{policy.name}.json"),
+    )
@@ -1,10 +1,23 @@
 import os
+import sys
 import json
 from datetime import date
 
+from attempt_limiter import limiter_for
+from utils import atomic_write_json
+from storage_backend import get_setting
+
 MAX_ATTEMPTS_PER_DAY = 3   
 
+# attempts.json only holds the days inside the limit window (the "hot"
+# counters); older days are moved to the append-only archive on write.
 ATTEMPT_FILE = "attempts.json"
+ATTEMPT_ARCHIVE_FILE = "attempts_archive.jsonl"
+ATTEMPT_WINDOW_DAYS = 1
+ATTEMPT_COLLECTION = "attempts"
+
+# "daily" (default), "daily:<days>", "rolling:<hours>" or "bucket:<refill per hour>".
+ATTEMPT_POLICY_ENV = "MCQ_ATTEMPT_POLICY"
 
 
 def _load_attempts():
@@ -15,24 +28,39 @@ def _load_attempts():
 
 
 def _save_attempts(data):
-    with open(ATTEMPT_FILE, "w") as f:
-        json.dump(data, f)
+    atomic_write_json(ATTEMPT_FILE, data)
 
 
 def _today_str():
     return date.today().isoformat()
 
 
-def get_attempts_left(name, max_attempts=MAX_ATTEMPTS_PER_DAY):
-    name = name.strip()
-    attempts = _load_attempts()
-    today = _today_str()
+_limiters = {}
+
+
+def get_limiter():
+    """Return the limiter for the configured policy, reusing its cache."""
+    spec = get_setting(ATTEMPT_POLICY_ENV, "attempt_policy", "daily")
+    if spec not in _limiters:
+        _limiters[spec] = limiter_for(
+            spec, MAX_ATTEMPTS_PER_DAY, ATTEMPT_COLLECTION,
+            path=lambda: ATTEMPT_FILE,
+            load=lambda: _load_attempts(),
+            save=lambda data: _save_attempts(data),
+            archive_path=lambda: ATTEMPT_ARCHIVE_FILE,
+            window_days=ATTEMPT_WINDOW_DAYS,
+            today=lambda: _today_str(),
+        )
+    return _limiters[spec]
 
-    user_attempts = attempts.get(name, {})
-    used_today = user_attempts.get(today, 0)
 
-    remaining = max(0, max_attempts - used_today)
-    return remaining
+def compact_attempts():
+    """Archive every day outside the limit window. Returns the rows moved."""
+    return get_limiter().compact()
+
+
+def get_attempts_left(name, max_attempts=MAX_ATTEMPTS_PER_DAY):
+    return get_limiter().remaining(name.strip(), max_attempts)
 
 
 def can_attempt_quiz(name, max_attempts=MAX_ATTEMPTS_PER_DAY):
@@ -41,11 +69,17 @@ def can_attempt_quiz(name, max_attempts=MAX_ATTEMPTS_PER_DAY):
 
 
 def record_quiz_attempt(name):
-    name = name.strip()
-    attempts = _load_attempts()
-    today = _today_str()
+    get_limiter().record(name.strip())
+
+
+def try_start_quiz(name, max_attempts=MAX_ATTEMPTS_PER_DAY):
+    """Check the limit and record the attempt in one locked step."""
+    return get_limiter().try_acquire(name.strip(), max_attempts)
 
-    user_attempts = attempts.setdefault(name, {})
-    user_attempts[today] = user_attempts.get(today, 0) + 1
 
-    _save_attempts(attempts)
+if __name__ == "__main__":
+    if len(sys.argv) > 1 and sys.argv[1] == "compact":
+        print(f"Archived {compact_attempts()} old attempt counter(s).")
+    else:
+        print("Usage: python attempts.py compact")
+        sys.exit(2)
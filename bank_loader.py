@@ -0,0 +1,229 @@
+import gc
+import os
+import sys
+import json
+import time
+import tracemalloc
+
+from question_bank import QuestionBank, get_bank
+from storage_backend import get_setting
+
+# Optional external bank (JSON Lines, an exported_questions.json style
+# array, or a compiled .mcqb file) used instead of the built-in
+# quiz_data questions.
+QUESTION_BANK_ENV = "MCQ_QUESTION_BANK"
+
+# Read size for the streaming parsers; large enough that a question never
+# needs more than a couple of refills.
+CHUNK_SIZE = 1 << 16
+# Only the first few problems are kept for the report.
+MAX_REPORTED_ERRORS = 20
+
+_decoder = json.JSONDecoder()
+
+
+def iter_jsonl(path):
+    """Yield (line_number, value) for each non-blank line of a JSON Lines file."""
+    with open(path, "r", encoding="utf-8") as f:
+        for n, line in enumerate(f, start=1):
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                yield n, _decoder.decode(line)
+            except json.JSONDecodeError as e:
+                yield n, e
+
+
+def iter_json_array(path, chunk_size=None):
+    """Yield (item_number, value) for each element of a top-level JSON array.
+
+    This is the format export_questions writes. The file is read in chunks
+    and decoded one element at a time, so only the current element and one
+    chunk are held at once, never the whole text or the whole list.
+    """
+    chunk_size = chunk_size or CHUNK_SIZE
+    with open(path, "r", encoding="utf-8") as f:
+        buf = ""
+        pos = 0
+        eof = False
+
+        def skip(chars):
+            nonlocal buf, pos, eof
+            while True:
+                while pos < len(buf) and buf[pos] in chars:
+                    pos += 1
+                if pos < len(buf) or eof:
+                    return
+                buf, pos = f.read(chunk_size), 0
+                eof = not buf
+
+        skip(" \t\r\n")
+        if buf[pos:pos + 1] != "[":
+            raise ValueError(f"{path}: expected a JSON array of questions")
+        pos += 1
+        n = 0
+        while True:
+            skip(" \t\r\n,")
+            if eof:
+                raise ValueError(f"{path}: unexpected end of file inside the array")
+            if buf[pos] == "]":
+                return
+            while True:
+                try:
+                    value, end = _decoder.raw_decode(buf, pos)
+                    # A bare number can be cut at the chunk edge; objects can't.
+                    if end < len(buf) or eof or isinstance(value, (dict, list)):
+                        break
+                except json.JSONDecodeError:
+                    pass
+                more = f.read(chunk_size)
+                if not more:
+                    eof = True
+                    try:
+                        value, end = _decoder.raw_decode(buf, pos)
+                        break
+                    except json.JSONDecodeError:
+                        raise ValueError(f"{path}: malformed JSON after item {n}")
+                buf, pos = buf[pos:] + more, 0
+            n += 1
+            yield n, value
+            pos = end
+
+
+def _all_strings(values):
+    try:
+        "".join(values)
+    except TypeError:
+        return False
+    return True
+
+
+def validate_question(q):
+    """Return None if q is a usable question dict, else a short reason."""
+    if type(q) is not dict:
+        return f"invalid JSON ({q.msg})" if isinstance(q, Exception) else "not an object"
+    text = q.get("question")
+    if type(text) is not str or not text.strip():
+        return "missing question text"
+    options = q.get("options")
+    if type(options) not in (list, tuple) or len(options) < 2 or not _all_strings(options):
+        return "options must be a list of at least two strings"
+    answer = q.get("answer")
+    if not isinstance(answer, str) or answer.strip().upper() not in tuple("ABCD"[:len(options)]):
+        return "answer must be one of the option letters"
+    for key in ("topic", "difficulty"):
+        if key in q and not isinstance(q[key], str):
+            return f"{key} must be a string"
+    return None
+
+
+def iter_questions(path, chunk_size=None):
+    """Pick the streaming parser from the file: JSON Lines or a JSON array."""
+    with open(path, "r", encoding="utf-8") as f:
+        head = f.read(1024).lstrip()
+    if head.startswith("["):
+        return iter_json_array(path, chunk_size)
+    return iter_jsonl(path)
+
+
+def load_bank(path, chunk_size=None, trace_memory=False):
+    """Stream questions from path into a new QuestionBank.
+
+    Invalid records are skipped. Returns (bank, report), where report has
+    "loaded", "skipped", "errors" ([(item, reason)], first few only),
+    "problems" (loaded questions with unlabelled options, first few only),
+    "seconds" and, with trace_memory, "peak_bytes" allocated while loading.
+    """
+    if trace_memory:
+        tracemalloc.start()
+    # The bank only grows, so there are no cycles to find; pausing the
+    # collector avoids rescanning millions of new objects while loading.
+    gc_was_enabled = gc.isenabled()
+    gc.disable()
+    start = time.perf_counter()
+    bank = QuestionBank()
+    skipped = 0
+    errors = []
+    try:
+        for n, q in iter_questions(path, chunk_size):
+            reason = validate_question(q)
+            if reason is not None:
+                skipped += 1
+                if len(errors) < MAX_REPORTED_ERRORS:
+                    errors.append((n, reason))
+                continue
+            q["options"] = tuple(q["options"])
+            q["answer"] = q["answer"].strip().upper()
+            bank.add(q)
+        report = {
+            "loaded": len(bank),
+            "skipped": skipped,
+            "errors": errors,
+            "problems": bank.problems[:MAX_REPORTED_ERRORS],
+            "seconds": time.perf_counter() - start,
+        }
+        if trace_memory:
+            report["peak_bytes"] = tracemalloc.get_traced_memory()[1]
+    finally:
+        if gc_was_enabled:
+            gc.enable()
+        if trace_memory:
+            tracemalloc.stop()
+    return bank, report
+
+
+def print_report(path, report):
+    print(f"Loaded {report['loaded']} question(s) from '{path}' in {report['seconds']:.2f}s")
+    if "peak_bytes" in report:
+        print(f"Peak memory while loading: {report['peak_bytes'] / (1024 * 1024):.1f} MiB")
+    if report["skipped"]:
+        print(f"Skipped {report['skipped']} invalid record(s):")
+        for n, reason in report["errors"]:
+            print(f"  item {n}: {reason}")
+    if report.get("problems"):
+        print("Questions with malformed options:")
+        for qid, problem in report["problems"]:
+            print(f"  question {qid + 1}: {problem}")
+
+
+_loaded = {}
+
+
+def get_question_bank(data):
+    """The bank the menus should use.
+
+    If MCQ_QUESTION_BANK (or "question_bank" in storage_config.json) names
+    a file, it is streamed in once (or, for a compiled bank, mapped) and
+    reused until the file changes; otherwise the bank is built from data.
+    """
+    path = get_setting(QUESTION_BANK_ENV, "question_bank", None)
+    if not path:
+        return get_bank(data)
+    stamp = os.stat(path).st_mtime_ns
+    cached = _loaded.get(path)
+    if cached is not None and cached[0] == stamp:
+        return cached[1]
+    from mmap_bank import MmapQuestionBank, is_binary_bank
+    if cached is not None:
+        # The file changed: release the old mapping and its file handle
+        # before the new bank is opened.
+        del _loaded[path]
+        if isinstance(cached[1], MmapQuestionBank):
+            cached[1].close()
+    if is_binary_bank(path):
+        bank = MmapQuestionBank(path)
+    else:
+        bank, report = load_bank(path)
+        if report["skipped"] or report["problems"]:
+            print_report(path, report)
+    _loaded[path] = (stamp, bank)
+    return bank
+
+
+if __name__ == "__main__":
+    if len(sys.argv) != 2:
+        print("Usage: python bank_loader.py <questions.jsonl|questions.json>")
+        sys.exit(2)
+    _, load_report = load_bank(sys.argv[1], trace_memory=True)
+    print_report(sys.argv[1], load_report)
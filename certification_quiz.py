@@ -1,16 +1,29 @@
 import os
 import json
-import random
 from datetime import date, datetime
 
 from quiz_data import ALL_QUIZ_DATA
-from utils import load_scores, save_scores
+from utils import record_score, atomic_write_json, file_lock
+from storage_backend import use_sqlite, get_sqlite_store, get_setting
+from attempt_limiter import limiter_for
+from bank_loader import get_question_bank
+from sampler import sample_questions
+from session import QuizSession
+from deadlines import DeadlineScheduler
+from mcq_types import timed_quiz
+from render import Screen, paint, show
 
 CERT_ATTEMPT_FILE = "cert_attempts.json"
+CERT_ATTEMPT_ARCHIVE_FILE = "cert_attempts_archive.jsonl"
+CERT_WINDOW_DAYS = 1
 MAX_CERT_ATTEMPTS_PER_DAY = 1   
+CERT_ATTEMPT_POLICY_ENV = "MCQ_CERT_ATTEMPT_POLICY"
 
 CERT_RESULT_FILE = "certification_results.json"
 
+CERT_ATTEMPT_COLLECTION = "cert_attempts"
+CERT_RESULT_COLLECTION = "certification_results"
+
 
 def _load_cert_attempts():
     if os.path.exists(CERT_ATTEMPT_FILE):
@@ -23,23 +36,37 @@ def _load_cert_attempts():
 
 
 def _save_cert_attempts(data):
-    with open(CERT_ATTEMPT_FILE, "w", encoding="utf-8") as f:
-        json.dump(data, f, indent=2)
+    atomic_write_json(CERT_ATTEMPT_FILE, data, indent=2)
 
 
 def _today_str():
     return date.today().isoformat()
 
 
-def get_cert_attempts_left(name, max_attempts=MAX_CERT_ATTEMPTS_PER_DAY):
-    name = name.strip()
-    attempts = _load_cert_attempts()
-    today = _today_str()
+_cert_limiters = {}
+
+
+def get_cert_limiter():
+    spec = get_setting(CERT_ATTEMPT_POLICY_ENV, "cert_attempt_policy", "daily")
+    if spec not in _cert_limiters:
+        _cert_limiters[spec] = limiter_for(
+            spec, MAX_CERT_ATTEMPTS_PER_DAY, CERT_ATTEMPT_COLLECTION,
+            path=lambda: CERT_ATTEMPT_FILE,
+            load=lambda: _load_cert_attempts(),
+            save=lambda data: _save_cert_attempts(data),
+            archive_path=lambda: CERT_ATTEMPT_ARCHIVE_FILE,
+            window_days=CERT_WINDOW_DAYS,
+            today=lambda: _today_str(),
+        )
+    return _cert_limiters[spec]
+
 
-    user_attempts = attempts.get(name, {})
-    used_today = user_attempts.get(today, 0)
-    remaining = max(0, max_attempts - used_today)
-    return remaining
+def compact_cert_attempts():
+    return get_cert_limiter().compact()
+
+
+def get_cert_attempts_left(name, max_attempts=MAX_CERT_ATTEMPTS_PER_DAY):
+    return get_cert_limiter().remaining(name.strip(), max_attempts)
 
 
 def can_attempt_cert_quiz(name, max_attempts=MAX_CERT_ATTEMPTS_PER_DAY):
@@ -48,14 +75,12 @@ def can_attempt_cert_quiz(name, max_attempts=MAX_CERT_ATTEMPTS_PER_DAY):
 
 
 def record_cert_attempt(name):
-    name = name.strip()
-    attempts = _load_cert_attempts()
-    today = _today_str()
+    get_cert_limiter().record(name.strip())
 
-    user_attempts = attempts.setdefault(name, {})
-    user_attempts[today] = user_attempts.get(today, 0) + 1
 
-    _save_cert_attempts(attempts)
+def try_start_cert_quiz(name, max_attempts=MAX_CERT_ATTEMPTS_PER_DAY):
+    """Check the limit and record the attempt in one locked step."""
+    return get_cert_limiter().try_acquire(name.strip(), max_attempts)
 
 
 def _load_cert_results():
@@ -69,14 +94,26 @@ def _load_cert_results():
 
 
 def _save_cert_results(results):
-    with open(CERT_RESULT_FILE, "w", encoding="utf-8") as f:
-        json.dump(results, f, indent=2)
+    atomic_write_json(CERT_RESULT_FILE, results, indent=2)
 
 
-def _add_cert_result(record):
+def _iter_cert_results(name=None):
+    if use_sqlite():
+        return get_sqlite_store().iter_records(CERT_RESULT_COLLECTION, name)
     results = _load_cert_results()
-    results.append(record)
-    _save_cert_results(results)
+    if name is None:
+        return iter(results)
+    return (r for r in results if _normalize_text(r.get("name", "")) == _normalize_text(name))
+
+
+def _add_cert_result(record):
+    if use_sqlite():
+        get_sqlite_store().append_record(CERT_RESULT_COLLECTION, record)
+        return
+    with file_lock(CERT_RESULT_FILE):
+        results = _load_cert_results()
+        results.append(record)
+        _save_cert_results(results)
 
 
 def _normalize_text(s: str) -> str:
@@ -88,11 +125,13 @@ def run_certification_exam(
     pass_mark: int = 70,
     timed: bool = False,
     time_per_question: int = 5,
+    seed=None,
 ):
     
 
 
-    if not ALL_QUIZ_DATA:
+    bank = get_question_bank(ALL_QUIZ_DATA)
+    if not len(bank):
         print("No questions available for certification.")
         return
 
@@ -101,7 +140,7 @@ def run_certification_exam(
         print("Name cannot be empty for certification.")
         return
 
-    allowed, remaining = can_attempt_cert_quiz(name)
+    allowed, remaining = try_start_cert_quiz(name)
     if not allowed:
         print("\nYou have used all certification attempts for today.")
         print("Please try again tomorrow.")
@@ -110,72 +149,59 @@ def run_certification_exam(
     print("\n===== CERTIFICATION EXAM MODE =====")
     print(f"Candidate : {name}")
     print(f"Pass mark : {pass_mark}%")
-    print(f"Questions : {len(ALL_QUIZ_DATA)}")
+    print(f"Questions : {len(bank)}")
     if timed:
         print(f"Timing    : {time_per_question} seconds per question")
     print("===================================")
     input("Press Enter to begin the certification exam...")
 
     
-    record_cert_attempt(name)
-
-    
-    indices = list(range(len(ALL_QUIZ_DATA)))
-    random.shuffle(indices)
-
-    questions = [ALL_QUIZ_DATA[i]["question"] for i in indices]
-    options = [ALL_QUIZ_DATA[i]["options"] for i in indices]
-    answers = [ALL_QUIZ_DATA[i]["answer"].strip().upper() for i in indices]
+    questions, options, answers = bank.select(sample_questions(bank, len(bank), seed=seed))
+    answers = [a.strip().upper() for a in answers]
+    session = QuizSession(questions, options, answers)
 
-    guesses = []
-    score = 0
-    total = len(questions)
+    scheduler = DeadlineScheduler() if timed else None
 
-    if timed:
-        
-        from mcq import timed_quiz
-
-    for i, question in enumerate(questions):
-        print("\n--------------------------------------------------")
-        print(f"Q{i+1}. {question}")
-        for opt in options[i]:
-            print("   " + opt)
+    while True:
+        current = session.next_question()
+        if current is None:
+            break
+        i, question, opts = current
+        paint(Screen("\n--------------------------------------------------", f"Q{i+1}. {question}",
+                     *("   " + opt for opt in opts)))
 
         if timed:
-            guess = timed_quiz("Enter (A, B, C, D): ", timeout=time_per_question)
+            guess = timed_quiz("Enter (A, B, C, D): ", timeout=time_per_question, scheduler=scheduler)
             if guess is None:
                 print("Time's up for this question! No answer recorded.")
                 guess = ""
         else:
             guess = input("Enter (A, B, C, D): ").strip().upper()
 
-        guess = guess.upper()
-        guesses.append(guess)
+        outcome = session.submit(guess.upper())
 
-        if guess == answers[i]:
-            score += 1
+        if outcome["correct"]:
             print("✔ CORRECT")
         else:
-            if guess == "":
+            if outcome["guess"] == "":
                 print("✖ No valid option chosen.")
             else:
                 print("✖ INCORRECT")
-            print(f"   Correct answer was: {answers[i]}")
+            print(f"   Correct answer was: {outcome['answer']}")
 
+    score, total = session.score, len(questions)
     percent = int((score / total) * 100) if total > 0 else 0
     passed = percent >= pass_mark
 
-    print("\n============== CERTIFICATION SUMMARY ==============")
-    print(f"Candidate       : {name}")
-    print(f"Score           : {score} / {total}")
-    print(f"Percentage      : {percent}%")
-    print(f"Pass mark       : {pass_mark}%")
-    print(f"Result          : {'PASSED ✅' if passed else 'FAILED ❌'}")
-    print("===================================================\n")
+    show(Screen("\n============== CERTIFICATION SUMMARY ==============",
+                f"Candidate       : {name}",
+                f"Score           : {score} / {total}",
+                f"Percentage      : {percent}%",
+                f"Pass mark       : {pass_mark}%",
+                f"Result          : {'PASSED ✅' if passed else 'FAILED ❌'}",
+                "===================================================\n"))
 
-    scores = load_scores()
-    scores.append({"name": name, "score": percent})
-    save_scores(scores)
+    record_score(name, percent, mode="certification")
 
     record = {
         "name": name,
@@ -205,8 +231,7 @@ def show_cert_history_for_user(name: str):
         print("Name cannot be empty.")
         return
 
-    results = _load_cert_results()
-    user_results = [r for r in results if _normalize_text(r.get("name", "")) == _normalize_text(name)]
+    user_results = list(_iter_cert_results(name))
 
     if not user_results:
         print(f"\nNo certification attempts found for '{name}'.")
@@ -224,7 +249,7 @@ def show_cert_history_for_user(name: str):
 
 
 def show_all_cert_attempts():
-    results = _load_cert_results()
+    results = list(_iter_cert_results())
     if not results:
         print("\nNo certification attempts recorded yet.")
         return
@@ -0,0 +1,162 @@
+import sys
+import math
+import time
+import heapq
+import select
+import itertools
+import functools
+
+# Windows console wait (kernel32): select() there only accepts sockets.
+STD_INPUT_HANDLE = -10
+WAIT_OBJECT_0 = 0
+INFINITE = 0xFFFFFFFF
+
+
+KEY_EVENT = 0x0001
+CONSOLE_BATCH = 64
+
+
+@functools.lru_cache(maxsize=None)
+def _input_record():
+    """ctypes layout of the console INPUT_RECORD (only key events are read)."""
+    import ctypes
+    from ctypes import wintypes
+
+    class KeyEvent(ctypes.Structure):
+        _fields_ = [("bKeyDown", wintypes.BOOL), ("wRepeatCount", wintypes.WORD),
+                    ("wVirtualKeyCode", wintypes.WORD), ("wVirtualScanCode", wintypes.WORD),
+                    ("uChar", wintypes.WCHAR), ("dwControlKeyState", wintypes.DWORD)]
+
+    class Event(ctypes.Union):
+        _fields_ = [("KeyEvent", KeyEvent), ("raw", ctypes.c_byte * 16)]
+
+    class InputRecord(ctypes.Structure):
+        _fields_ = [("EventType", wintypes.WORD), ("Event", Event)]
+
+    return InputRecord
+
+
+def _is_keypress(record):
+    key = record.Event.KeyEvent
+    return record.EventType == KEY_EVENT and key.bKeyDown and key.uChar != "\0"
+
+
+def _wait_console(timeout):
+    """Block until the Windows console has a key press or timeout seconds pass.
+
+    Focus, mouse and resize events (and key releases) also signal the
+    handle but are never seen by msvcrt.kbhit(); they are read off the
+    buffer here and the wait resumes, so callers do not spin on them.
+    """
+    import ctypes
+    kernel32 = ctypes.windll.kernel32
+    handle = kernel32.GetStdHandle(STD_INPUT_HANDLE)
+    end = None if timeout is None else time.monotonic() + timeout
+    records = (_input_record() * CONSOLE_BATCH)()
+    count = ctypes.c_ulong()
+    while True:
+        ms = INFINITE if end is None else math.ceil(max(0.0, end - time.monotonic()) * 1000)
+        if kernel32.WaitForSingleObject(handle, ms) != WAIT_OBJECT_0:
+            return False
+        if not kernel32.PeekConsoleInputW(handle, records, CONSOLE_BATCH, ctypes.byref(count)):
+            return True
+        if any(_is_keypress(r) for r in records[:count.value]):
+            return True
+        if count.value:
+            kernel32.ReadConsoleInputW(handle, records, count.value, ctypes.byref(count))
+
+
+def _select(readers, timeout):
+    if sys.platform.startswith("win"):
+        # The only input a Windows session waits on is the console.
+        return list(readers) if _wait_console(timeout) else []
+    return select.select(readers, [], [], timeout)[0]
+
+
+class Deadline:
+    """One scheduled deadline; cancel() it once it no longer matters."""
+
+    __slots__ = ("when", "callback", "args", "active")
+
+    def __init__(self, when, callback, args):
+        self.when = when
+        self.callback = callback
+        self.args = args
+        self.active = True
+
+    def cancel(self):
+        self.active = False
+
+
+class DeadlineScheduler:
+    """Per-question timeouts, exam time limits and warnings on one heap.
+
+    Deadlines are kept in a heapq ordered by time, so the next one is
+    always at the front, and wait() sleeps in a single select() call (a
+    wait on the console handle on Windows) until either an input is ready
+    or the next deadline is due: there is no polling loop. Any number of sessions can share one scheduler and
+    wait on their inputs together.
+
+    clock defaults to time.monotonic; pass time.time where callers (and
+    their tests) measure time with the wall clock.
+    """
+
+    def __init__(self, clock=time.monotonic):
+        self.clock = clock
+        self._heap = []
+        self._order = itertools.count()
+
+    def now(self):
+        return self.clock()
+
+    def at(self, when, callback=None, *args):
+        """Schedule callback(*args) for time when (on this clock)."""
+        deadline = Deadline(when, callback, args)
+        heapq.heappush(self._heap, (when, next(self._order), deadline))
+        return deadline
+
+    def after(self, delay, callback=None, *args):
+        return self.at(self.clock() + delay, callback, *args)
+
+    def next_deadline(self):
+        """Time of the earliest active deadline, or None."""
+        heap = self._heap
+        while heap and not heap[0][2].active:
+            heapq.heappop(heap)
+        return heap[0][0] if heap else None
+
+    def poll(self):
+        """Fire every deadline that is due; returns the time it checked."""
+        now = self.clock()
+        heap = self._heap
+        while heap and heap[0][0] <= now:
+            deadline = heapq.heappop(heap)[2]
+            if deadline.active:
+                deadline.active = False
+                if deadline.callback is not None:
+                    deadline.callback(*deadline.args)
+        return now
+
+    def __len__(self):
+        return sum(1 for _, _, d in self._heap if d.active)
+
+    def wait(self, readers, until=None):
+        """Wait until one of readers can be read or the time until.
+
+        Deadlines that fall due meanwhile (warnings, other sessions'
+        timeouts) fire on the way. Returns the ready readers, or [] once
+        until has passed. until=None waits for input alone.
+        """
+        while True:
+            now = self.poll()
+            upcoming = self.next_deadline()
+            if upcoming is not None and (until is None or upcoming < until):
+                timeout, final = max(0.0, upcoming - now), False
+            else:
+                timeout, final = (None if until is None else max(0.0, until - now)), True
+            ready = _select(readers, timeout)
+            if ready:
+                return ready
+            if final:
+                # select only comes back empty once its timeout is over.
+                return []
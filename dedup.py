@@ -0,0 +1,220 @@
+import os
+import re
+import sys
+import json
+import time
+import zlib
+import tempfile
+from array import array
+
+from question_bank import content_id, _normalize
+
+# Near-duplicates are found with MinHash over character shingles of the
+# question text, and LSH banding so each question is only compared with
+# the few others that share a band, not with the whole bank.
+SHINGLE_SIZE = 5
+NUM_PERM = 36
+BANDS = 12
+ROWS = NUM_PERM // BANDS
+_EMPTY = 1 << 32
+# Jaccard similarity of the shingle sets at or above which two questions
+# are reported as near-duplicates.
+THRESHOLD = 0.7
+# Shingles from boilerplate such as "Which of the following" appear in a
+# large share of the bank and would put unrelated questions in the same
+# buckets. Shingles seen in more than COMMON_SHARE of the questions (and
+# at least MIN_COMMON times) are left out of the signatures, like stop
+# words. Counts are kept per hash slot, so memory is fixed.
+COMMON_SHARE = 0.01
+MIN_COMMON = 50
+_COUNT_SLOTS = 1 << 20
+# Buckets stop growing at this size, which bounds the comparisons per
+# question whatever the input looks like.
+MAX_BUCKET = 32
+MAX_REPORTED = 20
+
+_PUNCTUATION = re.compile(r"[^\w\s]")
+
+
+def shingles(text, size=SHINGLE_SIZE):
+    """Set of overlapping n-grams of the normalized text, as UTF-8 bytes."""
+    data = _normalize(_PUNCTUATION.sub(" ", str(text))).encode("utf-8")
+    if len(data) <= size:
+        return {data}
+    return {data[i:i + size] for i in range(len(data) - size + 1)}
+
+
+def _hashes(text):
+    return list(map(zlib.crc32, shingles(text)))
+
+
+def signature(hashes):
+    """MinHash signature of a set of shingle hashes, NUM_PERM values long.
+
+    One-permutation hashing: the low bits of each hash pick a bin and the
+    bin keeps its smallest hash, so every shingle is hashed once rather
+    than NUM_PERM times. Bins no shingle fell into borrow from the next
+    filled bin, so short questions still get a full signature.
+    """
+    # Writing in descending order leaves each bin holding its minimum.
+    bins = {h % NUM_PERM: h for h in sorted(hashes, reverse=True)}
+    sig = [bins.get(i, _EMPTY) for i in range(NUM_PERM)]
+    if len(bins) == NUM_PERM or not bins:
+        return tuple(sig)
+    for i in range(NUM_PERM):
+        if sig[i] == _EMPTY:
+            d = 1
+            while (i + d) % NUM_PERM not in bins:
+                d += 1
+            sig[i] = bins[(i + d) % NUM_PERM] + _EMPTY * d
+    return tuple(sig)
+
+
+def jaccard(a, b):
+    if not a and not b:
+        return 1.0
+    return len(a & b) / len(a | b)
+
+
+def find_duplicates(questions, threshold=THRESHOLD):
+    """Find exact and near-duplicate questions in a list of question dicts.
+
+    Exact duplicates have the same content_id (question and options,
+    normalized). Near-duplicates have question texts whose shingle sets
+    are at least threshold similar; LSH only proposes candidates, each is
+    confirmed with the exact Jaccard similarity. The first occurrence is
+    always the one kept.
+
+    Two linear passes: the first finds exact duplicates and counts
+    shingles, the second signs and buckets the unique questions.
+
+    Returns a report: "total", "kept" (indexes), "exact" [(index,
+    kept_index)], "near" [(index, kept_index, similarity)] and "seconds".
+    """
+    start = time.perf_counter()
+    first_by_id = {}
+    unique, exact = [], []
+    counts = array("I", bytes(4 * _COUNT_SLOTS))
+    mask = _COUNT_SLOTS - 1
+    for i, q in enumerate(questions):
+        uid = content_id(q.get("question", ""), q.get("options"))
+        if uid in first_by_id:
+            exact.append((i, first_by_id[uid]))
+            continue
+        first_by_id[uid] = i
+        unique.append(i)
+        for h in _hashes(q.get("question", "")):
+            counts[h & mask] += 1
+    limit = max(MIN_COMMON, COMMON_SHARE * len(unique))
+
+    buckets = [{} for _ in range(BANDS)]
+    kept, near = [], []
+    for i in unique:
+        text = questions[i].get("question", "")
+        hashes = _hashes(text)
+        sig = signature([h for h in hashes if counts[h & mask] <= limit] or hashes)
+        keys = [sig[b * ROWS:(b + 1) * ROWS] for b in range(BANDS)]
+        candidates = set()
+        for bucket, key in zip(buckets, keys):
+            candidates.update(bucket.get(key, ()))
+        match = None
+        if candidates:
+            grams = shingles(text)
+            for j in sorted(candidates):
+                similarity = jaccard(grams, shingles(questions[j].get("question", "")))
+                if similarity >= threshold and (match is None or similarity > match[1]):
+                    match = (j, similarity)
+        if match is not None:
+            near.append((i, match[0], round(match[1], 3)))
+            continue
+        kept.append(i)
+        for bucket, key in zip(buckets, keys):
+            members = bucket.setdefault(key, [])
+            if len(members) < MAX_BUCKET:
+                members.append(i)
+    return {
+        "total": len(questions),
+        "kept": kept,
+        "exact": exact,
+        "near": near,
+        "seconds": time.perf_counter() - start,
+    }
+
+
+def load_questions(sources):
+    """Valid question dicts from each source, in order.
+
+    A source is "quiz_data" (the built-in questions) or a bank file that
+    bank_loader can stream.
+    """
+    from bank_loader import iter_questions, validate_question
+    questions = []
+    for source in sources:
+        if source == "quiz_data":
+            from quiz_data import ALL_QUIZ_DATA
+            questions.extend(ALL_QUIZ_DATA)
+            continue
+        questions.extend(q for _, q in iter_questions(source) if validate_question(q) is None)
+    return questions
+
+
+def write_merged(questions, indexes, dest):
+    """Write the chosen questions to dest as JSON Lines. Returns the count."""
+    directory = os.path.dirname(os.path.abspath(dest))
+    fd, tmp = tempfile.mkstemp(dir=directory, prefix=".merged-")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            for i in indexes:
+                q = dict(questions[i])
+                q["options"] = list(q["options"])
+                f.write(json.dumps(q, ensure_ascii=False) + "\n")
+        os.replace(tmp, dest)
+    except BaseException:
+        os.remove(tmp)
+        raise
+    return len(indexes)
+
+
+def merge_banks(sources, dest, threshold=THRESHOLD, keep_near=False):
+    """Load several banks, drop duplicates and write the result to dest.
+
+    Exact duplicates are always dropped. Near-duplicates are dropped too
+    unless keep_near is set, since two stems can read alike and still be
+    different questions. Returns (questions, report).
+    """
+    questions = load_questions(sources)
+    report = find_duplicates(questions, threshold)
+    indexes = report["kept"]
+    if keep_near:
+        indexes = sorted(indexes + [i for i, _, _ in report["near"]])
+    report["written"] = write_merged(questions, indexes, dest)
+    return questions, report
+
+
+def print_dedup_report(questions, report):
+    print(f"Checked {report['total']} question(s) in {report['seconds']:.2f}s")
+    print(f"Unique: {len(report['kept'])}  Exact duplicates: {len(report['exact'])}  "
+          f"Near-duplicates: {len(report['near'])}")
+    for i, j in report["exact"][:MAX_REPORTED]:
+        print(f"  exact  #{i + 1} = #{j + 1}: {questions[i]['question'].strip()}")
+    for i, j, similarity in report["near"][:MAX_REPORTED]:
+        print(f"  near   #{i + 1} ~ #{j + 1} ({similarity:.2f}): {questions[i]['question'].strip()}")
+        print(f"                 {questions[j]['question'].strip()}")
+    if "written" in report:
+        print(f"Wrote {report['written']} question(s).")
+
+
+if __name__ == "__main__":
+    args = sys.argv[1:]
+    out = None
+    if len(args) >= 2 and args[0] == "--out":
+        out, args = args[1], args[2:]
+    if not args:
+        print("Usage: python dedup.py [--out merged.jsonl] <quiz_data|questions.json|questions.jsonl>...")
+        sys.exit(2)
+    if out:
+        all_questions, dedup_report = merge_banks(args, out)
+    else:
+        all_questions = load_questions(args)
+        dedup_report = find_duplicates(all_questions)
+    print_dedup_report(all_questions, dedup_report)
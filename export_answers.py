@@ -1,14 +1,7 @@
 import json
 from quiz_data import ALL_QUIZ_DATA, FILL_IN_QUIZ_DATA
-
-
-def _get_option_text(options, correct_letter):
-   
-    correct_letter = correct_letter.strip().upper()
-    for opt in options:
-        if opt.strip().upper().startswith(correct_letter + "."):
-            return opt
-    return f"{correct_letter} (option text not found)"
+from question_bank import question_id, option_text
+from fill_answers import compile_answer
 
 
 def export_answers(filename="exported_answers.json"):
@@ -26,10 +19,11 @@ def export_answers(filename="exported_answers.json"):
         topic = q.get("topic")
         difficulty = q.get("difficulty")
 
-        correct_option_text = _get_option_text(options, correct_letter)
+        correct_option_text = option_text(options, correct_letter)
 
         data["mcq_answers"].append({
             "number": idx,
+            "id": question_id(q),
             "question": question_text,
             "options": options,
             "correct_letter": correct_letter,
@@ -45,10 +39,11 @@ def export_answers(filename="exported_answers.json"):
         topic = q.get("topic")
         difficulty = q.get("difficulty")
 
-        accepted_answers = [a.strip() for a in raw_answer.split("|") if a.strip()]
+        accepted_answers = [a for a in compile_answer(raw_answer).variants if a]
 
         data["fill_in_answers"].append({
             "number": idx,
+            "id": question_id(q),
             "question": question_text,
             "accepted_answers": accepted_answers,
             "raw_answer": raw_answer,
@@ -0,0 +1,123 @@
+import sys
+import importlib
+
+# Where each menu feature lives, as (module, function). A module is only
+# imported the first time one of its features is called, so reaching the
+# main menu costs the same however many features (or questions) there are.
+FEATURES = {
+    "take_quiz": ("mcq_types", "take_quiz"),
+    "take_negative_mark_quiz": ("mcq_types", "take_negative_mark_quiz"),
+    "take_quiz_until_wrong": ("mcq_types", "take_quiz_until_wrong"),
+    "take_quiz_challenge": ("mcq_types", "take_quiz_challenge"),
+    "learning_mode": ("mcq_types", "learning_mode"),
+    "quiz_by_difficulty": ("mcq", "quiz_by_difficulty"),
+    "quiz_by_topic": ("mcq", "quiz_by_topic"),
+    "age_based_quiz": ("mcq", "age_based_quiz"),
+    "fifty_fifty_quiz": ("mcq", "fifty_fifty_quiz"),
+    "take_quiz_with_skip": ("mcq", "take_quiz_with_skip"),
+    "take_fill_in_the_blanks_quiz": ("mcq", "take_fill_in_the_blanks_quiz"),
+    "take_quiz_with_summary": ("mcq", "take_quiz_with_summary"),
+    "take_wrong_answer_quiz": ("wrong_answer_quiz", "take_wrong_answer_quiz"),
+    "get_question_bank": ("bank_loader", "get_question_bank"),
+    "sample_questions": ("sampler", "sample_questions"),
+    "create_assessment": ("manage_assessment", "create_assessment"),
+    "add_question_to_assessment": ("manage_assessment", "add_question_to_assessment"),
+    "edit_question_in_assessment": ("manage_assessment", "edit_question_in_assessment"),
+    "delete_question_from_assessment": ("manage_assessment", "delete_question_from_assessment"),
+    "view_questions_in_assessment": ("manage_assessment", "view_questions_in_assessment"),
+    "open_assessment": ("assessment", "open_assessment"),
+    "show_all_answers": ("answers_viewer", "show_all_answers"),
+    "comparison_menu": ("attempt_comparison", "comparison_menu"),
+    "links_menu": ("answer_links", "links_menu"),
+    "show_all_questions_only": ("questions_viewer", "show_all_questions_only"),
+    "export_questions": ("export_questions", "export_questions"),
+    "export_answers": ("export_answers", "export_answers"),
+    "search_menu": ("search_index", "search_menu"),
+    "certification_menu": ("certification_quiz", "certification_menu"),
+}
+
+
+def register(name, module, attr=None):
+    """Add (or move) a feature; nothing is imported until it is called."""
+    FEATURES[name] = (module, attr or name)
+
+
+def load(name):
+    """The function registered as name, importing its module if needed.
+
+    The function is looked up on every call rather than kept, so patching
+    the owning module still takes effect.
+    """
+    module, attr = FEATURES[name]
+    return getattr(importlib.import_module(module), attr)
+
+
+def lazy(name):
+    """A stand-in for a registered feature that loads it when called."""
+    if name not in FEATURES:
+        raise KeyError(f"unknown feature: {name}")
+
+    def call(*args, **kwargs):
+        return load(name)(*args, **kwargs)
+
+    call.__name__ = call.__qualname__ = name
+    return call
+
+
+def parse_importtime(stderr):
+    """{module: cumulative microseconds} from python -X importtime output."""
+    times = {}
+    for line in stderr.splitlines():
+        parts = line[len("import time:"):].split("|")
+        if not line.startswith("import time:") or len(parts) != 3:
+            continue
+        try:
+            times[parts[2].strip()] = int(parts[1])
+        except ValueError:
+            continue  # the header line
+    return times
+
+
+def startup_benchmark(runs=5, target="main"):
+    """Measure how long the app takes to reach its first menu.
+
+    Imports target under python -X importtime to get the import cost of
+    target itself and of every feature module pulled in with it, then
+    starts main.py, answers "0" at the first menu and takes the best wall
+    time over runs. Returns a dict with "import_us", "feature_modules"
+    (feature modules imported at startup) and "first_menu_seconds".
+    """
+    import os
+    import time
+    import subprocess
+    here = os.path.dirname(os.path.abspath(__file__))
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {target}"],
+        cwd=here, capture_output=True, text=True, check=True,
+    )
+    times = parse_importtime(result.stderr)
+    modules = sorted({m for m, _ in FEATURES.values()} & set(times))
+    best = None
+    for _ in range(runs):
+        start = time.perf_counter()
+        subprocess.run(
+            [sys.executable, os.path.join(here, "main.py")],
+            cwd=here, input="0\n", capture_output=True, text=True, check=True,
+        )
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return {
+        "import_us": times.get(target, 0),
+        "feature_modules": modules,
+        "first_menu_seconds": best,
+    }
+
+
+if __name__ == "__main__":
+    if len(sys.argv) > 2 or (len(sys.argv) == 2 and not sys.argv[1].isdigit()):
+        print("Usage: python features.py [runs]")
+        sys.exit(2)
+    report = startup_benchmark(int(sys.argv[1]) if len(sys.argv) == 2 else 5)
+    print(f"Importing main: {report['import_us'] / 1000:.1f} ms")
+    print(f"Feature modules imported at startup: {', '.join(report['feature_modules']) or 'none'}")
+    print(f"Start to first menu and exit: {report['first_menu_seconds'] * 1000:.1f} ms (best run)")
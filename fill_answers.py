@@ -0,0 +1,110 @@
+import re
+from functools import lru_cache
+
+from question_bank import _normalize, data_version
+
+# A question may also list regular expressions under this key, each
+# matched (case-insensitively) against the whole normalized guess, e.g.
+# ["colou?r", "(the )?mitochondri(a|on)"]. The "answer" string itself is
+# always taken literally.
+PATTERNS_KEY = "answer_patterns"
+
+
+class FillAnswer:
+    """The accepted answers of one fill-in question, compiled once.
+
+    variants are the "|"-separated answers as written, for display;
+    accepted is a frozenset of their normalized forms, so checking a
+    guess is a single hash lookup. patterns holds the compiled regular
+    expressions; a bad one raises ValueError here, when the question is
+    loaded, rather than while a learner is being graded.
+    """
+
+    __slots__ = ("raw", "variants", "accepted", "patterns")
+
+    def __init__(self, raw, patterns=()):
+        self.raw = raw
+        self.variants = tuple(a.strip() for a in str(raw).split("|"))
+        self.accepted = frozenset(_normalize(v) for v in self.variants)
+        compiled = []
+        for pattern in patterns:
+            try:
+                compiled.append(re.compile(pattern, re.IGNORECASE))
+            except re.error as e:
+                raise ValueError(f"invalid answer pattern {pattern!r}: {e}") from None
+        self.patterns = tuple(compiled)
+
+    def accepts(self, normalized):
+        """True if an already normalized guess is correct."""
+        if normalized in self.accepted:
+            return True
+        return any(p.fullmatch(normalized) for p in self.patterns)
+
+    def check(self, guess):
+        return self.accepts(_normalize(guess))
+
+
+@lru_cache(maxsize=4096)
+def compile_answer(raw, patterns=()):
+    """The FillAnswer for a raw "a|b" answer string and a tuple of patterns (cached)."""
+    return FillAnswer(raw, patterns)
+
+
+def as_fill_answer(answer):
+    """answer as a FillAnswer: compiled ones (with their patterns) are kept, raw strings compiled."""
+    return answer if isinstance(answer, FillAnswer) else compile_answer(answer)
+
+
+_compiled = {}
+
+
+def get_fill_answers(data):
+    """FillAnswers for a list of fill-in question dicts, in order.
+
+    Cached by list identity and data_version like question_bank.get_bank,
+    so each list is compiled once and only again after it changes.
+    """
+    version = data_version(data)
+    cached = _compiled.get(id(data))
+    if cached is not None and cached[0] is data and cached[1] == version:
+        return cached[2]
+    if len(_compiled) >= 16:
+        _compiled.clear()
+    answers = []
+    for i, q in enumerate(data, start=1):
+        try:
+            answers.append(compile_answer(q.get("answer", ""), tuple(q.get(PATTERNS_KEY) or ())))
+        except ValueError as e:
+            raise ValueError(f"fill-in question {i}: {e}") from None
+    _compiled[id(data)] = (data, version, answers)
+    return answers
+
+
+def grade_fill(answers, submissions):
+    """Grade many submissions against the same fill-in questions at once.
+
+    answers holds one FillAnswer (from get_fill_answers, so the question's
+    answer_patterns count) or raw answer string per question, and
+    each submission is a list of guesses in question order; a missing
+    guess counts as wrong. Every answer is compiled once for the whole
+    batch, and a guess that several learners gave is only normalized and
+    looked up once per question.
+
+    Returns one (score, [correct, ...]) per submission.
+    """
+    compiled = [as_fill_answer(a) for a in answers]
+    seen = [{} for _ in compiled]
+    results = []
+    for guesses in submissions:
+        marks = []
+        for i, answer in enumerate(compiled):
+            guess = guesses[i] if i < len(guesses) else None
+            if guess is None:
+                marks.append(False)
+                continue
+            mark = seen[i].get(guess)
+            if mark is None:
+                mark = seen[i][guess] = answer.check(guess)
+            marks.append(mark)
+        results.append((sum(marks), marks))
+    return results
@@ -0,0 +1,170 @@
+import os
+import sys
+import json
+from bisect import bisect_right
+
+from utils import iter_scores, atomic_write_json, file_lock, migrate_scores, read_scores_from
+from storage_backend import use_sqlite, get_sqlite_store
+import score_buffer
+
+LEADERBOARD_FILE = "high_scores_top.json"
+LEADERBOARD_SIZE = 100
+
+
+def _empty_board():
+    # offset is how far into the score journal the board has been applied.
+    return {"size": LEADERBOARD_SIZE, "count": 0, "offset": 0, "overall": [], "by_mode": {}}
+
+
+def _insert(entries, record, size):
+    # Entries are kept sorted by score, highest first; equal scores keep
+    # the order they were recorded in.
+    keys = [-e["score"] for e in entries]
+    pos = bisect_right(keys, -record["score"])
+    if pos >= size:
+        return
+    entries.insert(pos, record)
+    del entries[size:]
+
+
+def _add_to_board(board, record):
+    entry = {
+        "name": record.get("name"),
+        "score": record.get("score", 0),
+        "mode": record.get("mode"),
+    }
+    board["count"] += 1
+    _insert(board["overall"], entry, board["size"])
+    if entry["mode"]:
+        _insert(board["by_mode"].setdefault(entry["mode"], []), entry, board["size"])
+
+
+def _load_board():
+    if not os.path.exists(LEADERBOARD_FILE):
+        return None
+    try:
+        with open(LEADERBOARD_FILE, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, json.JSONDecodeError):
+        return None
+
+
+def _save_board(board):
+    atomic_write_json(LEADERBOARD_FILE, board)
+
+
+def _board_from_scores(scores):
+    board = _empty_board()
+    for record in scores:
+        _add_to_board(board, record)
+    return board
+
+
+def _rebuild_board():
+    records, offset = read_scores_from(0)
+    board = _board_from_scores(records)
+    board["offset"] = offset
+    _save_board(board)
+    return board
+
+
+def rebuild_leaderboard():
+    migrate_scores()
+    with file_lock(LEADERBOARD_FILE):
+        return _rebuild_board()
+
+
+def sync_leaderboard():
+    """Apply every journal line the board has not seen yet, in one rewrite.
+
+    Processes that finish together queue on the lock. The first one in
+    applies everybody's records, so the rest find nothing new and return
+    without rewriting the file.
+    """
+    migrate_scores()
+    with file_lock(LEADERBOARD_FILE):
+        board = _load_board()
+        if board is None or "offset" not in board:
+            return _rebuild_board()
+        pending = read_scores_from(board["offset"])
+        if pending is None:
+            return _rebuild_board()
+        records, offset = pending
+        if offset == board["offset"]:
+            return board
+        for record in records:
+            _add_to_board(board, record)
+        board["offset"] = offset
+        _save_board(board)
+        return board
+
+
+def get_top_scores(n=10, mode=None):
+    score_buffer.flush()
+    if use_sqlite():
+        return [
+            {"name": r.get("name"), "score": r.get("score", 0), "mode": r.get("mode")}
+            for r in get_sqlite_store().top_scores(n, mode)
+        ]
+    board = _load_board()
+    if board is None:
+        board = rebuild_leaderboard()
+    if mode is None:
+        entries = board["overall"]
+    else:
+        entries = board["by_mode"].get(mode, [])
+    return entries[:n]
+
+
+def _sqlite_board(expected):
+    # SQLite has no sidecar file: its top-N queries take the board's place.
+    return {
+        "count": expected["count"],
+        "overall": get_top_scores(LEADERBOARD_SIZE),
+        "by_mode": {mode: get_top_scores(LEADERBOARD_SIZE, mode) for mode in expected["by_mode"]},
+    }
+
+
+def check_leaderboard():
+    """Compare the sidecar file with a fresh rebuild from the raw scores.
+
+    On SQLite, where no sidecar is kept, the top-N queries are compared
+    instead. Returns a list of problems; an empty list means the index is
+    consistent.
+    """
+    expected = _board_from_scores(iter_scores())
+    if use_sqlite():
+        stored = _sqlite_board(expected)
+    else:
+        stored = _load_board()
+        if stored is None:
+            return ["Leaderboard file is missing or unreadable."]
+    problems = []
+    if stored.get("count") != expected["count"]:
+        problems.append(
+            f"Indexed {stored.get('count')} scores but the store holds {expected['count']}."
+        )
+    if stored.get("overall") != expected["overall"]:
+        problems.append("Overall top scores do not match the raw scores.")
+    modes = set(stored.get("by_mode", {})) | set(expected["by_mode"])
+    for mode in sorted(modes):
+        if stored.get("by_mode", {}).get(mode) != expected["by_mode"].get(mode):
+            problems.append(f"Top scores for mode '{mode}' do not match the raw scores.")
+    return problems
+
+
+if __name__ == "__main__":
+    command = sys.argv[1] if len(sys.argv) > 1 else "check"
+    if command == "rebuild":
+        board = rebuild_leaderboard()
+        print(f"Leaderboard rebuilt from {board['count']} scores.")
+    elif command == "check":
+        problems = check_leaderboard()
+        if problems:
+            for p in problems:
+                print(p)
+            sys.exit(1)
+        print("Leaderboard is consistent with the score store.")
+    else:
+        print("Usage: python leaderboard.py [rebuild|check]")
+        sys.exit(2)
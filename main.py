@@ -1,21 +1,66 @@
-from mcq import menu, quiz_by_difficulty, age_based_quiz, fifty_fifty_quiz, take_quiz_with_skip, take_fill_in_the_blanks_quiz, take_quiz_with_summary, quiz_by_topic
-from mcq_types import take_quiz, timed_quiz, take_negative_mark_quiz, take_quiz_until_wrong, take_quiz_challenge, learning_mode
-from storage import check_high_score
-from assessment_storage import load_custom_assessments, save_custom_assessments
-from assessment import open_assessment
-from manage_assessment import create_assessment, add_question_to_assessment, edit_question_in_assessment, delete_question_from_assessment, view_questions_in_assessment
-from quiz_data import ALL_QUIZ_DATA, FILL_IN_QUIZ_DATA
-from attempts import can_attempt_quiz, record_quiz_attempt
-from answers_viewer import show_all_answers
-from attempt_comparison import comparison_menu
-from answer_links import links_menu
-from questions_viewer import show_all_questions_only
-from wrong_answer_quiz import take_wrong_answer_quiz
-from export_questions import export_questions
-from export_answers import export_answers
-from certification_quiz import certification_menu
-from utils import load_scores, save_scores, print_results
-
+import sys
+
+from features import lazy
+
+# Feature modules are imported on first use (see features.py), so the
+# first menu appears without loading every mode, tool and the question
+# bank up front.
+take_quiz = lazy("take_quiz")
+take_negative_mark_quiz = lazy("take_negative_mark_quiz")
+take_quiz_until_wrong = lazy("take_quiz_until_wrong")
+take_quiz_challenge = lazy("take_quiz_challenge")
+learning_mode = lazy("learning_mode")
+quiz_by_difficulty = lazy("quiz_by_difficulty")
+quiz_by_topic = lazy("quiz_by_topic")
+age_based_quiz = lazy("age_based_quiz")
+fifty_fifty_quiz = lazy("fifty_fifty_quiz")
+take_quiz_with_skip = lazy("take_quiz_with_skip")
+take_fill_in_the_blanks_quiz = lazy("take_fill_in_the_blanks_quiz")
+take_quiz_with_summary = lazy("take_quiz_with_summary")
+take_wrong_answer_quiz = lazy("take_wrong_answer_quiz")
+get_question_bank = lazy("get_question_bank")
+sample_questions = lazy("sample_questions")
+create_assessment = lazy("create_assessment")
+add_question_to_assessment = lazy("add_question_to_assessment")
+edit_question_in_assessment = lazy("edit_question_in_assessment")
+delete_question_from_assessment = lazy("delete_question_from_assessment")
+view_questions_in_assessment = lazy("view_questions_in_assessment")
+open_assessment = lazy("open_assessment")
+show_all_answers = lazy("show_all_answers")
+comparison_menu = lazy("comparison_menu")
+links_menu = lazy("links_menu")
+show_all_questions_only = lazy("show_all_questions_only")
+export_questions = lazy("export_questions")
+export_answers = lazy("export_answers")
+search_menu = lazy("search_menu")
+certification_menu = lazy("certification_menu")
+
+
+QUIZ_DATA_NAMES = ("ALL_QUIZ_DATA", "FILL_IN_QUIZ_DATA")
+
+
+def __getattr__(name):
+    """main.ALL_QUIZ_DATA and main.FILL_IN_QUIZ_DATA, imported on first use."""
+    if name in QUIZ_DATA_NAMES:
+        import quiz_data
+        return getattr(quiz_data, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def _quiz_data(name):
+    # Looked up on the module so a value set on main (e.g. by a test)
+    # wins over the lazy import in __getattr__.
+    return getattr(sys.modules[__name__], name)
+
+
+def menu():
+    print("\n====== QUIZ MENU ======")
+    print("1. Quick quiz")
+    print("2. Quiz modes")
+    print("3. Assessments")
+    print("4. Review & tools")
+    print("5. Certification exam")
+    print("0. Exit")
 
 
 def quiz_modes_menu():
@@ -37,41 +82,36 @@ def quiz_modes_menu():
         print("0. Back")
         choice = input("Enter choice: ").strip()
 
-        questions = [q['question'] for q in ALL_QUIZ_DATA]
-        options = [q['options'] for q in ALL_QUIZ_DATA]
-        answers = [q['answer'] for q in ALL_QUIZ_DATA]
+        bank = get_question_bank(_quiz_data("ALL_QUIZ_DATA"))
+        questions, options, answers = bank.questions, bank.options, bank.answers
 
         if choice == "1":
             name = input("Enter your name: ")
             try:
-                total_questions = int(input(f"How many questions do you want to take? (1 to {len(ALL_QUIZ_DATA)}): "))
-                if not (1 <= total_questions <= len(ALL_QUIZ_DATA)):
+                total_questions = int(input(f"How many questions do you want to take? (1 to {len(bank)}): "))
+                if not (1 <= total_questions <= len(bank)):
                     print("Invalid number, displaying all questions.")
-                    total_questions = len(ALL_QUIZ_DATA)
+                    total_questions = len(bank)
             except ValueError:
                 print("Invalid input, displaying all questions.")
-                total_questions = len(ALL_QUIZ_DATA)
+                total_questions = len(bank)
 
-            import random
-            selected = random.sample(ALL_QUIZ_DATA, total_questions)
-            qs = [q['question'] for q in selected]
-            opts = [q['options'] for q in selected]
-            ans = [q['answer'] for q in selected]
+            qs, opts, ans = bank.select(sample_questions(bank, total_questions))
             take_quiz(qs, opts, ans, name, timed=True)
 
         elif choice == "2":
-            quiz_by_difficulty(ALL_QUIZ_DATA)
+            quiz_by_difficulty(bank)
 
         elif choice == "3":
             name = input("Enter your name: ")
             try:
-                total_questions = int(input(f"How many questions do you want to take? (1 to {len(ALL_QUIZ_DATA)}): "))
-                if not (1 <= total_questions <= len(ALL_QUIZ_DATA)):
+                total_questions = int(input(f"How many questions do you want to take? (1 to {len(bank)}): "))
+                if not (1 <= total_questions <= len(bank)):
                     print("Invalid number, displaying all questions.")
-                    total_questions = len(ALL_QUIZ_DATA)
+                    total_questions = len(bank)
             except ValueError:
                 print("Invalid input, displaying all questions.")
-                total_questions = len(ALL_QUIZ_DATA)
+                total_questions = len(bank)
             try:
                 negative_mark = float(input("Enter negative mark per wrong answer (e.g., 0.25): "))
                 if negative_mark < 0:
@@ -80,32 +120,25 @@ def quiz_modes_menu():
             except ValueError:
                 print("Invalid input. Using 0.25 as negative marking.")
                 negative_mark = 0.25
-            import random
-            selected = random.sample(ALL_QUIZ_DATA, total_questions)
-            qs = [q['question'] for q in selected]
-            opts = [q['options'] for q in selected]
-            ans = [q['answer'] for q in selected]
+            qs, opts, ans = bank.select(sample_questions(bank, total_questions))
             take_negative_mark_quiz(qs, opts, ans, name=name, neg_mark=negative_mark)
 
         elif choice == "4":
-            age_based_quiz(ALL_QUIZ_DATA)
+            age_based_quiz(bank)
 
         elif choice == "5":
             name = input("Enter your name: ")
             try:
-                total_questions = int(input(f"How many questions do you want to take? (1 to {len(ALL_QUIZ_DATA)}): "))
-                if not (1 <= total_questions <= len(ALL_QUIZ_DATA)):
+                total_questions = int(input(f"How many questions do you want to take? (1 to {len(bank)}): "))
+                if not (1 <= total_questions <= len(bank)):
                     print("Invalid number, using all questions.")
-                    total_questions = len(ALL_QUIZ_DATA)
+                    total_questions = len(bank)
             except ValueError:
                 print("Invalid input, using all questions.")
-                total_questions = len(ALL_QUIZ_DATA)
+                total_questions = len(bank)
 
-            import random
-            selected = random.sample(ALL_QUIZ_DATA, total_questions)
-            qs = [q['question'] for q in selected]
-            opts = [tuple(q['options']) for q in selected]
-            ans = [q['answer'] for q in selected]
+            qs, opts, ans = bank.select(sample_questions(bank, total_questions))
+            opts = [tuple(o) for o in opts]
             fifty_fifty_quiz(qs, opts, ans, name)
 
         elif choice == "6":
@@ -118,19 +151,16 @@ def quiz_modes_menu():
 
         elif choice == "8":
             name = input("Enter your name: ")
-            import random
-            total_questions = len(ALL_QUIZ_DATA)
-            selected = random.sample(ALL_QUIZ_DATA, total_questions)
-            qs = [q['question'] for q in selected]
-            opts = [q['options'] for q in selected]
-            ans = [q['answer'] for q in selected]
+            total_questions = len(bank)
+            qs, opts, ans = bank.select(sample_questions(bank, total_questions))
             take_quiz_with_skip(qs, opts, ans, name=name)
 
         elif choice == "9":
             name = input("Enter your name: ").strip()
             import random
 
-            available = len(FILL_IN_QUIZ_DATA)
+            fill_data = _quiz_data("FILL_IN_QUIZ_DATA")
+            available = len(fill_data)
             if available == 0:
                 print("No fill-in-the-blanks questions available yet.")
                 continue
@@ -143,9 +173,11 @@ def quiz_modes_menu():
                 print("Invalid input, using all fill-in-the-blanks questions.")
                 total_questions = available
 
-            selected = random.sample(FILL_IN_QUIZ_DATA, total_questions)
-            qs = [q['question'] for q in selected]
-            ans = [q['answer'] for q in selected]
+            from fill_answers import get_fill_answers
+            fill_answers = get_fill_answers(fill_data)
+            picked = random.sample(range(available), total_questions)
+            qs = [fill_data[i]['question'] for i in picked]
+            ans = [fill_answers[i] for i in picked]
             take_fill_in_the_blanks_quiz(qs, ans, name=name)
 
         elif choice == "10":
@@ -154,21 +186,15 @@ def quiz_modes_menu():
 
         elif choice == "11":
             name = input("Enter your name: ")
-            import random
-            total_questions = len(ALL_QUIZ_DATA)
-            selected = random.sample(ALL_QUIZ_DATA, total_questions)
-            qs = [q['question'] for q in selected]
-            opts = [q['options'] for q in selected]
-            ans = [q['answer'] for q in selected]
+            total_questions = len(bank)
+            qs, opts, ans = bank.select(sample_questions(bank, total_questions))
             take_quiz_with_summary(qs, opts, ans, name=name)
 
         elif choice == "12":
-            questions = [q['question'] for q in ALL_QUIZ_DATA]
-            answers = [q['answer'] for q in ALL_QUIZ_DATA]
             learning_mode(questions, answers)
             
         elif choice == "13":
-            quiz_by_topic(ALL_QUIZ_DATA)
+            quiz_by_topic(bank)
 
         elif choice == "0":
             break
@@ -220,6 +246,7 @@ def review_tools_menu():
         print("4. See all questions")
         print("5. Export all questions")
         print("6. Export all answers")
+        print("7. Search questions and answers")
         print("0. Back")
         choice = input("Enter choice: ").strip()
 
@@ -237,6 +264,8 @@ def review_tools_menu():
         elif choice == "6":
             filename = input("Enter filename (default: exported_answers.json): ").strip() or "exported_answers.json"
             export_answers(filename)
+        elif choice == "7":
+            search_menu()
         elif choice == "0":
             break
         else:
@@ -251,20 +280,17 @@ def main():
 
         if choice == "1":
             name = input("Enter your name: ")
-            import random
+            bank = get_question_bank(_quiz_data("ALL_QUIZ_DATA"))
             try:
-                total_questions = int(input(f"How many questions do you want to take? (1 to {len(ALL_QUIZ_DATA)}): "))
-                if not (1 <= total_questions <= len(ALL_QUIZ_DATA)):
+                total_questions = int(input(f"How many questions do you want to take? (1 to {len(bank)}): "))
+                if not (1 <= total_questions <= len(bank)):
                     print("Invalid number, displaying all questions.")
-                    total_questions = len(ALL_QUIZ_DATA)
+                    total_questions = len(bank)
             except ValueError:
                 print("Invalid input, displaying all questions.")
-                total_questions = len(ALL_QUIZ_DATA)
+                total_questions = len(bank)
 
-            selected = random.sample(ALL_QUIZ_DATA, total_questions)
-            qs = [q['question'] for q in selected]
-            opts = [q['options'] for q in selected]
-            ans = [q['answer'] for q in selected]
+            qs, opts, ans = bank.select(sample_questions(bank, total_questions))
             take_quiz(qs, opts, ans, name)
 
         elif choice == "2":
@@ -1,5 +1,10 @@
-from assessment_storage import load_custom_assessments, save_custom_assessments
+from assessment_storage import stored_assessments, add_custom_assessment, save_assessment
 from mcq import take_quiz
+from search_index import SearchIndex, add_assessment, search_then_select
+
+# Assessments longer than this are not printed in full when picking a
+# question; the user searches for it instead.
+LIST_LIMIT = 20
 
 def create_assessment():
     custom_questions = []
@@ -17,23 +22,44 @@ def create_assessment():
         custom_questions.append(q)
         custom_options.append(tuple(opts))
         custom_answers.append(ans)
-    assessments = load_custom_assessments()
-    assessments.append({"name": name, "questions": custom_questions, "options": custom_options, "answers": custom_answers})
-    save_custom_assessments(assessments)
+    add_custom_assessment({"name": name, "questions": custom_questions, "options": custom_options, "answers": custom_answers})
     print(f"Assessment '{name}' created and saved!")
     take_now = input("Take this assessment now? (y/n): ").strip().lower()
     if take_now == 'y':
         take_quiz(custom_questions, custom_options, custom_answers)
 
 
+def _select_question(assessment, prompt):
+    """0-based index of the question the user picks, or None."""
+    questions = assessment["questions"]
+    if len(questions) <= LIST_LIMIT:
+        for i, q in enumerate(questions):
+            print(f"{i+1}. {q}")
+        try:
+            return int(input(f"{prompt}: ")) - 1
+        except:
+            print("Invalid input.")
+            return None
+    print(f"This assessment has {len(questions)} questions.")
+    index = SearchIndex()
+    add_assessment(index, assessment, kind="ASSESSMENT")
+    number = search_then_select(prompt, "ASSESSMENT", index)
+    return None if number is None else number - 1
+
+
 def list_assessments():
-    assessments = load_custom_assessments()
+    """Print the saved assessments' names from the catalog and return them.
+
+    Returns StoredAssessment entries; only the one the user picks needs
+    its questions read, with load().
+    """
+    assessments = stored_assessments()
     if not assessments:
         print("No assessments saved yet.")
         return None
     print("\nSaved assessments:")
     for i, a in enumerate(assessments):
-        print(f"{i+1}. {a['name']}")
+        print(f"{i+1}. {a.name}")
     return assessments
 
 
@@ -43,7 +69,7 @@ def add_question_to_assessment():
 
     try:
         sel = int(input("Select assessment to add a question: ")) - 1
-        assessment = assessments[sel]
+        stored = assessments[sel]
     except:
         print("Invalid input.")
         return
@@ -55,10 +81,11 @@ def add_question_to_assessment():
         opts.append(f"{j}. {opt}")
     ans = input("Enter correct answer (A/B/C/D): ").strip().upper()
 
+    assessment = stored.load()
     assessment["questions"].append(q)
     assessment["options"].append(tuple(opts))
     assessment["answers"].append(ans)
-    save_custom_assessments(assessments)
+    save_assessment(stored.assessment_id, assessment)
     print("Question added successfully!")
 
 
@@ -68,18 +95,14 @@ def edit_question_in_assessment():
 
     try:
         sel = int(input("Select assessment to edit: ")) - 1
-        assessment = assessments[sel]
+        stored = assessments[sel]
     except:
         print("Invalid selection.")
         return
 
-    for i, q in enumerate(assessment["questions"]):
-        print(f"{i+1}. {q}")
-
-    try:
-        q_idx = int(input("Select a question number to edit: ")) - 1
-    except:
-        print("Invalid input.")
+    assessment = stored.load()
+    q_idx = _select_question(assessment, "Select a question number to edit")
+    if q_idx is None:
         return
 
     if q_idx < 0 or q_idx >= len(assessment["questions"]):
@@ -101,7 +124,7 @@ def edit_question_in_assessment():
     if new_ans:
         assessment["answers"][q_idx] = new_ans
 
-    save_custom_assessments(assessments)
+    save_assessment(stored.assessment_id, assessment)
     print("Question updated!")
 
 
@@ -111,18 +134,14 @@ def delete_question_from_assessment():
 
     try:
         sel = int(input("Select assessment: ")) - 1
-        assessment = assessments[sel]
+        stored = assessments[sel]
     except:
         print("Invalid input.")
         return
 
-    for i, q in enumerate(assessment["questions"]):
-        print(f"{i+1}. {q}")
-
-    try:
-        q_idx = int(input("Select a question number to delete: ")) - 1
-    except:
-        print("Invalid input.")
+    assessment = stored.load()
+    q_idx = _select_question(assessment, "Select a question number to delete")
+    if q_idx is None:
         return
 
     if q_idx < 0 or q_idx >= len(assessment["questions"]):
@@ -132,19 +151,19 @@ def delete_question_from_assessment():
     removed = assessment["questions"].pop(q_idx)
     assessment["options"].pop(q_idx)
     assessment["answers"].pop(q_idx)
-    save_custom_assessments(assessments)
+    save_assessment(stored.assessment_id, assessment)
     print(f"Deleted: {removed}")
 
 
 def view_questions_in_assessment():
-    assessments = load_custom_assessments()
+    assessments = stored_assessments()
     if not assessments:
         print("No assessments saved yet.")
         return
 
     print("\nSaved assessments:")
     for idx, a in enumerate(assessments):
-        print(f"{idx + 1}. {a['name']}")
+        print(f"{idx + 1}. {a.name}")
 
     try:
         sel = int(input("Select an assessment to view: ")) - 1
@@ -156,7 +175,7 @@ def view_questions_in_assessment():
         print("Invalid selection.")
         return
 
-    assessment = assessments[sel]
+    assessment = assessments[sel].load()
     print(f"\n--- Assessment: {assessment['name']} ---")
 
     questions = assessment.get("questions", [])
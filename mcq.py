@@ -2,40 +2,33 @@ import sys
 import time
 import random
 from mcq_types import take_quiz, timed_quiz
-from utils import print_results, load_scores, save_scores
+from utils import print_results, record_score
+from question_bank import get_bank, letter_map
+from sampler import sample_questions
+from fill_answers import as_fill_answer
+from session import QuizSession, SkipAware
+from deadlines import DeadlineScheduler
+from render import Screen, paint, show
 
 def _normalize_text(s: str) -> str:
     return " ".join(s.strip().lower().split())
 
 
-def menu():
-    print("\n====== QUIZ MENU ======")
-    print("1. Quick quiz")                 
-    print("2. Quiz modes")                
-    print("3. Assessments")              
-    print("4. Review & tools")           
-    print("5. Certification exam")       
-    print("0. Exit")
-    
-
 def quiz_by_topic(ALL_QUIZ_DATA):
-    topics = sorted(list(set(q['topic'] for q in ALL_QUIZ_DATA)))
+    bank = get_bank(ALL_QUIZ_DATA)
+    topics = bank.topics()
     if not topics:
         print("No topics found in the quiz data.")
         return
     print("Select a topic:")
     for idx, topic in enumerate(topics):
-        count = sum(1 for q in ALL_QUIZ_DATA if q['topic'] == topic)
+        count = bank.count(topic=topic)
         print(f"{idx + 1}. {topic} ({count} questions)")
     try:
         topic_index = int(input("Enter topic number: ")) - 1
         if 0 <= topic_index < len(topics):
             selected_topic = topics[topic_index]
-            selected_data = [q for q in ALL_QUIZ_DATA if q['topic'] == selected_topic]
-
-            questions = [q['question'] for q in selected_data]
-            options = [q['options'] for q in selected_data]
-            answers = [q['answer'] for q in selected_data]
+            questions, options, answers = bank.select(bank.ids(topic=selected_topic))
             
             take_quiz(questions, options, answers)
         else:
@@ -45,24 +38,23 @@ def quiz_by_topic(ALL_QUIZ_DATA):
 
 
 def quiz_by_difficulty(ALL_QUIZ_DATA):
-    levels = sorted(list(set(q['difficulty'] for q in ALL_QUIZ_DATA)))
+    bank = get_bank(ALL_QUIZ_DATA)
+    levels = bank.difficulties()
     print("Select a difficulty level:")
     for idx, level in enumerate(levels):
-        count = sum(1 for q in ALL_QUIZ_DATA if q['difficulty'] == level)
+        count = bank.count(difficulty=level)
         print(f"{idx + 1}. {level} ({count} questions)")
     try:
         idx = int(input("Enter choice: ")) - 1
         
         if 0 <= idx < len(levels):
             selected_level = levels[idx]
-            selected_data = [q for q in ALL_QUIZ_DATA if q['difficulty'] == selected_level]
-            if not selected_data:
+            selected_ids = bank.ids(difficulty=selected_level)
+            if not selected_ids:
                 print("No questions for this level.")
                 return
 
-            questions = [q['question'] for q in selected_data]
-            options = [q['options'] for q in selected_data]
-            answers = [q['answer'] for q in selected_data]
+            questions, options, answers = bank.select(selected_ids)
             
             take_quiz(questions, options, answers)
         else:
@@ -72,7 +64,6 @@ def quiz_by_difficulty(ALL_QUIZ_DATA):
 
 
 def age_based_quiz(ALL_QUIZ_DATA):
-    import random
      
     name = input("Enter your name: ")
 
@@ -96,16 +87,13 @@ def age_based_quiz(ALL_QUIZ_DATA):
     print(f"Using questions with difficulties: {', '.join(allowed_difficulties)}")
 
     
-    filtered_questions = [
-        q for q in ALL_QUIZ_DATA if q["difficulty"] in allowed_difficulties
-    ]
+    bank = get_bank(ALL_QUIZ_DATA)
+    max_q = sum(bank.count(difficulty=level) for level in allowed_difficulties)
 
-    if not filtered_questions:
+    if not max_q:
         print("No questions available for this age group.")
         return
 
-    max_q = len(filtered_questions)
-
     
     try:
         total_questions = int(
@@ -119,21 +107,16 @@ def age_based_quiz(ALL_QUIZ_DATA):
         total_questions = max_q
 
     
-    selected = random.sample(filtered_questions, total_questions)
-    qs = [q["question"] for q in selected]
-    opts = [q["options"] for q in selected]
-    ans = [q["answer"] for q in selected]
+    qs, opts, ans = bank.select(
+        sample_questions(bank, total_questions, difficulties=allowed_difficulties)
+    )
 
     
     take_quiz(qs, opts, ans, name=name)
 
 
 def fifty_fifty(options, correct_letter):
-    correct_idx = None
-    for i, opt in enumerate(options):
-        if opt.strip().upper().startswith(correct_letter.upper() + "."):
-            correct_idx = i
-            break
+    correct_idx = letter_map(options).get(correct_letter.strip().upper())
     wrong_indices = [i for i in range(len(options)) if i != correct_idx]
     keep_wrong = random.choice(wrong_indices)
     keep_indices = {correct_idx, keep_wrong}
@@ -142,119 +125,88 @@ def fifty_fifty(options, correct_letter):
 
 def fifty_fifty_quiz(questions, options, answers, name=None):
     print("\n===== 50 - 50 LIFELINE QUIZ =====")
-    guesses = []
-    score = 0
-    total = len(questions)
-    for i, question in enumerate(questions):
-        print("\n--------------------------")
-        print(question)
-        for opt in options[i]:
-            print(opt)
+    session = QuizSession(questions, options, answers)
+    while True:
+        current = session.next_question()
+        if current is None:
+            break
+        _, question, opts = current
+        paint(Screen("\n--------------------------", question, *opts))
         use = input("Press 'F' to use 50-50 or press Enter to continue: ").strip().upper()
-        current_options = options[i]
         if use == "F":
-            current_options = fifty_fifty(options[i], answers[i])
-            print("\n50-50 Applied! Remaining options:")
-            for opt in current_options:
-                print(opt)
+            show(Screen("\n50-50 Applied! Remaining options:", *session.use_lifeline()))
         guess = input("Enter (A, B, C, D): ").strip().upper()
-        guesses.append(guess)
-        
-        if guess == answers[i]:
-            score += 1
+        outcome = session.submit(guess)
+
+        if outcome["correct"]:
             print("CORRECT!")
         else:
             print("INCORRECT!")
-            print(f"The correct answer was: {answers[i]}")
-    percent = int((score / total) * 100)
+            print(f"The correct answer was: {outcome['answer']}")
+    result = session.result()
 
-    print("\n===== RESULTS =====")
-    print(f"Your score: {score} / {total}")
-    print(f"Percentage: {percent}%")
+    show(Screen("\n===== RESULTS =====",
+                f"Your score: {result['score']} / {result['total']}",
+                f"Percentage: {result['percent']}%"))
 
     if name:
-        scores = load_scores()
-        scores.append({"name": name, "score": percent})
-        save_scores(scores)
+        record_score(name, result["percent"], mode="fifty_fifty")
 
 
 def take_quiz_with_skip(questions, options, answers, name=None):
     
-    guesses = []
-    score = 0
-    skipped = 0
-    total = len(questions)
+    session = QuizSession(questions, options, answers, SkipAware())
 
     print("\n===== QUIZ (WITH SKIP) =====")
     print("You can:")
     print("  - Enter A, B, C, or D to answer")
     print("  - Enter S or just press Enter to SKIP a question\n")
 
-    for i, question in enumerate(questions):
-        print("----------------------")
-        print(f"Q{i+1}. {question}")
-        for option in options[i]:
-            print(option)
+    while True:
+        current = session.next_question()
+        if current is None:
+            break
+        i, question, opts = current
+        paint(Screen("----------------------", f"Q{i+1}. {question}", *opts))
 
         while True:
             user_input = input("Enter (A, B, C, D) or S to skip: ").strip().upper()
 
             
             if user_input == "" or user_input == "S":
-                guess = "S"       
-                skipped += 1
+                outcome = session.skip()
                 print("Question skipped.")
                 break
             elif user_input in ("A", "B", "C", "D"):
-                guess = user_input
+                outcome = session.submit(user_input)
                 break
             else:
                 print("Invalid input. Please enter A, B, C, D, or S to skip.")
 
-        guesses.append(guess)
-
-        if guess == answers[i]:
-            score += 1
+        if outcome["correct"]:
             print("CORRECT!")
-        elif guess != "S":
+        elif not outcome["skipped"]:
             print("INCORRECT!")
-            print(f"{answers[i]} is the correct answer")
-
-    
-    print("----------------------")
-    print("     SKIP QUIZ RESULTS")
-    print("----------------------")
-    print("Answers: ", end="")
-    for answer in answers:
-        print(answer, end=" ")
-    print()
-
-    print("Guesses: ", end="")
-    for guess in guesses:
-        print(guess, end=" ")
-    print()
-
-    answered = total - skipped
-    if answered > 0:
-        percent = int((score / answered) * 100)
-    else:
-        percent = 0
-
-    print(f"\nTotal questions : {total}")
-    print(f"Answered        : {answered}")
-    print(f"Skipped         : {skipped}")
-    print(f"Correct         : {score}")
-    print(f"Your score is   : {percent}% (based only on answered questions)")
+            print(f"{outcome['answer']} is the correct answer")
+
+    result = session.result()
+    show(Screen("----------------------", "     SKIP QUIZ RESULTS", "----------------------")
+         .row("Answers: ", answers)
+         .row("Guesses: ", result["guesses"])
+         .add(f"\nTotal questions : {result['total']}",
+              f"Answered        : {result['total'] - result['skipped']}",
+              f"Skipped         : {result['skipped']}",
+              f"Correct         : {result['score']}",
+              f"Your score is   : {result['percent']}% (based only on answered questions)"))
 
     if name is not None:
-        scores = load_scores()
-        scores.append({"name": name, "score": percent})
-        save_scores(scores)
-
+        record_score(name, result["percent"], mode="skip")
 
 
 def take_fill_in_the_blanks_quiz(questions, answers, name=None):
-   
+    # answers may be FillAnswers from get_fill_answers, which also accept
+    # the question's answer_patterns, or raw "a|b" strings.
+    answers = [as_fill_answer(a) for a in answers]
     guesses = []
     score = 0
     total = len(questions)
@@ -263,80 +215,64 @@ def take_fill_in_the_blanks_quiz(questions, answers, name=None):
     print("Type your answer in the blank. Answers are not case sensitive.\n")
 
     for i, question in enumerate(questions):
-        print("----------------------")
-        print(f"Q{i+1}. {question}")
+        paint(Screen("----------------------", f"Q{i+1}. {question}"))
         user_answer = input("Your answer: ").strip()
         guesses.append(user_answer)
         normalized_user = _normalize_text(user_answer)
-        raw_correct = answers[i]
-        correct_variants = [a.strip() for a in raw_correct.split("|")]
-        normalized_correct_variants = [_normalize_text(a) for a in correct_variants]
+        correct = answers[i]
 
-        if normalized_user in normalized_correct_variants:
+        if correct.accepts(normalized_user):
             score += 1
             print("CORRECT!")
         else:
             print("INCORRECT!")
-            print("Accepted answer(s): " + " / ".join(correct_variants))
-
-    print("----------------------")
-    print("  FILL-IN QUIZ RESULTS")
-    print("----------------------")
-
-    print("Correct answers: ", end="")
-    for a in answers:
-        print(a, end=" | ")
-    print()
-
-    print("Your answers : ", end="")
-    for g in guesses:
-        print(g, end=" | ")
-    print()
+            print("Accepted answer(s): " + " / ".join(correct.variants))
 
     percent = int((score / total) * 100) if total > 0 else 0
-    print(f"\nTotal questions : {total}")
-    print(f"Correct         : {score}")
-    print(f"Your score is   : {percent}%")
+    show(Screen("----------------------", "  FILL-IN QUIZ RESULTS", "----------------------")
+         .row("Correct answers: ", [a.raw for a in answers], sep=" | ")
+         .row("Your answers : ", guesses, sep=" | ")
+         .add(f"\nTotal questions : {total}",
+              f"Correct         : {score}",
+              f"Your score is   : {percent}%"))
 
     if name is not None:
-        scores = load_scores()
-        scores.append({"name": name, "score": percent})
-        save_scores(scores)
+        record_score(name, percent, mode="fill_in")
 
 
 def take_quiz_with_summary(questions, options, answers, name=None, timed=False):
-    guesses = []
-    score = 0
-    total = len(questions)
+    session = QuizSession(questions, options, answers)
+    scheduler = DeadlineScheduler() if timed else None
 
     if timed:
         print("You have 5 seconds for each question!")
 
-    for i, question in enumerate(questions):
-        print("----------------------")
-        print(question)
-        for option in options[i]:
-            print(option)
+    while True:
+        current = session.next_question()
+        if current is None:
+            break
+        _, question, opts = current
+        paint(Screen("----------------------", question, *opts))
 
         if timed:
-            guess = timed_quiz("Enter (A, B, C, D): ", timeout=5)
+            guess = timed_quiz("Enter (A, B, C, D): ", timeout=5, scheduler=scheduler)
             if guess is None:
                 print("Time's up!")
                 guess = ''
         else:
             guess = input("Enter (A, B, C, D): ").strip().upper()
 
-        guesses.append(guess)
+        outcome = session.submit(guess)
 
-        if guess == answers[i]:
-            score += 1
+        if outcome["correct"]:
             print("CORRECT!")
         else:
             print("INCORRECT!")
-            print(f"The correct answer is: {answers[i]}")
+            print(f"The correct answer is: {outcome['answer']}")
 
     
-    percent = int((score / total) * 100)
+    result = session.result()
+    percent = result["percent"]
 
     
     if percent <= 25:
@@ -348,19 +284,15 @@ def take_quiz_with_summary(questions, options, answers, name=None, timed=False):
     else:
         summary = "Excellent performance! You have a strong command of the material. Outstanding job!"
 
-    print("----------------------")
-    print("         RESULTS       ")
-    print("----------------------")
-    print("Answers: ", " ".join(answers))
-    print("Guesses: ", " ".join(guesses))
-    print(f"\nScore: {score} / {total}")
-    print(f"Percentage: {percent}%")
-    print("\n Summary:")
-    print(summary)
+    show(Screen("----------------------", "         RESULTS       ", "----------------------",
+                f"Answers:  {' '.join(answers)}",
+                f"Guesses:  {' '.join(result['guesses'])}",
+                f"\nScore: {result['score']} / {result['total']}",
+                f"Percentage: {percent}%",
+                "\n Summary:",
+                summary))
 
     
     if name:
-        scores = load_scores()
-        scores.append({"name": name, "score": percent})
-        save_scores(scores)
+        record_score(name, percent, mode="summary")
 
@@ -1,50 +1,65 @@
 import sys
 import time
 import random
-from utils import print_results, load_scores, save_scores
+from utils import print_results, record_score
+from session import QuizSession, NegativeMarking, Streak
+from deadlines import DeadlineScheduler
+from render import Screen, paint, show
+
+# Challenge mode warns when this many seconds are left.
+CHALLENGE_WARNINGS = (60, 30, 10)
 
 
 def take_quiz(questions, options, answers, name=None, timed=False):
-    guesses = []
-    score = 0
-    total = len(questions)
+    session = QuizSession(questions, options, answers)
+    scheduler = DeadlineScheduler() if timed else None
     if timed:
         print("You have 5 seconds for each question!")
-    for i, question in enumerate(questions):
-        print("----------------------")
-        print(question)
-        for option in options[i]:
-            print(option)
+    while True:
+        current = session.next_question()
+        if current is None:
+            break
+        _, question, opts = current
+        paint(Screen("----------------------", question, *opts))
         if timed:
-            guess = timed_quiz("Enter (A, B, C, D): ", timeout=5)
+            guess = timed_quiz("Enter (A, B, C, D): ", timeout=5, scheduler=scheduler)
             if guess is None:
                 print("Time's up!")
                 guess = ''
         else:
             guess = input("Enter (A, B, C, D): ").strip().upper()
-        guesses.append(guess)
-        if guess == answers[i]:
-            score += 1
+        outcome = session.submit(guess)
+        if outcome["correct"]:
             print("CORRECT!")
         else:
             print("INCORRECT!")
-            print(f"{answers[i]} is the correct answer")
-    print_results(guesses, score, answers)
-    percent = int(score / total * 100)
+            print(f"{outcome['answer']} is the correct answer")
+    print_results(session.guesses, session.score, answers)
+    percent = session.result()["percent"]
     if name is not None:
-        scores = load_scores()
-        scores.append({"name": name, "score": percent})
-        save_scores(scores)
+        record_score(name, percent, mode="timed" if timed else "standard")
 
 
-def timed_quiz(prompt, timeout=5):
+def timed_quiz(prompt, timeout=5, scheduler=None, until=None):
+    """Read one answer, or return None once timeout seconds have passed.
+
+    until, a time on the scheduler's clock (such as the end of an exam),
+    replaces timeout. With a DeadlineScheduler, any of its deadlines that
+    fall due while waiting (such as time warnings) fire too.
+    """
+    if timeout < 0:
+        raise ValueError("timeout must be non-negative")
+    if scheduler is None:
+        scheduler = DeadlineScheduler(clock=time.time)
+    end = scheduler.now() + timeout if until is None else until
     if sys.platform.startswith("win"):
+        # Keys are read one at a time with msvcrt; between key presses the
+        # scheduler blocks on the console handle until a key press or a deadline.
         import msvcrt
         print(prompt, end='', flush=True)
-        start = time.time()
         buf = ""
         while True:
-            if msvcrt.kbhit():
+            while msvcrt.kbhit():
                 ch = msvcrt.getwch()
                 if ch in ("\r", "\n"):
                     print()
@@ -57,15 +72,12 @@ def timed_quiz(prompt, timeout=5):
                 buf += ch
                 print(ch, end='', flush=True)
 
-            if time.time() - start >= timeout:
+            if scheduler.poll() >= end or not scheduler.wait([sys.stdin], end):
                 print()
                 return None
-            time.sleep(0.01)
     else:
-        import select
         print(prompt, end='', flush=True)
-        rlist, _, _ = select.select([sys.stdin], [], [], timeout)
-        if rlist:
+        if scheduler.wait([sys.stdin], end):
             return sys.stdin.readline().strip().upper()
         else:
             print()
@@ -73,56 +85,40 @@ def timed_quiz(prompt, timeout=5):
 
 
 def take_negative_mark_quiz(questions, options, answers, name=None, neg_mark=0.25, timed=False):
-    guesses = []
-    score = 0.0
-    total = len(questions)
+    session = QuizSession(questions, options, answers, NegativeMarking(neg_mark))
 
     print(f"\nNegative marking is ON: -{neg_mark} for each wrong answer")
 
-    for i, question in enumerate(questions):
-        print("----------------------")
-        print(question)
-        for option in options[i]:
-            print(option)
+    while True:
+        current = session.next_question()
+        if current is None:
+            break
+        _, question, opts = current
+        paint(Screen("----------------------", question, *opts))
         guess = input("Enter (A, B, C, D): ").strip().upper()
-        guesses.append(guess)
-        if guess == answers[i]:
-            score += 1
+        outcome = session.submit(guess)
+        if outcome["correct"]:
             print("CORRECT! (+1)")
+        elif guess == '':
+            print("No answer selected.")
+            print(f"{outcome['answer']} is the correct answer (0 marks)")
         else:
-            if guess == '':
-                print("No answer selected.")
-                print(f"{answers[i]} is the correct answer (0 marks)")
-            else:
-                score -= neg_mark
-                print("INCORRECT!")
-                print(f"{answers[i]} is the correct answer (-{neg_mark})")
-    percent = max(0, int((score / total) * 100))
-    print("----------------------")
-    print("NEGATIVE QUIZ RESULTS")
-    print("----------------------")
-    print("Answers: ", end="")
-    for answer in answers:
-        print(answer, end=" ")
-    print()
-    print("Guesses: ", end="")
-    for guess in guesses:
-        print(guess, end=" ")
-    print()
-    correct = sum(1 for g, a in zip(guesses, answers) if g == a)
-    wrong = sum(1 for g, a in zip(guesses, answers) if g not in ("",) and g != a)
-    penalty = wrong * neg_mark
-    print(f"\nTotal questions : {total}")
-    print(f"Correct answers : {correct}")
-    print(f"Wrong answers   : {wrong}")
-    print(f"Negative mark   : -{neg_mark} per wrong answer")
-    print(f"Total penalty   : -{penalty} marks")
-    print(f"\nFinal score : {round(score, 2)} / {total}")
-    print(f"Your score is   : {percent}%")
+            print("INCORRECT!")
+            print(f"{outcome['answer']} is the correct answer (-{neg_mark})")
+    result = session.result()
+    penalty = result["wrong"] * neg_mark
+    show(Screen("----------------------", "NEGATIVE QUIZ RESULTS", "----------------------")
+         .row("Answers: ", answers)
+         .row("Guesses: ", result["guesses"])
+         .add(f"\nTotal questions : {result['total']}",
+              f"Correct answers : {result['correct']}",
+              f"Wrong answers   : {result['wrong']}",
+              f"Negative mark   : -{neg_mark} per wrong answer",
+              f"Total penalty   : -{penalty} marks",
+              f"\nFinal score : {round(result['score'], 2)} / {result['total']}",
+              f"Your score is   : {result['percent']}%"))
     if name is not None:
-        scores = load_scores()
-        scores.append({"name": name, "score": percent})
-        save_scores(scores)
+        record_score(name, result["percent"], mode="negative_marking")
 
 
 def take_quiz_challenge(questions, options, answers, name=None):
@@ -145,12 +141,15 @@ def take_quiz_challenge(questions, options, answers, name=None):
     asked = 0
     correct = 0
     i = 0
-    start_time = time.time()
+    scheduler = DeadlineScheduler(clock=time.time)
+    exam = scheduler.after(total_seconds)
+    for left in CHALLENGE_WARNINGS:
+        if left < total_seconds:
+            scheduler.at(exam.when - left, print, f"\n*** {left} seconds left in the challenge! ***")
 
     while True:
-        elapsed = time.time() - start_time
-        remaining = total_seconds - elapsed
-        if remaining <= 0:
+        now = scheduler.poll()
+        if not exam.active:
             print("\nTime is up for the challenge!")
             break
         if i >= len(indices):
@@ -159,13 +158,10 @@ def take_quiz_challenge(questions, options, answers, name=None):
         idx = indices[i]
         i += 1
 
-        print("----------------------")
-        print(f"Time remaining: {int(remaining)} seconds")
-        print(questions[idx])
-        for opt in options[idx]:
-            print(opt)
+        paint(Screen("----------------------", f"Time remaining: {int(exam.when - now)} seconds",
+                     questions[idx], *options[idx]))
 
-        guess = timed_quiz("Enter (A, B, C, D): ", timeout=remaining)
+        guess = timed_quiz("Enter (A, B, C, D): ", until=exam.when, scheduler=scheduler)
         if guess is None:
             print("\nTime's up while answering!")
             break
@@ -181,97 +177,62 @@ def take_quiz_challenge(questions, options, answers, name=None):
         else:
             print("INCORRECT!")
             print(f"{answers[idx]} is the correct answer.")
-    print("----------------------")
-    print("CHALLENGE RESULTS")
-    print("----------------------")
-    print("Answers: ", end="")
-    for a in used_answers:
-        print(a, end=" ")
-    print()
-    print("Guesses: ", end="")
-    for g in guesses:
-        print(g, end=" ")
-    print()
-
-    print(f"\nTotal time        : {minutes} minutes")
-    print(f"Questions answered: {asked}")
-    print(f"Correct answers   : {correct}")
-
     if asked > 0:
         percent = int((correct / asked) * 100)
     else:
         percent = 0
-    print(f"Accuracy          : {percent}%")
+    show(Screen("----------------------", "CHALLENGE RESULTS", "----------------------")
+         .row("Answers: ", used_answers)
+         .row("Guesses: ", guesses)
+         .add(f"\nTotal time        : {minutes} minutes",
+              f"Questions answered: {asked}",
+              f"Correct answers   : {correct}",
+              f"Accuracy          : {percent}%"))
 
     if name is not None:
-        scores = load_scores()
-        scores.append({"name": name, "score": percent})
-        save_scores(scores)
+        record_score(name, percent, mode="challenge")
 
 
 def take_quiz_until_wrong(questions, options, answers, name=None):
     indices = list(range(len(questions)))
     random.shuffle(indices)
+    session = QuizSession(questions, options, answers, Streak(), order=indices)
 
-    guesses = []
-    answers_used = []
-    score = 0
-    asked = 0
-
-    for idx in indices:
-        question = questions[idx]
-        opts = options[idx]
-        correct_answer = answers[idx]
+    while True:
+        current = session.next_question()
+        if current is None:
+            break
+        _, question, opts = current
 
-        print("--------------------------")
-        print(question)
-        for opt in opts:
-            print(opt)
+        paint(Screen("--------------------------", question, *opts))
 
         guess = input("Enter (A, B, C, D): ").strip().upper()
-        guesses.append(guess)
-        answers_used.append(correct_answer)
-        asked += 1
+        outcome = session.submit(guess)
 
-        if guess == correct_answer:
-            score += 1
-            print("CORRECT!")
-        else:
+        if not outcome["correct"]:
             if guess == '':
                 print("No answer selected.")
             else:
                 print("INCORRECT!")
-            print(f"{correct_answer} is the correct answer.")
+            print(f"{outcome['answer']} is the correct answer.")
             print("Quiz over!! First wrong answer reached.")
-            break
-    print("-------------------------")
-    print("STREAK MODE QUIZ RESULTS")
-    print("-------------------------")
-    print("Answers: ", end="")
-    for a in answers_used:
-        print(a, end=" ")
-    print()
-    print("Guesses: ", end="")
-    for g in guesses:
-        print(g, end=" ")
-    print()
-
-    if asked > 0:
-        percent = int((score / asked) * 100)
-    else:
-        percent = 0
-
-    print(f"\nQuestions answered : {asked}")
-    print(f"Correct in a row   : {score}")
-    print(f"Your score is      : {percent}%")
-
-    if score == asked and asked == len(questions):
-        print("\nAmazing! You answered ALL questions correctly!")
+        else:
+            print("CORRECT!")
+    result = session.result()
+    screen = (
+        Screen("-------------------------", "STREAK MODE QUIZ RESULTS", "-------------------------")
+        .row("Answers: ", result["answers"])
+        .row("Guesses: ", result["guesses"])
+        .add(f"\nQuestions answered : {result['asked']}",
+             f"Correct in a row   : {result['score']}",
+             f"Your score is      : {result['percent']}%")
+    )
+    if result["score"] == result["asked"] and result["asked"] == len(questions):
+        screen.add("\nAmazing! You answered ALL questions correctly!")
+    show(screen)
 
     if name is not None:
-        scores = load_scores()
-        scores.append({"name": name, "score": percent})
-        save_scores(scores)
+        record_score(name, result["percent"], mode="streak")
 
 
 def learning_mode(questions, answers):
@@ -290,8 +251,7 @@ def learning_mode(questions, answers):
         question = questions[idx]
         answer = answers[idx]
 
-        print("----------------------")
-        print(f"Q: {question}")
+        paint(Screen("----------------------", f"Q: {question}"))
         input("Press Enter to reveal the answer...")
 
         print(f"A: {answer}")
@@ -0,0 +1,248 @@
+import os
+import sys
+import json
+import mmap
+import struct
+import tempfile
+
+from question_bank import Question, QuestionBank
+
+# Binary question bank (.mcqb):
+#
+#   header   MAGIC, version, count, label count, and the offsets of the
+#            label list and the offset table
+#   payload  one record per question: question, answer and options as
+#            UTF-8, separated by NUL bytes
+#   labels   JSON list of the distinct topic/difficulty strings
+#   table    count fixed-width entries: payload offset, payload length,
+#            topic label, difficulty label
+#
+# Question i is found with one table lookup and only its own payload is
+# decoded, so a reader touches just the pages it needs.
+MAGIC = b"MCQB"
+VERSION = 1
+HEADER = struct.Struct("<4sHHIIQQ")
+ENTRY = struct.Struct("<QIHH")
+NO_LABEL = 0xFFFF
+SEPARATOR = b"\0"
+
+
+def _pack_record(q):
+    fields = [q["question"], q["answer"].strip().upper()] + list(q["options"])
+    if any("\0" in f for f in fields):
+        raise ValueError(f"Question text may not contain NUL bytes: {q['question']!r}")
+    return SEPARATOR.join(f.encode("utf-8") for f in fields)
+
+
+def compile_bank(questions, dest):
+    """Write question dicts to dest in the binary format. Returns the count.
+
+    questions is any iterable (ALL_QUIZ_DATA, or a stream from
+    bank_loader); records are written as they arrive, and only the
+    fixed-width table is kept in memory.
+    """
+    labels = []
+    label_ids = {}
+
+    def label(value):
+        if value is None:
+            return NO_LABEL
+        if value not in label_ids:
+            if len(labels) == NO_LABEL:
+                raise ValueError("Too many distinct topics and difficulties for the binary format.")
+            label_ids[value] = len(labels)
+            labels.append(value)
+        return label_ids[value]
+
+    table = bytearray()
+    directory = os.path.dirname(os.path.abspath(dest))
+    fd, tmp = tempfile.mkstemp(dir=directory, prefix=".mcqb-")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(bytes(HEADER.size))
+            offset = 0
+            count = 0
+            for q in questions:
+                record = _pack_record(q)
+                f.write(record)
+                table += ENTRY.pack(offset, len(record), label(q.get("topic")), label(q.get("difficulty")))
+                offset += len(record)
+                count += 1
+            labels_offset = HEADER.size + offset
+            encoded = json.dumps(labels).encode("utf-8")
+            f.write(encoded)
+            table_offset = labels_offset + len(encoded)
+            f.write(table)
+            f.seek(0)
+            f.write(HEADER.pack(MAGIC, VERSION, 0, count, len(labels), labels_offset, table_offset))
+        os.replace(tmp, dest)
+    except BaseException:
+        os.remove(tmp)
+        raise
+    return count
+
+
+def is_binary_bank(path):
+    with open(path, "rb") as f:
+        return f.read(len(MAGIC)) == MAGIC
+
+
+class _Column:
+    """Read-only sequence view of one field across the bank."""
+
+    def __init__(self, bank, field):
+        self._bank = bank
+        self._field = field
+
+    def __len__(self):
+        return len(self._bank)
+
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            return [self[j] for j in range(*i.indices(len(self)))]
+        return getattr(self._bank.record(i), self._field)
+
+    def __iter__(self):
+        for i in range(len(self)):
+            yield self[i]
+
+
+class MmapQuestionBank(QuestionBank):
+    """A QuestionBank read from a compiled .mcqb file through mmap.
+
+    Has the same interface as the in-memory bank. records, questions,
+    options and answers are views that decode one record per access, and
+    the topic/difficulty indexes are built from the offset table the first
+    time they are needed, without reading any payload.
+    """
+
+    __slots__ = ("path", "_file", "_mm", "_count", "_labels", "_payload", "_table", "_indexes")
+
+    def __init__(self, path):
+        self.path = path
+        self._file = open(path, "rb")
+        try:
+            self._mm = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            self._file.close()
+            raise ValueError(f"{path}: empty file is not a question bank")
+        if len(self._mm) < HEADER.size:
+            self.close()
+            raise ValueError(f"{path}: too short to be a question bank")
+        magic, version, _, count, n_labels, labels_offset, table_offset = HEADER.unpack_from(self._mm, 0)
+        if magic != MAGIC or version != VERSION:
+            self.close()
+            raise ValueError(f"{path}: not a version {VERSION} binary question bank")
+        self._count = count
+        self._labels = json.loads(self._mm[labels_offset:table_offset].decode("utf-8"))
+        self._payload = HEADER.size
+        self._table = table_offset
+        self._indexes = None
+        self._by_uid = None
+        # Records are built on demand, so malformed options are reported
+        # when the source bank is loaded (bank_loader), not here.
+        self.problems = []
+
+    def close(self):
+        self._mm.close()
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def __len__(self):
+        return self._count
+
+    def add(self, q):
+        raise TypeError("A compiled question bank is read-only; recompile it to add questions.")
+
+    def _label(self, idx):
+        return None if idx == NO_LABEL else self._labels[idx]
+
+    def record(self, i):
+        if i < 0:
+            i += self._count
+        if not 0 <= i < self._count:
+            raise IndexError("question id out of range")
+        offset, length, topic, difficulty = ENTRY.unpack_from(self._mm, self._table + i * ENTRY.size)
+        start = self._payload + offset
+        fields = self._mm[start:start + length].decode("utf-8").split("\0")
+        return Question(i, fields[0], tuple(fields[2:]), fields[1], self._label(topic), self._label(difficulty))
+
+    @property
+    def records(self):
+        return _RecordView(self)
+
+    @property
+    def questions(self):
+        return _Column(self, "question")
+
+    @property
+    def options(self):
+        return _Column(self, "options")
+
+    @property
+    def answers(self):
+        return _Column(self, "answer")
+
+    def _build_indexes(self):
+        if self._indexes is None:
+            by_topic, by_difficulty, by_pair = {}, {}, {}
+            end = self._table + self._count * ENTRY.size
+            for i, (_, _, t, d) in enumerate(ENTRY.iter_unpack(self._mm[self._table:end])):
+                topic, difficulty = self._label(t), self._label(d)
+                by_topic.setdefault(topic, []).append(i)
+                by_difficulty.setdefault(difficulty, []).append(i)
+                by_pair.setdefault((topic, difficulty), []).append(i)
+            self._indexes = (by_topic, by_difficulty, by_pair)
+        return self._indexes
+
+    @property
+    def by_topic(self):
+        return self._build_indexes()[0]
+
+    @property
+    def by_difficulty(self):
+        return self._build_indexes()[1]
+
+    @property
+    def by_topic_difficulty(self):
+        return self._build_indexes()[2]
+
+    def select(self, ids):
+        records = [self.record(i) for i in ids]
+        return (
+            [r.question for r in records],
+            [r.options for r in records],
+            [r.answer for r in records],
+        )
+
+
+class _RecordView(_Column):
+
+    def __init__(self, bank):
+        super().__init__(bank, None)
+
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            return [self[j] for j in range(*i.indices(len(self)))]
+        return self._bank.record(i)
+
+
+if __name__ == "__main__":
+    if len(sys.argv) != 3:
+        print("Usage: python mmap_bank.py <quiz_data|questions.json|questions.jsonl> <out.mcqb>")
+        sys.exit(2)
+    source, out = sys.argv[1], sys.argv[2]
+    if source == "quiz_data":
+        from quiz_data import ALL_QUIZ_DATA
+        written = compile_bank(ALL_QUIZ_DATA, out)
+    else:
+        from bank_loader import iter_questions, validate_question
+        written = compile_bank(
+            (q for _, q in iter_questions(source) if validate_question(q) is None), out
+        )
+    print(f"Compiled {written} question(s) into '{out}'.")
@@ -0,0 +1,268 @@
+import sys
+import random
+import hashlib
+from functools import lru_cache
+
+
+_letter_maps = {}
+
+
+def parse_options(options):
+    """Map each option's letter label ("B. Cat" -> "B") to its position.
+
+    Returns (letters, problems): options without an "X." label, or with a
+    letter already used, are left out of the map and described in
+    problems. Identical maps are shared, so a bank of standard A-D
+    questions holds one map, not one per question.
+    """
+    letters = {}
+    problems = []
+    for i, opt in enumerate(options):
+        text = str(opt).strip()
+        letter = text[:1].upper()
+        if len(text) < 2 or text[1] != "." or not letter.isalpha():
+            problems.append(f"option {i + 1} has no letter label: {opt!r}")
+        elif letter in letters:
+            problems.append(f"option letter {letter} is used twice")
+        else:
+            letters[letter] = i
+    key = tuple(letters.items())
+    return _letter_maps.setdefault(key, letters), problems
+
+
+@lru_cache(maxsize=4096)
+def _cached_letters(options):
+    return parse_options(options)[0]
+
+
+def letter_map(options):
+    """Letter -> position map for a loose options list (see parse_options).
+
+    Recently seen option lists are cached, so repeated lookups for the
+    same question don't rescan its options.
+    """
+    try:
+        return _cached_letters(tuple(options))
+    except TypeError:
+        return parse_options(options)[0]
+
+
+def option_text(options, letter):
+    """Text of the option labelled letter, or a "not found" note."""
+    letter = str(letter).strip().upper()
+    i = letter_map(options).get(letter)
+    if i is None:
+        return f"{letter} (option text not found)"
+    return options[i]
+
+
+class Question:
+    """One quiz question; slots keep thousands of them small.
+
+    letters maps option letters to positions and correct is the position
+    of the answer (None if it matches no option); both are worked out
+    once, when the question is loaded.
+    """
+
+    __slots__ = ("id", "question", "options", "answer", "topic", "difficulty", "letters", "correct")
+
+    def __init__(self, qid, question, options, answer, topic=None, difficulty=None):
+        self.id = qid
+        self.question = question
+        self.options = options
+        self.answer = answer
+        self.topic = topic
+        self.difficulty = difficulty
+        self.letters, _ = parse_options(options)
+        self.correct = self.letters.get(str(answer).strip().upper())
+
+    @classmethod
+    def from_dict(cls, qid, q):
+        return cls(qid, q["question"], q["options"], q["answer"], q.get("topic"), q.get("difficulty"))
+
+    def problems(self):
+        """Descriptions of malformed options or an unmatched answer."""
+        problems = parse_options(self.options)[1]
+        if self.correct is None:
+            problems.append(f"answer {str(self.answer).strip().upper()!r} matches no option")
+        return problems
+
+    def correct_text(self):
+        if self.correct is None:
+            return f"{str(self.answer).strip().upper()} (option text not found)"
+        return self.options[self.correct]
+
+
+def _normalize(text):
+    return " ".join(str(text).strip().lower().split())
+
+
+def content_id(question, options=()):
+    """Stable question id: a hash of the normalized question and options.
+
+    Unlike a position in ALL_QUIZ_DATA it survives reordering and
+    insertions, and the same question always gets the same id, so exported
+    or externally loaded copies can be matched with one dict lookup.
+    """
+    parts = [_normalize(question)] + [_normalize(o) for o in (options or ())]
+    return hashlib.sha1("\x1f".join(parts).encode("utf-8")).hexdigest()[:16]
+
+
+def question_id(q):
+    """content_id for a question dict (MCQ or fill-in)."""
+    return content_id(q.get("question", ""), q.get("options"))
+
+
+def _intern(value):
+    # Topics and difficulties repeat across every record of a large bank;
+    # share one string object per distinct value.
+    return sys.intern(value) if isinstance(value, str) else value
+
+
+class QuestionBank:
+    """Quiz questions indexed by topic, difficulty and (topic, difficulty).
+
+    Built once from the ALL_QUIZ_DATA dicts, or one record at a time with
+    add() (see bank_loader). A question's id is its position, and
+    questions/options/answers are parallel lists ready to hand to the quiz
+    functions (which only read them, so they are shared, not copied).
+    """
+
+    __slots__ = (
+        "records", "questions", "options", "answers",
+        "by_topic", "by_difficulty", "by_topic_difficulty", "_by_uid", "problems",
+    )
+
+    def __init__(self, data=()):
+        self.records = []
+        self.questions = []
+        self.options = []
+        self.answers = []
+        self.by_topic = {}
+        self.by_difficulty = {}
+        self.by_topic_difficulty = {}
+        self._by_uid = None
+        self.problems = []
+        for q in data:
+            self.add(q)
+
+    def add(self, q):
+        """Append one question dict and index it. Returns its id."""
+        r = Question.from_dict(len(self.records), q)
+        r.topic = _intern(r.topic)
+        r.difficulty = _intern(r.difficulty)
+        self.records.append(r)
+        self.questions.append(r.question)
+        self.options.append(r.options)
+        self.answers.append(r.answer)
+        self.by_topic.setdefault(r.topic, []).append(r.id)
+        self.by_difficulty.setdefault(r.difficulty, []).append(r.id)
+        self.by_topic_difficulty.setdefault((r.topic, r.difficulty), []).append(r.id)
+        if r.correct is None or len(r.letters) != len(r.options):
+            self.problems.extend((r.id, p) for p in r.problems())
+        if self._by_uid is not None:
+            self._by_uid.setdefault(content_id(r.question, r.options), r.id)
+        return r.id
+
+    def correct_text(self, i):
+        """Text of question i's correct option, without rescanning options."""
+        return self.records[i].correct_text()
+
+    def option_index(self, i, letter):
+        return self.records[i].letters.get(str(letter).strip().upper())
+
+    def question_id(self, i):
+        r = self.records[i]
+        return content_id(r.question, r.options)
+
+    def find(self, uid):
+        """Position of the question with stable id uid, or None.
+
+        The id index is built on first use; the first question wins if two
+        are identical.
+        """
+        if self._by_uid is None:
+            by_uid = {}
+            for r in self.records:
+                by_uid.setdefault(content_id(r.question, r.options), r.id)
+            self._by_uid = by_uid
+        return self._by_uid.get(uid)
+
+    def __len__(self):
+        return len(self.records)
+
+    def topics(self):
+        return sorted(t for t in self.by_topic if t is not None)
+
+    def difficulties(self):
+        return sorted(d for d in self.by_difficulty if d is not None)
+
+    def ids(self, topic=None, difficulty=None):
+        """Ids matching the topic and/or difficulty, in bank order."""
+        if topic is not None and difficulty is not None:
+            return self.by_topic_difficulty.get((topic, difficulty), [])
+        if topic is not None:
+            return self.by_topic.get(topic, [])
+        if difficulty is not None:
+            return self.by_difficulty.get(difficulty, [])
+        return range(len(self))
+
+    def count(self, topic=None, difficulty=None):
+        return len(self.ids(topic, difficulty))
+
+    def ids_for_difficulties(self, levels):
+        ids = []
+        for level in levels:
+            ids.extend(self.by_difficulty.get(level, []))
+        return sorted(ids)
+
+    def sample(self, n, ids=None):
+        return random.sample(self.ids() if ids is None else ids, n)
+
+    def select(self, ids):
+        """Return (questions, options, answers) for ids, in that order."""
+        return (
+            [self.questions[i] for i in ids],
+            [self.options[i] for i in ids],
+            [self.answers[i] for i in ids],
+        )
+
+
+_versions = {}
+
+
+def data_version(data):
+    """Cache key for a list of question dicts: its length and edit count.
+
+    Both are O(1), so a cache hit costs nothing like rebuilding. Code that
+    edits a list in place without changing its length calls data_changed.
+    """
+    return len(data), _versions.get(id(data), 0)
+
+
+def data_changed(data):
+    """Record an in-place edit, so caches built from data are rebuilt."""
+    _versions[id(data)] = _versions.get(id(data), 0) + 1
+
+
+_banks = {}
+
+
+def get_bank(data):
+    """Return the QuestionBank for a list of question dicts, building it once.
+
+    Banks are cached by list identity and data_version, so the menus can
+    call this on every loop iteration; a list that grew, shrank or was
+    marked with data_changed gets a fresh bank.
+    """
+    if isinstance(data, QuestionBank):
+        return data
+    version = data_version(data)
+    cached = _banks.get(id(data))
+    if cached is not None and cached[0] is data and cached[1] == version:
+        return cached[2]
+    if len(_banks) >= 16:
+        _banks.clear()
+    bank = QuestionBank(data)
+    _banks[id(data)] = (data, version, bank)
+    return bank
@@ -1,6 +1,7 @@
 
 
 from quiz_data import ALL_QUIZ_DATA, FILL_IN_QUIZ_DATA
+from search_index import search_menu
 
 
 def show_all_mcq_questions_only():
@@ -49,6 +50,7 @@ def questions_viewer_menu():
         print("1. See all MCQ questions (no answers)")
         print("2. See all fill-in-the-blanks questions (no answers)")
         print("3. See ALL questions (no answers)")
+        print("4. Search questions")
         print("0. Back")
         choice = input("Enter choice: ").strip()
 
@@ -58,6 +60,8 @@ def questions_viewer_menu():
             show_all_fill_in_questions_only()
         elif choice == "3":
             show_all_questions_only()
+        elif choice == "4":
+            search_menu()
         elif choice == "0":
             break
         else:
@@ -0,0 +1,303 @@
+import sys
+import json
+import time
+import random
+import asyncio
+
+from session import QuizSession, PlainScoring, NegativeMarking, SkipAware, Streak, WrongAnswer
+from score_buffer import ScoreBuffer
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8765
+MAX_LINE = 64 * 1024
+# Room for a whole exam room connecting at once; with the default of 100
+# the rest of a burst waits for the kernel to retry their connections.
+BACKLOG = 1024
+
+# The quiz modes main.py offers that work without a console, as
+# (policy factory, mode name recorded with the score, lifelines).
+MODES = {
+    "standard": (PlainScoring, "standard", 0),
+    "negative": (NegativeMarking, "negative_marking", 0),
+    "skip": (SkipAware, "skip", 0),
+    "streak": (Streak, "streak", 0),
+    "fifty_fifty": (PlainScoring, "fifty_fifty", None),
+    "summary": (PlainScoring, "summary", 0),
+    "wrong_answer": (WrongAnswer, "wrong_answer", 0),
+}
+
+
+TOO_LONG = object()
+
+
+async def _read_line(reader):
+    """Next request line (b"" at end of stream), or TOO_LONG for a line
+    over MAX_LINE, which is read to its end and dropped so the next
+    request still starts on a line of its own."""
+    too_long = False
+    while True:
+        try:
+            line = await reader.readuntil(b"\n")
+        except asyncio.IncompleteReadError as e:
+            line = e.partial
+        except asyncio.LimitOverrunError as e:
+            await reader.readexactly(e.consumed)
+            too_long = True
+            continue
+        return TOO_LONG if too_long else line
+
+
+def _question(session):
+    current = session.next_question()
+    if current is None:
+        return None
+    idx, text, options = current
+    return {
+        "number": session.position + 1,
+        "total": len(session.order),
+        "id": idx,
+        "text": text,
+        "options": list(options),
+    }
+
+
+class QuizServer:
+    """Serves quiz sessions to many candidates over one TCP port.
+
+    The protocol is JSON Lines: each request is one JSON object on one
+    line and gets exactly one JSON line back. A connection holds at most
+    one session at a time:
+
+      {"cmd": "start", "mode": "negative", "count": 10, "name": "Ana",
+       "penalty": 0.25, "seed": 7}     -> {"ok": true, "question": {...}}
+      {"cmd": "answer", "guess": "B"}  -> {"ok": true, "correct": false,
+                                           "answer": "C", "question": {...}}
+      {"cmd": "skip"} / {"cmd": "lifeline"} / {"cmd": "result"} / {"cmd": "quit"}
+
+    When the last question is answered the reply carries "result"
+    instead of "question", and the score of a named candidate goes to
+    the shared ScoreBuffer. Every session reads the same question bank;
+    none of them copies it.
+    """
+
+    def __init__(self, bank=None, write_batch=None):
+        if bank is None:
+            from quiz_data import ALL_QUIZ_DATA
+            from bank_loader import get_question_bank
+            bank = get_question_bank(ALL_QUIZ_DATA)
+        if write_batch is None:
+            from utils import write_score_batch as write_batch
+        self.bank = bank
+        self.scores = ScoreBuffer(write_batch, durability="batch")
+        self.active = 0
+        self.finished = 0
+
+    def start_session(self, request):
+        mode = request.get("mode", "standard")
+        if mode not in MODES:
+            raise ValueError(f"unknown mode '{mode}'; use one of: {', '.join(MODES)}")
+        factory, record_mode, lifelines = MODES[mode]
+        count = int(request.get("count") or len(self.bank))
+        if not 1 <= count <= len(self.bank):
+            raise ValueError(f"count must be between 1 and {len(self.bank)}")
+        from sampler import sample_questions
+        ids = sample_questions(self.bank, count, seed=request.get("seed"))
+        policy = factory(float(request.get("penalty", 0.25))) if factory is NegativeMarking else factory()
+        session = QuizSession(
+            self.bank.questions, self.bank.options, self.bank.answers, policy,
+            order=ids, lifelines=lifelines,
+        )
+        return session, record_mode
+
+    def finish(self, session, name, record_mode):
+        result = session.result()
+        self.finished += 1
+        if name:
+            from datetime import datetime
+            self.scores.add({
+                "name": name,
+                "score": result["percent"],
+                "mode": record_mode,
+                "timestamp": datetime.now().isoformat(timespec="seconds"),
+            })
+        return result
+
+    def handle_request(self, state, request):
+        """Apply one request to a connection's state; returns the reply."""
+        cmd = request.get("cmd")
+        if cmd == "start":
+            state["session"], state["mode"] = self.start_session(request)
+            state["name"] = str(request.get("name") or "").strip() or None
+            return {"ok": True, "mode": request.get("mode", "standard"), "question": _question(state["session"])}
+        session = state.get("session")
+        if cmd == "quit":
+            return {"ok": True, "bye": True}
+        if session is None:
+            raise ValueError("no quiz started; send a start command first")
+        if cmd == "result":
+            return {"ok": True, "result": session.result()}
+        if session.finished:
+            raise ValueError("the quiz is finished; start a new one")
+        if cmd == "lifeline":
+            return {"ok": True, "options": list(session.use_lifeline())}
+        if cmd == "answer":
+            outcome = session.submit(str(request.get("guess", "")).strip().upper())
+        elif cmd == "skip":
+            outcome = session.skip()
+        else:
+            raise ValueError(f"unknown command '{cmd}'")
+        reply = {"ok": True, "correct": outcome["correct"], "answer": outcome["answer"]}
+        if outcome["finished"]:
+            reply["result"] = self.finish(session, state["name"], state["mode"])
+        else:
+            reply["question"] = _question(session)
+        return reply
+
+    async def handle(self, reader, writer):
+        state = {}
+        self.active += 1
+        try:
+            while True:
+                line = await _read_line(reader)
+                if not line:
+                    break
+                try:
+                    if line is TOO_LONG:
+                        raise ValueError(f"request longer than {MAX_LINE} bytes")
+                    request = json.loads(line)
+                    if not isinstance(request, dict):
+                        raise ValueError("each request must be a JSON object")
+                    reply = self.handle_request(state, request)
+                except (ValueError, TypeError, RuntimeError) as e:
+                    reply = {"ok": False, "error": str(e)}
+                writer.write((json.dumps(reply) + "\n").encode("utf-8"))
+                await writer.drain()
+                if reply.get("bye"):
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            self.active -= 1
+            writer.close()
+
+    async def serve(self, host=DEFAULT_HOST, port=DEFAULT_PORT):
+        """Start listening; returns the asyncio server (port 0 picks one)."""
+        return await asyncio.start_server(self.handle, host, port, limit=MAX_LINE, backlog=BACKLOG)
+
+    def close(self):
+        self.scores.close()
+
+
+def percentile(values, p):
+    """Nearest-rank percentile of values (p from 0 to 100)."""
+    if not values:
+        return None
+    ordered = sorted(values)
+    rank = max(1, -(-len(ordered) * p // 100))
+    return ordered[int(rank) - 1]
+
+
+async def _candidate(host, port, mode, count, latencies, rng):
+    reader, writer = await asyncio.open_connection(host, port, limit=MAX_LINE)
+
+    async def call(request):
+        writer.write((json.dumps(request) + "\n").encode("utf-8"))
+        await writer.drain()
+        reply = json.loads(await reader.readline())
+        if not reply.get("ok"):
+            raise RuntimeError(reply.get("error"))
+        return reply
+
+    try:
+        name = f"load-{rng.randrange(1_000_000)}"
+        reply = await call({"cmd": "start", "mode": mode, "count": count, "name": name})
+        while "result" not in reply:
+            start = time.perf_counter()
+            reply = await call({"cmd": "answer", "guess": rng.choice("ABCD")})
+            latencies.append(time.perf_counter() - start)
+        await call({"cmd": "quit"})
+        return reply["result"]
+    finally:
+        writer.close()
+
+
+async def run_load(host=DEFAULT_HOST, port=DEFAULT_PORT, candidates=200, count=10, mode="standard", seed=None):
+    """Simulate candidates taking a quiz at the same time.
+
+    Each candidate opens its own connection, starts a quiz and answers
+    every question at random as fast as the server replies. Returns
+    "candidates", "answers", "seconds", "answers_per_second" and the
+    p50 / p99 / max answer round-trip in milliseconds.
+    """
+    rng = random.Random(seed)
+    latencies = []
+    start = time.perf_counter()
+    results = await asyncio.gather(*(
+        _candidate(host, port, mode, count, latencies, random.Random(rng.random()))
+        for _ in range(candidates)
+    ))
+    elapsed = time.perf_counter() - start
+    return {
+        "candidates": len(results),
+        "answers": len(latencies),
+        "seconds": elapsed,
+        "answers_per_second": len(latencies) / elapsed if elapsed else 0.0,
+        "p50_ms": percentile(latencies, 50) * 1000 if latencies else None,
+        "p99_ms": percentile(latencies, 99) * 1000 if latencies else None,
+        "max_ms": max(latencies) * 1000 if latencies else None,
+    }
+
+
+def print_load_report(report):
+    print(f"{report['candidates']} candidate(s), {report['answers']} answer(s) "
+          f"in {report['seconds']:.2f}s ({report['answers_per_second']:,.0f} answers/s)")
+    if report["answers"]:
+        print(f"Answer latency: p50 {report['p50_ms']:.2f} ms  p99 {report['p99_ms']:.2f} ms  "
+              f"max {report['max_ms']:.2f} ms")
+
+
+async def _serve_forever(host, port):
+    server = QuizServer()
+    listener = await server.serve(host, port)
+    print(f"Quiz server listening on {host}:{listener.sockets[0].getsockname()[1]}")
+    try:
+        async with listener:
+            await listener.serve_forever()
+    finally:
+        server.close()
+
+
+async def _self_test(candidates, count):
+    # Server and load client in one process, with scores discarded.
+    server = QuizServer(write_batch=lambda records: None)
+    listener = await server.serve(DEFAULT_HOST, 0)
+    port = listener.sockets[0].getsockname()[1]
+    try:
+        return await run_load(DEFAULT_HOST, port, candidates, count)
+    finally:
+        listener.close()
+        await listener.wait_closed()
+        server.close()
+
+
+if __name__ == "__main__":
+    args = sys.argv[1:]
+    command = args[0] if args else ""
+    try:
+        if command == "serve":
+            asyncio.run(_serve_forever(args[1] if len(args) > 1 else DEFAULT_HOST,
+                                       int(args[2]) if len(args) > 2 else DEFAULT_PORT))
+        elif command == "load":
+            print_load_report(asyncio.run(run_load(
+                DEFAULT_HOST, int(args[2]) if len(args) > 2 else DEFAULT_PORT,
+                int(args[1]) if len(args) > 1 else 200,
+            )))
+        elif command == "bench":
+            print_load_report(asyncio.run(_self_test(int(args[1]) if len(args) > 1 else 200, 10)))
+        else:
+            print("Usage: python quiz_server.py serve [host] [port]")
+            print("       python quiz_server.py load [candidates] [port]")
+            print("       python quiz_server.py bench [candidates]")
+            sys.exit(2)
+    except KeyboardInterrupt:
+        pass
@@ -0,0 +1,256 @@
+import io
+import os
+import sys
+import time
+
+from storage_backend import get_setting
+
+# MCQ_RENDER=diff (or "render": "diff" in storage_config.json) repaints
+# question screens in place at the top of the terminal with ANSI escapes,
+# rewriting only the lines that changed since the previous question.
+# Anything else writes each screen as plain text.
+RENDER_ENV = "MCQ_RENDER"
+
+HOME = "\x1b[H"
+CLEAR_SCREEN = "\x1b[2J"
+CLEAR_LINE_END = "\x1b[K"
+CLEAR_BELOW = "\x1b[J"
+
+
+class Screen:
+    """The lines of one screen, built up first and written in one go."""
+
+    __slots__ = ("lines",)
+
+    def __init__(self, *lines):
+        self.lines = list(lines)
+
+    def add(self, *lines):
+        self.lines.extend(lines)
+        return self
+
+    def row(self, label, items, sep=" "):
+        """label then every item followed by sep, on a single line."""
+        self.lines.append(label + "".join(f"{item}{sep}" for item in items))
+        return self
+
+    def text(self):
+        return "".join(f"{line}\n" for line in self.lines)
+
+
+def _move(row, col=1):
+    return f"\x1b[{row};{col}H"
+
+
+class Renderer:
+    """Writes each screen with a single print() call and one flush.
+
+    With diff=True, paint() keeps question screens at the top of the
+    terminal: the first one clears the screen, and each one after that
+    only rewrites what differs from the last, from the first changed
+    column of each changed row, then clears
+    everything below it (the previous answer and its feedback). It
+    assumes nothing scrolled the screen in between and that no line is
+    wider than the terminal. show() always writes plainly, after which
+    the next paint() starts over with a cleared screen.
+    """
+
+    def __init__(self, diff=False):
+        self.diff = diff
+        self.frame = None
+
+    def write(self, text):
+        # No flush here: input() flushes before it prompts, a terminal
+        # writes the screen at its last newline, and a pipe keeps batching.
+        print(text, end="")
+
+    def show(self, screen):
+        self.frame = None
+        self.write(screen.text())
+
+    def repaint(self, lines):
+        """The escapes and text that turn the last frame into lines."""
+        old, self.frame = self.frame, lines
+        if old is None:
+            return HOME + CLEAR_SCREEN + "".join(f"{line}\n" for line in lines)
+        out = []
+        for row, line in enumerate(lines, 1):
+            before = old[row - 1] if row <= len(old) else ""
+            if line == before:
+                continue
+            # Keep the part both share, but only where one character is
+            # one column wide.
+            col = len(os.path.commonprefix((before, line))) if line.isascii() and before.isascii() else 0
+            out.append(f"{_move(row, col + 1)}{line[col:]}{CLEAR_LINE_END}")
+        out.append(_move(len(lines) + 1) + CLEAR_BELOW)
+        return "".join(out)
+
+    def paint(self, screen):
+        if not self.diff:
+            self.write(screen.text())
+            return
+        self.write(self.repaint(screen.text().splitlines()))
+
+
+def get_render_mode():
+    return get_setting(RENDER_ENV, "render", "plain").strip().lower()
+
+
+_renderer = Renderer()
+
+
+def show(screen):
+    """Write a screen (a results table, a notice) in one call."""
+    _renderer.show(screen)
+
+
+def paint(screen):
+    """Write a question screen; repainted in place in diff mode."""
+    _renderer.diff = get_render_mode() == "diff"
+    _renderer.paint(screen)
+
+
+class _CountingRaw(io.RawIOBase):
+    """A raw stream to /dev/null that counts its write() system calls."""
+
+    def __init__(self):
+        self.fd = os.open(os.devnull, os.O_WRONLY)
+        self.calls = 0
+        self.bytes = 0
+
+    def writable(self):
+        return True
+
+    def write(self, data):
+        self.calls += 1
+        self.bytes += len(data)
+        return os.write(self.fd, data)
+
+    def close(self):
+        if not self.closed:
+            os.close(self.fd)
+        super().close()
+
+
+def _stream(kind):
+    raw = _CountingRaw()
+    if kind == "unbuffered":
+        # python -u / PYTHONUNBUFFERED, or a pager reading as it goes.
+        return raw, io.TextIOWrapper(raw, encoding="utf-8", write_through=True)
+    buffered = io.BufferedWriter(raw)
+    # A terminal (or SSH session) is line buffered; a pipe is not.
+    return raw, io.TextIOWrapper(buffered, encoding="utf-8", line_buffering=kind == "tty")
+
+
+def _print_quiz(questions, options, answers, guesses, screen):
+    # One question screen per question, then the standard results table,
+    # either as the quizzes used to print them or through screen().
+    for question, opts in zip(questions, options):
+        if screen is None:
+            print("----------------------")
+            print(question)
+            for option in opts:
+                print(option)
+        else:
+            screen(Screen("----------------------", question, *opts))
+    header = ("----------------------", "       RESULTS        ", "----------------------")
+    if screen is None:
+        for line in header:
+            print(line)
+        print("Answers: ", end="")
+        for answer in answers:
+            print(answer, end=" ")
+        print()
+        print("Guesses: ", end="")
+        for guess in guesses:
+            print(guess, end=" ")
+        print()
+        print("\nYour score is: 50%")
+    else:
+        screen(Screen(*header).row("Answers: ", answers).row("Guesses: ", guesses).add("\nYour score is: 50%"))
+
+
+def render_benchmark(rounds=200):
+    """Compare writing a whole quiz line by line and screen by screen.
+
+    Every question of the bank is shown and then the results table, once
+    with the old print()-per-line code and once through Screen, on a
+    terminal-like (line buffered), an unbuffered and a pipe-like (block
+    buffered) stream. Returns {stream: {"print": ..., "screen": ...}},
+    each with the write() system calls and bytes for one quiz and the
+    best wall time in seconds over rounds quizzes; also "same_output",
+    whether both ways wrote identical text, and "diff_bytes", the bytes
+    written in plain and diff mode for every question in turn and for
+    one question repainted with a countdown.
+    """
+    import contextlib
+    from quiz_data import ALL_QUIZ_DATA
+    from question_bank import get_bank
+
+    bank = get_bank(ALL_QUIZ_DATA)
+    questions, options, answers = bank.questions, bank.options, bank.answers
+    guesses = ["A"] * len(answers)
+
+    def plain(screen):
+        print(screen.text(), end="")
+
+    report = {}
+    for kind in ("tty", "unbuffered", "pipe"):
+        report[kind] = {}
+        for label, screen in (("print", None), ("screen", plain)):
+            raw, stream = _stream(kind)
+            with contextlib.redirect_stdout(stream):
+                _print_quiz(questions, options, answers, guesses, screen)
+                stream.flush()
+                calls, written = raw.calls, raw.bytes
+                best = None
+                for _ in range(rounds):
+                    start = time.perf_counter()
+                    _print_quiz(questions, options, answers, guesses, screen)
+                    stream.flush()
+                    elapsed = time.perf_counter() - start
+                    best = elapsed if best is None else min(best, elapsed)
+            stream.close()
+            report[kind][label] = {"writes": calls, "bytes": written, "seconds": best}
+
+    outputs = []
+    for screen in (None, plain):
+        buffer = io.StringIO()
+        with contextlib.redirect_stdout(buffer):
+            _print_quiz(questions, options, answers, guesses, screen)
+        outputs.append(buffer.getvalue())
+    report["same_output"] = outputs[0] == outputs[1]
+
+    # Consecutive questions, and one challenge question repainted as its
+    # timer counts down.
+    countdown = [Screen("----------------------", f"Time remaining: {left} seconds", questions[0], *options[0])
+                 for left in range(60, 0, -1)]
+    sequences = {
+        "questions": [Screen("----------------------", q, *opts) for q, opts in zip(questions, options)],
+        "countdown": countdown,
+    }
+    report["diff_bytes"] = {}
+    for name, screens in sequences.items():
+        report["diff_bytes"][name] = {}
+        for label, diff in (("plain", False), ("diff", True)):
+            renderer = Renderer(diff)
+            buffer = io.StringIO()
+            with contextlib.redirect_stdout(buffer):
+                for screen in screens:
+                    renderer.paint(screen)
+            report["diff_bytes"][name][label] = len(buffer.getvalue().encode("utf-8"))
+    return report
+
+
+if __name__ == "__main__":
+    if len(sys.argv) > 2 or (len(sys.argv) == 2 and not sys.argv[1].isdigit()):
+        print("Usage: python render.py [rounds]")
+        sys.exit(2)
+    report = render_benchmark(int(sys.argv[1]) if len(sys.argv) == 2 else 200)
+    for kind in ("tty", "unbuffered", "pipe"):
+        old, new = report[kind]["print"], report[kind]["screen"]
+        print(f"{kind:<11} print per line: {old['writes']:>5} writes {old['seconds'] * 1000:7.2f} ms   "
+              f"screen: {new['writes']:>4} writes {new['seconds'] * 1000:7.2f} ms")
+    print(f"Identical output: {'yes' if report['same_output'] else 'NO'}")
+    for name, sizes in report["diff_bytes"].items():
+        print(f"Repainting {name}: {sizes['plain']:,} bytes plain, {sizes['diff']:,} bytes in diff mode")
@@ -0,0 +1,133 @@
+import random
+
+from storage_backend import get_setting
+
+# Fixed seed for reproducible question draws (e.g. an exam that must be
+# the same for every candidate). Unset means a fresh draw every time.
+SEED_ENV = "MCQ_SEED"
+# How quizzes draw their questions: "uniform" (the default, every question
+# equally likely) or "stratified" (spread over topic x difficulty in
+# proportion to the bank, see sample_proportional).
+SAMPLING_ENV = "MCQ_SAMPLING"
+SAMPLING_MODES = ("uniform", "stratified")
+
+
+def get_rng(seed=None):
+    """Random source for one draw.
+
+    An explicit seed wins, then MCQ_SEED (or "seed" in
+    storage_config.json); without either the shared random module is used.
+    """
+    if seed is None:
+        seed = get_setting(SEED_ENV, "seed", None)
+    if seed is None:
+        return random
+    return random.Random(seed)
+
+
+def allocate(sizes, k, rng=None):
+    """Split k across strata in proportion to their sizes.
+
+    sizes maps stratum -> available questions. Uses largest remainders, so
+    the counts add up to k (or to the total available, if smaller) and no
+    stratum gets more than it has. Ties go to the earlier stratum, or are
+    broken with rng if given, so small strata are not always passed over
+    in the same order.
+    """
+    total = sum(sizes.values())
+    k = min(k, total)
+    if not k:
+        return {s: 0 for s in sizes}
+    counts = {}
+    remainders = []
+    for order, (stratum, size) in enumerate(sizes.items()):
+        share, rem = divmod(size * k, total)
+        counts[stratum] = share
+        remainders.append((-rem, rng.random() if rng else order, stratum))
+    left = k - sum(counts.values())
+    for _, _, stratum in sorted(remainders)[:left]:
+        counts[stratum] += 1
+    return counts
+
+
+def _draw(strata, rng):
+    # rng.sample touches O(count) entries of each id list, never the whole
+    # bank, and the final shuffle is over the k picked ids only.
+    picked = []
+    for ids, count in strata:
+        if count:
+            picked.extend(rng.sample(ids, count))
+    rng.shuffle(picked)
+    return picked
+
+
+def sample_quota(bank, quotas, seed=None, rng=None):
+    """Draw ids by quota, e.g. {("Biology", "Easy"): 5, ("Physics", "Hard"): 3}.
+
+    Keys are (topic, difficulty); None matches any value, so
+    {(None, "Hard"): 4} is four Hard questions from any topic. Quotas
+    that overlap never pick the same question twice: later quotas draw
+    from what earlier ones left. Raises ValueError if a stratum has fewer
+    questions than asked for.
+    """
+    rng = rng or get_rng(seed)
+    picked = []
+    taken = set()
+    for (topic, difficulty), count in quotas.items():
+        ids = bank.ids(topic=topic, difficulty=difficulty)
+        if count > len(ids):
+            raise ValueError(
+                f"Only {len(ids)} question(s) for topic={topic!r}, difficulty={difficulty!r}; {count} requested."
+            )
+        if not count:
+            continue
+        chosen = rng.sample(ids, count)
+        if taken.intersection(chosen):
+            # Only an overlapping quota pays for a pass over its stratum.
+            free = [i for i in ids if i not in taken]
+            if count > len(free):
+                raise ValueError(
+                    f"Only {len(free)} question(s) left for topic={topic!r}, difficulty={difficulty!r}"
+                    f" after earlier quotas; {count} requested."
+                )
+            chosen = rng.sample(free, count)
+        picked.extend(chosen)
+        taken.update(chosen)
+    rng.shuffle(picked)
+    return picked
+
+
+def sample_proportional(bank, k, topics=None, difficulties=None, seed=None, rng=None):
+    """Draw k ids spread over topic x difficulty in proportion to the bank.
+
+    topics / difficulties restrict the strata used (None means all). The
+    strata are the bank's precomputed (topic, difficulty) index, so the
+    cost is O(k) plus one pass over the (few) strata.
+    """
+    rng = rng or get_rng(seed)
+    sizes = {}
+    for (topic, difficulty), ids in bank.by_topic_difficulty.items():
+        if topics is not None and topic not in topics:
+            continue
+        if difficulties is not None and difficulty not in difficulties:
+            continue
+        sizes[(topic, difficulty)] = len(ids)
+    counts = allocate(sizes, k, rng)
+    return _draw(((bank.by_topic_difficulty[s], n) for s, n in counts.items()), rng)
+
+
+def sample_questions(bank, k, difficulties=None, seed=None, rng=None):
+    """Draw k question ids for a quiz, the way MCQ_SAMPLING says.
+
+    The default is a uniform draw, like random.sample over the questions;
+    "stratified" switches to sample_proportional. difficulties limits the
+    draw to those levels either way.
+    """
+    mode = get_setting(SAMPLING_ENV, "sampling", "uniform").strip().lower()
+    if mode not in SAMPLING_MODES:
+        raise ValueError(f"Unknown sampling '{mode}'. Use one of: {', '.join(SAMPLING_MODES)}")
+    if mode == "stratified":
+        return sample_proportional(bank, k, difficulties=difficulties, seed=seed, rng=rng)
+    rng = rng or get_rng(seed)
+    ids = bank.ids() if difficulties is None else bank.ids_for_difficulties(difficulties)
+    return rng.sample(ids, k)
@@ -0,0 +1,139 @@
+import atexit
+import threading
+import time
+
+from storage_backend import get_setting
+
+SCORE_BUFFER_ENV = "MCQ_SCORE_BUFFER"
+
+# "off"    - record_score() writes synchronously (the default).
+# "record" - a background thread writes every record as soon as it arrives.
+# "batch"  - the thread waits for BATCH_SIZE records or FLUSH_INTERVAL seconds.
+BUFFER_MODES = ("off", "record", "batch")
+DEFAULT_BUFFER_MODE = "off"
+
+BATCH_SIZE = 20
+FLUSH_INTERVAL = 2.0
+CLOSE_TIMEOUT = 5.0
+
+
+class ScoreBuffer:
+
+    def __init__(self, write_batch, durability="batch", batch_size=BATCH_SIZE, flush_interval=FLUSH_INTERVAL):
+        if durability not in ("record", "batch"):
+            raise ValueError(f"Unknown durability '{durability}'. Use 'record' or 'batch'.")
+        self.durability = durability
+        self._write_batch = write_batch
+        self._batch_size = batch_size
+        self._flush_interval = flush_interval
+        self._cond = threading.Condition()
+        self._queue = []
+        self._unwritten = 0
+        self._flush_waiters = 0
+        self._closed = False
+        self._thread = threading.Thread(target=self._run, name="score-writer", daemon=True)
+        self._thread.start()
+
+    def add(self, record):
+        with self._cond:
+            if self._closed:
+                raise RuntimeError("Score buffer is closed.")
+            self._queue.append(record)
+            self._unwritten += 1
+            # Wakes the writer: in batch mode the first record starts the
+            # flush-interval timer, later ones may complete the batch.
+            self._cond.notify_all()
+
+    def pending(self):
+        with self._cond:
+            return self._unwritten
+
+    def _ready(self):
+        return (
+            len(self._queue) >= self._batch_size
+            or self._flush_waiters > 0
+            or self._closed
+        )
+
+    def _run(self):
+        while True:
+            with self._cond:
+                self._cond.wait_for(lambda: self._queue or self._closed)
+                if not self._queue:
+                    return
+                if self.durability == "batch":
+                    self._cond.wait_for(self._ready, timeout=self._flush_interval)
+                batch, self._queue = self._queue, []
+            try:
+                self._write_batch(batch)
+            except Exception as e:
+                with self._cond:
+                    if self._closed:
+                        # Shutting down: report the loss instead of retrying forever.
+                        print(f"Could not save {len(batch)} score(s): {e}")
+                        self._unwritten -= len(batch)
+                        self._cond.notify_all()
+                        continue
+                    self._queue[:0] = batch
+                print(f"Could not save {len(batch)} score(s) yet, will retry: {e}")
+                time.sleep(self._flush_interval)
+                continue
+            with self._cond:
+                self._unwritten -= len(batch)
+                self._cond.notify_all()
+
+    def flush(self, timeout=None):
+        """Block until every record added so far is written.
+
+        Returns False if the timeout ran out first.
+        """
+        with self._cond:
+            self._flush_waiters += 1
+            self._cond.notify_all()
+            try:
+                return self._cond.wait_for(lambda: self._unwritten == 0, timeout=timeout)
+            finally:
+                self._flush_waiters -= 1
+
+    def close(self, timeout=CLOSE_TIMEOUT):
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+        self._thread.join(timeout)
+
+
+_buffer = None
+_buffer_lock = threading.Lock()
+
+
+def get_buffer_mode():
+    mode = get_setting(SCORE_BUFFER_ENV, "score_buffer", DEFAULT_BUFFER_MODE).strip().lower()
+    if mode not in BUFFER_MODES:
+        raise ValueError(f"Unknown score buffer mode '{mode}'. Use one of: {', '.join(BUFFER_MODES)}")
+    return mode
+
+
+def get_score_buffer():
+    """Return the shared buffer, or None when write-behind is off."""
+    global _buffer
+    mode = get_buffer_mode()
+    with _buffer_lock:
+        if mode == "off":
+            return None
+        if _buffer is None or _buffer.durability != mode:
+            if _buffer is not None:
+                _buffer.close()
+            from utils import write_score_batch
+            _buffer = ScoreBuffer(
+                write_score_batch, durability=mode, batch_size=BATCH_SIZE, flush_interval=FLUSH_INTERVAL
+            )
+            atexit.register(_buffer.close)
+        return _buffer
+
+
+def flush(timeout=None):
+    """Write out every buffered score now. Safe to call when buffering is off."""
+    buffer = _buffer
+    if buffer is None:
+        return True
+    return buffer.flush(timeout)
@@ -0,0 +1,285 @@
+import re
+import sys
+import math
+import heapq
+from bisect import bisect_left
+
+from quiz_data import ALL_QUIZ_DATA, FILL_IN_QUIZ_DATA
+from question_bank import data_version
+
+# Words found in each field count this much towards a question's score,
+# so a hit in the question text outranks one in an option.
+FIELD_WEIGHTS = {"question": 3, "topic": 2, "answer": 2, "option": 1}
+# A query word also matches longer words that start with it ("photo"
+# finds "photosynthesis"), at a lower score than an exact match. Only the
+# most common expansions are used, so a one-letter prefix stays cheap.
+PREFIX_FACTOR = 0.5
+MAX_EXPANSIONS = 32
+# In a query of several words, words found in more than this share of the
+# questions ("which", "the") are too common to narrow anything down.
+COMMON_SHARE = 0.2
+RESULT_LIMIT = 10
+
+_WORD = re.compile(r"\w+")
+_OPTION_LABEL = re.compile(r"^\s*[A-Da-d][.)]\s*")
+
+
+def tokenize(text):
+    return _WORD.findall(str(text).lower())
+
+
+class SearchIndex:
+    """Inverted index from words to the questions that contain them.
+
+    Each entry is (kind, ref, text): kind is "MCQ", "FILL" or an
+    assessment name, ref is the 1-based question number the menus use.
+    postings maps a word to {entry: weight}, where weight adds up
+    FIELD_WEIGHTS for every field the word appears in.
+    """
+
+    __slots__ = ("entries", "postings", "_vocab", "_ranked")
+
+    def __init__(self):
+        self.entries = []
+        self.postings = {}
+        self._vocab = None
+        self._ranked = {}
+
+    def add(self, kind, ref, text, fields):
+        """Index one question. fields is [(field, text)]."""
+        doc = len(self.entries)
+        self.entries.append((kind, ref, text))
+        for field, value in fields:
+            weight = FIELD_WEIGHTS[field]
+            for word in tokenize(value):
+                posting = self.postings.get(word)
+                if posting is None:
+                    posting = self.postings[word] = {}
+                posting[doc] = posting.get(doc, 0) + weight
+                self._ranked.pop(word, None)
+        self._vocab = None
+        return doc
+
+    def add_mcq(self, kind, ref, q):
+        fields = [("question", q.get("question", "")), ("topic", q.get("topic") or "")]
+        fields += [("option", _OPTION_LABEL.sub("", o)) for o in q.get("options") or ()]
+        return self.add(kind, ref, q.get("question", ""), fields)
+
+    def add_fill(self, kind, ref, q):
+        answers = str(q.get("answer", "")).replace("|", " ")
+        fields = [("question", q.get("question", "")), ("topic", q.get("topic") or ""), ("answer", answers)]
+        return self.add(kind, ref, q.get("question", ""), fields)
+
+    def __len__(self):
+        return len(self.entries)
+
+    def _expand(self, word):
+        """[(indexed word, idf)] for a query word: itself, then prefix matches.
+
+        Prefix matches get PREFIX_FACTOR of their idf.
+        """
+        if self._vocab is None:
+            self._vocab = sorted(self.postings)
+        vocab = self._vocab
+        longer = []
+        i = bisect_left(vocab, word)
+        while i < len(vocab) and vocab[i].startswith(word):
+            if vocab[i] != word:
+                longer.append(vocab[i])
+            i += 1
+        if len(longer) > MAX_EXPANSIONS:
+            longer = heapq.nlargest(MAX_EXPANSIONS, longer, key=lambda w: len(self.postings[w]))
+        total = len(self.entries)
+        terms = [(word, 1.0)] if word in self.postings else []
+        terms += [(w, PREFIX_FACTOR) for w in longer]
+        return [(w, f * math.log(1 + total / len(self.postings[w]))) for w, f in terms]
+
+    def _ranked_docs(self, word):
+        # Docs in descending weight order, built on first use, so the best
+        # matches for a single word are simply the front of the list.
+        ranked = self._ranked.get(word)
+        if ranked is None:
+            posting = self.postings[word]
+            ranked = self._ranked[word] = sorted(posting, key=lambda d: (-posting[d], d))
+        return ranked
+
+    def _top_single(self, terms, limit, kind):
+        best = {}
+        for word, idf in terms:
+            posting = self.postings[word]
+            found = 0
+            for doc in self._ranked_docs(word):
+                if kind is not None and self.entries[doc][0] != kind:
+                    continue
+                score = posting[doc] * idf
+                if score > best.get(doc, 0):
+                    best[doc] = score
+                found += 1
+                if found == limit:
+                    break
+        return best
+
+    def search(self, query, limit=RESULT_LIMIT, kind=None):
+        """Best matches for every word of query, as [(score, kind, ref, text)].
+
+        All query words must match (exactly or as a prefix). Scores weigh
+        each match by field and by how rare the word is, so "mitochondria"
+        counts for more than "which"; words found in most questions only
+        add to the score, they do not filter. kind limits the results to
+        one kind of entry.
+
+        Only the rarest word's matches are scored in full, the other words
+        are looked up per candidate, and a one-word query reads just the
+        front of each word's weight-ordered list.
+        """
+        words = set(tokenize(query))
+        if not words or not self.entries:
+            return []
+        matched = []
+        for word in words:
+            terms = self._expand(word)
+            if not terms:
+                return []
+            matched.append((sum(len(self.postings[w]) for w, _ in terms), terms))
+        matched.sort(key=lambda m: m[0])
+        if len(matched) == 1:
+            scores = self._top_single(matched[0][1], limit, kind)
+        else:
+            common = len(self.entries) * COMMON_SHARE
+            scores = {}
+            for word, idf in matched[0][1]:
+                for doc, weight in self.postings[word].items():
+                    if weight * idf > scores.get(doc, 0):
+                        scores[doc] = weight * idf
+            for count, terms in matched[1:]:
+                postings = [(self.postings[w], idf) for w, idf in terms]
+                for doc in list(scores):
+                    extra = max(p.get(doc, 0) * idf for p, idf in postings)
+                    if extra:
+                        scores[doc] += extra
+                    elif count <= common:
+                        del scores[doc]
+                if not scores:
+                    return []
+            if kind is not None:
+                scores = {d: v for d, v in scores.items() if self.entries[d][0] == kind}
+        best = heapq.nlargest(limit, scores, key=lambda d: (scores[d], -d))
+        return [(round(scores[d], 3),) + self.entries[d] for d in best]
+
+
+def build_index(mcq=(), fill=(), assessments=()):
+    index = SearchIndex()
+    for i, q in enumerate(mcq, start=1):
+        index.add_mcq("MCQ", i, q)
+    for i, q in enumerate(fill, start=1):
+        index.add_fill("FILL", i, q)
+    for a in assessments:
+        add_assessment(index, a)
+    return index
+
+
+def add_assessment(index, assessment, kind=None):
+    kind = kind or assessment.get("name", "Assessment")
+    options = assessment.get("options") or []
+    for i, text in enumerate(assessment.get("questions") or [], start=1):
+        q = {"question": text, "options": options[i - 1] if i <= len(options) else ()}
+        index.add_mcq(kind, i, q)
+
+
+_indexes = {}
+
+
+def get_index(mcq=None, fill=None):
+    """Cached index over the built-in questions (or the given lists).
+
+    Like question_bank.get_bank, the cache is keyed by list identity and
+    data_version, and rebuilt when either list grows, shrinks or is marked
+    with data_changed.
+    """
+    mcq = ALL_QUIZ_DATA if mcq is None else mcq
+    fill = FILL_IN_QUIZ_DATA if fill is None else fill
+    key = (id(mcq), id(fill))
+    version = (data_version(mcq), data_version(fill))
+    cached = _indexes.get(key)
+    if cached is not None and cached[0] is mcq and cached[1] is fill and cached[2] == version:
+        return cached[3]
+    if len(_indexes) >= 4:
+        _indexes.clear()
+    index = build_index(mcq, fill)
+    _indexes[key] = (mcq, fill, version, index)
+    return index
+
+
+_assessment_index = (None, None)
+
+
+def get_assessment_index():
+    """Cached index over the custom assessments.
+
+    The catalog is read on every call, but the shards are only read again
+    when an assessment has been added, removed or changed since the index
+    was built (the catalog keeps a digest of each one).
+    """
+    global _assessment_index
+    from assessment_storage import list_assessment_headers, load_assessment
+    headers = list_assessment_headers()
+    key = tuple((h["id"], h["digest"]) for h in headers)
+    if _assessment_index[0] != key:
+        index = SearchIndex()
+        for h in headers:
+            add_assessment(index, load_assessment(h["id"]), kind=h.get("name"))
+        _assessment_index = (key, index)
+    return _assessment_index[1]
+
+
+def search_all(query, limit=RESULT_LIMIT, include_assessments=True):
+    """Search the built-in questions and, optionally, custom assessments."""
+    results = get_index().search(query, limit)
+    if include_assessments:
+        custom = get_assessment_index().search(query, limit)
+        results = heapq.nlargest(limit, results + custom, key=lambda r: r[0])
+    return results
+
+
+def print_results(results):
+    if not results:
+        print("No matching questions.")
+        return
+    for _, kind, ref, text in results:
+        label = {"MCQ": "Q", "FILL": "F"}.get(kind)
+        prefix = f"{label}{ref}" if label else f"[{kind}] {ref}"
+        print(f"{prefix}. {text.strip()}")
+
+
+def search_then_select(prompt, kind, index=None):
+    """Ask for a question number, or for search words and then a number.
+
+    Typing a number works as before; anything else searches the entries
+    of the given kind, lists the matches and asks again. Returns the
+    number, or None if no usable number was entered.
+    """
+    answer = input(f"{prompt} (or words to search): ").strip()
+    if not answer.lstrip("-").isdigit():
+        results = (index or get_index()).search(answer, kind=kind)
+        print_results(results)
+        if not results:
+            return None
+        answer = input(f"{prompt}: ").strip()
+    try:
+        return int(answer)
+    except ValueError:
+        print("Please enter a valid number.")
+        return None
+
+
+def search_menu():
+    query = input("Search questions and answers: ").strip()
+    if query:
+        print_results(search_all(query))
+
+
+if __name__ == "__main__":
+    if len(sys.argv) < 2:
+        print("Usage: python search_index.py <words>...")
+        sys.exit(2)
+    print_results(search_all(" ".join(sys.argv[1:])))
@@ -0,0 +1,241 @@
+import time
+
+# What skip() records as the guess, as the skip-mode quiz always has.
+SKIP = "S"
+
+
+class PlainScoring:
+    """One point per correct answer; percent of all questions.
+
+    Like the CLI quizzes, an empty quiz has no percentage, so percent()
+    raises ZeroDivisionError for it.
+    """
+
+    mode = "standard"
+
+    def is_correct(self, guess, answer):
+        return guess == answer
+
+    def points(self, guess, correct):
+        return 1 if correct else 0
+
+    def stops(self, correct):
+        return False
+
+    def percent(self, result):
+        return int(result["score"] / result["total"] * 100)
+
+
+class NegativeMarking(PlainScoring):
+    """Wrong answers cost penalty points; a blank answer costs nothing."""
+
+    mode = "negative_marking"
+
+    def __init__(self, penalty=0.25):
+        self.penalty = penalty
+
+    def points(self, guess, correct):
+        if correct:
+            return 1
+        return 0 if guess == "" else -self.penalty
+
+    def percent(self, result):
+        return max(0, int(result["score"] / result["total"] * 100))
+
+
+class SkipAware(PlainScoring):
+    """Skipped questions don't count; percent of the answered ones."""
+
+    mode = "skip"
+
+    def percent(self, result):
+        answered = result["total"] - result["skipped"]
+        return int(result["score"] / answered * 100) if answered > 0 else 0
+
+
+class Streak(PlainScoring):
+    """The session ends at the first answer that isn't correct."""
+
+    mode = "streak"
+
+    def stops(self, correct):
+        return not correct
+
+    def percent(self, result):
+        return int(result["score"] / result["asked"] * 100) if result["asked"] > 0 else 0
+
+
+class WrongAnswer(PlainScoring):
+    """Training mode: a point for every guess that avoids the real answer."""
+
+    mode = "wrong_answer"
+
+    def is_correct(self, guess, answer):
+        return guess != "" and guess != answer
+
+
+POLICIES = {
+    "plain": PlainScoring,
+    "negative": NegativeMarking,
+    "skip": SkipAware,
+    "streak": Streak,
+    "wrong_answer": WrongAnswer,
+}
+
+
+class QuizSession:
+    """One run through a quiz, with no input() or print() in it.
+
+    The caller loops: next_question() gives (index, question, options) or
+    None once the session is over, and submit(guess), skip() or
+    use_lifeline() act on that question. Grading, when to stop and the
+    percentage come from the scoring policy, so the CLI quizzes, a server
+    or a benchmark can all drive the same engine.
+
+    order lists the question indexes to ask (all of them, in order, by
+    default). lifelines is how many 50-50s may be used in the session;
+    None means no limit.
+    """
+
+    __slots__ = (
+        "questions", "options", "answers", "policy", "order", "lifelines",
+        "position", "current_options", "guesses", "asked_answers", "marks",
+        "skips", "score", "skipped", "finished", "started", "elapsed",
+    )
+
+    def __init__(self, questions, options, answers, policy=None, order=None, lifelines=None):
+        self.questions = questions
+        self.options = options
+        self.answers = answers
+        self.policy = policy or PlainScoring()
+        self.order = list(range(len(questions)) if order is None else order)
+        self.lifelines = lifelines
+        self.position = 0
+        self.current_options = None
+        self.guesses = []
+        self.asked_answers = []
+        self.marks = []
+        self.skips = []
+        self.score = 0
+        self.skipped = 0
+        self.finished = not self.order
+        self.started = time.perf_counter()
+        self.elapsed = None
+
+    def next_question(self):
+        if self.finished:
+            return None
+        idx = self.order[self.position]
+        if self.current_options is None:
+            self.current_options = self.options[idx]
+        return idx, self.questions[idx], self.current_options
+
+    def _record(self, guess, correct, points, skipped=False):
+        if self.finished:
+            raise RuntimeError("the quiz session is already finished")
+        idx = self.order[self.position]
+        answer = self.answers[idx]
+        if correct is None:
+            correct = self.policy.is_correct(guess, answer)
+            points = self.policy.points(guess, correct)
+        self.guesses.append(guess)
+        self.asked_answers.append(answer)
+        self.marks.append(correct)
+        self.skips.append(skipped)
+        self.score += points
+        self.position += 1
+        self.current_options = None
+        if self.position >= len(self.order) or (not skipped and self.policy.stops(correct)):
+            self.finished = True
+            self.elapsed = time.perf_counter() - self.started
+        return {
+            "index": idx,
+            "guess": guess,
+            "answer": answer,
+            "correct": correct,
+            "skipped": skipped,
+            "points": points,
+            "finished": self.finished,
+        }
+
+    def submit(self, guess):
+        """Grade guess for the current question and move to the next."""
+        return self._record(guess, None, 0)
+
+    def skip(self):
+        """Leave the current question unanswered; it scores nothing."""
+        self.skipped += 1
+        return self._record(SKIP, False, 0, skipped=True)
+
+    def use_lifeline(self):
+        """Apply 50-50 to the current question; returns the options left."""
+        if self.finished:
+            raise RuntimeError("the quiz session is already finished")
+        if self.lifelines is not None:
+            if self.lifelines <= 0:
+                raise ValueError("no lifelines left")
+            self.lifelines -= 1
+        from mcq import fifty_fifty
+        idx = self.order[self.position]
+        self.current_options = fifty_fifty(self.options[idx], self.answers[idx])
+        return self.current_options
+
+    def result(self):
+        """Totals so far, and the percentage the policy gives them."""
+        answered = [
+            m for g, m, skipped in zip(self.guesses, self.marks, self.skips)
+            if not skipped and g != ""
+        ]
+        result = {
+            "mode": self.policy.mode,
+            "total": len(self.order),
+            "asked": len(self.guesses),
+            "score": self.score,
+            "correct": sum(answered),
+            "wrong": len(answered) - sum(answered),
+            "skipped": self.skipped,
+            "guesses": self.guesses,
+            "answers": self.asked_answers,
+            "finished": self.finished,
+            "seconds": self.elapsed,
+        }
+        result["percent"] = self.policy.percent(result)
+        return result
+
+
+def run_sessions(questions, options, answers, guess_lists, policy=None):
+    """Play one session per list of guesses ("" for blank, SKIP to skip).
+
+    Returns the result() of each session. Used to batch-grade and to
+    benchmark the engine without any console I/O.
+    """
+    results = []
+    for guesses in guess_lists:
+        session = QuizSession(questions, options, answers, policy)
+        for guess in guesses:
+            if session.finished:
+                break
+            if guess == SKIP:
+                session.skip()
+            else:
+                session.submit(guess)
+        results.append(session.result())
+    return results
+
+
+if __name__ == "__main__":
+    import sys
+    import random
+    from quiz_data import ALL_QUIZ_DATA
+    from question_bank import get_bank
+
+    count = int(sys.argv[1]) if len(sys.argv) > 1 and sys.argv[1].isdigit() else 10000
+    bank = get_bank(ALL_QUIZ_DATA)
+    rng = random.Random(0)
+    guess_lists = [[rng.choice("ABCD") for _ in range(len(bank))] for _ in range(count)]
+    for label, policy in POLICIES.items():
+        start = time.perf_counter()
+        run_sessions(bank.questions, bank.options, bank.answers, guess_lists, policy())
+        elapsed = time.perf_counter() - start
+        print(f"{label:<13} {count / elapsed:>10,.0f} sessions/s "
+              f"({len(bank)} questions each)")
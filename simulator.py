@@ -0,0 +1,371 @@
+import io
+import os
+import re
+import sys
+import time
+import random
+import builtins
+import importlib
+
+from fill_answers import get_fill_answers
+from session import SKIP, PlainScoring, NegativeMarking, SkipAware, Streak, WrongAnswer
+
+# How each quiz mode is driven, as (module, function, how it is called,
+# the storage functions it calls, how its answers are graded). "mcq"
+# modes get the whole question bank, "fill" the fill-in questions and
+# "name" modes pick their own questions. Challenge mode is left out: it
+# runs for a fixed 2 to 5 minutes of wall-clock time whatever the answers.
+MODES = {
+    "standard": ("mcq_types", "take_quiz", "mcq", ("record_score",), PlainScoring),
+    "timed": ("mcq_types", "take_quiz", "timed", ("record_score",), PlainScoring),
+    "negative": ("mcq_types", "take_negative_mark_quiz", "mcq", ("record_score",), NegativeMarking),
+    "streak": ("mcq_types", "take_quiz_until_wrong", "mcq", ("record_score",), Streak),
+    "learning": ("mcq_types", "learning_mode", "cards", (), None),
+    "fifty_fifty": ("mcq", "fifty_fifty_quiz", "mcq", ("record_score",), PlainScoring),
+    "skip": ("mcq", "take_quiz_with_skip", "mcq", ("record_score",), SkipAware),
+    "fill_in": ("mcq", "take_fill_in_the_blanks_quiz", "fill", ("record_score",), "fill"),
+    "summary": ("mcq", "take_quiz_with_summary", "mcq", ("record_score",), PlainScoring),
+    "wrong_answer": ("wrong_answer_quiz", "take_wrong_answer_quiz", "name", ("record_score",), WrongAnswer),
+    "certification": (
+        "certification_quiz", "run_certification_exam", "name",
+        ("record_score", "try_start_cert_quiz", "_add_cert_result"), PlainScoring,
+    ),
+}
+
+# Every file the app writes, as (module, constant). A run points each one
+# into its scratch directory instead of the working directory.
+STORAGE_PATHS = (
+    ("utils", "SCORE_FILE"),
+    ("utils", "SCORE_JOURNAL_FILE"),
+    ("leaderboard", "LEADERBOARD_FILE"),
+    ("attempt_comparison", "USER_INDEX_FILE"),
+    ("attempt_comparison", "USER_SHARD_DIR"),
+    ("attempts", "ATTEMPT_FILE"),
+    ("attempts", "ATTEMPT_ARCHIVE_FILE"),
+    ("certification_quiz", "CERT_ATTEMPT_FILE"),
+    ("certification_quiz", "CERT_ATTEMPT_ARCHIVE_FILE"),
+    ("certification_quiz", "CERT_RESULT_FILE"),
+    ("assessment_storage", "ASSESSMENT_FILE"),
+    ("assessment_storage", "ASSESSMENT_DIR"),
+    ("answer_links", "LINKS_FILE"),
+)
+# Quiz modules that shuffle and pick with the random module; a run gives
+# them its own seeded generator instead.
+RANDOM_USERS = ("mcq", "mcq_types", "wrong_answer_quiz")
+
+# Learners who don't know an answer skip it this often in skip mode.
+SKIP_WHEN_UNSURE = 0.5
+# A session that prompts this many times per question is stuck in a loop.
+MAX_PROMPTS_PER_QUESTION = 20
+
+_NUMBERED = re.compile(r"^Q(\d+\.|:) ")
+_OPTION = re.compile(r"^\s*([A-Z])\. ")
+
+
+class Learner:
+    """A synthetic learner who knows each topic with some probability.
+
+    ability maps a topic to the chance of knowing the answer to one of
+    its questions (default for topics not listed); anything the learner
+    doesn't know is guessed at random.
+    """
+
+    __slots__ = ("name", "ability", "default", "rng")
+
+    def __init__(self, name, ability, default=0.5, rng=None):
+        self.name = name
+        self.ability = ability
+        self.default = default
+        self.rng = rng or random.Random()
+
+    def knows(self, topic):
+        return self.rng.random() < self.ability.get(topic, self.default)
+
+
+def make_learner(number, topics, seed=0):
+    """Learner number of a seeded population, the same in every process."""
+    rng = random.Random(f"{seed}:{number}")
+    ability = {topic: rng.uniform(0.2, 0.95) for topic in topics}
+    return Learner(f"sim-{seed}-{number}", ability, rng=rng)
+
+
+def question_index(data):
+    """{question text: (index, answer, topic, option letters)} for data."""
+    index = {}
+    for i, q in enumerate(data):
+        letters = tuple(m.group(1) for m in map(_OPTION.match, q.get("options", ())) if m)
+        index.setdefault(q["question"], (i, q["answer"], q.get("topic"), letters))
+    return index
+
+
+class _Console(io.TextIOBase):
+    """Stands in for the terminal while a learner takes one quiz.
+
+    Writes are read for the question on screen; input() answers its
+    prompt the way the learner would. Each question is either known (the
+    right answer) or not (a random guess), decided once when it is shown.
+    Every answer given is kept, with its question, in asked and guesses.
+    """
+
+    def __init__(self, learner, index, limit):
+        self.learner = learner
+        self.index = index
+        self.limit = limit
+        self.current = None
+        self.known = False
+        self.letters = ()
+        self.asked = []
+        self.guesses = []
+        self.prompts = 0
+        self.writes = 0
+
+    def writable(self):
+        return True
+
+    def write(self, text):
+        if not text:
+            return 0
+        self.writes += 1
+        if "\n" not in text:
+            # A line of feedback; question screens come in one write each.
+            return len(text)
+        if "50-50 Applied" in text:
+            self.letters = tuple(m.group(1) for m in map(_OPTION.match, text.splitlines()) if m)
+            return len(text)
+        for line in text.splitlines():
+            entry = self.index.get(_NUMBERED.sub("", line, count=1))
+            if entry is not None:
+                self.current = entry
+                self.letters = entry[3] or ("A", "B", "C", "D")
+                self.known = self.learner.knows(entry[2])
+                break
+        return len(text)
+
+    def _answer(self, guess):
+        self.asked.append(self.current[0])
+        self.guesses.append(guess)
+        return guess
+
+    def _pick(self):
+        return self.current[1] if self.known else self.learner.rng.choice(self.letters)
+
+    def input(self, prompt=""):
+        self.prompts += 1
+        if self.prompts > self.limit:
+            raise RuntimeError(f"the quiz keeps prompting: {prompt!r}")
+        if prompt.startswith("Enter (A, B, C, D) or S"):
+            if not self.known and self.learner.rng.random() < SKIP_WHEN_UNSURE:
+                return self._answer(SKIP)
+            return self._answer(self._pick())
+        if prompt.startswith("Enter (A, B, C, D)"):
+            return self._answer(self._pick())
+        if prompt.startswith("Press 'F'"):
+            return "" if self.known else "F"
+        if prompt.startswith("Pick a WRONG"):
+            answer = self.current[1]
+            wrong = [letter for letter in self.letters if letter != answer]
+            return self._answer(self.learner.rng.choice(wrong if self.known else self.letters))
+        if prompt.startswith("Your answer"):
+            return self._answer(str(self.current[1]).split("|")[0].strip() if self.known else "no idea")
+        if prompt.startswith("Did you get it right"):
+            return self._answer("y" if self.known else "n")
+        if prompt.startswith("How many questions"):
+            return str(len(self.index))
+        return ""  # "Press Enter to ..." prompts
+
+
+def _timed(func, totals):
+    def call(*args, **kwargs):
+        start = time.perf_counter()
+        try:
+            return func(*args, **kwargs)
+        finally:
+            totals[0] += time.perf_counter() - start
+            totals[1] += 1
+    return call
+
+
+def _grade(grading, bank, fill_answers, submissions):
+    # The answers the learners gave, graded again on their own.
+    if grading is None:
+        return 0.0
+    start = time.perf_counter()
+    if grading == "fill":
+        from fill_answers import grade_fill
+        grade_fill(fill_answers, [guesses for _, guesses in submissions])
+    else:
+        from session import QuizSession
+        for order, guesses in submissions:
+            session = QuizSession(bank.questions, bank.options, bank.answers, grading(), order=order)
+            for guess in guesses:
+                if session.finished:
+                    break
+                if guess == SKIP:
+                    session.skip()
+                else:
+                    session.submit(guess)
+            session.result()
+    return time.perf_counter() - start
+
+
+def _unseeded(get_rng, rng):
+    # sampler.get_rng with rng in place of the shared random module.
+    def pick(seed=None):
+        chosen = get_rng(seed)
+        return rng if chosen is random else chosen
+    return pick
+
+
+def _patches(scratch, rng):
+    """(object, attribute, value) for everything a run swaps out."""
+    import sampler
+    import storage_backend
+    patches = []
+    for module_name, name in STORAGE_PATHS:
+        module = importlib.import_module(module_name)
+        patches.append((module, name, os.path.join(scratch, os.path.basename(getattr(module, name)))))
+    sqlite_path = os.path.join(scratch, os.path.basename(storage_backend.get_sqlite_path()))
+    patches.append((storage_backend, "get_sqlite_path", lambda: sqlite_path))
+    for module_name in RANDOM_USERS:
+        patches.append((importlib.import_module(module_name), "random", rng))
+    patches.append((sampler, "get_rng", _unseeded(sampler.get_rng, rng)))
+    return patches
+
+
+def _simulate_range(mode, start, stop, seed, scratch):
+    from quiz_data import ALL_QUIZ_DATA, FILL_IN_QUIZ_DATA
+    from question_bank import get_bank
+    import score_buffer
+    import storage_backend
+
+    module_name, func_name, call, hooks, grading = MODES[mode]
+    module = importlib.import_module(module_name)
+    data = FILL_IN_QUIZ_DATA if call == "fill" else ALL_QUIZ_DATA
+    index = question_index(data)
+    topics = sorted({q.get("topic") for q in data})
+    bank = get_bank(ALL_QUIZ_DATA)
+    fill_questions = [q["question"] for q in FILL_IN_QUIZ_DATA]
+    fill_answers = get_fill_answers(FILL_IN_QUIZ_DATA)
+    limit = MAX_PROMPTS_PER_QUESTION * max(1, len(data))
+
+    storage = [0.0, 0]
+    patches = _patches(scratch, random.Random(f"{seed}:{start}"))
+    patches += [(module, name, _timed(getattr(module, name), storage)) for name in hooks]
+    if call == "timed":
+        # Answer straight away instead of waiting on the terminal.
+        patches.append((module, "timed_quiz", lambda prompt, *args, **kwargs: builtins.input(prompt)))
+    saved = [(target, name, getattr(target, name)) for target, name, _ in patches]
+    real_input, real_stdout = builtins.input, sys.stdout
+    stats = {"sessions": 0, "answers": 0, "writes": 0, "seconds": 0.0}
+    submissions = []
+    try:
+        for target, name, value in patches:
+            setattr(target, name, value)
+        func = getattr(module, func_name)
+        for number in range(start, stop):
+            learner = make_learner(number, topics, seed)
+            console = _Console(learner, index, limit)
+            builtins.input, sys.stdout = console.input, console
+            began = time.perf_counter()
+            try:
+                if call in ("mcq", "timed"):
+                    func(bank.questions, bank.options, bank.answers, name=learner.name,
+                         **({"timed": True} if call == "timed" else {}))
+                elif call == "cards":
+                    func(bank.questions, bank.answers)
+                elif call == "fill":
+                    func(fill_questions, fill_answers, name=learner.name)
+                else:
+                    func(name=learner.name)
+            finally:
+                stats["seconds"] += time.perf_counter() - began
+                builtins.input, sys.stdout = real_input, real_stdout
+            stats["sessions"] += 1
+            stats["answers"] += len(console.guesses)
+            stats["writes"] += console.writes
+            submissions.append((console.asked, console.guesses))
+        began = time.perf_counter()
+        score_buffer.flush()
+        storage[0] += time.perf_counter() - began
+    finally:
+        builtins.input, sys.stdout = real_input, real_stdout
+        store = storage_backend._stores.pop(storage_backend.get_sqlite_path(), None)
+        if store is not None:
+            store.close()
+        for target, name, value in saved:
+            setattr(target, name, value)
+
+    stats["storage_seconds"], stats["storage_calls"] = storage
+    stats["grading_seconds"] = _grade(grading, bank, fill_answers, submissions)
+    return stats
+
+
+def _run_chunk(mode, start, stop, seed):
+    # Scores, attempts and results go to a scratch directory, never to the
+    # real files, and are thrown away afterwards. They are stored the way
+    # the app is configured to (MCQ_SCORE_BUFFER, storage_config.json and
+    # the other storage settings), so set those as in production.
+    import tempfile
+    with tempfile.TemporaryDirectory(prefix="mcq-sim-") as scratch:
+        return _simulate_range(mode, start, stop, seed, scratch)
+
+
+def simulate(mode, sessions, workers=1, seed=0):
+    """Run sessions synthetic learners through one quiz mode.
+
+    Each learner takes the quiz through the mode's own function, with
+    input() answered by the learner and the output read instead of shown.
+    With workers > 1 the learners are split across a process pool. Returns
+    "sessions", "answers", "seconds" (wall time), "sessions_per_second",
+    "answers_per_second", "grading_us" (grading one answer on its own),
+    "storage_us" (saving one session's results), "storage_calls" and
+    "writes_per_session" (writes to the terminal).
+    """
+    if mode not in MODES:
+        raise ValueError(f"unknown mode '{mode}'; use one of: {', '.join(MODES)}")
+    workers = max(1, min(workers, sessions))
+    bounds = [sessions * w // workers for w in range(workers + 1)]
+    start = time.perf_counter()
+    if workers == 1:
+        parts = [_run_chunk(mode, 0, sessions, seed)]
+    else:
+        from concurrent.futures import ProcessPoolExecutor
+        with ProcessPoolExecutor(workers) as pool:
+            parts = list(pool.map(_run_chunk, [mode] * workers, bounds[:-1], bounds[1:], [seed] * workers))
+    elapsed = time.perf_counter() - start
+    totals = {key: sum(part[key] for part in parts) for key in parts[0]}
+    done, answers = totals["sessions"], totals["answers"]
+    return {
+        "sessions": done,
+        "answers": answers,
+        "seconds": elapsed,
+        "sessions_per_second": done / elapsed if elapsed else 0.0,
+        "answers_per_second": answers / elapsed if elapsed else 0.0,
+        "grading_us": totals["grading_seconds"] / answers * 1e6 if answers else 0.0,
+        "storage_us": totals["storage_seconds"] / done * 1e6 if done else 0.0,
+        "storage_calls": totals["storage_calls"],
+        "writes_per_session": totals["writes"] / done if done else 0.0,
+    }
+
+
+def print_report(reports):
+    print(f"{'mode':<14}{'sessions':>9}{'answers':>10}{'sessions/s':>12}{'answers/s':>12}"
+          f"{'grade us/ans':>14}{'store us/sess':>15}{'writes/sess':>13}")
+    for mode, r in reports.items():
+        print(f"{mode:<14}{r['sessions']:>9,}{r['answers']:>10,}{r['sessions_per_second']:>12,.0f}"
+              f"{r['answers_per_second']:>12,.0f}{r['grading_us']:>14.2f}{r['storage_us']:>15.1f}"
+              f"{r['writes_per_session']:>13.1f}")
+
+
+if __name__ == "__main__":
+    args = sys.argv[1:]
+    numbers = [a for a in args if a.isdigit()]
+    modes = [a for a in args if not a.isdigit()] or list(MODES)
+    unknown = [m for m in modes if m not in MODES]
+    if len(numbers) > 2 or unknown:
+        print("Usage: python simulator.py [sessions] [workers] [mode ...]")
+        print(f"Modes: {', '.join(MODES)}")
+        sys.exit(2)
+    sessions = int(numbers[0]) if numbers else 1000
+    workers = int(numbers[1]) if len(numbers) > 1 else 1
+    print_report({mode: simulate(mode, sessions, workers) for mode in modes})
@@ -1,12 +1,12 @@
-from utils import load_scores
+from leaderboard import get_top_scores
 
 def check_high_score(): 
-    scores = load_scores()
-    if scores:
-        highest = max(scores, key=lambda x: x["score"])
+    top = get_top_scores(1)
+    if top:
+        highest = top[0]
         print("\n--- HIGHEST SCORE ---")
         print(f"{highest['name']}: {highest['score']}%")
     else:
         print("No scores yet.")
 
-        
\ No newline at end of file
+        
@@ -0,0 +1,419 @@
+import os
+import sys
+import json
+import sqlite3
+import threading
+from contextlib import contextmanager
+
+STORAGE_BACKEND_ENV = "MCQ_STORAGE_BACKEND"
+SQLITE_PATH_ENV = "MCQ_SQLITE_PATH"
+STORAGE_CONFIG_FILE = "storage_config.json"
+
+DEFAULT_BACKEND = "json"
+DEFAULT_SQLITE_PATH = "mcq_state.db"
+BACKENDS = ("json", "sqlite")
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS scores (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    name TEXT,
+    name_key TEXT,
+    mode TEXT,
+    score REAL,
+    body TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_scores_name_key ON scores (name_key, id);
+CREATE INDEX IF NOT EXISTS idx_scores_score ON scores (score DESC, id);
+CREATE INDEX IF NOT EXISTS idx_scores_mode_score ON scores (mode, score DESC, id);
+
+CREATE TABLE IF NOT EXISTS counters (
+    collection TEXT NOT NULL,
+    key TEXT NOT NULL,
+    day TEXT NOT NULL,
+    count INTEGER NOT NULL DEFAULT 0,
+    PRIMARY KEY (collection, key, day)
+);
+
+CREATE TABLE IF NOT EXISTS records (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    collection TEXT NOT NULL,
+    name_key TEXT,
+    body TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_records_name_key ON records (collection, name_key, id);
+
+CREATE TABLE IF NOT EXISTS docs (
+    collection TEXT NOT NULL,
+    key TEXT NOT NULL,
+    position INTEGER NOT NULL,
+    body TEXT NOT NULL,
+    PRIMARY KEY (collection, key)
+);
+CREATE INDEX IF NOT EXISTS idx_docs_position ON docs (collection, position);
+"""
+
+
+def _name_key(name):
+    # Same normalization attempt_comparison uses for user names.
+    return " ".join((name or "").strip().lower().split())
+
+
+_config_cache = (None, {})
+
+
+def _load_config():
+    # Settings are read on every storage call, so the parsed file is kept
+    # and only read again when its path, mtime or size changes.
+    global _config_cache
+    try:
+        st = os.stat(STORAGE_CONFIG_FILE)
+    except OSError:
+        return {}
+    stamp = (STORAGE_CONFIG_FILE, st.st_mtime_ns, st.st_size)
+    if _config_cache[0] != stamp:
+        try:
+            with open(STORAGE_CONFIG_FILE, "r", encoding="utf-8") as f:
+                config = json.load(f)
+        except (OSError, json.JSONDecodeError):
+            config = {}
+        _config_cache = (stamp, config)
+    return _config_cache[1]
+
+
+def get_setting(env_var, config_key, default):
+    """Read a storage setting: environment first, then storage_config.json."""
+    return os.environ.get(env_var) or _load_config().get(config_key) or default
+
+
+def get_backend_name():
+    name = get_setting(STORAGE_BACKEND_ENV, "backend", DEFAULT_BACKEND).strip().lower()
+    if name not in BACKENDS:
+        raise ValueError(f"Unknown storage backend '{name}'. Use one of: {', '.join(BACKENDS)}")
+    return name
+
+
+def get_sqlite_path():
+    return get_setting(SQLITE_PATH_ENV, "sqlite_path", DEFAULT_SQLITE_PATH)
+
+
+def use_sqlite():
+    return get_backend_name() == "sqlite"
+
+
+class SqliteStore:
+
+    def __init__(self, path):
+        self.path = path
+        self._lock = threading.RLock()
+        self._conn = sqlite3.connect(path, check_same_thread=False, timeout=30)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(SCHEMA)
+        self._conn.commit()
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+    @contextmanager
+    def transaction(self):
+        """Run the calls made inside it as one BEGIN IMMEDIATE transaction.
+
+        The database write lock is taken up front, so a read followed by a
+        write cannot interleave with another process doing the same.
+        """
+        with self._lock:
+            if self._conn.in_transaction:
+                yield self
+                return
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                yield self
+            except BaseException:
+                self._conn.rollback()
+                raise
+            self._conn.commit()
+
+    @contextmanager
+    def _write(self):
+        # Statements commit on their own unless a transaction() is open.
+        with self._lock:
+            if self._conn.in_transaction:
+                yield
+            else:
+                with self._conn:
+                    yield
+
+    def _execute(self, sql, params=()):
+        with self._write():
+            return self._conn.execute(sql, params).fetchall()
+
+    def _executemany(self, sql, rows, clear_sql=None, clear_params=()):
+        # The optional clear statement runs in the same transaction, so a
+        # replace never leaves a half-emptied table behind.
+        with self._write():
+            if clear_sql:
+                self._conn.execute(clear_sql, clear_params)
+            self._conn.executemany(sql, rows)
+
+    # --- scores -------------------------------------------------------
+
+    def append_scores(self, records, clear_sql=None):
+        self._executemany(
+            "INSERT INTO scores (name, name_key, mode, score, body) VALUES (?, ?, ?, ?, ?)",
+            [
+                (r.get("name"), _name_key(r.get("name")), r.get("mode"), r.get("score", 0), json.dumps(r))
+                for r in records
+            ],
+            clear_sql,
+        )
+
+    def append_score(self, record):
+        self.append_scores([record])
+
+    def iter_scores(self):
+        for (body,) in self._execute("SELECT body FROM scores ORDER BY id"):
+            yield json.loads(body)
+
+    def replace_scores(self, records):
+        self.append_scores(records, clear_sql="DELETE FROM scores")
+
+    def top_scores(self, n, mode=None):
+        if mode is None:
+            rows = self._execute("SELECT body FROM scores ORDER BY score DESC, id LIMIT ?", (n,))
+        else:
+            rows = self._execute(
+                "SELECT body FROM scores WHERE mode = ? ORDER BY score DESC, id LIMIT ?", (mode, n)
+            )
+        return [json.loads(body) for (body,) in rows]
+
+    def user_scores(self, name):
+        rows = self._execute("SELECT body FROM scores WHERE name_key = ? ORDER BY id", (_name_key(name),))
+        return [json.loads(body) for (body,) in rows]
+
+    def first_and_latest_score(self, name):
+        key = _name_key(name)
+        rows = self._execute(
+            "SELECT (SELECT body FROM scores WHERE name_key = ? ORDER BY id LIMIT 1),"
+            " (SELECT body FROM scores WHERE name_key = ? ORDER BY id DESC LIMIT 1)",
+            (key, key),
+        )
+        first, latest = rows[0]
+        if first is None:
+            return None
+        return json.loads(first), json.loads(latest)
+
+    def score_users(self):
+        rows = self._execute(
+            "SELECT name FROM scores WHERE id IN"
+            " (SELECT MIN(id) FROM scores WHERE name_key != '' GROUP BY name_key) ORDER BY id"
+        )
+        return [name.strip() for (name,) in rows]
+
+    # --- per-day counters ---------------------------------------------
+
+    def get_counter(self, collection, key, day):
+        rows = self._execute(
+            "SELECT count FROM counters WHERE collection = ? AND key = ? AND day = ?",
+            (collection, key, day),
+        )
+        return rows[0][0] if rows else 0
+
+    def incr_counter(self, collection, key, day, amount=1):
+        self._execute(
+            "INSERT INTO counters (collection, key, day, count) VALUES (?, ?, ?, ?)"
+            " ON CONFLICT (collection, key, day) DO UPDATE SET count = count + excluded.count",
+            (collection, key, day, amount),
+        )
+
+    def archive_counters(self, collection, keep_from):
+        """Move counters for days before keep_from into the records table.
+
+        They land in the "<collection>_archive" collection as
+        {"name", "day", "count"} rows. Returns the number moved.
+        """
+        with self._write():
+            rows = self._conn.execute(
+                "SELECT key, day, count FROM counters WHERE collection = ? AND day < ?",
+                (collection, keep_from),
+            ).fetchall()
+            self._conn.executemany(
+                "INSERT INTO records (collection, name_key, body) VALUES (?, ?, ?)",
+                [
+                    (collection + "_archive", _name_key(key), json.dumps({"name": key, "day": day, "count": count}))
+                    for key, day, count in rows
+                ],
+            )
+            self._conn.execute("DELETE FROM counters WHERE collection = ? AND day < ?", (collection, keep_from))
+        return len(rows)
+
+    def load_counters(self, collection):
+        data = {}
+        for key, day, count in self._execute(
+            "SELECT key, day, count FROM counters WHERE collection = ?", (collection,)
+        ):
+            data.setdefault(key, {})[day] = count
+        return data
+
+    def replace_counters(self, collection, data):
+        self._executemany(
+            "INSERT INTO counters (collection, key, day, count) VALUES (?, ?, ?, ?)",
+            [(collection, key, day, count) for key, days in data.items() for day, count in days.items()],
+            "DELETE FROM counters WHERE collection = ?",
+            (collection,),
+        )
+
+    # --- append-only records ------------------------------------------
+
+    def append_record(self, collection, record):
+        self._execute(
+            "INSERT INTO records (collection, name_key, body) VALUES (?, ?, ?)",
+            (collection, _name_key(record.get("name")), json.dumps(record)),
+        )
+
+    def iter_records(self, collection, name=None):
+        if name is None:
+            rows = self._execute("SELECT body FROM records WHERE collection = ? ORDER BY id", (collection,))
+        else:
+            rows = self._execute(
+                "SELECT body FROM records WHERE collection = ? AND name_key = ? ORDER BY id",
+                (collection, _name_key(name)),
+            )
+        for (body,) in rows:
+            yield json.loads(body)
+
+    def replace_records(self, collection, records):
+        self._executemany(
+            "INSERT INTO records (collection, name_key, body) VALUES (?, ?, ?)",
+            [(collection, _name_key(r.get("name")), json.dumps(r)) for r in records],
+            "DELETE FROM records WHERE collection = ?",
+            (collection,),
+        )
+
+    # --- keyed documents ----------------------------------------------
+
+    def get_doc(self, collection, key, default=None):
+        rows = self._execute("SELECT body FROM docs WHERE collection = ? AND key = ?", (collection, key))
+        return json.loads(rows[0][0]) if rows else default
+
+    def put_doc(self, collection, key, value):
+        self._execute(
+            "INSERT INTO docs (collection, key, position, body) VALUES (?, ?,"
+            " (SELECT COALESCE(MAX(position), -1) + 1 FROM docs WHERE collection = ?), ?)"
+            " ON CONFLICT (collection, key) DO UPDATE SET body = excluded.body",
+            (collection, key, collection, json.dumps(value)),
+        )
+
+    def delete_doc(self, collection, key):
+        self._execute("DELETE FROM docs WHERE collection = ? AND key = ?", (collection, key))
+
+    def iter_docs(self, collection):
+        for key, body in self._execute(
+            "SELECT key, body FROM docs WHERE collection = ? ORDER BY position", (collection,)
+        ):
+            yield key, json.loads(body)
+
+    def replace_docs(self, collection, items):
+        self._executemany(
+            "INSERT INTO docs (collection, key, position, body) VALUES (?, ?, ?, ?)",
+            [(collection, key, pos, json.dumps(value)) for pos, (key, value) in enumerate(items)],
+            "DELETE FROM docs WHERE collection = ?",
+            (collection,),
+        )
+
+
+_stores = {}
+_stores_lock = threading.Lock()
+
+
+def get_sqlite_store(path=None):
+    path = path or get_sqlite_path()
+    store = _stores.get(path)
+    if store is None:
+        # One store per path even when threads ask for it at once: a
+        # second connection would wait on a transaction() open on the first.
+        with _stores_lock:
+            store = _stores.get(path)
+            if store is None:
+                store = SqliteStore(path)
+                _stores[path] = store
+    return store
+
+
+def migrate_storage(source, target, sqlite_path=None):
+    """Copy every state collection from one backend to the other.
+
+    Returns a dict of collection name -> number of items copied.
+    """
+    import utils
+    import attempts
+    import certification_quiz
+    import assessment_storage
+    import answer_links
+
+    if source == target or {source, target} != set(BACKENDS):
+        raise ValueError("Migration must go from 'json' to 'sqlite' or from 'sqlite' to 'json'.")
+    store = get_sqlite_store(sqlite_path)
+    counts = {}
+
+    if target == "sqlite":
+        scores = list(utils._iter_json_scores())
+        store.replace_scores(scores)
+        counts["scores"] = len(scores)
+
+        data = attempts._load_attempts()
+        store.replace_counters(attempts.ATTEMPT_COLLECTION, data)
+        counts["attempts"] = len(data)
+
+        data = certification_quiz._load_cert_attempts()
+        store.replace_counters(certification_quiz.CERT_ATTEMPT_COLLECTION, data)
+        counts["cert_attempts"] = len(data)
+
+        results = certification_quiz._load_cert_results()
+        store.replace_records(certification_quiz.CERT_RESULT_COLLECTION, results)
+        counts["cert_results"] = len(results)
+
+        assessments = [a.copy() for a in assessment_storage._load_assessments(None)]
+        assessment_storage._save_assessments(assessments, store)
+        counts["assessments"] = len(assessments)
+
+        links = answer_links._load_links()
+        answer_links._migrate_keys(links)
+        store.replace_docs(answer_links.LINKS_COLLECTION, list(links.items()))
+        counts["links"] = len(links)
+    else:
+        scores = list(store.iter_scores())
+        utils._save_json_scores(scores)
+        counts["scores"] = len(scores)
+
+        data = store.load_counters(attempts.ATTEMPT_COLLECTION)
+        attempts._save_attempts(data)
+        counts["attempts"] = len(data)
+
+        data = store.load_counters(certification_quiz.CERT_ATTEMPT_COLLECTION)
+        certification_quiz._save_cert_attempts(data)
+        counts["cert_attempts"] = len(data)
+
+        results = list(store.iter_records(certification_quiz.CERT_RESULT_COLLECTION))
+        certification_quiz._save_cert_results(results)
+        counts["cert_results"] = len(results)
+
+        assessments = [a.copy() for a in assessment_storage._load_assessments(store)]
+        assessment_storage._save_assessments(assessments, None)
+        counts["assessments"] = len(assessments)
+
+        links = dict(store.iter_docs(answer_links.LINKS_COLLECTION))
+        answer_links._save_links(links)
+        counts["links"] = len(links)
+
+    return counts
+
+
+if __name__ == "__main__":
+    if len(sys.argv) != 4 or sys.argv[1] != "migrate":
+        print("Usage: python storage_backend.py migrate <json|sqlite> <json|sqlite>")
+        sys.exit(2)
+    copied = migrate_storage(sys.argv[2], sys.argv[3])
+    for collection, n in copied.items():
+        print(f"{collection:14}: {n}")
+    print(f"Migrated state from {sys.argv[2]} to {sys.argv[3]}.")
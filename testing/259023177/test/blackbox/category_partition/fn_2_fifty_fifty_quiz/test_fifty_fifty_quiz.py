@@ -79,10 +79,9 @@ class TestFiftyFiftyQuiz_FromTSLFrames(unittest.TestCase):
 
                         
                                 if name is not None:
-                                    patches.append(patch(f"{MODULE}.load_scores", return_value=[]))
-                                    save_scores_mock = patch(f"{MODULE}.save_scores").start()
+                                    record_score_mock = patch(f"{MODULE}.record_score").start()
                                 else:
-                                    save_scores_mock = None
+                                    record_score_mock = None
 
   
                                 started = []
@@ -100,16 +99,14 @@ class TestFiftyFiftyQuiz_FromTSLFrames(unittest.TestCase):
                                         pass
                                     else:
                                        
-                                        self.assertTrue(save_scores_mock.called, "save_scores should be called when name is provided")
-                                        saved_arg = save_scores_mock.call_args[0][0]
-                                        self.assertIsInstance(saved_arg, list)
-                                        self.assertGreaterEqual(len(saved_arg), 1)
-                                        self.assertEqual(saved_arg[-1]["name"], "Sarthak")
-                                        self.assertEqual(saved_arg[-1]["score"], expected)
+                                        self.assertTrue(record_score_mock.called, "record_score should be called when name is provided")
+                                        saved_name, saved_score = record_score_mock.call_args[0][:2]
+                                        self.assertEqual(saved_name, "Sarthak")
+                                        self.assertEqual(saved_score, expected)
 
                                 finally:
-                                    if save_scores_mock is not None:
-                                        patch(f"{MODULE}.save_scores").stop()
+                                    if record_score_mock is not None:
+                                        patch(f"{MODULE}.record_score").stop()
 
                                     for p in reversed(patches):
                                         try:
@@ -68,7 +68,7 @@ class TestChooseUserFromListAndCompare_FromTSLFrames(unittest.TestCase):
             sx = (x or "").strip()
             return normalize_map.get(x, normalize_map.get(sx, default_norm(x)))
 
-        with patch.object(self.mod, "load_scores", return_value=scores), \
+        with patch.object(self.mod, "_load_user_index", side_effect=lambda: self.mod.build_user_index(scores)[0]), \
              patch.object(self.mod, "_normalize_name", side_effect=norm_side_effect), \
              patch.object(self.mod, "show_first_and_latest_attempt") as show_mock, \
              patch("builtins.input", return_value=user_input), \
@@ -34,13 +34,11 @@ class TestTakeNegativeMarkQuizFromTSLFrames(unittest.TestCase):
 
     #With a name provided, scores should be saved after a correct answer
     @patch("builtins.print")
-    @patch("mcq_types.save_scores")
-    @patch("mcq_types.load_scores", return_value=[])
+    @patch("mcq_types.record_score")
     @patch("builtins.input", return_value="A")
     def test_frame_2_one_default_correct_name_yes(
         self,
         _mock_input,
-        _mock_load,
         mock_save,
         _mock_print,
     ):
@@ -57,13 +55,11 @@ class TestTakeNegativeMarkQuizFromTSLFrames(unittest.TestCase):
 
     #If no name is provided, nothing should be written to the scores file
     @patch("builtins.print")
-    @patch("mcq_types.save_scores")
-    @patch("mcq_types.load_scores", return_value=[])
+    @patch("mcq_types.record_score")
     @patch("builtins.input", return_value="A")
     def test_frame_3_one_default_correct_name_no(
         self,
         _mock_input,
-        _mock_load,
         mock_save,
         _mock_print,
     ):
@@ -80,13 +76,11 @@ class TestTakeNegativeMarkQuizFromTSLFrames(unittest.TestCase):
 
     #Even with a wrong answer and penalty, the attempt should still be recorded for named users
     @patch("builtins.print")
-    @patch("mcq_types.save_scores")
-    @patch("mcq_types.load_scores", return_value=[])
+    @patch("mcq_types.record_score")
     @patch("builtins.input", return_value="B")
     def test_frame_4_one_default_wrong_name_yes(
         self,
         _mock_input,
-        _mock_load,
         mock_save,
         _mock_print,
     ):
@@ -103,13 +97,11 @@ class TestTakeNegativeMarkQuizFromTSLFrames(unittest.TestCase):
 
     #An empty answer input shouldn't stop the quiz from saving the final score for named users
     @patch("builtins.print")
-    @patch("mcq_types.save_scores")
-    @patch("mcq_types.load_scores", return_value=[])
+    @patch("mcq_types.record_score")
     @patch("builtins.input", return_value="")
     def test_frame_6_one_default_empty_name_yes(
         self,
         _mock_input,
-        _mock_load,
         mock_save,
         _mock_print,
     ):
@@ -126,13 +118,11 @@ class TestTakeNegativeMarkQuizFromTSLFrames(unittest.TestCase):
 
     #Invalid option input should still complete the run and save results for named users
     @patch("builtins.print")
-    @patch("mcq_types.save_scores")
-    @patch("mcq_types.load_scores", return_value=[])
+    @patch("mcq_types.record_score")
     @patch("builtins.input", return_value="X")
     def test_frame_8_one_default_invalid_name_yes(
         self,
         _mock_input,
-        _mock_load,
         mock_save,
         _mock_print,
     ):
@@ -149,13 +139,11 @@ class TestTakeNegativeMarkQuizFromTSLFrames(unittest.TestCase):
 
     #With zero penalty configured, a correct answer should save a clean 100% score
     @patch("builtins.print")
-    @patch("mcq_types.save_scores")
-    @patch("mcq_types.load_scores", return_value=[])
+    @patch("mcq_types.record_score")
     @patch("builtins.input", return_value="A")
     def test_frame_10_one_zero_penalty_correct_name_yes(
         self,
         _mock_input,
-        _mock_load,
         mock_save,
         _mock_print,
     ):
@@ -172,13 +160,11 @@ class TestTakeNegativeMarkQuizFromTSLFrames(unittest.TestCase):
 
     #A high negative mark should still save a valid or clamped percentage for named users
     @patch("builtins.print")
-    @patch("mcq_types.save_scores")
-    @patch("mcq_types.load_scores", return_value=[])
+    @patch("mcq_types.record_score")
     @patch("builtins.input", return_value="B")
     def test_frame_20_one_high_penalty_wrong_name_yes(
         self,
         _mock_input,
-        _mock_load,
         mock_save,
         _mock_print,
     ):
@@ -195,13 +181,11 @@ class TestTakeNegativeMarkQuizFromTSLFrames(unittest.TestCase):
 
     #With multiple questions answered correctly, the final score should be saved once
     @patch("builtins.print")
-    @patch("mcq_types.save_scores")
-    @patch("mcq_types.load_scores", return_value=[])
+    @patch("mcq_types.record_score")
     @patch("builtins.input", side_effect=["A", "B"])
     def test_frame_26_many_default_correct_name_yes(
         self,
         _mock_input,
-        _mock_load,
         mock_save,
         _mock_print,
     ):
@@ -218,13 +202,11 @@ class TestTakeNegativeMarkQuizFromTSLFrames(unittest.TestCase):
 
     #Multiple wrong answers should apply penalties but still save the final percentage for named users
     @patch("builtins.print")
-    @patch("mcq_types.save_scores")
-    @patch("mcq_types.load_scores", return_value=[])
+    @patch("mcq_types.record_score")
     @patch("builtins.input", side_effect=["C", "D"])
     def test_frame_28_many_default_wrong_name_yes(
         self,
         _mock_input,
-        _mock_load,
         mock_save,
         _mock_print,
     ):
@@ -22,13 +22,11 @@ class TestTakeQuizChallengeFromFrames(unittest.TestCase):
 
     #If the user enters minutes below the allowed range, the function should reprompt and accept a valid value
     @patch("builtins.print")
-    @patch("mcq_types.save_scores")
-    @patch("mcq_types.load_scores", return_value=[])
+    @patch("mcq_types.record_score")
     @patch("mcq_types.timed_quiz", return_value=None)
     def test_frame_2_below_then_valid_minutes(
             self,
             _mock_timed_quiz,
-            _mock_load,
             mock_save,
             _mock_print,
     ):
@@ -46,13 +44,11 @@ class TestTakeQuizChallengeFromFrames(unittest.TestCase):
 
     #If the user enters minutes above the allowed range, the function should reprompt and accept a valid value
     @patch("builtins.print")
-    @patch("mcq_types.save_scores")
-    @patch("mcq_types.load_scores", return_value=[])
+    @patch("mcq_types.record_score")
     @patch("mcq_types.timed_quiz", return_value=None)
     def test_frame_3_above_then_valid_minutes(
             self,
             _mock_timed_quiz,
-            _mock_load,
             mock_save,
             _mock_print,
     ):
@@ -70,13 +66,11 @@ class TestTakeQuizChallengeFromFrames(unittest.TestCase):
 
     #A valid minimum duration of 2 minutes should run and save a result for a named user
     @patch("builtins.print")
-    @patch("mcq_types.save_scores")
-    @patch("mcq_types.load_scores", return_value=[])
+    @patch("mcq_types.record_score")
     @patch("mcq_types.timed_quiz", return_value=None)
     def test_frame_4_non_zero_valid_2(
             self,
             _mock_timed_quiz,
-            _mock_load,
             mock_save,
             _mock_print,
     ):
@@ -94,13 +88,11 @@ class TestTakeQuizChallengeFromFrames(unittest.TestCase):
 
     #A valid maximum duration of 5 minutes should run and save a result for a named user.
     @patch("builtins.print")
-    @patch("mcq_types.save_scores")
-    @patch("mcq_types.load_scores", return_value=[])
+    @patch("mcq_types.record_score")
     @patch("mcq_types.timed_quiz", return_value=None)
     def test_frame_5_non_zero_valid_5(
             self,
             _mock_timed_quiz,
-            _mock_load,
             mock_save,
             _mock_print,
     ):
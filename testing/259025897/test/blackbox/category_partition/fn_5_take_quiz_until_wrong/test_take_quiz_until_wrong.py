@@ -25,11 +25,9 @@ class TestTakeQuizUntilWrongFromFrames(unittest.TestCase):
 
     #If there are no questions, the function should still record a 0% score for a named user
     @patch("builtins.print")
-    @patch("mcq_types.save_scores")
-    @patch("mcq_types.load_scores", return_value=[])
+    @patch("mcq_types.record_score")
     def test_tc1_zero_questions_saves_zero_percent(
         self,
-        _mock_load,
         mock_save,
         _mock_print,
     ):
@@ -40,13 +38,11 @@ class TestTakeQuizUntilWrongFromFrames(unittest.TestCase):
     #A single-question streak where the user answers correctly should be saved when a name is provided
     @patch("builtins.print")
     @patch("mcq_types.random.shuffle", side_effect=shuffle_identity)
-    @patch("mcq_types.save_scores")
-    @patch("mcq_types.load_scores", return_value=[])
+    @patch("mcq_types.record_score")
     @patch("builtins.input", return_value="A")
     def test_tc11_one_all_correct_name_yes(
         self,
         _mock_input,
-        _mock_load,
         mock_save,
         _mock_shuffle,
         _mock_print,
@@ -58,13 +54,11 @@ class TestTakeQuizUntilWrongFromFrames(unittest.TestCase):
     #Even if the answer is correct, no score should be persisted when the name is None
     @patch("builtins.print")
     @patch("mcq_types.random.shuffle", side_effect=shuffle_identity)
-    @patch("mcq_types.save_scores")
-    @patch("mcq_types.load_scores", return_value=[])
+    @patch("mcq_types.record_score")
     @patch("builtins.input", return_value="A")
     def test_tc12_one_all_correct_name_no(
         self,
         _mock_input,
-        _mock_load,
         mock_save,
         _mock_shuffle,
         _mock_print,
@@ -76,13 +70,11 @@ class TestTakeQuizUntilWrongFromFrames(unittest.TestCase):
     #An empty input should end the streak immediately, but the attempt should still be saved for a named user
     @patch("builtins.print")
     @patch("mcq_types.random.shuffle", side_effect=shuffle_identity)
-    @patch("mcq_types.save_scores")
-    @patch("mcq_types.load_scores", return_value=[])
+    @patch("mcq_types.record_score")
     @patch("builtins.input", return_value="")
     def test_tc17_one_empty_input_name_yes(
         self,
         _mock_input,
-        _mock_load,
         mock_save,
         _mock_shuffle,
         _mock_print,
@@ -94,13 +86,11 @@ class TestTakeQuizUntilWrongFromFrames(unittest.TestCase):
     #A wrong answer on the first question should stop the quiz and still store the score for a named user
     @patch("builtins.print")
     @patch("mcq_types.random.shuffle", side_effect=shuffle_identity)
-    @patch("mcq_types.save_scores")
-    @patch("mcq_types.load_scores", return_value=[])
+    @patch("mcq_types.record_score")
     @patch("builtins.input", return_value="B")
     def test_tc23_one_wrong_input_name_yes(
         self,
         _mock_input,
-        _mock_load,
         mock_save,
         _mock_shuffle,
         _mock_print,
@@ -112,13 +102,11 @@ class TestTakeQuizUntilWrongFromFrames(unittest.TestCase):
     #An invalid option should be treated as a wrong answer and still be saved for a named user
     @patch("builtins.print")
     @patch("mcq_types.random.shuffle", side_effect=shuffle_identity)
-    @patch("mcq_types.save_scores")
-    @patch("mcq_types.load_scores", return_value=[])
+    @patch("mcq_types.record_score")
     @patch("builtins.input", return_value="X")
     def test_tc29_one_invalid_input_name_yes(
         self,
         _mock_input,
-        _mock_load,
         mock_save,
         _mock_shuffle,
         _mock_print,
@@ -130,13 +118,11 @@ class TestTakeQuizUntilWrongFromFrames(unittest.TestCase):
     #If the user answers every question correctly, it should save a 100% streak result for a named user
     @patch("builtins.print")
     @patch("mcq_types.random.shuffle", side_effect=shuffle_identity)
-    @patch("mcq_types.save_scores")
-    @patch("mcq_types.load_scores", return_value=[])
+    @patch("mcq_types.record_score")
     @patch("builtins.input", side_effect=["A", "B", "C"])
     def test_tc37_many_all_correct_name_yes(
         self,
         _mock_input,
-        _mock_load,
         mock_save,
         _mock_shuffle,
         _mock_print,
@@ -148,13 +134,11 @@ class TestTakeQuizUntilWrongFromFrames(unittest.TestCase):
     #Empty input on the first question should end immediately and still save a 0% result for a named user
     @patch("builtins.print")
     @patch("mcq_types.random.shuffle", side_effect=shuffle_identity)
-    @patch("mcq_types.save_scores")
-    @patch("mcq_types.load_scores", return_value=[])
+    @patch("mcq_types.record_score")
     @patch("builtins.input", return_value="")
     def test_tc41_many_empty_first_name_yes(
         self,
         _mock_input,
-        _mock_load,
         mock_save,
         _mock_shuffle,
         _mock_print,
@@ -166,13 +150,11 @@ class TestTakeQuizUntilWrongFromFrames(unittest.TestCase):
     #A wrong answer part way through should stop the streak and save the partial score for a named user
     @patch("builtins.print")
     @patch("mcq_types.random.shuffle", side_effect=shuffle_identity)
-    @patch("mcq_types.save_scores")
-    @patch("mcq_types.load_scores", return_value=[])
+    @patch("mcq_types.record_score")
     @patch("builtins.input", side_effect=["A", "D"])
     def test_tc49_many_wrong_middle_name_yes(
         self,
         _mock_input,
-        _mock_load,
         mock_save,
         _mock_shuffle,
         _mock_print,
@@ -184,13 +166,11 @@ class TestTakeQuizUntilWrongFromFrames(unittest.TestCase):
     #An invalid answer later in the quiz should count as wrong and the final streak score should be saved
     @patch("builtins.print")
     @patch("mcq_types.random.shuffle", side_effect=shuffle_identity)
-    @patch("mcq_types.save_scores")
-    @patch("mcq_types.load_scores", return_value=[])
+    @patch("mcq_types.record_score")
     @patch("builtins.input", side_effect=["A", "B", "X"])
     def test_tc57_many_invalid_last_name_yes(
         self,
         _mock_input,
-        _mock_load,
         mock_save,
         _mock_shuffle,
         _mock_print,
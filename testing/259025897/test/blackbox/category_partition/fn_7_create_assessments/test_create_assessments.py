@@ -1,4 +1,6 @@
+import os
 import json
+import tempfile
 import unittest
 from unittest.mock import mock_open, patch
 import manage_assessment as app
@@ -15,11 +17,9 @@ class TestCreateAssessmentCategoryPartition(unittest.TestCase):
     #Creates an assessment with 0 questions and chooses not to take it, so it should save but not start a quiz
     @patch("builtins.print")
     @patch("manage_assessment.take_quiz")
-    @patch("manage_assessment.save_custom_assessments")
-    @patch("manage_assessment.load_custom_assessments", return_value=[])
+    @patch("manage_assessment.add_custom_assessment")
     def test_question_count_zero_take_no(
         self,
-        _mock_load,
         mock_save,
         mock_take_quiz,
         _mock_print,
@@ -37,11 +37,9 @@ class TestCreateAssessmentCategoryPartition(unittest.TestCase):
     #Creates an assessment with 1 question and opts to take it immediately, answer should be uppercased and quiz should run
     @patch("builtins.print")
     @patch("manage_assessment.take_quiz")
-    @patch("manage_assessment.save_custom_assessments")
-    @patch("manage_assessment.load_custom_assessments", return_value=[])
+    @patch("manage_assessment.add_custom_assessment")
     def test_question_count_one_valid_answer_take_yes(
         self,
-        _mock_load,
         mock_save,
         mock_take_quiz,
         _mock_print,
@@ -65,11 +63,9 @@ class TestCreateAssessmentCategoryPartition(unittest.TestCase):
     #Creates an assessment with multiple questions and declines to take it, so it should save without invoking the quiz
     @patch("builtins.print")
     @patch("manage_assessment.take_quiz")
-    @patch("manage_assessment.save_custom_assessments")
-    @patch("manage_assessment.load_custom_assessments", return_value=[])
+    @patch("manage_assessment.add_custom_assessment")
     def test_question_count_many_take_no(
         self,
-        _mock_load,
         mock_save,
         mock_take_quiz,
         _mock_print,
@@ -89,11 +85,9 @@ class TestCreateAssessmentCategoryPartition(unittest.TestCase):
     #Even with an invalid correct option (not A/B/C/D), the assessment should still be persisted, and the quiz should not run when user says 'n'
     @patch("builtins.print")
     @patch("manage_assessment.take_quiz")
-    @patch("manage_assessment.save_custom_assessments")
-    @patch("manage_assessment.load_custom_assessments", return_value=[])
+    @patch("manage_assessment.add_custom_assessment")
     def test_invalid_correct_option_still_saved(
         self,
-        _mock_load,
         mock_save,
         mock_take_quiz,
         _mock_print,
@@ -119,25 +113,29 @@ class TestAssessmentStorageFunctions(unittest.TestCase):
         self.assertEqual(assessment_storage.load_custom_assessments(), [])
 
 
-    #When the file exists, load should parse JSON content and return the exact decoded Python structure
-    @patch("assessment_storage.os.path.exists", return_value=True)
-    def test_load_custom_assessments_file_exists_reads_json(self, _mock_exists):
+    #When the legacy single JSON file exists, load should return the exact decoded Python structure
+    def test_load_custom_assessments_file_exists_reads_json(self):
         fake_data = [{"name": "A1", "questions": [], "options": [], "answers": []}]
-        m = mock_open(read_data=json.dumps(fake_data))
-        with patch("assessment_storage.open", m):
+        with tempfile.TemporaryDirectory() as d, \
+                patch.dict(os.environ, {"MCQ_STORAGE_BACKEND": "json"}), \
+                patch("assessment_storage.ASSESSMENT_FILE", os.path.join(d, "custom_assessment.json")), \
+                patch("assessment_storage.ASSESSMENT_DIR", os.path.join(d, "custom_assessments")):
+            with open(assessment_storage.ASSESSMENT_FILE, "w") as f:
+                json.dump(fake_data, f)
             result = assessment_storage.load_custom_assessments()
-        self.assertEqual(result, fake_data)
+            self.assertEqual(result, fake_data)
 
 
     #Save should write valid JSON that rounds back to the original data structure
     def test_save_custom_assessments_writes_json(self):
         fake_data = [{"name": "A1", "questions": [], "options": [], "answers": []}]
-        m = mock_open()
-        with patch("assessment_storage.open", m):
+        with tempfile.TemporaryDirectory() as d, \
+                patch.dict(os.environ, {"MCQ_STORAGE_BACKEND": "json"}), \
+                patch("assessment_storage.ASSESSMENT_FILE", os.path.join(d, "missing.json")), \
+                patch("assessment_storage.ASSESSMENT_DIR", d):
             assessment_storage.save_custom_assessments(fake_data)
-        handle = m()
-        written = "".join(call.args[0] for call in handle.write.mock_calls)
-        self.assertEqual(json.loads(written), fake_data)
+            with open(os.path.join(d, "a1.json")) as f:
+                self.assertEqual([json.load(f)], fake_data)
 
 
 if __name__ == "__main__":
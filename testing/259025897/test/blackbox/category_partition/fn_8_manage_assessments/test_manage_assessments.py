@@ -1,6 +1,7 @@
 import unittest
 from unittest.mock import patch
 import manage_assessment
+from assessment_storage import StoredAssessment
 
 
 def sample_assessments():
@@ -23,32 +24,37 @@ def sample_assessments():
     ]
 
 
+#Catalog entries for in-memory assessments; load() returns the dict itself
+def stored(data):
+    return [StoredAssessment({"id": f"a{i + 1}", "name": a["name"]}, lambda a=a: a) for i, a in enumerate(data)]
+
+
 class TestListAssessments(unittest.TestCase):
 
     #If there are no saved assessments, the helper should print a message and return None
     @patch("builtins.print")
-    @patch("manage_assessment.load_custom_assessments", return_value=[])
+    @patch("manage_assessment.stored_assessments", return_value=[])
     def test_none_saved_returns_none(self, _mock_load, _mock_print):
         result = manage_assessment.list_assessments()
         self.assertIsNone(result)
 
 
-    #If saved assessments exist, the helper should return the same list it loaded
+    #If saved assessments exist, the helper should return the catalog entries it listed
     @patch("builtins.print")
-    @patch("manage_assessment.load_custom_assessments")
+    @patch("manage_assessment.stored_assessments")
     def test_some_saved_returns_list(self, mock_load, _mock_print):
         data = sample_assessments()
-        mock_load.return_value = data
+        mock_load.return_value = stored(data)
 
         result = manage_assessment.list_assessments()
-        self.assertEqual(result, data)
+        self.assertEqual([a.load() for a in result], data)
 
 
 class TestAddQuestionToAssessment(unittest.TestCase):
 
     #When there are no assessments, add-question should exit early and not attempt to save anything
     @patch("builtins.print")
-    @patch("manage_assessment.save_custom_assessments")
+    @patch("manage_assessment.save_assessment")
     @patch("manage_assessment.list_assessments", return_value=[])
     def test_none_saved_returns_early(self, _mock_list, mock_save, _mock_print):
         manage_assessment.add_question_to_assessment()
@@ -57,10 +63,10 @@ class TestAddQuestionToAssessment(unittest.TestCase):
 
     #A non-numeric assessment selection should be treated as invalid and must not trigger a save
     @patch("builtins.print")
-    @patch("manage_assessment.save_custom_assessments")
+    @patch("manage_assessment.save_assessment")
     @patch("manage_assessment.list_assessments")
     def test_invalid_selection_non_int(self, mock_list, mock_save, _mock_print):
-        mock_list.return_value = sample_assessments()
+        mock_list.return_value = stored(sample_assessments())
 
         with patch("builtins.input", side_effect=["abc"]):
             manage_assessment.add_question_to_assessment()
@@ -70,10 +76,10 @@ class TestAddQuestionToAssessment(unittest.TestCase):
 
     #An out-of-range assessment index should be rejected and must not modify or save the data
     @patch("builtins.print")
-    @patch("manage_assessment.save_custom_assessments")
+    @patch("manage_assessment.save_assessment")
     @patch("manage_assessment.list_assessments")
     def test_out_of_range_selection(self, mock_list, mock_save, _mock_print):
-        mock_list.return_value = sample_assessments()
+        mock_list.return_value = stored(sample_assessments())
 
         with patch("builtins.input", side_effect=["99"]):
             manage_assessment.add_question_to_assessment()
@@ -83,11 +89,11 @@ class TestAddQuestionToAssessment(unittest.TestCase):
 
     #A valid selection should append the new question/options/answer and persist the updated assessments list
     @patch("builtins.print")
-    @patch("manage_assessment.save_custom_assessments")
+    @patch("manage_assessment.save_assessment")
     @patch("manage_assessment.list_assessments")
     def test_valid_adds_question_and_saves(self, mock_list, mock_save, _mock_print):
         data = sample_assessments()
-        mock_list.return_value = data
+        mock_list.return_value = stored(data)
 
         inputs = [
             "1",
@@ -107,14 +113,14 @@ class TestAddQuestionToAssessment(unittest.TestCase):
             ("A. oA", "B. oB", "C. oC", "D. oD"),
         )
         self.assertEqual(data[0]["answers"][-1], "C")
-        mock_save.assert_called_once_with(data)
+        mock_save.assert_called_once_with("a1", data[0])
 
 
 class TestEditQuestionInAssessment(unittest.TestCase):
 
     #If no assessments exist, edit should stop immediately and never call save
     @patch("builtins.print")
-    @patch("manage_assessment.save_custom_assessments")
+    @patch("manage_assessment.save_assessment")
     @patch("manage_assessment.list_assessments", return_value=[])
     def test_none_saved_returns_early(self, _mock_list, mock_save, _mock_print):
         manage_assessment.edit_question_in_assessment()
@@ -123,10 +129,10 @@ class TestEditQuestionInAssessment(unittest.TestCase):
 
     #If the user enters a non-integer for assessment selection, nothing should be edited or saved
     @patch("builtins.print")
-    @patch("manage_assessment.save_custom_assessments")
+    @patch("manage_assessment.save_assessment")
     @patch("manage_assessment.list_assessments")
     def test_invalid_assessment_selection(self, mock_list, mock_save, _mock_print):
-        mock_list.return_value = sample_assessments()
+        mock_list.return_value = stored(sample_assessments())
 
         with patch("builtins.input", side_effect=["nope"]):
             manage_assessment.edit_question_in_assessment()
@@ -136,10 +142,10 @@ class TestEditQuestionInAssessment(unittest.TestCase):
 
     #If the selected question number is out of range, edit should abort without saving
     @patch("builtins.print")
-    @patch("manage_assessment.save_custom_assessments")
+    @patch("manage_assessment.save_assessment")
     @patch("manage_assessment.list_assessments")
     def test_question_index_out_of_range(self, mock_list, mock_save, _mock_print):
-        mock_list.return_value = sample_assessments()
+        mock_list.return_value = stored(sample_assessments())
 
         inputs = ["2", "99"]
         with patch("builtins.input", side_effect=inputs):
@@ -150,11 +156,11 @@ class TestEditQuestionInAssessment(unittest.TestCase):
 
     #Leaving all prompts blank should keep question, options, and answer unchanged
     @patch("builtins.print")
-    @patch("manage_assessment.save_custom_assessments")
+    @patch("manage_assessment.save_assessment")
     @patch("manage_assessment.list_assessments")
     def test_blank_keep_everything(self, mock_list, mock_save, _mock_print):
         data = sample_assessments()
-        mock_list.return_value = data
+        mock_list.return_value = stored(data)
 
         original_q = data[0]["questions"][0]
         original_opts = data[0]["options"][0]
@@ -175,12 +181,12 @@ class TestEditQuestionInAssessment(unittest.TestCase):
         self.assertEqual(data[0]["questions"][0], original_q)
         self.assertEqual(data[0]["options"][0], original_opts)
         self.assertEqual(data[0]["answers"][0], original_ans)
-        mock_save.assert_called_once_with(data)
+        mock_save.assert_called_once_with("a1", data[0])
 
 
     #Editing specific fields should update only those fields and uppercase the final answer before saving
     @patch("builtins.print")
-    @patch("manage_assessment.save_custom_assessments")
+    @patch("manage_assessment.save_assessment")
     @patch("manage_assessment.list_assessments")
     def test_changes_question_some_options_and_answer(
         self,
@@ -189,7 +195,7 @@ class TestEditQuestionInAssessment(unittest.TestCase):
         _mock_print
     ):
         data = sample_assessments()
-        mock_list.return_value = data
+        mock_list.return_value = stored(data)
         inputs = ["2", "1", "S1 edited", "", "B changed", "", "", "c"]
         with patch("builtins.input", side_effect=inputs):
             manage_assessment.edit_question_in_assessment()
@@ -199,14 +205,14 @@ class TestEditQuestionInAssessment(unittest.TestCase):
             ("A. a", "B changed", "C. c", "D. d"),
         )
         self.assertEqual(data[1]["answers"][0], "C")
-        mock_save.assert_called_once_with(data)
+        mock_save.assert_called_once_with("a2", data[1])
 
 
 class TestDeleteQuestionFromAssessment(unittest.TestCase):
 
     #If there are no assessments to delete from, the function should exit without saving
     @patch("builtins.print")
-    @patch("manage_assessment.save_custom_assessments")
+    @patch("manage_assessment.save_assessment")
     @patch("manage_assessment.list_assessments", return_value=[])
     def test_none_saved_returns_early(self, _mock_list, mock_save, _mock_print):
         manage_assessment.delete_question_from_assessment()
@@ -215,10 +221,10 @@ class TestDeleteQuestionFromAssessment(unittest.TestCase):
 
     #An invalid assessment selection should not delete anything and should not call save
     @patch("builtins.print")
-    @patch("manage_assessment.save_custom_assessments")
+    @patch("manage_assessment.save_assessment")
     @patch("manage_assessment.list_assessments")
     def test_invalid_assessment_selection(self, mock_list, mock_save, _mock_print):
-        mock_list.return_value = sample_assessments()
+        mock_list.return_value = stored(sample_assessments())
         with patch("builtins.input", side_effect=["x"]):
             manage_assessment.delete_question_from_assessment()
         mock_save.assert_not_called()
@@ -226,10 +232,10 @@ class TestDeleteQuestionFromAssessment(unittest.TestCase):
 
     #An out-of-range question number should be rejected without mutating data or saving
     @patch("builtins.print")
-    @patch("manage_assessment.save_custom_assessments")
+    @patch("manage_assessment.save_assessment")
     @patch("manage_assessment.list_assessments")
     def test_question_index_out_of_range(self, mock_list, mock_save, _mock_print):
-        mock_list.return_value = sample_assessments()
+        mock_list.return_value = stored(sample_assessments())
 
         inputs = ["1", "99"]
 
@@ -241,11 +247,11 @@ class TestDeleteQuestionFromAssessment(unittest.TestCase):
 
     #A valid delete should remove the chosen question/options/answer consistently and then persist the updated list
     @patch("builtins.print")
-    @patch("manage_assessment.save_custom_assessments")
+    @patch("manage_assessment.save_assessment")
     @patch("manage_assessment.list_assessments")
     def test_valid_deletes_and_saves(self, mock_list, mock_save, _mock_print):
         data = sample_assessments()
-        mock_list.return_value = data
+        mock_list.return_value = stored(data)
         inputs = ["2", "2"]
 
         with patch("builtins.input", side_effect=inputs):
@@ -254,7 +260,7 @@ class TestDeleteQuestionFromAssessment(unittest.TestCase):
         self.assertEqual(data[1]["questions"], ["S1"])
         self.assertEqual(len(data[1]["options"]), 1)
         self.assertEqual(data[1]["answers"], ["A"])
-        mock_save.assert_called_once_with(data)
+        mock_save.assert_called_once_with("a2", data[1])
 
 
 if __name__ == "__main__":
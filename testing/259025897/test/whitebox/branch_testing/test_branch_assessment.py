@@ -2,18 +2,23 @@ import io
 import unittest
 from unittest.mock import patch
 import manage_assessment
+from assessment_storage import StoredAssessment
+
+
+#Catalog entries for in-memory assessments; load() returns the dict itself
+def stored(data):
+    return [StoredAssessment({"id": f"a{i + 1}", "name": a["name"]}, lambda a=a: a) for i, a in enumerate(data)]
 
 
 class TestAssessment_Branches(unittest.TestCase):
 
     # Verifies create_assessment does not start the quiz when the user chooses not to take it now
     @patch("manage_assessment.take_quiz")
-    @patch("manage_assessment.save_custom_assessments")
-    @patch("manage_assessment.load_custom_assessments", return_value=[])
+    @patch("manage_assessment.add_custom_assessment")
     @patch("builtins.input",
         side_effect=["Assess1", "1", "Q1", "o1", "o2", "o3", "o4", "A", "n"],
     )
-    def test_create_assessment_not_taken_now(self, m_input, m_load, m_save, m_take):
+    def test_create_assessment_not_taken_now(self, m_input, m_save, m_take):
         manage_assessment.create_assessment()
         m_save.assert_called_once()
         m_take.assert_not_called()
@@ -21,26 +26,25 @@ class TestAssessment_Branches(unittest.TestCase):
 
     #Checks create_assessment starts the quiz when the user chooses to take it immediately
     @patch("manage_assessment.take_quiz")
-    @patch("manage_assessment.save_custom_assessments")
-    @patch("manage_assessment.load_custom_assessments", return_value=[])
+    @patch("manage_assessment.add_custom_assessment")
     @patch("builtins.input",
         side_effect=["Assess2", "1", "Q1", "o1", "o2", "o3", "o4", "A", "y"],
     )
-    def test_create_assessment_taken_now_calls_quiz(self, m_input, m_load, m_save, m_take):
+    def test_create_assessment_taken_now_calls_quiz(self, m_input, m_save, m_take):
         manage_assessment.create_assessment()
         m_save.assert_called_once()
         m_take.assert_called_once()
 
 
     #Tests list_assessments returns None when there are no saved assessments
-    @patch("manage_assessment.load_custom_assessments", return_value=[])
+    @patch("manage_assessment.stored_assessments", return_value=[])
     def test_list_assessments_empty_returns_none(self, m_load):
         self.assertIsNone(manage_assessment.list_assessments())
 
 
     #Tests list_assessments returns a list when saved assessments exist
-    @patch("manage_assessment.load_custom_assessments",
-        return_value=[{"name": "A", "questions": [], "options": [], "answers": []}],
+    @patch("manage_assessment.stored_assessments",
+        return_value=stored([{"name": "A", "questions": [], "options": [], "answers": []}]),
     )
     def test_list_assessments_non_empty_returns_list(self, m_load):
         out = manage_assessment.list_assessments()
@@ -50,7 +54,7 @@ class TestAssessment_Branches(unittest.TestCase):
 
     #Verifies add_question_to_assessment exits when the assessment selection is not a number
     @patch("manage_assessment.list_assessments",
-        return_value=[{"name": "A", "questions": [], "options": [], "answers": []}],
+        return_value=stored([{"name": "A", "questions": [], "options": [], "answers": []}]),
     )
     @patch("builtins.input", side_effect=["abc"])
     def test_add_question_invalid_selection(self, m_input, m_list):
@@ -59,9 +63,9 @@ class TestAssessment_Branches(unittest.TestCase):
 
 
     #Checks add_question_to_assessment appends question/options/answer and keeps the updated assessment
-    @patch("manage_assessment.save_custom_assessments")
+    @patch("manage_assessment.save_assessment")
     @patch("manage_assessment.list_assessments",
-        return_value=[{"name": "A", "questions": [], "options": [], "answers": []}],
+        return_value=stored([{"name": "A", "questions": [], "options": [], "answers": []}]),
     )
     @patch("builtins.input", side_effect=["1", "New Q", "oA", "oB", "oC", "oD", "A"])
     def test_add_question_valid_saves(self, m_input, m_list, m_save):
@@ -71,12 +75,12 @@ class TestAssessment_Branches(unittest.TestCase):
 
     #Verifies edit_question_in_assessment returns early when the selected question index is out of range
     @patch("manage_assessment.list_assessments",
-        return_value=[{
+        return_value=stored([{
             "name": "A",
             "questions": ["Q1"],
             "options": [("A.1", "B.2", "C.3", "D.4")],
             "answers": ["A"],
-        }],
+        }]),
     )
     @patch("builtins.input", side_effect=["1", "99"])
     def test_edit_question_invalid_q_index(self, m_input, m_list):
@@ -85,14 +89,14 @@ class TestAssessment_Branches(unittest.TestCase):
 
 
     #Verifies edit_question_in_assessment keeps existing values when blanks are provided and still saves
-    @patch("manage_assessment.save_custom_assessments")
+    @patch("manage_assessment.save_assessment")
     @patch("manage_assessment.list_assessments",
-        return_value=[{
+        return_value=stored([{
             "name": "A",
             "questions": ["Q1"],
             "options": [("A.1", "B.2", "C.3", "D.4")],
             "answers": ["A"],
-        }],
+        }]),
     )
     @patch("builtins.input", side_effect=["1", "1", "", "", "", "", "", ""])
     def test_edit_question_keep_existing_saves(self, m_input, m_list, m_save):
@@ -101,14 +105,14 @@ class TestAssessment_Branches(unittest.TestCase):
 
 
     #Tests delete_question_from_assessment removes the chosen question and maintains the change
-    @patch("manage_assessment.save_custom_assessments")
+    @patch("manage_assessment.save_assessment")
     @patch("manage_assessment.list_assessments",
-        return_value=[{
+        return_value=stored([{
             "name": "A",
             "questions": ["Q1"],
             "options": [("A.1", "B.2", "C.3", "D.4")],
             "answers": ["A"],
-        }],
+        }]),
     )
     @patch("builtins.input", side_effect=["1", "1"])
     def test_delete_question_valid_saves(self, m_input, m_list, m_save):
@@ -118,12 +122,12 @@ class TestAssessment_Branches(unittest.TestCase):
 
     #Verifies delete_question_from_assessment exits early when the selected question index is out of range
     @patch("manage_assessment.list_assessments",
-        return_value=[{
+        return_value=stored([{
             "name": "A",
             "questions": ["Q1"],
             "options": [("A.1", "B.2", "C.3", "D.4")],
             "answers": ["A"],
-        }],
+        }]),
     )
     @patch("builtins.input", side_effect=["1", "99"])
     def test_delete_question_invalid_index(self, m_input, m_list):
@@ -132,20 +136,20 @@ class TestAssessment_Branches(unittest.TestCase):
 
 
     #Checks view_questions_in_assessment returns immediately when no assessments are saved
-    @patch("manage_assessment.load_custom_assessments", return_value=[])
+    @patch("manage_assessment.stored_assessments", return_value=[])
     def test_view_questions_no_assessments(self, m_load):
         with patch("sys.stdout", new_callable=io.StringIO):
             manage_assessment.view_questions_in_assessment()
 
 
     #Verifies view_questions_in_assessment returns early when the user selects an invalid assessment number
-    @patch("manage_assessment.load_custom_assessments",
-        return_value=[{
+    @patch("manage_assessment.stored_assessments",
+        return_value=stored([{
             "name": "A",
             "questions": ["Q1"],
             "options": [("A.1", "B.2", "C.3", "D.4")],
             "answers": ["A"],
-        }],
+        }]),
     )
     @patch("builtins.input", side_effect=["99"])
     def test_view_questions_invalid_selection(self, m_input, m_load):
@@ -154,8 +158,8 @@ class TestAssessment_Branches(unittest.TestCase):
 
 
     #Tests view_questions_in_assessment shows the 'no questions yet' path when the assessment has no questions
-    @patch("manage_assessment.load_custom_assessments",
-        return_value=[{"name": "A", "questions": [], "options": [], "answers": []}],
+    @patch("manage_assessment.stored_assessments",
+        return_value=stored([{"name": "A", "questions": [], "options": [], "answers": []}]),
     )
     @patch("builtins.input", side_effect=["1"])
     def test_view_questions_empty_questions_branch(self, m_input, m_load):
@@ -163,13 +167,13 @@ class TestAssessment_Branches(unittest.TestCase):
             manage_assessment.view_questions_in_assessment()
 
     #Tests view_questions_in_assessment prints question text and the correct answer for a normal assessment
-    @patch("manage_assessment.load_custom_assessments",
-        return_value=[{
+    @patch("manage_assessment.stored_assessments",
+        return_value=stored([{
             "name": "A",
             "questions": ["Q1"],
             "options": [("A.1", "B.2", "C.3", "D.4")],
             "answers": ["A"],
-        }],
+        }]),
     )
     @patch("builtins.input", side_effect=["1"])
     def test_view_questions_normal_branch(self, m_input, m_load):
@@ -1,32 +1,171 @@
+import os
+import json
+import tempfile
 import unittest
-from unittest.mock import mock_open, patch
+from unittest.mock import patch
 import assessment_storage
+import storage_backend
+
+
+def _assessment(name, n=2):
+    return {
+        "name": name,
+        "questions": [f"{name} q{i}" for i in range(n)],
+        "options": [["A. 1", "B. 2", "C. 3", "D. 4"] for _ in range(n)],
+        "answers": ["A"] * n,
+    }
 
 
 class TestAssessmentStorage_Branches(unittest.TestCase):
 
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        d = self.tmp.name
+        self.patches = [
+            patch.dict(os.environ, {"MCQ_STORAGE_BACKEND": "json"}),
+            patch("assessment_storage.ASSESSMENT_FILE", os.path.join(d, "custom_assessment.json")),
+            patch("assessment_storage.ASSESSMENT_DIR", os.path.join(d, "custom_assessments")),
+        ]
+        for p in self.patches:
+            p.start()
+
+    def tearDown(self):
+        for p in self.patches:
+            p.stop()
+        self.tmp.cleanup()
+
+
     #Tests load_custom_assessments returns an empty list when the storage file does not exist
     @patch("assessment_storage.os.path.exists", return_value=False)
     def test_load_custom_assessments_no_file(self, m_exists):
         self.assertEqual(assessment_storage.load_custom_assessments(), [])
 
 
-    #Tests load_custom_assessments reads and returns JSON content when the storage file exists
-    @patch("assessment_storage.os.path.exists", return_value=True)
-    @patch("assessment_storage.open",
-        new_callable=mock_open,
-        read_data='[{"name":"A"}]',
-    )
-    def test_load_custom_assessments_with_file(self, m_open, m_exists):
-        self.assertEqual(assessment_storage.load_custom_assessments(), [{"name": "A"}])
+    #Tests a legacy single-file store is split into one shard per assessment
+    def test_legacy_file_is_migrated(self):
+        with open(assessment_storage.ASSESSMENT_FILE, "w") as f:
+            json.dump([_assessment("A"), _assessment("B")], f)
+        self.assertEqual(assessment_storage.load_custom_assessments(), [_assessment("A"), _assessment("B")])
+        self.assertEqual(
+            sorted(os.listdir(assessment_storage.ASSESSMENT_DIR)),
+            ["a1.json", "a2.json", "catalog.json"],
+        )
+
+
+    #Tests listing names reads only the catalog, and load() reads one shard once
+    def test_listing_reads_only_catalog(self):
+        assessment_storage.save_custom_assessments([_assessment("A"), _assessment("B")])
+        with patch("assessment_storage._read_shard", wraps=assessment_storage._read_shard) as m_read:
+            stored = assessment_storage.stored_assessments()
+            self.assertEqual([a.name for a in stored], ["A", "B"])
+            m_read.assert_not_called()
+            self.assertEqual(stored[1].load(), _assessment("B"))
+            self.assertIs(stored[1].load(), stored[1].load())
+        self.assertEqual(m_read.call_count, 1)
+        self.assertEqual(stored[1].assessment_id, "a2")
+
+
+    #Tests editing one assessment rewrites only that assessment's shard
+    def test_save_rewrites_only_changed_shard(self):
+        assessment_storage.save_custom_assessments([_assessment("A"), _assessment("B"), _assessment("C")])
+        assessments = assessment_storage.load_custom_assessments()
+        assessments[1]["questions"][0] = "edited"
+        with patch("assessment_storage._write_shard", wraps=assessment_storage._write_shard) as m_write:
+            assessment_storage.save_custom_assessments(assessments)
+        self.assertEqual([c.args[0] for c in m_write.call_args_list], ["a2"])
+        self.assertEqual(assessment_storage.load_custom_assessments()[1]["questions"][0], "edited")
+
+
+    #Tests a new assessment after an edited one keeps the edited one's id
+    def test_edit_and_append_keep_ids(self):
+        assessment_storage.save_custom_assessments([_assessment("A"), _assessment("B")])
+        assessments = assessment_storage.load_custom_assessments()
+        assessments[0]["answers"][0] = "B"
+        assessments.append(_assessment("C"))
+        assessment_storage.save_custom_assessments(assessments)
+        headers = assessment_storage.list_assessment_headers()
+        self.assertEqual([(h["id"], h["name"]) for h in headers], [("a1", "A"), ("a2", "B"), ("a3", "C")])
+        self.assertEqual(assessment_storage.load_assessment("a1")["answers"], ["B", "A"])
+
+
+    #Tests dropping an assessment from the list removes its shard
+    def test_removed_assessment_shard_deleted(self):
+        assessment_storage.save_custom_assessments([_assessment("A"), _assessment("B")])
+        assessments = assessment_storage.load_custom_assessments()
+        assessment_storage.save_custom_assessments(assessments[1:] + [_assessment("C")])
+        self.assertEqual([a["name"] for a in assessment_storage.load_custom_assessments()], ["B", "C"])
+        self.assertFalse(os.path.exists(os.path.join(assessment_storage.ASSESSMENT_DIR, "a1.json")))
+
+
+    #Tests catalog headers carry the question count and keep the created time across edits
+    def test_headers_track_counts_and_times(self):
+        assessment_storage.save_custom_assessments([_assessment("A", 3)])
+        created = assessment_storage.list_assessment_headers()[0]["created"]
+        assessments = assessment_storage.load_custom_assessments()
+        assessments[0]["questions"].pop()
+        assessment_storage.save_custom_assessments(assessments)
+        header = assessment_storage.list_assessment_headers()[0]
+        self.assertEqual((header["id"], header["name"], header["questions"]), ("a1", "A", 2))
+        self.assertEqual(header["created"], created)
+        self.assertEqual(assessment_storage.load_assessment("a1")["questions"], ["A q0", "A q1"])
+
+
+    #Tests listing many assessments reads only the catalog
+    def test_many_headers_without_shards(self):
+        assessment_storage.save_custom_assessments([_assessment(f"T{i}", 50) for i in range(300)])
+        with patch("assessment_storage._read_shard") as m_read:
+            headers = assessment_storage.list_assessment_headers()
+            stored = assessment_storage.stored_assessments()
+        self.assertEqual(len(headers), 300)
+        self.assertEqual(stored[299].header["questions"], 50)
+        m_read.assert_not_called()
+
+
+    #Tests adding and saving one assessment touch only its own shard and catalog entry
+    def test_add_and_save_one_assessment(self):
+        assessment_storage.save_custom_assessments([_assessment("A"), _assessment("B")])
+        with patch("assessment_storage._read_shard") as m_read, \
+                patch("assessment_storage._write_shard", wraps=assessment_storage._write_shard) as m_write:
+            self.assertEqual(assessment_storage.add_custom_assessment(_assessment("C")), "a3")
+            edited = _assessment("B", 3)
+            assessment_storage.save_assessment("a2", edited)
+            assessment_storage.save_assessment("a2", edited)
+        m_read.assert_not_called()
+        self.assertEqual([c.args[0] for c in m_write.call_args_list], ["a3", "a2"])
+        headers = assessment_storage.list_assessment_headers()
+        self.assertEqual([(h["id"], h["name"], h["questions"]) for h in headers],
+                         [("a1", "A", 2), ("a2", "B", 3), ("a3", "C", 2)])
+        self.assertEqual(assessment_storage.load_assessment("a2"), edited)
+        with self.assertRaises(KeyError):
+            assessment_storage.save_assessment("a9", edited)
+
+
+    #Tests the manage menus list from the catalog and read only the picked shard
+    def test_menus_read_only_selected_shard(self):
+        import manage_assessment
+        assessment_storage.save_custom_assessments([_assessment("A"), _assessment("B")])
+        with patch("assessment_storage._read_shard", wraps=assessment_storage._read_shard) as m_read, \
+                patch("builtins.print"), \
+                patch("builtins.input", side_effect=["2", "New Q", "o1", "o2", "o3", "o4", "b"]):
+            manage_assessment.add_question_to_assessment()
+        self.assertEqual([c.args[0] for c in m_read.call_args_list], ["a2"])
+        self.assertEqual(assessment_storage.load_assessment("a2")["questions"][-1], "New Q")
+        self.assertEqual(assessment_storage.load_assessment("a1"), _assessment("A"))
 
 
-    #Verifies save_custom_assessments opens the file for writing and attempts to write JSON
-    @patch("assessment_storage.open", new_callable=mock_open)
-    def test_save_custom_assessments_writes_file(self, m_open):
-        assessment_storage.save_custom_assessments([{"name": "A"}])
-        m_open.assert_called_once()
+    #Tests the sqlite backend keeps one row per assessment plus the catalog
+    def test_sqlite_shards(self):
+        store = storage_backend.SqliteStore(os.path.join(self.tmp.name, "state.db"))
+        try:
+            assessment_storage._save_assessments([_assessment("A"), _assessment("B")], store)
+            assessments = assessment_storage._load_assessments(store)
+            assessments[0]["answers"][0] = "D"
+            assessment_storage._save_assessments(assessments, store)
+            self.assertEqual(store.get_doc(assessment_storage.ASSESSMENT_COLLECTION, "a1")["answers"], ["D", "A"])
+            self.assertEqual(len(list(store.iter_docs(assessment_storage.ASSESSMENT_COLLECTION))), 2)
+        finally:
+            store.close()
 
 
 if __name__ == "__main__":
-    unittest.main()
\ No newline at end of file
+    unittest.main()
@@ -0,0 +1,105 @@
+import os
+import json
+import tempfile
+import unittest
+from unittest.mock import patch
+import attempts
+import attempt_limiter
+import certification_quiz
+import storage_backend
+
+
+class TestAttemptCompaction_Branches(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        d = self.tmp.name
+        self.patches = [
+            patch.dict(os.environ, {"MCQ_STORAGE_BACKEND": "json"}),
+            patch("attempts.ATTEMPT_FILE", os.path.join(d, "attempts.json")),
+            patch("attempts.ATTEMPT_ARCHIVE_FILE", os.path.join(d, "attempts_archive.jsonl")),
+            patch("certification_quiz.CERT_ATTEMPT_FILE", os.path.join(d, "cert_attempts.json")),
+            patch("certification_quiz.CERT_ATTEMPT_ARCHIVE_FILE", os.path.join(d, "cert_archive.jsonl")),
+            patch("attempts._today_str", return_value="2025-03-10"),
+            patch("certification_quiz._today_str", return_value="2025-03-10"),
+        ]
+        for p in self.patches:
+            p.start()
+
+    def tearDown(self):
+        for p in self.patches:
+            p.stop()
+        self.tmp.cleanup()
+
+    def _write(self, path, data):
+        with open(path, "w") as f:
+            json.dump(data, f)
+
+    def _read_lines(self, path):
+        with open(path) as f:
+            return [json.loads(line) for line in f]
+
+
+    #Tests split_counters keeps days inside the window and lists the rest for the archive
+    def test_split_counters(self):
+        data = {"a": {"2025-03-08": 2, "2025-03-10": 1}, "b": {"2025-03-01": 3}}
+        hot, archived = attempt_limiter.split_counters(data, attempt_limiter.window_start("2025-03-10", 2))
+        self.assertEqual(hot, {"a": {"2025-03-10": 1}})
+        self.assertEqual(len(archived), 2)
+        hot, archived = attempt_limiter.split_counters(data, "2025-03-08")
+        self.assertEqual(hot, {"a": {"2025-03-08": 2, "2025-03-10": 1}})
+
+
+    #Tests recording an attempt moves older days out of the hot file into the archive
+    def test_record_rolls_old_days_into_archive(self):
+        self._write(attempts.ATTEMPT_FILE, {"mru": {"2025-03-09": 3}, "ty::Quiz": {"2025-01-02": 1}})
+        attempts.record_quiz_attempt("mru")
+        with open(attempts.ATTEMPT_FILE) as f:
+            self.assertEqual(json.load(f), {"mru": {"2025-03-10": 1}})
+        archived = self._read_lines(attempts.ATTEMPT_ARCHIVE_FILE)
+        self.assertEqual(sorted(r["day"] for r in archived), ["2025-01-02", "2025-03-09"])
+        self.assertEqual(attempts.get_attempts_left("mru", max_attempts=3), 2)
+
+
+    #Tests compact_attempts reports the rows moved and is a no-op the second time
+    def test_compact_attempts(self):
+        self._write(attempts.ATTEMPT_FILE, {"a": {"2025-03-01": 1, "2025-03-10": 2}})
+        self.assertEqual(attempts.compact_attempts(), 1)
+        self.assertEqual(attempts.compact_attempts(), 0)
+        self.assertEqual(attempts.get_attempts_left("a", max_attempts=3), 1)
+
+
+    #Tests compact_attempts on a missing file archives nothing
+    def test_compact_attempts_missing_file(self):
+        self.assertEqual(attempts.compact_attempts(), 0)
+        self.assertFalse(os.path.exists(attempts.ATTEMPT_ARCHIVE_FILE))
+
+
+    #Tests certification counters are compacted the same way
+    def test_cert_attempts_compacted(self):
+        self._write(certification_quiz.CERT_ATTEMPT_FILE, {"mru": {"2025-03-09": 1}})
+        certification_quiz.record_cert_attempt("mru")
+        self.assertEqual(certification_quiz.can_attempt_cert_quiz("mru"), (False, 0))
+        self.assertEqual(len(self._read_lines(certification_quiz.CERT_ATTEMPT_ARCHIVE_FILE)), 1)
+        with open(certification_quiz.CERT_ATTEMPT_FILE) as f:
+            self.assertEqual(json.load(f), {"mru": {"2025-03-10": 1}})
+
+
+    #Tests the sqlite backend moves old counters into the archive collection
+    def test_sqlite_archive_counters(self):
+        db = os.path.join(self.tmp.name, "state.db")
+        store = storage_backend.SqliteStore(db)
+        try:
+            store.replace_counters("attempts", {"a": {"2025-03-01": 2, "2025-03-10": 1}})
+            self.assertEqual(store.archive_counters("attempts", "2025-03-10"), 1)
+            self.assertEqual(store.load_counters("attempts"), {"a": {"2025-03-10": 1}})
+            self.assertEqual(
+                list(store.iter_records("attempts_archive", "a")),
+                [{"name": "a", "day": "2025-03-01", "count": 2}],
+            )
+        finally:
+            store.close()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,73 @@
+import os
+import unittest
+import utils
+import leaderboard
+import attempt_comparison
+
+
+class TestUserIndex_Branches(unittest.TestCase):
+
+    def setUp(self):
+        self.index_file = attempt_comparison.USER_INDEX_FILE
+
+
+    #Tests an unknown user has no attempts and no first/latest pair
+    def test_unknown_user(self):
+        self.assertEqual(attempt_comparison.get_user_attempts("nobody"), [])
+        self.assertIsNone(attempt_comparison.get_first_and_latest_attempt("nobody"))
+
+
+    #Tests attempts are grouped by normalized name and kept in recording order
+    def test_attempts_grouped_by_normalized_name(self):
+        utils.record_score("Alex", 10)
+        utils.record_score("Bob", 99)
+        utils.record_score("  alex ", 30)
+        utils.record_score("ALEX", 20)
+        scores = [a["score"] for a in attempt_comparison.get_user_attempts("alex")]
+        self.assertEqual(scores, [10, 30, 20])
+        first, latest = attempt_comparison.get_first_and_latest_attempt("Alex")
+        self.assertEqual((first["score"], latest["score"]), (10, 20))
+        self.assertEqual(attempt_comparison.get_all_users(), ["Alex", "Bob"])
+
+
+    #Tests blank names are not indexed
+    def test_blank_names_skipped(self):
+        utils.record_score("   ", 10)
+        self.assertEqual(attempt_comparison.get_all_users(), [])
+
+
+    #Tests a deleted index is rebuilt from the raw score store
+    def test_rebuild_from_raw_store(self):
+        utils.record_score("Alex", 10)
+        utils.record_score("Alex", 40)
+        os.remove(self.index_file)
+        self.assertEqual(attempt_comparison.get_all_users(), ["Alex"])
+        first, latest = attempt_comparison.get_first_and_latest_attempt("alex")
+        self.assertEqual((first["score"], latest["score"]), (10, 40))
+
+
+    #Tests a new score only rewrites a small state file and appends new users
+    def test_catalog_not_rewritten_per_user(self):
+        for i in range(20):
+            utils.record_score(f"user{i}", i)
+        size = os.path.getsize(self.index_file)
+        utils.record_score("user3", 90)
+        utils.record_score("newcomer", 50)
+        self.assertEqual(os.path.getsize(self.index_file), size)
+        self.assertEqual(attempt_comparison._load_user_index()["count"], 22)
+        self.assertEqual(len(attempt_comparison.get_all_users()), 21)
+        self.assertEqual([a["score"] for a in attempt_comparison.get_user_attempts("user3")], [3, 90])
+
+
+    #Tests a user removed from the store does not get their old attempts back
+    def test_removed_user_shard_dropped(self):
+        utils.record_score("Alex", 10)
+        utils.record_score("Bob", 99)
+        utils.save_scores([r for r in utils.load_scores() if r["name"] == "Bob"])
+        self.assertEqual(attempt_comparison.get_all_users(), ["Bob"])
+        utils.record_score("Alex", 70)
+        self.assertEqual([a["score"] for a in attempt_comparison.get_user_attempts("alex")], [70])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,201 @@
+import os
+import json
+import tempfile
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import patch, MagicMock
+import attempts
+import certification_quiz
+import attempt_limiter
+import storage_backend
+from attempt_limiter import AttemptLimiter, DailyPolicy, SlidingWindowPolicy, TokenBucketPolicy
+
+
+class _Clock:
+
+    def __init__(self, now=1_000_000.0):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+
+class TestAttemptPolicies_Branches(unittest.TestCase):
+
+    #Tests the daily policy counts every day inside its window
+    def test_daily_policy_window(self):
+        policy = DailyPolicy(3, window_days=2, today=lambda: "2025-03-10")
+        entry = {"2025-03-08": 5, "2025-03-09": 1, "2025-03-10": 1}
+        self.assertEqual(policy.remaining(entry), 1)
+        self.assertEqual(policy.remaining(entry, limit=5), 3)
+        self.assertEqual(policy.record(entry)["2025-03-10"], 2)
+
+
+    #Tests the sliding window frees a slot once the oldest attempt ages out
+    def test_sliding_window(self):
+        clock = _Clock()
+        policy = SlidingWindowPolicy(2, hours=1, clock=clock)
+        entry = policy.record(None)
+        clock.now += 600
+        entry = policy.record(entry)
+        self.assertEqual(policy.remaining(entry), 0)
+        clock.now += 3000
+        self.assertEqual(policy.remaining(entry), 1)
+        state, archived = policy.compact({"a": entry, "b": [clock.now - 7200]})
+        self.assertEqual((list(state), archived), (["a"], []))
+
+
+    #Tests the token bucket spends one token per attempt and refills over time
+    def test_token_bucket(self):
+        clock = _Clock()
+        policy = TokenBucketPolicy(2, refill_per_hour=1, clock=clock)
+        entry = policy.record(policy.record(None))
+        self.assertEqual(policy.remaining(entry), 0)
+        clock.now += 1800
+        self.assertEqual(policy.remaining(entry), 0)
+        clock.now += 1800
+        self.assertEqual(policy.remaining(entry), 1)
+        clock.now += 36000
+        self.assertEqual(policy.compact({"a": entry}), ({}, []))
+
+
+    #Tests the sliding window and the bucket hold a caller to a larger limit
+    def test_larger_limit_is_kept(self):
+        clock = _Clock()
+        sliding = SlidingWindowPolicy(2, hours=1, clock=clock)
+        entry = None
+        for _ in range(4):
+            entry = sliding.record(entry, limit=5)
+        self.assertEqual(sliding.remaining(entry, limit=5), 1)
+        self.assertEqual(sliding.remaining(entry), 0)
+
+        bucket = TokenBucketPolicy(2, refill_per_hour=1, clock=clock)
+        self.assertEqual(bucket.remaining(None, limit=5), 5)
+        entry = bucket.record(bucket.record(None, limit=5), limit=5)
+        self.assertEqual(bucket.remaining(entry, limit=5), 3)
+        self.assertEqual(bucket.remaining(entry), 2)
+        clock.now += 3600
+        self.assertEqual(bucket.compact({"a": entry}), ({"a": entry}, []))
+
+
+    #Tests make_policy parses each spec and rejects unknown ones
+    def test_make_policy(self):
+        self.assertEqual(attempt_limiter.make_policy("daily:7", 3).window_days, 7)
+        self.assertEqual(attempt_limiter.make_policy("rolling:12", 3).window, 12 * 3600)
+        self.assertIsInstance(attempt_limiter.make_policy("bucket:0.5", 3), TokenBucketPolicy)
+        with self.assertRaises(ValueError):
+            attempt_limiter.make_policy("weekly", 3)
+
+
+class TestAttemptLimiter_Branches(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp.name, "state.json")
+        self.env = patch.dict(os.environ, {"MCQ_STORAGE_BACKEND": "json"})
+        self.env.start()
+
+    def tearDown(self):
+        self.env.stop()
+        self.tmp.cleanup()
+
+    def _limiter(self, policy, load=None):
+        return AttemptLimiter(policy, "test", lambda: self.path, load=load)
+
+
+    #Tests a check followed by a record parses the state file only once
+    def test_check_then_record_uses_cache(self):
+        load = MagicMock(side_effect=lambda: attempt_limiter._load_json_state(self.path))
+        limiter = self._limiter(DailyPolicy(2, today=lambda: "2025-03-10"), load=load)
+        self.assertEqual(limiter.admit("mru"), (True, 2))
+        limiter.record("mru")
+        self.assertEqual(limiter.admit("mru"), (True, 1))
+        self.assertEqual(load.call_count, 1)
+
+
+    #Tests the cache is refreshed when another process changes the file
+    def test_cache_reloads_after_external_write(self):
+        limiter = self._limiter(DailyPolicy(2, today=lambda: "2025-03-10"))
+        self.assertEqual(limiter.remaining("mru"), 2)
+        with open(self.path, "w") as f:
+            json.dump({"mru": {"2025-03-10": 2}}, f)
+        self.assertEqual(limiter.remaining("mru"), 0)
+
+
+    #Tests try_acquire records only while attempts are left
+    def test_try_acquire(self):
+        limiter = self._limiter(DailyPolicy(1, today=lambda: "2025-03-10"))
+        self.assertEqual(limiter.try_acquire("mru"), (True, 1))
+        self.assertEqual(limiter.try_acquire("mru"), (False, 0))
+        with open(self.path) as f:
+            self.assertEqual(json.load(f), {"mru": {"2025-03-10": 1}})
+
+
+    #Tests SQLite admits exactly the limit when attempts race each other
+    def test_try_acquire_sqlite_is_atomic(self):
+        db = os.path.join(self.tmp.name, "state.db")
+        env = {"MCQ_STORAGE_BACKEND": "sqlite", "MCQ_SQLITE_PATH": db}
+        limiter = self._limiter(SlidingWindowPolicy(3, hours=1))
+        with patch.dict(os.environ, env):
+            with ThreadPoolExecutor(8) as pool:
+                results = list(pool.map(lambda _: limiter.try_acquire("mru")[0], range(8)))
+            self.assertEqual(results.count(True), 3)
+        store = storage_backend.get_sqlite_store(db)
+        with self.assertRaises(RuntimeError), store.transaction():
+            store.put_doc("test", "other", [1])
+            raise RuntimeError
+        self.assertIsNone(store.get_doc("test", "other"))
+        storage_backend._stores.pop(db).close()
+
+
+class TestAttemptModulesUseLimiter_Branches(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        d = self.tmp.name
+        self.patches = [
+            patch.dict(os.environ, {"MCQ_STORAGE_BACKEND": "json"}),
+            patch("attempts.ATTEMPT_FILE", os.path.join(d, "attempts.json")),
+            patch("certification_quiz.CERT_ATTEMPT_FILE", os.path.join(d, "cert_attempts.json")),
+            patch("attempts._limiters", {}),
+            patch("certification_quiz._cert_limiters", {}),
+        ]
+        for p in self.patches:
+            p.start()
+
+    def tearDown(self):
+        for p in self.patches:
+            p.stop()
+        self.tmp.cleanup()
+
+
+    #Tests a rolling policy keeps its state in its own file next to attempts.json
+    def test_rolling_policy_uses_own_file(self):
+        with patch.dict(os.environ, {"MCQ_ATTEMPT_POLICY": "rolling:24"}):
+            self.assertEqual(attempts.try_start_quiz("mru::Quiz", max_attempts=1), (True, 1))
+            self.assertEqual(attempts.can_attempt_quiz("mru::Quiz", max_attempts=1), (False, 0))
+        self.assertFalse(os.path.exists(attempts.ATTEMPT_FILE))
+        self.assertTrue(os.path.exists(attempts.ATTEMPT_FILE.replace(".json", "_sliding.json")))
+
+
+    #Tests the certification limit and the quiz limit are kept apart
+    def test_cert_and_quiz_limits_are_separate(self):
+        certification_quiz.record_cert_attempt("mru")
+        self.assertEqual(certification_quiz.can_attempt_cert_quiz("mru"), (False, 0))
+        self.assertEqual(attempts.can_attempt_quiz("mru"), (True, attempts.MAX_ATTEMPTS_PER_DAY))
+
+
+    #Tests the exam takes its attempt before the intro prompt, in one step
+    def test_cert_exam_takes_attempt_up_front(self):
+        seen = []
+        with patch("builtins.print"), patch("builtins.input", side_effect=lambda _="": seen.append(
+                certification_quiz.get_cert_attempts_left("mru")) or "A"), \
+             patch.object(certification_quiz, "record_score"), \
+             patch.object(certification_quiz, "_add_cert_result"):
+            certification_quiz.run_certification_exam("mru")
+        self.assertEqual(seen[0], 0)
+        self.assertEqual(certification_quiz.try_start_cert_quiz("mru"), (False, 0))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,85 @@
+import os
+import json
+import tempfile
+import unittest
+from unittest.mock import patch
+import bank_loader
+from quiz_data import ALL_QUIZ_DATA
+
+
+def _q(text, answer="A", topic="Math"):
+    return {"question": text, "options": ["A. 1", "B. 2", "C. 3", "D. 4"], "answer": answer,
+            "topic": topic, "difficulty": "Easy"}
+
+
+class TestBankLoader_Branches(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def _path(self, name, text):
+        path = os.path.join(self.tmp.name, name)
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(text)
+        return path
+
+
+    #Tests a JSON Lines bank loads valid records and reports the invalid ones
+    def test_jsonl_with_invalid_records(self):
+        lines = [json.dumps(_q("Q1")), "{broken", "", json.dumps(_q("Q2", answer="E")),
+                 json.dumps(_q("Q3", answer=" b ")), json.dumps([1, 2])]
+        bank, report = bank_loader.load_bank(self._path("bank.jsonl", "\n".join(lines)))
+        self.assertEqual(bank.questions, ["Q1", "Q3"])
+        self.assertEqual(bank.answers, ["A", "B"])
+        self.assertEqual(bank.options[0], ("A. 1", "B. 2", "C. 3", "D. 4"))
+        self.assertEqual((report["loaded"], report["skipped"]), (2, 3))
+        self.assertEqual([n for n, _ in report["errors"]], [2, 4, 6])
+
+
+    #Tests an exported_questions.json style array streams correctly across tiny chunks
+    def test_json_array_small_chunks(self):
+        path = self._path("bank.json", json.dumps(ALL_QUIZ_DATA, indent=4))
+        bank, report = bank_loader.load_bank(path, chunk_size=7)
+        self.assertEqual(report["loaded"], len(ALL_QUIZ_DATA))
+        self.assertEqual(bank.questions, [q["question"] for q in ALL_QUIZ_DATA])
+        self.assertEqual(bank.options, [tuple(q["options"]) for q in ALL_QUIZ_DATA])
+
+
+    #Tests bare values cut at a chunk edge are decoded whole and rejected
+    def test_json_array_scalar_items(self):
+        items = list(bank_loader.iter_json_array(self._path("s.json", "[12345, 6789]"), chunk_size=3))
+        self.assertEqual(items, [(1, 12345), (2, 6789)])
+
+
+    #Tests a truncated or non-array file raises ValueError
+    def test_json_array_malformed(self):
+        with self.assertRaises(ValueError):
+            list(bank_loader.iter_json_array(self._path("t.json", '[{"question": "Q1"'), chunk_size=4))
+        with self.assertRaises(ValueError):
+            list(bank_loader.iter_json_array(self._path("o.json", '{"question": "Q1"}')))
+
+
+    #Tests the report includes peak memory when tracing is requested
+    def test_report_peak_memory(self):
+        path = self._path("bank.jsonl", "\n".join(json.dumps(_q(f"Q{i}")) for i in range(50)))
+        bank, report = bank_loader.load_bank(path, trace_memory=True)
+        self.assertEqual(len(bank), 50)
+        self.assertGreater(report["peak_bytes"], 0)
+
+
+    #Tests get_question_bank uses the configured file and caches it until it changes
+    def test_get_question_bank_configured(self):
+        path = self._path("bank.jsonl", json.dumps(_q("Q1")))
+        with patch.dict(os.environ, {"MCQ_QUESTION_BANK": path}), patch("bank_loader._loaded", {}):
+            bank = bank_loader.get_question_bank(ALL_QUIZ_DATA)
+            self.assertEqual(bank.questions, ["Q1"])
+            self.assertIs(bank_loader.get_question_bank(ALL_QUIZ_DATA), bank)
+        with patch.dict(os.environ, {"MCQ_QUESTION_BANK": ""}):
+            self.assertEqual(len(bank_loader.get_question_bank(ALL_QUIZ_DATA)), len(ALL_QUIZ_DATA))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,88 @@
+import os
+import json
+import unittest
+import multiprocessing
+from unittest.mock import patch
+import utils
+import attempts
+import leaderboard
+import attempt_comparison
+
+WRITERS = 50
+
+
+def _finish_quiz(start, i):
+    start.wait()
+    utils.record_score(f"user{i}", i, mode="standard")
+    attempts.record_quiz_attempt("shared")
+
+
+@unittest.skipUnless(
+    utils.fcntl is not None and "fork" in multiprocessing.get_all_start_methods(),
+    "needs fcntl locks and the fork start method",
+)
+class TestConcurrentWriters_Branches(unittest.TestCase):
+
+    def setUp(self):
+        patcher = patch.dict(os.environ, {"MCQ_STORAGE_BACKEND": "json"})
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+
+    #Tests no score, index entry or attempt is lost when 50 processes finish at once
+    def test_parallel_writers_lose_nothing(self):
+        utils.migrate_scores()
+        ctx = multiprocessing.get_context("fork")
+        start = ctx.Event()
+        workers = [ctx.Process(target=_finish_quiz, args=(start, i)) for i in range(WRITERS)]
+        for w in workers:
+            w.start()
+        start.set()
+        for w in workers:
+            w.join(60)
+            self.assertEqual(w.exitcode, 0)
+
+        names = sorted(r["name"] for r in utils.load_scores())
+        self.assertEqual(names, sorted(f"user{i}" for i in range(WRITERS)))
+        self.assertEqual(leaderboard.check_leaderboard(), [])
+        self.assertEqual(leaderboard.get_top_scores(1)[0]["score"], WRITERS - 1)
+        self.assertEqual(len(attempt_comparison.get_all_users()), WRITERS)
+        self.assertEqual(attempt_comparison._load_user_index()["count"], WRITERS)
+        with open(attempts.ATTEMPT_FILE) as f:
+            self.assertEqual(json.load(f)["shared"][attempts._today_str()], WRITERS)
+
+
+    #Tests a sync with nothing new in the journal does not rewrite the board
+    def test_sync_without_new_records_skips_rewrite(self):
+        utils.record_score("a", 10)
+        with patch("leaderboard._save_board") as m_save:
+            leaderboard.sync_leaderboard()
+        m_save.assert_not_called()
+
+
+    #Tests one sync applies every record appended since the last one
+    def test_sync_applies_batch(self):
+        utils.record_score("a", 10)
+        with open(utils.SCORE_JOURNAL_FILE, "a") as f:
+            f.write(json.dumps({"name": "b", "score": 20}) + "\n")
+            f.write(json.dumps({"name": "c", "score": 30}) + "\n")
+        with patch("leaderboard._save_board", wraps=leaderboard._save_board) as m_save:
+            board = leaderboard.sync_leaderboard()
+        self.assertEqual(m_save.call_count, 1)
+        self.assertEqual(board["count"], 3)
+        self.assertEqual(attempt_comparison.sync_user_index()["count"], 3)
+
+
+    #Tests a line still being written is left for the next sync
+    def test_partial_line_not_consumed(self):
+        utils.record_score("a", 10)
+        with open(utils.SCORE_JOURNAL_FILE, "a") as f:
+            f.write('{"name": "b", "sco')
+        records, offset = utils.read_scores_from(0)
+        self.assertEqual([r["name"] for r in records], ["a"])
+        self.assertLess(offset, os.path.getsize(utils.SCORE_JOURNAL_FILE))
+        self.assertIsNone(utils.read_scores_from(offset + 1000))
+
+
+if __name__ == "__main__":
+    unittest.main()
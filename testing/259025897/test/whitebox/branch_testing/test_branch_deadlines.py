@@ -0,0 +1,157 @@
+import sys
+import socket
+import unittest
+from unittest.mock import patch
+import mcq_types
+import deadlines
+from deadlines import DeadlineScheduler
+
+
+class FakeClock:
+
+    def __init__(self):
+        self.t = 0.0
+
+    def __call__(self):
+        return self.t
+
+
+class TestDeadlines_Branches(unittest.TestCase):
+
+    def setUp(self):
+        self.clock = FakeClock()
+        self.scheduler = DeadlineScheduler(clock=self.clock)
+        self.fired = []
+
+
+    #Tests due deadlines fire in time order and cancelled ones never fire
+    def test_poll_order_and_cancel(self):
+        self.scheduler.at(3, self.fired.append, "c")
+        self.scheduler.at(1, self.fired.append, "a")
+        cancelled = self.scheduler.at(2, self.fired.append, "b")
+        cancelled.cancel()
+        self.clock.t = 2.5
+        self.assertEqual(self.scheduler.poll(), 2.5)
+        self.assertEqual(self.fired, ["a"])
+        self.assertEqual(self.scheduler.next_deadline(), 3)
+        self.assertEqual(len(self.scheduler), 1)
+
+
+    #Tests wait sleeps once per deadline instead of polling
+    def test_wait_without_polling(self):
+        a, b = socket.socketpair()
+        try:
+            self.scheduler.at(1, self.fired.append, "warning")
+            calls = []
+
+            def fake_select(readers, writers, errors, timeout):
+                calls.append(timeout)
+                self.clock.t += timeout
+                return [], [], []
+
+            with patch("select.select", side_effect=fake_select):
+                self.assertEqual(self.scheduler.wait([a], until=5), [])
+            self.assertEqual(calls, [1, 4])
+            self.assertEqual(self.fired, ["warning"])
+            b.send(b"x\n")
+            self.assertEqual(self.scheduler.wait([a], until=self.clock.t + 5), [a])
+        finally:
+            a.close()
+            b.close()
+
+
+    #Tests several sessions share one scheduler and wait together
+    def test_concurrent_sessions(self):
+        pairs = [socket.socketpair() for _ in range(3)]
+        try:
+            timeouts = [self.scheduler.at(t, self.fired.append, f"session {i}") for i, t in enumerate((2, 1, 3))]
+            pairs[2][1].send(b"B\n")
+            ready = self.scheduler.wait([p[0] for p in pairs], until=10)
+            self.assertEqual(ready, [pairs[2][0]])
+            timeouts[2].cancel()
+            self.clock.t = 3
+            self.scheduler.poll()
+            self.assertEqual(self.fired, ["session 1", "session 0"])
+        finally:
+            for a, b in pairs:
+                a.close()
+                b.close()
+
+
+    #Tests timed_quiz rejects a negative timeout and fires scheduler warnings
+    def test_timed_quiz_with_scheduler(self):
+        with patch("mcq_types.sys.platform", "linux"), patch("builtins.print"):
+            with self.assertRaises(ValueError):
+                mcq_types.timed_quiz("> ", timeout=-1)
+            self.scheduler.at(0, self.fired.append, "warn")
+            with patch("select.select", return_value=([], [], [])):
+                self.assertIsNone(mcq_types.timed_quiz("> ", timeout=0, scheduler=self.scheduler))
+        self.assertEqual(self.fired, ["warn"])
+
+
+    #Tests challenge mode prints its time warnings from the scheduler
+    @patch("mcq_types.record_score")
+    @patch("mcq_types.random.shuffle", side_effect=lambda x: None)
+    @patch("mcq_types.timed_quiz", return_value=None)
+    @patch("builtins.input", side_effect=["2"])
+    @patch("mcq_types.time.time", side_effect=[0, 95, 95])
+    def test_challenge_warnings(self, m_time, m_input, m_timed, m_shuffle, m_save):
+        with patch("builtins.print") as m_print:
+            mcq_types.take_quiz_challenge(["Q1"], [("A.1", "B.2")], ["A"], name="W")
+        m_print.assert_any_call("\n*** 60 seconds left in the challenge! ***")
+        self.assertEqual(m_timed.call_args.kwargs["until"], 120)
+
+
+    #Tests the Windows path blocks on the console handle between key presses
+    @patch("builtins.print")
+    def test_windows_waits_on_console(self, m_print):
+        keys = iter([False, True, True, False])
+        fake_msvcrt = type(sys)("msvcrt")
+        fake_msvcrt.kbhit = lambda: next(keys)
+        fake_msvcrt.getwch = iter(["b", "\r"]).__next__
+        waits = []
+
+        def fake_wait(timeout):
+            waits.append(timeout)
+            self.clock.t += 1
+            return True
+
+        with patch.dict(sys.modules, {"msvcrt": fake_msvcrt}), patch("mcq_types.sys.platform", "win32"):
+            with patch("deadlines._wait_console", side_effect=fake_wait), patch("time.sleep") as m_sleep:
+                self.assertEqual(mcq_types.timed_quiz("> ", timeout=5, scheduler=self.scheduler), "B")
+        self.assertEqual(waits, [5])
+        m_sleep.assert_not_called()
+
+
+    #Tests focus and mouse events are read off the console and the wait resumes until a key press
+    def test_console_wait_drains_non_key_events(self):
+        pending = [[(0x0010, False, "\0"), (0x0002, False, "\0")], [(deadlines.KEY_EVENT, False, "a")],
+                   [(deadlines.KEY_EVENT, True, "a")]]
+        drained = []
+
+        class Kernel32:
+            GetStdHandle = staticmethod(lambda n: 1)
+            WaitForSingleObject = staticmethod(lambda h, ms: deadlines.WAIT_OBJECT_0)
+
+            @staticmethod
+            def PeekConsoleInputW(h, records, size, count):
+                for r, (kind, down, char) in zip(records, pending[0]):
+                    r.EventType, r.Event.KeyEvent.bKeyDown, r.Event.KeyEvent.uChar = kind, down, char
+                count._obj.value = len(pending[0])
+                return 1
+
+            @staticmethod
+            def ReadConsoleInputW(h, records, size, count):
+                drained.append(size)
+                pending.pop(0)
+                return 1
+
+        with patch("ctypes.windll", type(sys)("windll"), create=True) as windll:
+            windll.kernel32 = Kernel32
+            self.assertTrue(deadlines._wait_console(5))
+        self.assertEqual(drained, [2, 1])
+        self.assertEqual(len(pending), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
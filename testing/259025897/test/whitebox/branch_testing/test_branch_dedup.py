@@ -0,0 +1,77 @@
+import os
+import json
+import hashlib
+import tempfile
+import unittest
+import dedup
+from quiz_data import ALL_QUIZ_DATA
+
+
+def _q(text, options=("A. 1", "B. 2"), answer="A"):
+    return {"question": text, "options": list(options), "answer": answer}
+
+
+class TestDedup_Branches(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+
+    #Tests exact duplicates match after normalization and keep the first copy
+    def test_exact_duplicates(self):
+        questions = [_q("What is H2O?"), _q("what is  h2o? "), _q("What is H2O?", ("A. 3", "B. 4"))]
+        report = dedup.find_duplicates(questions)
+        self.assertEqual(report["exact"], [(1, 0)])
+        self.assertEqual(report["near"], [(2, 0, 1.0)])
+        self.assertEqual(report["kept"], [0])
+
+
+    #Tests reworded questions are reported as near-duplicates of the first
+    def test_near_duplicates(self):
+        questions = [
+            _q("Which planet is known as the Red Planet in our solar system?"),
+            _q("Which organ pumps blood through the human body?"),
+            _q("Which planet is known as the red planet of our solar system?"),
+        ]
+        report = dedup.find_duplicates(questions)
+        self.assertEqual([(i, j) for i, j, _ in report["near"]], [(2, 0)])
+        self.assertGreaterEqual(report["near"][0][2], dedup.THRESHOLD)
+        self.assertEqual(dedup.find_duplicates(questions, threshold=0.99)["near"], [])
+
+
+    #Tests the built-in bank has no duplicates
+    def test_builtin_bank_is_clean(self):
+        report = dedup.find_duplicates(ALL_QUIZ_DATA)
+        self.assertEqual(len(report["kept"]), len(ALL_QUIZ_DATA))
+
+
+    #Tests common stems do not make unrelated questions near-duplicates
+    def test_common_stem_is_ignored(self):
+        questions = [_q(f"Which of the following is true about {hashlib.md5(str(i).encode()).hexdigest()}?")
+                     for i in range(200)]
+        report = dedup.find_duplicates(questions)
+        self.assertEqual(report["near"], [])
+        self.assertEqual(len(report["kept"]), 200)
+
+
+    #Tests merging two banks writes one copy of each question as JSON Lines
+    def test_merge_banks(self):
+        path = os.path.join(self.tmp.name, "extra.jsonl")
+        with open(path, "w", encoding="utf-8") as f:
+            for q in [ALL_QUIZ_DATA[0], _q("A brand new question?")]:
+                f.write(json.dumps(dict(q, options=list(q["options"]))) + "\n")
+        out = os.path.join(self.tmp.name, "merged.jsonl")
+        questions, report = dedup.merge_banks(["quiz_data", path], out)
+        self.assertEqual(len(questions), len(ALL_QUIZ_DATA) + 2)
+        self.assertEqual(report["exact"], [(len(ALL_QUIZ_DATA), 0)])
+        with open(out, encoding="utf-8") as f:
+            merged = [json.loads(line) for line in f]
+        self.assertEqual(report["written"], len(merged))
+        self.assertEqual(merged[-1]["question"], "A brand new question?")
+
+
+if __name__ == "__main__":
+    unittest.main()
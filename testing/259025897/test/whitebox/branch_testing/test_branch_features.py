@@ -0,0 +1,70 @@
+import os
+import sys
+import subprocess
+import unittest
+from unittest.mock import patch
+import features
+
+ROOT = os.path.dirname(os.path.abspath(features.__file__))
+
+
+class TestFeatures_Branches(unittest.TestCase):
+
+    #Tests importing main pulls in no feature module and no question data
+    def test_main_imports_no_features(self):
+        modules = sorted({m for m, _ in features.FEATURES.values()} | {"quiz_data"})
+        code = f"import sys, main; print([m for m in {modules!r} if m in sys.modules])"
+        result = subprocess.run([sys.executable, "-c", code], cwd=ROOT,
+                                capture_output=True, text=True, check=True)
+        self.assertEqual(result.stdout.strip(), "[]")
+
+
+    #Tests the quiz data is imported on first access and a value set on main wins
+    def test_main_quiz_data(self):
+        import main
+        import quiz_data
+        self.assertIs(main.ALL_QUIZ_DATA, quiz_data.ALL_QUIZ_DATA)
+        self.assertIs(main._quiz_data("FILL_IN_QUIZ_DATA"), quiz_data.FILL_IN_QUIZ_DATA)
+        self.assertNotIn("ALL_QUIZ_DATA", vars(main))
+        with patch.object(main, "ALL_QUIZ_DATA", [], create=True):
+            self.assertEqual(main._quiz_data("ALL_QUIZ_DATA"), [])
+        with self.assertRaises(AttributeError):
+            main.NO_SUCH_DATA
+
+
+    #Tests every registered feature resolves to a function
+    def test_registry_resolves(self):
+        for name in features.FEATURES:
+            self.assertTrue(callable(features.load(name)), name)
+
+
+    #Tests a lazy feature dispatches to the current function of its module
+    def test_lazy_dispatch(self):
+        search_menu = features.lazy("search_menu")
+        self.assertEqual(search_menu.__name__, "search_menu")
+        with patch("search_index.search_menu", return_value="found") as mock:
+            self.assertEqual(search_menu(), "found")
+        mock.assert_called_once_with()
+
+
+    #Tests unknown names are rejected and new features can be registered
+    def test_register(self):
+        with self.assertRaises(KeyError):
+            features.lazy("no_such_feature")
+        with patch.dict(features.FEATURES):
+            features.register("dedup_report", "dedup", "print_dedup_report")
+            self.assertEqual(features.FEATURES["dedup_report"], ("dedup", "print_dedup_report"))
+            self.assertEqual(features.lazy("dedup_report").__name__, "dedup_report")
+
+
+    #Tests -X importtime output is parsed into cumulative times
+    def test_parse_importtime(self):
+        stderr = ("import time: self [us] | cumulative | imported package\n"
+                  "import time:       120 |        120 |   features\n"
+                  "import time:       300 |        420 | main\n"
+                  "some other line\n")
+        self.assertEqual(features.parse_importtime(stderr), {"features": 120, "main": 420})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,81 @@
+import unittest
+from unittest.mock import patch
+import fill_answers
+import mcq
+from fill_answers import FillAnswer, compile_answer, get_fill_answers, grade_fill
+from question_bank import data_changed
+from quiz_data import FILL_IN_QUIZ_DATA
+
+
+class TestFillAnswers_Branches(unittest.TestCase):
+
+    #Tests variants are normalized once into a set of accepted answers
+    def test_compiled_variants(self):
+        answer = FillAnswer(" Mitochondria | the  Mitochondrion ")
+        self.assertEqual(answer.variants, ("Mitochondria", "the  Mitochondrion"))
+        self.assertEqual(answer.accepted, frozenset({"mitochondria", "the mitochondrion"}))
+        self.assertTrue(answer.check("  THE mitochondrion"))
+        self.assertFalse(answer.check("nucleus"))
+
+
+    #Tests patterns match the whole normalized guess and answers stay literal
+    def test_pattern_variants(self):
+        answer = FillAnswer("colour|re:gr[ae]y", patterns=["colou?rs?"])
+        self.assertEqual(len(answer.patterns), 1)
+        self.assertTrue(answer.check("Colors"))
+        self.assertTrue(answer.accepts("colour"))
+        self.assertFalse(answer.check("colored"))
+        self.assertTrue(answer.check("RE:gr[ae]y"))
+        self.assertFalse(answer.check("grey"))
+
+
+    #Tests a bad pattern is rejected when the questions are loaded
+    def test_invalid_pattern_fails_at_load(self):
+        data = [dict(FILL_IN_QUIZ_DATA[0]), {"question": "Q", "answer": "a", "answer_patterns": ["(unclosed"]}]
+        with self.assertRaisesRegex(ValueError, "fill-in question 2"):
+            get_fill_answers(data)
+
+
+    #Tests raw answers and question lists are compiled once
+    def test_caching(self):
+        self.assertIs(compile_answer("Au"), compile_answer("Au"))
+        data = [dict(FILL_IN_QUIZ_DATA[0])]
+        first = get_fill_answers(data)
+        self.assertIs(get_fill_answers(data), first)
+        data.append(dict(FILL_IN_QUIZ_DATA[1]))
+        self.assertEqual(len(get_fill_answers(data)), 2)
+        data[0]["answer"] = "Silver"
+        data_changed(data)
+        self.assertTrue(get_fill_answers(data)[0].check("silver"))
+
+
+    #Tests the bulk grader scores every submission, including short ones
+    def test_grade_fill(self):
+        answers = ["Au", "oxygen|O2", fill_answers.FillAnswer("Jupiter", patterns=["jupiter( planet)?"])]
+        results = grade_fill(answers, [
+            ["au", "o2", "Jupiter planet"],
+            ["Ag", "Oxygen"],
+            ["AU", None, "saturn"],
+        ])
+        self.assertEqual(results, [
+            (3, [True, True, True]),
+            (1, [False, True, False]),
+            (1, [True, False, False]),
+        ])
+        self.assertEqual(grade_fill(answers, []), [])
+
+
+    #Tests a guess matching only a question's answer_patterns scores in the quiz and the grader
+    def test_pattern_only_answer_is_correct(self):
+        data = [{"question": "Gas we breathe?", "answer": "Oxygen", "answer_patterns": ["o(xygen|2)( gas)?"]}]
+        answers = get_fill_answers(data)
+        self.assertFalse(compile_answer("Oxygen").check("O2 gas"))
+        self.assertEqual(grade_fill(answers, [["O2 gas"]]), [(1, [True])])
+        with patch("builtins.input", return_value="O2 gas"), patch("builtins.print"), \
+             patch.object(mcq, "record_score") as record:
+            mcq.take_fill_in_the_blanks_quiz(["Gas we breathe?"], answers, name="Ann")
+        record.assert_called_once_with("Ann", 100, mode="fill_in")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,67 @@
+import json
+import unittest
+from unittest.mock import patch
+import utils
+import leaderboard
+import attempt_comparison
+
+
+class TestLeaderboard_Branches(unittest.TestCase):
+
+    def setUp(self):
+        self.board_file = leaderboard.LEADERBOARD_FILE
+
+
+    #Tests get_top_scores returns an empty list when nothing has been recorded
+    def test_top_scores_empty(self):
+        self.assertEqual(leaderboard.get_top_scores(1), [])
+
+
+    #Tests recorded scores come back highest first, overall and per mode
+    def test_top_scores_overall_and_by_mode(self):
+        utils.record_score("a", 40, mode="timed")
+        utils.record_score("b", 90, mode="standard")
+        utils.record_score("c", 70, mode="timed")
+        self.assertEqual([e["name"] for e in leaderboard.get_top_scores(2)], ["b", "c"])
+        self.assertEqual([e["name"] for e in leaderboard.get_top_scores(10, mode="timed")], ["c", "a"])
+        self.assertEqual(leaderboard.get_top_scores(10, mode="streak"), [])
+
+
+    #Tests equal scores keep the order they were recorded in
+    def test_ties_keep_recording_order(self):
+        utils.record_score("first", 50)
+        utils.record_score("second", 50)
+        self.assertEqual([e["name"] for e in leaderboard.get_top_scores(2)], ["first", "second"])
+
+
+    #Tests the board only keeps LEADERBOARD_SIZE entries
+    @patch("leaderboard.LEADERBOARD_SIZE", 3)
+    def test_board_is_bounded(self):
+        for score in [10, 20, 30, 40, 50]:
+            utils.record_score("u", score)
+        self.assertEqual([e["score"] for e in leaderboard.get_top_scores(10)], [50, 40, 30])
+
+
+    #Tests check_leaderboard reports a stale index and rebuild_leaderboard repairs it
+    def test_check_and_rebuild(self):
+        utils.record_score("a", 40)
+        self.assertEqual(leaderboard.check_leaderboard(), [])
+        with open(self.board_file, "w") as f:
+            json.dump(leaderboard._empty_board(), f)
+        self.assertTrue(leaderboard.check_leaderboard())
+        leaderboard.rebuild_leaderboard()
+        self.assertEqual(leaderboard.check_leaderboard(), [])
+
+
+    #Tests check_high_score prints the top entry from the leaderboard
+    @patch("builtins.print")
+    def test_check_high_score_uses_board(self, m_print):
+        import storage
+        utils.record_score("a", 40)
+        utils.record_score("b", 80)
+        storage.check_high_score()
+        m_print.assert_any_call("b: 80%")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -20,29 +20,26 @@ class TestTakeQuiz_Branches(unittest.TestCase):
 
 
     #Tests untimed quiz path where a wrong answer is given and the score is saved when a name is provided
-    @patch("mcq_types.save_scores")
-    @patch("mcq_types.load_scores", return_value=[])
+    @patch("mcq_types.record_score")
     @patch("mcq_types.print_results")
     @patch("builtins.input", side_effect=["B"])
     def test_take_quiz_untimed_incorrect_with_name_saves(
-        self, m_input, m_print_results, m_load, m_save
+        self, m_input, m_print_results, m_save
     ):
         qs = ["Q1"]
         opts = [("A.1", "B.2", "C.3", "D.4")]
         ans = ["A"]
         mcq_types.take_quiz(qs, opts, ans, name="Alice", timed=False)
         m_print_results.assert_called_once()
-        m_load.assert_called_once()
         m_save.assert_called_once()
 
 
     #Checks timed quiz path where timed_quiz returns a valid answer and the score is saved
-    @patch("mcq_types.save_scores")
-    @patch("mcq_types.load_scores", return_value=[])
+    @patch("mcq_types.record_score")
     @patch("mcq_types.print_results")
     @patch("mcq_types.timed_quiz", return_value="A")
     def test_take_quiz_timed_input_with_name_saves(
-        self, m_timed, m_print_results, m_load, m_save
+        self, m_timed, m_print_results, m_save
     ):
         qs = ["Q1"]
         opts = [("A.1", "B.2", "C.3", "D.4")]
@@ -54,12 +51,11 @@ class TestTakeQuiz_Branches(unittest.TestCase):
 
 
     #Checks timed quiz timeout path where timed_quiz returns None and the blank guess branch runs
-    @patch("mcq_types.save_scores")
-    @patch("mcq_types.load_scores", return_value=[])
+    @patch("mcq_types.record_score")
     @patch("mcq_types.print_results")
     @patch("mcq_types.timed_quiz", return_value=None)
     def test_take_quiz_timed_timeout_sets_blank_guess(
-        self, m_timed, m_print_results, m_load, m_save
+        self, m_timed, m_print_results, m_save
     ):
         qs = ["Q1"]
         opts = [("A.1", "B.2", "C.3", "D.4")]
@@ -134,10 +130,9 @@ class TestTimedQuiz_Branches(unittest.TestCase):
 class TestNegativeMark_Branches(unittest.TestCase):
 
     #Tests negative marking quiz branches for correct, wrong with penalty, and blank answer cases
-    @patch("mcq_types.save_scores")
-    @patch("mcq_types.load_scores", return_value=[])
+    @patch("mcq_types.record_score")
     @patch("builtins.input", side_effect=["A", "B", ""])
-    def test_negative_mark_branches(self, m_input, m_load, m_save):
+    def test_negative_mark_branches(self, m_input, m_save):
         qs = ["Q1", "Q2", "Q3"]
         opts = [("A.1", "B.2", "C.3", "D.4")] * 3
         ans = ["A", "A", "A"]
@@ -148,13 +143,12 @@ class TestNegativeMark_Branches(unittest.TestCase):
 class TestChallenge_Branches(unittest.TestCase):
 
     #Checks challenge mode branch where time runs out immediately and the score is still saved for a named user
-    @patch("mcq_types.save_scores")
-    @patch("mcq_types.load_scores", return_value=[])
+    @patch("mcq_types.record_score")
     @patch("mcq_types.random.shuffle", side_effect=lambda x: None)
     @patch("builtins.input", side_effect=["3"])
     @patch("mcq_types.time.time", side_effect=[0, 9999])
     def test_challenge_immediate_timeup_saves(
-        self, m_time, m_input, m_shuffle, m_load, m_save
+        self, m_time, m_input, m_shuffle, m_save
     ):
         qs = ["Q1"]
         opts = [("A.1", "B.2", "C.3", "D.4")]
@@ -164,14 +158,13 @@ class TestChallenge_Branches(unittest.TestCase):
 
 
     #Checks challenge mode branch where timed_quiz returns None mid-question and the score is still saved
-    @patch("mcq_types.save_scores")
-    @patch("mcq_types.load_scores", return_value=[])
+    @patch("mcq_types.record_score")
     @patch("mcq_types.random.shuffle", side_effect=lambda x: None)
     @patch("mcq_types.timed_quiz", return_value=None)
     @patch("builtins.input", side_effect=["3"])
     @patch("mcq_types.time.time", side_effect=[0, 0, 1])
     def test_challenge_guess_none_branch_saves(
-        self, m_time, m_input, m_timed, m_shuffle, m_load, m_save
+        self, m_time, m_input, m_timed, m_shuffle, m_save
     ):
         qs = ["Q1"]
         opts = [("A.1", "B.2", "C.3", "D.4")]
@@ -181,13 +174,12 @@ class TestChallenge_Branches(unittest.TestCase):
 
 
     #Checks challenge mode validation loop where invalid minutes are rejected until a valid value is entered
-    @patch("mcq_types.save_scores")
-    @patch("mcq_types.load_scores", return_value=[])
+    @patch("mcq_types.record_score")
     @patch("mcq_types.timed_quiz", return_value=None)
     @patch("builtins.input", side_effect=["10", "abc", "3"])
     @patch("mcq_types.time.time", side_effect=[0, 0, 1])
     def test_challenge_minutes_validation_loop_saves(
-        self, m_time, m_input, m_timed, m_load, m_save
+        self, m_time, m_input, m_timed, m_save
     ):
         qs = ["Q1"]
         opts = [("A.1", "B.2", "C.3", "D.4")]
@@ -199,12 +191,11 @@ class TestChallenge_Branches(unittest.TestCase):
 class TestStreak_Branches(unittest.TestCase):
 
     #Checks streak mode branch where all questions are answered correctly and the completion message path is reached
-    @patch("mcq_types.save_scores")
-    @patch("mcq_types.load_scores", return_value=[])
+    @patch("mcq_types.record_score")
     @patch("mcq_types.random.shuffle", side_effect=lambda x: None)
     @patch("builtins.input", side_effect=["A"])
     def test_streak_all_correct_amazing_branch(
-        self, m_input, m_shuffle, m_load, m_save
+        self, m_input, m_shuffle, m_save
     ):
         qs = ["Q1"]
         opts = [("A.1", "B.2", "C.3", "D.4")]
@@ -214,12 +205,11 @@ class TestStreak_Branches(unittest.TestCase):
 
 
     #Checks streak mode branch where a wrong answer ends the quiz early and the score is saved
-    @patch("mcq_types.save_scores")
-    @patch("mcq_types.load_scores", return_value=[])
+    @patch("mcq_types.record_score")
     @patch("mcq_types.random.shuffle", side_effect=lambda x: None)
     @patch("builtins.input", side_effect=["B"])
     def test_streak_wrong_answer_branch_saves(
-        self, m_input, m_shuffle, m_load, m_save
+        self, m_input, m_shuffle, m_save
     ):
         qs = ["Q1"]
         opts = [("A.1", "B.2", "C.3", "D.4")]
@@ -229,12 +219,11 @@ class TestStreak_Branches(unittest.TestCase):
 
 
     #Checks streak mode branch where the user submits a blank answer and the 'No answer selected' path is taken
-    @patch("mcq_types.save_scores")
-    @patch("mcq_types.load_scores", return_value=[])
+    @patch("mcq_types.record_score")
     @patch("mcq_types.random.shuffle", side_effect=lambda x: None)
     @patch("builtins.input", side_effect=[""])
     def test_streak_blank_answer_branch_saves(
-        self, m_input, m_shuffle, m_load, m_save
+        self, m_input, m_shuffle, m_save
     ):
         qs = ["Q1"]
         opts = [("A.1", "B.2", "C.3", "D.4")]
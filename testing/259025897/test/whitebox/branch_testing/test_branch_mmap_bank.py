@@ -0,0 +1,104 @@
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+import bank_loader
+import mmap_bank
+from question_bank import QuestionBank
+from quiz_data import ALL_QUIZ_DATA
+
+
+class TestMmapBank_Branches(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp.name, "bank.mcqb")
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def _open(self, data=ALL_QUIZ_DATA):
+        mmap_bank.compile_bank(data, self.path)
+        bank = mmap_bank.MmapQuestionBank(self.path)
+        self.addCleanup(bank.close)
+        return bank
+
+
+    #Tests a compiled bank answers every query the same way as the in-memory bank
+    def test_same_interface_as_memory_bank(self):
+        bank = self._open()
+        memory = QuestionBank(ALL_QUIZ_DATA)
+        self.assertEqual(len(bank), len(memory))
+        self.assertEqual(list(bank.questions), memory.questions)
+        self.assertEqual(list(bank.options), [tuple(o) for o in memory.options])
+        self.assertEqual(bank.topics(), memory.topics())
+        self.assertEqual(bank.ids(topic="Chemistry", difficulty="Easy"), memory.ids(topic="Chemistry", difficulty="Easy"))
+        self.assertEqual(bank.ids_for_difficulties(["Easy"]), memory.ids_for_difficulties(["Easy"]))
+        self.assertEqual(bank.select([5, 1]), memory.select([5, 1]))
+
+
+    #Tests fetching one question decodes only that record
+    def test_record_lookup(self):
+        bank = self._open([
+            {"question": "Qé", "options": ["A. 1", "B. 2"], "answer": "b"},
+            {"question": "Q2", "options": ["A. x", "B. y", "C. z"], "answer": "C", "topic": "T"},
+        ])
+        record = bank.record(-2)
+        self.assertEqual((record.question, record.answer, record.topic), ("Qé", "B", None))
+        self.assertEqual(bank.records[1].options, ("A. x", "B. y", "C. z"))
+        self.assertEqual(bank.answers[0:2], ["B", "C"])
+        with self.assertRaises(IndexError):
+            bank.record(2)
+        with self.assertRaises(TypeError):
+            bank.add({"question": "Q3"})
+
+
+    #Tests sampling picks ids without reading the question payloads
+    def test_sample_reads_only_chosen_records(self):
+        bank = self._open()
+        with patch.object(mmap_bank.MmapQuestionBank, "record", wraps=bank.record) as m_record:
+            qs, _, _ = bank.select(bank.sample(3))
+        self.assertEqual(len(qs), 3)
+        self.assertEqual(m_record.call_count, 3)
+
+
+    #Tests non-bank files and NUL bytes in text are rejected
+    def test_rejects_bad_input(self):
+        other = os.path.join(self.tmp.name, "other.bin")
+        with open(other, "wb") as f:
+            f.write(b"not a bank at all, just bytes")
+        self.assertFalse(mmap_bank.is_binary_bank(other))
+        with self.assertRaises(ValueError):
+            mmap_bank.MmapQuestionBank(other)
+        with self.assertRaises(ValueError):
+            mmap_bank.compile_bank([{"question": "a\0b", "options": ["A", "B"], "answer": "A"}], self.path)
+        self.assertEqual(os.listdir(self.tmp.name), ["other.bin"])
+
+
+    #Tests a configured .mcqb file is opened as a memory-mapped bank
+    def test_get_question_bank_opens_binary(self):
+        mmap_bank.compile_bank(ALL_QUIZ_DATA, self.path)
+        with patch.dict(os.environ, {"MCQ_QUESTION_BANK": self.path}), patch("bank_loader._loaded", {}):
+            bank = bank_loader.get_question_bank([])
+            self.addCleanup(bank.close)
+        self.assertIsInstance(bank, mmap_bank.MmapQuestionBank)
+        self.assertEqual(len(bank), len(ALL_QUIZ_DATA))
+
+
+    #Tests reloading a changed .mcqb file closes the previous mapping
+    def test_reload_closes_old_mapping(self):
+        mmap_bank.compile_bank(ALL_QUIZ_DATA, self.path)
+        with patch.dict(os.environ, {"MCQ_QUESTION_BANK": self.path}), patch("bank_loader._loaded", {}):
+            old = bank_loader.get_question_bank([])
+            mmap_bank.compile_bank(ALL_QUIZ_DATA[:3], self.path)
+            os.utime(self.path, ns=(0, os.stat(self.path).st_mtime_ns + 1))
+            new = bank_loader.get_question_bank([])
+            self.addCleanup(new.close)
+        self.assertEqual(len(new), 3)
+        self.assertTrue(old._mm.closed)
+        self.assertTrue(old._file.closed)
+        self.assertFalse(new._mm.closed)
+
+
+if __name__ == "__main__":
+    unittest.main()
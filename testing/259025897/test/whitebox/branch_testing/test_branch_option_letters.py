@@ -0,0 +1,75 @@
+import os
+import io
+import json
+import tempfile
+import unittest
+from contextlib import redirect_stdout
+import bank_loader
+import question_bank
+from question_bank import QuestionBank, parse_options, letter_map, option_text
+from quiz_data import ALL_QUIZ_DATA
+
+
+class TestOptionLetters_Branches(unittest.TestCase):
+
+    #Tests option labels map to positions and identical maps are shared
+    def test_parse_options(self):
+        letters, problems = parse_options(["A. Cat", "b. Dog", "C. Cow"])
+        self.assertEqual(letters, {"A": 0, "B": 1, "C": 2})
+        self.assertEqual(problems, [])
+        self.assertIs(parse_options(["A. x", "B. y", "C. z"])[0], letters)
+
+
+    #Tests unlabelled and repeated option letters are reported
+    def test_parse_options_problems(self):
+        letters, problems = parse_options(["A. one", "A. two", "three", "D) four"])
+        self.assertEqual(letters, {"A": 0})
+        self.assertEqual(len(problems), 3)
+        self.assertIn("used twice", problems[0])
+
+
+    #Tests the bank looks up the correct option without scanning
+    def test_bank_correct_text(self):
+        bank = QuestionBank(ALL_QUIZ_DATA)
+        q = ALL_QUIZ_DATA[0]
+        self.assertEqual(bank.records[0].correct, bank.option_index(0, q["answer"]))
+        self.assertTrue(bank.correct_text(0).upper().startswith(q["answer"].upper() + "."))
+        self.assertIsNone(bank.option_index(0, "Z"))
+        self.assertEqual(bank.problems, [])
+
+
+    #Tests malformed questions are collected once when the bank is built
+    def test_bank_problems(self):
+        bank = QuestionBank([
+            {"question": "Q1", "options": ["A. 1", "B. 2"], "answer": "C"},
+            {"question": "Q2", "options": ["A. 1", "2"], "answer": "A"},
+        ])
+        self.assertEqual([qid for qid, _ in bank.problems], [0, 1])
+        self.assertEqual(bank.correct_text(0), "C (option text not found)")
+        self.assertEqual(bank.correct_text(1), "A. 1")
+
+
+    #Tests loose option lists use the cached letter map
+    def test_option_text(self):
+        self.assertEqual(option_text(["A. one", "B. two"], " b "), "B. two")
+        self.assertEqual(option_text(["A) one"], "A"), "A (option text not found)")
+        self.assertIs(letter_map(["A. one", "B. two"]), letter_map(("A. one", "B. two")))
+        self.assertEqual(letter_map([["unhashable"], "B. two"]), {"B": 1})
+
+
+    #Tests load_bank reports malformed options in its summary
+    def test_load_bank_reports_problems(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "bank.jsonl")
+            with open(path, "w", encoding="utf-8") as f:
+                f.write(json.dumps({"question": "Q", "options": ["A. 1", "B 2"], "answer": "B"}) + "\n")
+            bank, report = bank_loader.load_bank(path)
+        self.assertEqual(len(report["problems"]), 2)
+        out = io.StringIO()
+        with redirect_stdout(out):
+            bank_loader.print_report(path, report)
+        self.assertIn("malformed options", out.getvalue())
+
+
+if __name__ == "__main__":
+    unittest.main()
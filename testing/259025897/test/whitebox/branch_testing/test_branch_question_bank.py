@@ -0,0 +1,73 @@
+import unittest
+from unittest.mock import patch
+import mcq
+from question_bank import QuestionBank, get_bank, data_changed
+
+
+DATA = [
+    {"question": "Q1", "options": ("A. 1", "B. 2"), "answer": "A", "topic": "Math", "difficulty": "Easy"},
+    {"question": "Q2", "options": ("A. 1", "B. 2"), "answer": "B", "topic": "Bio", "difficulty": "Hard"},
+    {"question": "Q3", "options": ("A. 1", "B. 2"), "answer": "A", "topic": "Math", "difficulty": "Hard"},
+    {"question": "Q4", "options": ("A. 1", "B. 2"), "answer": "B", "topic": "Math", "difficulty": "Medium"},
+]
+
+
+class TestQuestionBank_Branches(unittest.TestCase):
+
+    #Tests the bank builds parallel arrays and per-topic / per-difficulty indexes
+    def test_indexes_and_counts(self):
+        bank = QuestionBank(DATA)
+        self.assertEqual(bank.questions, ["Q1", "Q2", "Q3", "Q4"])
+        self.assertEqual(bank.topics(), ["Bio", "Math"])
+        self.assertEqual(bank.count(topic="Math"), 3)
+        self.assertEqual(bank.ids(difficulty="Hard"), [1, 2])
+        self.assertEqual(bank.ids(topic="Math", difficulty="Hard"), [2])
+        self.assertEqual(bank.ids(topic="Chem"), [])
+        self.assertEqual(bank.ids_for_difficulties(["Medium", "Easy"]), [0, 3])
+
+
+    #Tests question records use slots instead of per-instance dicts
+    def test_records_have_slots(self):
+        record = QuestionBank(DATA).records[0]
+        self.assertFalse(hasattr(record, "__dict__"))
+        self.assertEqual((record.id, record.topic), (0, "Math"))
+
+
+    #Tests select returns parallel lists in the order of the ids given
+    def test_select(self):
+        qs, opts, ans = QuestionBank(DATA).select([3, 0])
+        self.assertEqual((qs, ans), (["Q4", "Q1"], ["B", "A"]))
+        self.assertEqual(len(opts), 2)
+
+
+    #Tests get_bank builds once per list and rebuilds when the list grows or is marked edited
+    def test_get_bank_cache(self):
+        data = list(DATA)
+        bank = get_bank(data)
+        self.assertIs(get_bank(data), bank)
+        self.assertIs(get_bank(bank), bank)
+        data.append(dict(DATA[0], question="Q5"))
+        self.assertEqual(len(get_bank(data)), 5)
+        bank = get_bank(data)
+        data[0] = dict(data[0], question="Edited")
+        self.assertIs(get_bank(data), bank)
+        data_changed(data)
+        self.assertEqual(get_bank(data).questions[0], "Edited")
+
+
+    #Tests the topic quiz reads counts from the index and builds the bank only once
+    @patch("mcq.take_quiz")
+    @patch("builtins.print")
+    @patch("builtins.input", return_value="2")
+    def test_quiz_by_topic_uses_bank(self, m_input, m_print, m_take):
+        data = list(DATA)
+        mcq.quiz_by_topic(data)
+        bank = get_bank(data)
+        mcq.quiz_by_topic(data)
+        self.assertIs(get_bank(data), bank)
+        m_print.assert_any_call("2. Math (3 questions)")
+        self.assertEqual(m_take.call_args.args[0], ["Q1", "Q3", "Q4"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,74 @@
+import os
+import json
+import tempfile
+import unittest
+from unittest.mock import patch
+import answer_links
+import export_answers
+from question_bank import QuestionBank, content_id, question_id
+from quiz_data import ALL_QUIZ_DATA, FILL_IN_QUIZ_DATA
+
+
+class TestQuestionIds_Branches(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.links = os.path.join(self.tmp.name, "answer_links.json")
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+
+    #Tests ids ignore case and spacing but change with the options
+    def test_content_id_normalization(self):
+        self.assertEqual(content_id("What is  H2O?", ["A. Water"]), content_id(" what is h2o? ", ["a.   water"]))
+        self.assertNotEqual(content_id("What is H2O?", ["A. Water"]), content_id("What is H2O?", ["A. Ice"]))
+        self.assertEqual(len(content_id("Q")), 16)
+
+
+    #Tests a question keeps its id when the bank is reordered
+    def test_find_survives_reordering(self):
+        uid = question_id(ALL_QUIZ_DATA[3])
+        bank = QuestionBank(list(reversed(ALL_QUIZ_DATA)))
+        self.assertEqual(bank.find(uid), len(ALL_QUIZ_DATA) - 4)
+        self.assertEqual(bank.question_id(bank.find(uid)), uid)
+        new = bank.add({"question": "New?", "options": ["A. x", "B. y"], "answer": "A"})
+        self.assertEqual(bank.find(content_id("New?", ["A. x", "B. y"])), new)
+        self.assertIsNone(bank.find("0" * 16))
+
+
+    #Tests positional link keys are moved to question ids and merged
+    def test_migrate_positional_keys(self):
+        key = answer_links._key_for_mcq(2)
+        with open(self.links, "w") as f:
+            json.dump({"MCQ-2": ["u1", "u2"], key: ["u2"], "FILL-99": ["keep"]}, f)
+        with patch("answer_links.LINKS_FILE", self.links), patch("answer_links.use_sqlite", return_value=False):
+            self.assertEqual(answer_links.migrate_link_keys(), 1)
+            self.assertEqual(answer_links._load_links(), {key: ["u2", "u1"], "FILL-99": ["keep"]})
+            self.assertEqual(answer_links.migrate_link_keys(), 0)
+        self.assertEqual(key, f"MCQ-{question_id(ALL_QUIZ_DATA[1])}")
+
+
+    #Tests reading links is a plain lookup that leaves unmigrated keys alone
+    def test_read_does_not_migrate(self):
+        with open(self.links, "w") as f:
+            json.dump({"MCQ-2": ["u1"]}, f)
+        with patch("answer_links.LINKS_FILE", self.links), patch("answer_links.use_sqlite", return_value=False), \
+             patch("answer_links._save_links") as m_save:
+            self.assertEqual(answer_links._get_user_links(answer_links._key_for_mcq(2)), [])
+            self.assertEqual(answer_links._get_user_links("MCQ-2"), ["u1"])
+        m_save.assert_not_called()
+
+
+    #Tests exported answers carry the stable id of each question
+    def test_export_includes_ids(self):
+        out = os.path.join(self.tmp.name, "answers.json")
+        export_answers.export_answers(out)
+        with open(out, encoding="utf-8") as f:
+            data = json.load(f)
+        self.assertEqual(data["mcq_answers"][0]["id"], question_id(ALL_QUIZ_DATA[0]))
+        self.assertEqual(data["fill_in_answers"][0]["id"], question_id(FILL_IN_QUIZ_DATA[0]))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,117 @@
+import json
+import asyncio
+import unittest
+from unittest.mock import patch
+import quiz_server
+from quiz_server import QuizServer
+
+
+class TestQuizServer_Branches(unittest.TestCase):
+
+    def setUp(self):
+        self.written = []
+        self.server = QuizServer(write_batch=self.written.extend)
+
+    def tearDown(self):
+        self.server.close()
+
+
+    #Tests a session runs over requests and the named score is buffered once
+    def test_session_requests(self):
+        state = {}
+        reply = self.server.handle_request(state, {"cmd": "start", "mode": "skip", "count": 2, "name": "Ana", "seed": 1})
+        self.assertEqual(reply["question"]["number"], 1)
+        reply = self.server.handle_request(state, {"cmd": "skip"})
+        self.assertEqual(reply["question"]["number"], 2)
+        answer = self.server.bank.answers[reply["question"]["id"]]
+        reply = self.server.handle_request(state, {"cmd": "answer", "guess": answer.lower()})
+        self.assertTrue(reply["correct"])
+        self.assertEqual((reply["result"]["skipped"], reply["result"]["percent"]), (1, 100))
+        self.server.scores.flush(timeout=5)
+        self.assertEqual([(r["name"], r["mode"], r["score"]) for r in self.written], [("Ana", "skip", 100)])
+
+
+    #Tests bad requests are answered with an error instead of closing
+    def test_request_errors(self):
+        state = {}
+        with self.assertRaises(ValueError):
+            self.server.handle_request(state, {"cmd": "answer", "guess": "A"})
+        with self.assertRaises(ValueError):
+            self.server.handle_request(state, {"cmd": "start", "mode": "nope"})
+        with self.assertRaises(ValueError):
+            self.server.handle_request(state, {"cmd": "start", "count": 10 ** 6})
+        self.server.handle_request(state, {"cmd": "start", "count": 1})
+        with self.assertRaises(ValueError):
+            self.server.handle_request(state, {"cmd": "lifeline"})
+        self.server.handle_request(state, {"cmd": "answer", "guess": "A"})
+        with self.assertRaises(ValueError):
+            self.server.handle_request(state, {"cmd": "answer", "guess": "A"})
+
+
+    #Tests the 50-50 mode allows a lifeline that narrows the options
+    def test_lifeline(self):
+        state = {}
+        self.server.handle_request(state, {"cmd": "start", "mode": "fifty_fifty", "count": 1})
+        reply = self.server.handle_request(state, {"cmd": "lifeline"})
+        self.assertEqual(len(reply["options"]), 2)
+
+
+    #Tests concurrent candidates over TCP and the latency report
+    def test_load_over_tcp(self):
+        async def run():
+            listener = await self.server.serve("127.0.0.1", 0)
+            port = listener.sockets[0].getsockname()[1]
+            try:
+                report = await quiz_server.run_load("127.0.0.1", port, candidates=20, count=3, seed=2)
+                reader, writer = await asyncio.open_connection("127.0.0.1", port)
+                writer.write(b"not json\n")
+                await writer.drain()
+                error = json.loads(await reader.readline())
+                writer.close()
+                return report, error
+            finally:
+                listener.close()
+                await listener.wait_closed()
+
+        report, error = asyncio.run(run())
+        self.assertEqual((report["candidates"], report["answers"]), (20, 60))
+        self.assertLessEqual(report["p50_ms"], report["p99_ms"])
+        self.assertFalse(error["ok"])
+        self.assertEqual(self.server.finished, 20)
+        self.server.scores.flush(timeout=5)
+        self.assertEqual(len(self.written), 20)
+
+
+    #Tests an over-long request gets a JSON error and the connection keeps working
+    def test_line_too_long(self):
+        async def run():
+            listener = await self.server.serve("127.0.0.1", 0)
+            port = listener.sockets[0].getsockname()[1]
+            try:
+                reader, writer = await asyncio.open_connection("127.0.0.1", port)
+                replies = []
+                for request in (b"x" * (quiz_server.MAX_LINE * 3) + b"\n", b'{"cmd": "quit"}\n'):
+                    writer.write(request)
+                    await writer.drain()
+                    replies.append(json.loads(await reader.readline()))
+                writer.close()
+                return replies
+            finally:
+                listener.close()
+                await listener.wait_closed()
+
+        too_long, bye = asyncio.run(run())
+        self.assertFalse(too_long["ok"])
+        self.assertIn("longer than", too_long["error"])
+        self.assertTrue(bye["bye"])
+
+
+    #Tests nearest-rank percentiles
+    def test_percentile(self):
+        self.assertEqual(quiz_server.percentile([5, 1, 4, 2, 3], 50), 3)
+        self.assertEqual(quiz_server.percentile(list(range(1, 101)), 99), 99)
+        self.assertIsNone(quiz_server.percentile([], 50))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,82 @@
+import os
+import unittest
+from unittest.mock import patch
+import utils
+import render
+from render import Screen, Renderer, render_benchmark
+
+
+class TestRender_Branches(unittest.TestCase):
+
+    #Tests a screen builds the same text the print loops used to
+    def test_screen_text(self):
+        screen = Screen("--", "Q?").add("A. a").row("Answers: ", ["A", "B"]).row("Yours: ", ["x"], sep=" | ")
+        self.assertEqual(screen.text(), "--\nQ?\nA. a\nAnswers: A B \nYours: x | \n")
+
+
+    #Tests the results table is written with a single print call
+    def test_print_results_one_call(self):
+        with patch("builtins.print") as mock_print:
+            utils.print_results(["A", "C"], 1, ["A", "B"])
+        mock_print.assert_called_once_with(
+            "----------------------\n       RESULTS        \n----------------------\n"
+            "Answers: A B \nGuesses: A C \n\nYour score is: 50%\n",
+            end="",
+        )
+
+
+    #Tests plain mode writes every screen in full
+    def test_paint_plain(self):
+        renderer = Renderer()
+        with patch("builtins.print") as mock_print:
+            renderer.paint(Screen("a", "b"))
+            renderer.paint(Screen("a", "b"))
+        self.assertEqual([c.args[0] for c in mock_print.call_args_list], ["a\nb\n", "a\nb\n"])
+
+
+    #Tests diff mode clears once, then rewrites only the changed columns and rows
+    def test_paint_diff(self):
+        renderer = Renderer(diff=True)
+        with patch("builtins.print") as mock_print:
+            renderer.paint(Screen("--", "Time: 60", "Q?"))
+            renderer.paint(Screen("--", "Time: 59", "Q?", "new"))
+            renderer.paint(Screen("--", "✓"))
+        first, second, third = [c.args[0] for c in mock_print.call_args_list]
+        self.assertEqual(first, "\x1b[H\x1b[2J--\nTime: 60\nQ?\n")
+        self.assertEqual(second, "\x1b[2;7H59\x1b[K\x1b[4;1Hnew\x1b[K\x1b[5;1H\x1b[J")
+        self.assertEqual(third, "\x1b[2;1H✓\x1b[K\x1b[3;1H\x1b[J")
+
+
+    #Tests show() writes plainly and makes the next paint start over
+    def test_show_resets_frame(self):
+        renderer = Renderer(diff=True)
+        with patch("builtins.print") as mock_print:
+            renderer.paint(Screen("a"))
+            renderer.show(Screen("done"))
+            renderer.paint(Screen("a"))
+        self.assertEqual(mock_print.call_args_list[1].args[0], "done\n")
+        self.assertTrue(mock_print.call_args_list[2].args[0].startswith("\x1b[H\x1b[2J"))
+
+
+    #Tests the render mode is read from the environment or storage_config.json on each paint
+    def test_render_setting(self):
+        with patch("render._renderer", Renderer()), patch("builtins.print") as mock_print:
+            with patch.dict(os.environ, {"MCQ_RENDER": ""}), \
+                    patch("storage_backend._load_config", return_value={"render": "diff"}):
+                render.paint(Screen("a"))
+            with patch.dict(os.environ, {"MCQ_RENDER": "plain"}):
+                render.paint(Screen("a"))
+        self.assertEqual([c.args[0] for c in mock_print.call_args_list], ["\x1b[H\x1b[2Ja\n", "a\n"])
+
+
+    #Tests the benchmark matches the old output with fewer writes
+    def test_benchmark(self):
+        report = render_benchmark(rounds=1)
+        self.assertTrue(report["same_output"])
+        self.assertLess(report["tty"]["screen"]["writes"], report["tty"]["print"]["writes"])
+        self.assertLessEqual(report["pipe"]["screen"]["writes"], report["pipe"]["print"]["writes"])
+        self.assertLess(report["diff_bytes"]["countdown"]["diff"], report["diff_bytes"]["countdown"]["plain"])
+
+
+if __name__ == "__main__":
+    unittest.main()
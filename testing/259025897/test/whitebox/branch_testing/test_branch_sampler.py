@@ -0,0 +1,82 @@
+import os
+import unittest
+from unittest.mock import patch
+import sampler
+from question_bank import QuestionBank
+from quiz_data import ALL_QUIZ_DATA
+
+
+class TestSampler_Branches(unittest.TestCase):
+
+    def setUp(self):
+        self.bank = QuestionBank(ALL_QUIZ_DATA)
+
+
+    #Tests proportional allocation adds up to k and never exceeds a stratum
+    def test_allocate(self):
+        self.assertEqual(sampler.allocate({"a": 6, "b": 3, "c": 1}, 5), {"a": 3, "b": 2, "c": 0})
+        self.assertEqual(sampler.allocate({"a": 1, "b": 1}, 9), {"a": 1, "b": 1})
+        self.assertEqual(sampler.allocate({"a": 2}, 0), {"a": 0})
+        self.assertEqual(sampler.allocate({}, 3), {})
+
+
+    #Tests quotas draw the requested count from each stratum
+    def test_sample_quota(self):
+        ids = sampler.sample_quota(self.bank, {("Biology", "Easy"): 2, (None, "Hard"): 3}, seed=1)
+        self.assertEqual(len(set(ids)), 5)
+        records = [self.bank.records[i] for i in ids]
+        self.assertEqual(sum(r.topic == "Biology" and r.difficulty == "Easy" for r in records), 2)
+        self.assertEqual(sum(r.difficulty == "Hard" for r in records), 3)
+        with self.assertRaises(ValueError):
+            sampler.sample_quota(self.bank, {("Biology", "Easy"): 99})
+
+
+    #Tests proportional draws respect the difficulty filter and the seed
+    def test_sample_proportional_seeded(self):
+        first = sampler.sample_proportional(self.bank, 6, difficulties=["Easy"], seed=7)
+        self.assertEqual(first, sampler.sample_proportional(self.bank, 6, difficulties=["Easy"], seed=7))
+        self.assertEqual(len(set(first)), 6)
+        self.assertTrue(all(self.bank.records[i].difficulty == "Easy" for i in first))
+        everything = sampler.sample_proportional(self.bank, len(self.bank), seed=3)
+        self.assertEqual(sorted(everything), list(range(len(self.bank))))
+
+
+    #Tests the seed can come from the environment
+    def test_seed_setting(self):
+        with patch.dict(os.environ, {"MCQ_SEED": "42"}):
+            a = sampler.sample_proportional(self.bank, 4)
+            b = sampler.sample_proportional(self.bank, 4)
+        self.assertEqual(a, b)
+        with patch.dict(os.environ, {"MCQ_SEED": ""}), patch("storage_backend._load_config", return_value={}):
+            self.assertIs(sampler.get_rng(), sampler.random)
+
+
+    #Tests overlapping quotas never pick the same question twice
+    def test_sample_quota_overlap(self):
+        easy = len(self.bank.ids(difficulty="Easy"))
+        biology = len(self.bank.ids(topic="Biology", difficulty="Easy"))
+        for seed in range(20):
+            ids = sampler.sample_quota(self.bank, {("Biology", "Easy"): biology, (None, "Easy"): easy - biology}, seed=seed)
+            self.assertEqual(sorted(ids), self.bank.ids(difficulty="Easy"))
+        with self.assertRaises(ValueError):
+            sampler.sample_quota(self.bank, {("Biology", "Easy"): biology, (None, "Easy"): easy - biology + 1}, seed=1)
+
+
+    #Tests quizzes draw uniformly unless stratified sampling is switched on
+    def test_sample_questions_modes(self):
+        with patch.dict(os.environ, {"MCQ_SAMPLING": ""}), patch("storage_backend._load_config", return_value={}), \
+                patch("sampler.random.sample", side_effect=lambda data, n: list(data)[:n]) as uniform:
+            self.assertEqual(sampler.sample_questions(self.bank, 3), [0, 1, 2])
+            easy = sampler.sample_questions(self.bank, 2, difficulties=["Easy"])
+        self.assertEqual(uniform.call_count, 2)
+        self.assertEqual(easy, self.bank.ids_for_difficulties(["Easy"])[:2])
+        with patch.dict(os.environ, {"MCQ_SAMPLING": "stratified"}), \
+                patch("sampler.sample_proportional", return_value=[5]) as stratified:
+            self.assertEqual(sampler.sample_questions(self.bank, 1, seed=4), [5])
+        stratified.assert_called_once_with(self.bank, 1, difficulties=None, seed=4, rng=None)
+        with patch.dict(os.environ, {"MCQ_SAMPLING": "clustered"}), self.assertRaises(ValueError):
+            sampler.sample_questions(self.bank, 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
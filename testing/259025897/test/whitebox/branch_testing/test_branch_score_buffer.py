@@ -0,0 +1,146 @@
+import os
+import threading
+import unittest
+from unittest.mock import patch
+import utils
+import leaderboard
+import attempt_comparison
+import score_buffer
+
+
+class _Recorder:
+
+    def __init__(self, fail_times=0):
+        self.batches = []
+        self.fail_times = fail_times
+        self.written = threading.Event()
+
+    def __call__(self, batch):
+        if self.fail_times:
+            self.fail_times -= 1
+            raise OSError("disk full")
+        self.batches.append(list(batch))
+        self.written.set()
+
+
+class TestScoreBuffer_Branches(unittest.TestCase):
+
+    def setUp(self):
+        self.buffers = []
+
+    def tearDown(self):
+        for b in self.buffers:
+            b.close()
+
+    def _buffer(self, writer, **kwargs):
+        b = score_buffer.ScoreBuffer(writer, **kwargs)
+        self.buffers.append(b)
+        return b
+
+
+    #Tests batch durability holds records until flush() and writes them as one batch
+    def test_batch_mode_waits_for_flush(self):
+        rec = _Recorder()
+        b = self._buffer(rec, durability="batch", batch_size=10, flush_interval=60)
+        for i in range(3):
+            b.add({"score": i})
+        self.assertEqual(rec.batches, [])
+        self.assertEqual(b.pending(), 3)
+        self.assertTrue(b.flush(timeout=5))
+        self.assertEqual(rec.batches, [[{"score": 0}, {"score": 1}, {"score": 2}]])
+        self.assertEqual(b.pending(), 0)
+
+
+    #Tests reaching the batch size triggers a write without flush()
+    def test_batch_mode_size_threshold(self):
+        rec = _Recorder()
+        b = self._buffer(rec, durability="batch", batch_size=2, flush_interval=60)
+        b.add({"score": 1})
+        b.add({"score": 2})
+        self.assertTrue(rec.written.wait(5))
+        self.assertEqual(rec.batches[0], [{"score": 1}, {"score": 2}])
+
+
+    #Tests the time threshold writes a partial batch
+    def test_batch_mode_time_threshold(self):
+        rec = _Recorder()
+        b = self._buffer(rec, durability="batch", batch_size=100, flush_interval=0.05)
+        b.add({"score": 1})
+        self.assertTrue(rec.written.wait(5))
+
+
+    #Tests record durability writes each record without waiting for a batch
+    def test_record_mode_writes_immediately(self):
+        rec = _Recorder()
+        b = self._buffer(rec, durability="record", batch_size=100, flush_interval=60)
+        b.add({"score": 1})
+        self.assertTrue(rec.written.wait(5))
+
+
+    #Tests a failed write is retried and the records are not lost
+    @patch("builtins.print")
+    def test_failed_write_is_retried(self, m_print):
+        rec = _Recorder(fail_times=1)
+        b = self._buffer(rec, durability="record", flush_interval=0.01)
+        b.add({"score": 1})
+        self.assertTrue(b.flush(timeout=5))
+        self.assertEqual(rec.batches, [[{"score": 1}]])
+
+
+    #Tests close() drains the queue and rejects later records
+    def test_close_drains_queue(self):
+        rec = _Recorder()
+        b = self._buffer(rec, durability="batch", batch_size=100, flush_interval=60)
+        b.add({"score": 1})
+        b.close()
+        self.assertEqual(rec.batches, [[{"score": 1}]])
+        with self.assertRaises(RuntimeError):
+            b.add({"score": 2})
+
+
+    #Tests an unknown durability or buffer mode is rejected
+    def test_unknown_modes_rejected(self):
+        with self.assertRaises(ValueError):
+            score_buffer.ScoreBuffer(_Recorder(), durability="sometimes")
+        with patch.dict(os.environ, {"MCQ_SCORE_BUFFER": "maybe"}):
+            with self.assertRaises(ValueError):
+                score_buffer.get_buffer_mode()
+
+
+class TestBufferedRecordScore_Branches(unittest.TestCase):
+
+    def setUp(self):
+        for patcher in (
+            patch.dict(os.environ, {"MCQ_STORAGE_BACKEND": "json", "MCQ_SCORE_BUFFER": "batch"}),
+            patch("score_buffer._buffer", None),
+            patch("score_buffer.FLUSH_INTERVAL", 60),
+        ):
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def tearDown(self):
+        if score_buffer._buffer is not None:
+            score_buffer._buffer.close()
+
+
+    #Tests record_score returns before the journal is written and readers see the record
+    def test_record_score_is_write_behind(self):
+        with patch("score_buffer.ScoreBuffer", wraps=score_buffer.ScoreBuffer) as m_cls:
+            utils.record_score("mru", 80, mode="standard")
+        self.assertEqual(m_cls.call_args.kwargs["durability"], "batch")
+        self.assertFalse(os.path.exists(utils.SCORE_JOURNAL_FILE))
+        self.assertEqual(leaderboard.get_top_scores(1)[0]["name"], "mru")
+        self.assertEqual(attempt_comparison.get_all_users(), ["mru"])
+        self.assertTrue(os.path.exists(utils.SCORE_JOURNAL_FILE))
+
+
+    #Tests record_score writes synchronously when buffering is off
+    def test_record_score_unbuffered(self):
+        with patch.dict(os.environ, {"MCQ_SCORE_BUFFER": "off"}):
+            utils.record_score("mru", 80)
+        self.assertIsNone(score_buffer._buffer)
+        self.assertEqual([r["name"] for r in utils.load_scores()], ["mru"])
+
+
+if __name__ == "__main__":
+    unittest.main()
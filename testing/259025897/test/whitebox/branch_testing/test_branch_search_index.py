@@ -0,0 +1,98 @@
+import io
+import unittest
+from contextlib import redirect_stdout
+from unittest.mock import patch
+import search_index
+import assessment_storage
+import manage_assessment
+from question_bank import data_changed
+from quiz_data import ALL_QUIZ_DATA, FILL_IN_QUIZ_DATA
+
+
+class TestSearchIndex_Branches(unittest.TestCase):
+
+    def setUp(self):
+        self.index = search_index.build_index(ALL_QUIZ_DATA, FILL_IN_QUIZ_DATA)
+
+
+    #Tests a match in the question text ranks above one in an option
+    def test_ranking_by_field(self):
+        results = self.index.search("heart")
+        self.assertEqual([(r[1], r[2]) for r in results], [("MCQ", 19), ("MCQ", 7)])
+        self.assertGreater(results[0][0], results[1][0])
+
+
+    #Tests prefixes, multi-word AND queries and the kind filter
+    def test_prefix_and_kind(self):
+        self.assertEqual([r[2] for r in self.index.search("photo")], [12])
+        self.assertEqual([r[2] for r in self.index.search("chemical gold", kind="FILL")], [1])
+        self.assertEqual(self.index.search("gold photosynthesis"), [])
+        self.assertEqual(self.index.search("   "), [])
+        self.assertEqual(search_index.SearchIndex().search("gold"), [])
+
+
+    #Tests accepted fill-in answers are searchable
+    def test_fill_answers_indexed(self):
+        results = self.index.search("o2")
+        self.assertEqual([(r[1], r[2]) for r in results], [("FILL", 4)])
+
+
+    #Tests typing a number selects directly and words search first
+    def test_search_then_select(self):
+        with patch("builtins.input", side_effect=["7"]):
+            self.assertEqual(search_index.search_then_select("Enter MCQ number", "MCQ", self.index), 7)
+        out = io.StringIO()
+        with patch("builtins.input", side_effect=["symbol gold", "6"]), redirect_stdout(out):
+            self.assertEqual(search_index.search_then_select("Enter MCQ number", "MCQ", self.index), 6)
+        self.assertIn("Q6. What is the chemical symbol for gold?", out.getvalue())
+        with patch("builtins.input", side_effect=["zzzz"]), redirect_stdout(io.StringIO()):
+            self.assertIsNone(search_index.search_then_select("Enter MCQ number", "MCQ", self.index))
+
+
+    #Tests a long assessment is searched instead of printed in full
+    def test_long_assessment_uses_search(self):
+        n = manage_assessment.LIST_LIMIT + 5
+        assessment = {"name": "Big", "questions": [f"Question {i} about item{i}" for i in range(1, n + 1)]}
+        out = io.StringIO()
+        with patch("builtins.input", side_effect=["item7", "7"]), redirect_stdout(out):
+            self.assertEqual(manage_assessment._select_question(assessment, "Select a question number to edit"), 6)
+        self.assertNotIn("Question 8 about", out.getvalue())
+
+
+    #Tests the cached index is rebuilt when the question list grows or is marked edited
+    def test_get_index_cache(self):
+        data, fill = [dict(ALL_QUIZ_DATA[0])], []
+        first = search_index.get_index(data, fill)
+        self.assertIs(search_index.get_index(data, fill), first)
+        data.append(dict(ALL_QUIZ_DATA[1]))
+        self.assertEqual(len(search_index.get_index(data, fill)), 2)
+        data[1]["question"] = "Which zebra?"
+        data_changed(data)
+        self.assertEqual(search_index.get_index(data, fill).search("zebra")[0][2], 2)
+
+
+    #Tests words found in most questions add to the score without filtering
+    def test_common_words_only_add(self):
+        index = search_index.SearchIndex()
+        for i, text in enumerate(["which gold", "which silver", "which iron", "lead", "tin"], start=1):
+            index.add("MCQ", i, text, [("question", text)])
+        self.assertEqual([r[2] for r in index.search("lead which")], [4])
+        self.assertGreater(index.search("gold which")[0][0], index.search("gold")[0][0])
+
+
+    #Tests the assessment index is only rebuilt when the catalog changes
+    def test_assessment_index_cache(self):
+        assessment_storage.save_custom_assessments([{"name": "Metals", "questions": ["Which metal rusts?"]}])
+        with patch("assessment_storage.load_assessment", wraps=assessment_storage.load_assessment) as load:
+            self.assertEqual([r[1] for r in search_index.search_all("rusts")], ["Metals"])
+            self.assertEqual([r[1] for r in search_index.search_all("metal rusts")], ["Metals"])
+            self.assertEqual(load.call_count, 1)
+            assessments = assessment_storage.load_custom_assessments()
+            assessments.append({"name": "Gases", "questions": ["Which gas rusts iron?"]})
+            assessment_storage.save_custom_assessments(assessments)
+            self.assertEqual(sorted(r[1] for r in search_index.search_all("rusts")), ["Gases", "Metals"])
+            self.assertEqual(load.call_count, 3)
+
+
+if __name__ == "__main__":
+    unittest.main()
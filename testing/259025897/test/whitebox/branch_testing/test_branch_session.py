@@ -0,0 +1,99 @@
+import unittest
+from unittest.mock import patch
+import session
+from session import QuizSession, NegativeMarking, SkipAware, Streak, WrongAnswer, SKIP
+
+QUESTIONS = ["Q1", "Q2", "Q3"]
+OPTIONS = [["A. a", "B. b", "C. c", "D. d"]] * 3
+ANSWERS = ["A", "B", "C"]
+
+
+class TestQuizSession_Branches(unittest.TestCase):
+
+    #Tests a plain session walks the questions and grades each answer
+    def test_plain_flow(self):
+        s = QuizSession(QUESTIONS, OPTIONS, ANSWERS)
+        self.assertEqual(s.next_question(), (0, "Q1", OPTIONS[0]))
+        self.assertTrue(s.submit("A")["correct"])
+        outcome = s.submit("C")
+        self.assertEqual((outcome["correct"], outcome["answer"]), (False, "B"))
+        self.assertTrue(s.submit("C")["finished"])
+        self.assertIsNone(s.next_question())
+        result = s.result()
+        self.assertEqual((result["score"], result["correct"], result["wrong"], result["percent"]), (2, 2, 1, 66))
+        with self.assertRaises(RuntimeError):
+            s.submit("A")
+
+
+    #Tests negative marking leaves blank answers unpenalised
+    def test_negative_marking(self):
+        s = QuizSession(QUESTIONS, OPTIONS, ANSWERS, NegativeMarking(0.5))
+        for guess in ("A", "", "D"):
+            s.submit(guess)
+        result = s.result()
+        self.assertEqual((result["score"], result["wrong"], result["percent"]), (0.5, 1, 16))
+
+
+    #Tests skipped questions are left out of the skip-aware percentage
+    def test_skip_aware(self):
+        s = QuizSession(QUESTIONS, OPTIONS, ANSWERS, SkipAware())
+        self.assertEqual(s.skip()["guess"], SKIP)
+        s.submit("B")
+        s.skip()
+        result = s.result()
+        self.assertEqual((result["skipped"], result["score"], result["percent"]), (2, 1, 100))
+
+
+    #Tests a streak session ends at the first wrong answer, in the given order
+    def test_streak(self):
+        s = QuizSession(QUESTIONS, OPTIONS, ANSWERS, Streak(), order=[2, 0, 1])
+        self.assertEqual(s.next_question()[0], 2)
+        s.submit("C")
+        self.assertTrue(s.submit("D")["finished"])
+        result = s.result()
+        self.assertEqual((result["asked"], result["answers"], result["percent"]), (2, ["C", "A"], 50))
+
+
+    #Tests typing "S" is an ordinary wrong answer unless skip() was called
+    def test_typed_s_is_not_a_skip(self):
+        streak = QuizSession(QUESTIONS, OPTIONS, ANSWERS, Streak())
+        outcome = streak.submit("S")
+        self.assertEqual((outcome["skipped"], outcome["finished"]), (False, True))
+        negative = QuizSession(QUESTIONS, OPTIONS, ANSWERS, NegativeMarking(0.25))
+        for guess in ("S", "B", "C"):
+            negative.submit(guess)
+        result = negative.result()
+        self.assertEqual((result["score"], result["wrong"], result["skipped"]), (1.75, 1, 0))
+
+
+    #Tests the wrong-answer policy rewards avoiding the real answer
+    def test_wrong_answer(self):
+        s = QuizSession(QUESTIONS, OPTIONS, ANSWERS, WrongAnswer())
+        for guess in ("B", "B", "A"):
+            s.submit(guess)
+        self.assertEqual(s.result()["score"], 2)
+
+
+    #Tests the 50-50 lifeline narrows the current options and can be limited
+    def test_lifeline(self):
+        s = QuizSession(QUESTIONS, OPTIONS, ANSWERS, lifelines=1)
+        with patch("mcq.random.choice", return_value=3):
+            self.assertEqual(s.use_lifeline(), ("A. a", "D. d"))
+        self.assertEqual(s.next_question()[2], ("A. a", "D. d"))
+        s.submit("A")
+        self.assertEqual(s.next_question()[2], OPTIONS[1])
+        with self.assertRaises(ValueError):
+            s.use_lifeline()
+
+
+    #Tests sessions can be played in bulk without any console I/O
+    def test_run_sessions(self):
+        with patch("builtins.input", side_effect=AssertionError), patch("builtins.print", side_effect=AssertionError):
+            results = session.run_sessions(QUESTIONS, OPTIONS, ANSWERS, [["A", "B", "C"], [SKIP, "B"]])
+        self.assertEqual([r["score"] for r in results], [3, 1])
+        self.assertFalse(results[1]["finished"])
+        self.assertEqual(QuizSession([], [], []).next_question(), None)
+
+
+if __name__ == "__main__":
+    unittest.main()
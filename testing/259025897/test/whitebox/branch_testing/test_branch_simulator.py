@@ -0,0 +1,90 @@
+import os
+import unittest
+import simulator
+from simulator import Learner, make_learner, question_index, simulate, _Console
+from quiz_data import ALL_QUIZ_DATA
+
+
+class TestSimulator_Branches(unittest.TestCase):
+
+    #Tests the same learner number gets the same abilities every time
+    def test_make_learner_deterministic(self):
+        a = make_learner(7, ["Biology", "Physics"], seed=3)
+        b = make_learner(7, ["Biology", "Physics"], seed=3)
+        self.assertEqual(a.name, "sim-3-7")
+        self.assertEqual(a.ability, b.ability)
+        self.assertNotEqual(a.ability, make_learner(8, ["Biology", "Physics"], seed=3).ability)
+
+
+    #Tests the console finds the question on screen and answers like the learner
+    def test_console_answers(self):
+        index = question_index(ALL_QUIZ_DATA)
+        question = ALL_QUIZ_DATA[0]
+        sure = _Console(Learner("x", {}, default=1.0), index, 100)
+        sure.write("----------------------\n" + question["question"] + "\n" + "\n".join(question["options"]) + "\n")
+        self.assertEqual(sure.input("Enter (A, B, C, D): "), question["answer"])
+        self.assertEqual(sure.input("Press 'F' to use 50-50 or press Enter to continue: "), "")
+        self.assertNotEqual(sure.input("Pick a WRONG option (A/B/C/D): "), question["answer"])
+        self.assertEqual(sure.asked, [0, 0])
+
+        unsure = _Console(Learner("y", {}, default=0.0), index, 100)
+        unsure.write("----------------------\nQ1. " + question["question"] + "\n")
+        self.assertEqual(unsure.input("Press 'F' to use 50-50 or press Enter to continue: "), "F")
+        unsure.write("\n50-50 Applied! Remaining options:\nA. x\nC. y\n")
+        self.assertIn(unsure.input("Enter (A, B, C, D): "), ("A", "C"))
+
+
+    #Tests a console that keeps being prompted stops the session
+    def test_console_prompt_limit(self):
+        console = _Console(Learner("x", {}), {}, 2)
+        console.input("Press Enter to begin...")
+        console.input("Press Enter to begin...")
+        with self.assertRaises(RuntimeError):
+            console.input("Press Enter to begin...")
+
+
+    #Tests every mode runs to the end and leaves no files behind
+    def test_simulate_all_modes(self):
+        before = set(os.listdir("."))
+        for mode in simulator.MODES:
+            report = simulate(mode, 2, seed=1)
+            self.assertEqual(report["sessions"], 2, mode)
+            self.assertGreater(report["answers"], 0, mode)
+            self.assertGreater(report["writes_per_session"], 0, mode)
+        self.assertEqual(set(os.listdir(".")), before)
+
+
+    #Tests a run leaves the shared random state, working directory and paths alone
+    def test_simulate_leaves_process_state(self):
+        import random
+        import sys
+        import utils
+        state, cwd, path, score_file = random.getstate(), os.getcwd(), list(sys.path), utils.SCORE_FILE
+        first = simulate("skip", 2, seed=4)
+        self.assertEqual((random.getstate(), os.getcwd(), sys.path, utils.SCORE_FILE), (state, cwd, path, score_file))
+        self.assertEqual(simulate("skip", 2, seed=4)["answers"], first["answers"])
+        self.assertFalse(os.path.exists(score_file))
+
+
+    #Tests a standard run answers every question and saves every score
+    def test_simulate_standard_counts(self):
+        report = simulate("standard", 3, seed=2)
+        self.assertEqual(report["answers"], 3 * len(ALL_QUIZ_DATA))
+        self.assertEqual(report["storage_calls"], 3)
+        self.assertGreater(report["grading_us"], 0)
+
+
+    #Tests a process pool runs the same sessions as one process
+    def test_simulate_workers(self):
+        self.assertEqual(simulate("negative", 4, workers=2, seed=5)["answers"],
+                         simulate("negative", 4, seed=5)["answers"])
+
+
+    #Tests an unknown mode is rejected
+    def test_simulate_unknown_mode(self):
+        with self.assertRaises(ValueError):
+            simulate("challenge", 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
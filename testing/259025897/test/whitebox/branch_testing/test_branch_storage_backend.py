@@ -0,0 +1,155 @@
+import os
+import json
+import unittest
+from unittest.mock import patch
+import storage_backend
+import utils
+import attempts
+import leaderboard
+import attempt_comparison
+import answer_links
+import certification_quiz
+import assessment_storage
+
+
+class TestStorageBackend_Branches(unittest.TestCase):
+
+    def setUp(self):
+        self.db = storage_backend.DEFAULT_SQLITE_PATH
+        patcher = patch.dict(os.environ, {"MCQ_STORAGE_BACKEND": "sqlite"})
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def tearDown(self):
+        store = storage_backend._stores.pop(self.db, None)
+        if store is not None:
+            store.close()
+
+
+    #Tests the backend defaults to json and rejects unknown names
+    def test_backend_selection(self):
+        with patch.dict(os.environ, {"MCQ_STORAGE_BACKEND": ""}):
+            self.assertEqual(storage_backend.get_backend_name(), "json")
+        with patch.dict(os.environ, {"MCQ_STORAGE_BACKEND": "mongo"}):
+            with self.assertRaises(ValueError):
+                storage_backend.get_backend_name()
+        self.assertTrue(storage_backend.use_sqlite())
+
+
+    #Tests the config file selects the backend when no env var is set
+    def test_backend_from_config_file(self):
+        with open(storage_backend.STORAGE_CONFIG_FILE, "w") as f:
+            json.dump({"backend": "sqlite"}, f)
+        with patch.dict(os.environ, {"MCQ_STORAGE_BACKEND": ""}):
+            self.assertEqual(storage_backend.get_backend_name(), "sqlite")
+
+
+    #Tests the config file is parsed once and read again only after it changes
+    def test_config_file_cached_until_changed(self):
+        with open(storage_backend.STORAGE_CONFIG_FILE, "w") as f:
+            json.dump({"backend": "sqlite"}, f)
+        with patch.dict(os.environ, {"MCQ_STORAGE_BACKEND": ""}), \
+                patch("storage_backend.json.load", wraps=json.load) as m_load:
+            self.assertTrue(storage_backend.use_sqlite())
+            self.assertTrue(storage_backend.use_sqlite())
+            self.assertEqual(m_load.call_count, 1)
+            with open(storage_backend.STORAGE_CONFIG_FILE, "w") as f:
+                json.dump({"backend": "json"}, f)
+            os.utime(storage_backend.STORAGE_CONFIG_FILE, ns=(0, 0))
+            self.assertFalse(storage_backend.use_sqlite())
+            self.assertEqual(m_load.call_count, 2)
+
+
+    #Tests scores recorded on sqlite feed the leaderboard and user comparison queries
+    def test_sqlite_scores_and_queries(self):
+        utils.record_score("Mru", 40, mode="standard")
+        utils.record_score("ty", 90, mode="timed")
+        utils.record_score("mru ", 70, mode="standard")
+        self.assertFalse(os.path.exists(utils.SCORE_JOURNAL_FILE))
+        self.assertEqual([r["score"] for r in utils.load_scores()], [40, 90, 70])
+        self.assertEqual([e["score"] for e in leaderboard.get_top_scores(2)], [90, 70])
+        self.assertEqual([e["name"] for e in leaderboard.get_top_scores(5, mode="standard")], ["mru ", "Mru"])
+        first, latest = attempt_comparison.get_first_and_latest_attempt("MRU")
+        self.assertEqual((first["score"], latest["score"]), (40, 70))
+        self.assertIsNone(attempt_comparison.get_first_and_latest_attempt("nobody"))
+        self.assertEqual(attempt_comparison.get_all_users(), ["Mru", "ty"])
+
+
+    #Tests the leaderboard check compares the top-N queries on sqlite, not a sidecar
+    @patch("leaderboard.LEADERBOARD_SIZE", 2)
+    def test_sqlite_check_leaderboard(self):
+        for name, score, mode in [("a", 40, "timed"), ("b", 90, "standard"), ("c", 90, "timed"), ("d", 10, "timed")]:
+            utils.record_score(name, score, mode=mode)
+        self.assertEqual(leaderboard.check_leaderboard(), [])
+        self.assertFalse(os.path.exists(leaderboard.LEADERBOARD_FILE))
+        with patch.object(storage_backend.SqliteStore, "top_scores", return_value=[]):
+            self.assertTrue(leaderboard.check_leaderboard())
+
+
+    #Tests threads opening the same database at once share one store
+    def test_sqlite_store_shared_across_threads(self):
+        import time
+        from concurrent.futures import ThreadPoolExecutor
+        real_init = storage_backend.SqliteStore.__init__
+
+        def slow_init(store, path):
+            time.sleep(0.01)
+            real_init(store, path)
+
+        with patch.object(storage_backend.SqliteStore, "__init__", slow_init), patch("storage_backend._stores", {}):
+            with ThreadPoolExecutor(8) as pool:
+                stores = list(pool.map(lambda _: storage_backend.get_sqlite_store(self.db), range(8)))
+            self.assertEqual(len({id(store) for store in stores}), 1)
+            stores[0].close()
+
+
+    #Tests daily attempt counters increment in place on sqlite
+    def test_sqlite_attempt_counters(self):
+        attempts.record_quiz_attempt("mru")
+        attempts.record_quiz_attempt("mru")
+        self.assertEqual(attempts.get_attempts_left("mru", max_attempts=3), 1)
+        certification_quiz.record_cert_attempt("mru")
+        self.assertEqual(certification_quiz.can_attempt_cert_quiz("mru"), (False, 0))
+
+
+    #Tests answer links are stored per key and removed when emptied
+    def test_sqlite_answer_links(self):
+        answer_links.add_link_for_mcq(1, "https://example.com/a")
+        answer_links.add_link_for_mcq(1, "https://example.com/a")
+        self.assertEqual(answer_links._get_user_links(answer_links._key_for_mcq(1)), ["https://example.com/a"])
+        ok, _ = answer_links.delete_link_for_mcq(1, 1)
+        self.assertTrue(ok)
+        self.assertEqual(storage_backend.get_sqlite_store().get_doc(answer_links.LINKS_COLLECTION, answer_links._key_for_mcq(1)), None)
+
+
+    #Tests migrating json state into sqlite and back preserves every collection
+    def test_migrate_round_trip(self):
+        with patch.dict(os.environ, {"MCQ_STORAGE_BACKEND": "json"}):
+            utils.record_score("mru", 50, mode="standard")
+            attempts.record_quiz_attempt("mru")
+            certification_quiz._add_cert_result({"name": "mru", "score": 80, "passed": True})
+            assessment_storage.save_custom_assessments([{"title": "A", "questions": []}])
+            answer_links.add_link_for_fill(2, "note")
+        counts = storage_backend.migrate_storage("json", "sqlite")
+        self.assertEqual(counts["scores"], 1)
+        self.assertEqual(counts["links"], 1)
+        self.assertEqual(attempts.get_attempts_left("mru", max_attempts=3), 2)
+        self.assertEqual(assessment_storage.load_custom_assessments(), [{"title": "A", "questions": []}])
+        self.assertEqual([r["score"] for r in certification_quiz._iter_cert_results("MRU")], [80])
+
+        os.remove(utils.SCORE_JOURNAL_FILE)
+        os.remove(answer_links.LINKS_FILE)
+        storage_backend.migrate_storage("sqlite", "json")
+        with patch.dict(os.environ, {"MCQ_STORAGE_BACKEND": "json"}):
+            self.assertEqual([r["name"] for r in utils.load_scores()], ["mru"])
+            self.assertEqual(answer_links.get_links_for_fill(2)[-1], "note")
+
+
+    #Tests migrate_storage refuses a same-backend migration
+    def test_migrate_rejects_same_backend(self):
+        with self.assertRaises(ValueError):
+            storage_backend.migrate_storage("json", "json")
+
+
+if __name__ == "__main__":
+    unittest.main()
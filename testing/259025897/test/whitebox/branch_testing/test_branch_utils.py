@@ -0,0 +1,58 @@
+import json
+import unittest
+import utils
+import leaderboard
+import attempt_comparison
+
+
+class TestScoreJournal_Branches(unittest.TestCase):
+
+    def setUp(self):
+        self.legacy = utils.SCORE_FILE
+        self.journal = utils.SCORE_JOURNAL_FILE
+
+
+    #Tests migrate_scores imports every record of the legacy JSON array exactly once
+    def test_migrate_scores_imports_legacy_array_once(self):
+        with open(self.legacy, "w") as f:
+            json.dump([{"name": "a", "score": 10}, {"name": "b", "score": 20}], f)
+        self.assertEqual(utils.migrate_scores(), 2)
+        self.assertEqual(utils.migrate_scores(), 0)
+        self.assertEqual(utils.load_scores(), [{"name": "a", "score": 10}, {"name": "b", "score": 20}])
+
+
+    #Tests migrate_scores creates an empty journal when there is no legacy file
+    def test_migrate_scores_without_legacy_file(self):
+        self.assertEqual(utils.migrate_scores(), 0)
+        self.assertEqual(utils.load_scores(), [])
+
+
+    #Tests record_score appends one line per result without rewriting earlier lines
+    def test_record_score_appends_line(self):
+        utils.record_score("mru", 50, mode="standard")
+        utils.record_score("ty", 75, mode="timed")
+        with open(self.journal) as f:
+            lines = f.read().splitlines()
+        self.assertEqual(len(lines), 2)
+        self.assertEqual(json.loads(lines[1])["mode"], "timed")
+        names = [r["name"] for r in utils.iter_scores()]
+        self.assertEqual(names, ["mru", "ty"])
+
+
+    #Tests iter_scores skips a torn trailing line left by an interrupted write
+    def test_iter_scores_skips_torn_line(self):
+        utils.record_score("mru", 50)
+        with open(self.journal, "a") as f:
+            f.write('{"name": "x", "sco')
+        self.assertEqual([r["name"] for r in utils.iter_scores()], ["mru"])
+
+
+    #Tests save_scores replaces the whole journal
+    def test_save_scores_rewrites_journal(self):
+        utils.record_score("mru", 50)
+        utils.save_scores([{"name": "only", "score": 1}])
+        self.assertEqual(utils.load_scores(), [{"name": "only", "score": 1}])
+
+
+if __name__ == "__main__":
+    unittest.main()
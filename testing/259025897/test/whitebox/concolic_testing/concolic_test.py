@@ -2,16 +2,21 @@ import io, sys, json, types, unittest
 from unittest.mock import patch, mock_open
 import mcq_types, manage_assessment, assessment_storage
 
+
+#Catalog entries for in-memory assessments; load() returns the dict itself
+def stored(data):
+    return [assessment_storage.StoredAssessment({"id": f"a{i + 1}", "name": a["name"]}, lambda a=a: a) for i, a in enumerate(data)]
+
+
 # test cases for take quiz function
 class TestConcolicTakeQuiz(unittest.TestCase):
 
     # Concolic Case 1: untimed + correct answer + name=None should not save scores
-    @patch("mcq_types.save_scores")
-    @patch("mcq_types.load_scores", return_value=[])
+    @patch("mcq_types.record_score")
     @patch("mcq_types.print_results")
     @patch("builtins.input", side_effect=["A"])
     def test_concolic_case_1_untimed_correct_name_none_no_save(
-        self, m_input, m_print_results, m_load_scores, m_save_scores
+        self, m_input, m_print_results, m_record_score
     ):
         qs = ["Q1"]
         opts = [("A.1", "B.2", "C.3", "D.4")]
@@ -19,17 +24,15 @@ class TestConcolicTakeQuiz(unittest.TestCase):
 
         mcq_types.take_quiz(qs, opts, ans, name=None, timed=False)
         m_print_results.assert_called_once()
-        m_load_scores.assert_not_called()
-        m_save_scores.assert_not_called()
+        m_record_score.assert_not_called()
 
 
     #Concolic Case 2: untimed + correct answer + name provided should save scores once
-    @patch("mcq_types.save_scores")
-    @patch("mcq_types.load_scores", return_value=[])
+    @patch("mcq_types.record_score")
     @patch("mcq_types.print_results")
     @patch("builtins.input", side_effect=["A"])
     def test_concolic_case_2_untimed_correct_name_saves(
-        self, m_input, m_print_results, m_load_scores, m_save_scores
+        self, m_input, m_print_results, m_record_score
     ):
         qs = ["Q1"]
         opts = [("A.1", "B.2", "C.3", "D.4")]
@@ -37,17 +40,15 @@ class TestConcolicTakeQuiz(unittest.TestCase):
 
         mcq_types.take_quiz(qs, opts, ans, name="Mru", timed=False)
         m_print_results.assert_called_once()
-        m_load_scores.assert_called_once()
-        m_save_scores.assert_called_once()
+        m_record_score.assert_called_once()
 
 
     #Concolic Case 3: untimed + incorrect answer + name provided should still save percent once
-    @patch("mcq_types.save_scores")
-    @patch("mcq_types.load_scores", return_value=[])
+    @patch("mcq_types.record_score")
     @patch("mcq_types.print_results")
     @patch("builtins.input", side_effect=["B"])
     def test_concolic_case_3_untimed_incorrect_name_saves(
-        self, m_input, m_print_results, m_load_scores, m_save_scores
+        self, m_input, m_print_results, m_record_score
     ):
         qs = ["Q1"]
         opts = [("A.1", "B.2", "C.3", "D.4")]
@@ -55,17 +56,15 @@ class TestConcolicTakeQuiz(unittest.TestCase):
 
         mcq_types.take_quiz(qs, opts, ans, name="Dhu", timed=False)
         m_print_results.assert_called_once()
-        m_load_scores.assert_called_once()
-        m_save_scores.assert_called_once()
+        m_record_score.assert_called_once()
 
 
     #Concolic Case 4: timed + timed_quiz returns a letter + correct answer + name=None should not save
-    @patch("mcq_types.save_scores")
-    @patch("mcq_types.load_scores", return_value=[])
+    @patch("mcq_types.record_score")
     @patch("mcq_types.print_results")
     @patch("mcq_types.timed_quiz", return_value="A")
     def test_concolic_case_4_timed_input_correct_name_none_no_save(
-        self, m_timed_quiz, m_print_results, m_load_scores, m_save_scores
+        self, m_timed_quiz, m_print_results, m_record_score
     ):
         qs = ["Q1"]
         opts = [("A.1", "B.2", "C.3", "D.4")]
@@ -74,17 +73,15 @@ class TestConcolicTakeQuiz(unittest.TestCase):
         mcq_types.take_quiz(qs, opts, ans, name=None, timed=True)
         m_timed_quiz.assert_called_once()
         m_print_results.assert_called_once()
-        m_load_scores.assert_not_called()
-        m_save_scores.assert_not_called()
+        m_record_score.assert_not_called()
 
 
     #Concolic Case 5: timed + timed_quiz returns None (timeout) + name provided should save once
-    @patch("mcq_types.save_scores")
-    @patch("mcq_types.load_scores", return_value=[])
+    @patch("mcq_types.record_score")
     @patch("mcq_types.print_results")
     @patch("mcq_types.timed_quiz", return_value=None)
     def test_concolic_case_5_timed_timeout_name_saves(
-        self, m_timed_quiz, m_print_results, m_load_scores, m_save_scores
+        self, m_timed_quiz, m_print_results, m_record_score
     ):
         qs = ["Q1"]
         opts = [("A.1", "B.2", "C.3", "D.4")]
@@ -93,8 +90,7 @@ class TestConcolicTakeQuiz(unittest.TestCase):
         mcq_types.take_quiz(qs, opts, ans, name="Laa", timed=True)
         m_timed_quiz.assert_called_once()
         m_print_results.assert_called_once()
-        m_load_scores.assert_called_once()
-        m_save_scores.assert_called_once()
+        m_record_score.assert_called_once()
 
 
 # test cases for timed quiz function
@@ -202,10 +198,9 @@ class TestTimedQuiz_Concolic(unittest.TestCase):
 class TestNegativeMarkQuiz_Concolic(unittest.TestCase):
 
     # Concolic test case 1: Correct answer path with name=None avoids saving scores
-    @patch("mcq_types.save_scores")
-    @patch("mcq_types.load_scores", return_value=[])
+    @patch("mcq_types.record_score")
     @patch("builtins.input", side_effect=["A"])
-    def test_concolic_1_correct_no_save(self, m_input, m_load, m_save):
+    def test_concolic_1_correct_no_save(self, m_input, m_save):
         qs = ["Q1"]
         opts = [("A.1", "B.2", "C.3", "D.4")]
         ans = ["A"]
@@ -214,23 +209,20 @@ class TestNegativeMarkQuiz_Concolic(unittest.TestCase):
 
 
     # Concolic test case 2: Correct answer path with name set triggers to save score
-    @patch("mcq_types.save_scores")
-    @patch("mcq_types.load_scores", return_value=[])
+    @patch("mcq_types.record_score")
     @patch("builtins.input", side_effect=["A"])
-    def test_concolic_2_correct_with_save(self, m_input, m_load, m_save):
+    def test_concolic_2_correct_with_save(self, m_input, m_save):
         qs = ["Q1"]
         opts = [("A.1", "B.2", "C.3", "D.4")]
         ans = ["A"]
         mcq_types.take_negative_mark_quiz(qs, opts, ans, name="Sam", neg_mark=0.25)
-        m_load.assert_called_once()
         m_save.assert_called_once()
 
 
     # Concolic test case 3: Blank answer path keeps score unchanged and still saves when name is provided
-    @patch("mcq_types.save_scores")
-    @patch("mcq_types.load_scores", return_value=[])
+    @patch("mcq_types.record_score")
     @patch("builtins.input", side_effect=[""])
-    def test_concolic_3_blank_answer_branch_saves(self, m_input, m_load, m_save):
+    def test_concolic_3_blank_answer_branch_saves(self, m_input, m_save):
         qs = ["Q1"]
         opts = [("A.1", "B.2", "C.3", "D.4")]
         ans = ["A"]
@@ -239,10 +231,9 @@ class TestNegativeMarkQuiz_Concolic(unittest.TestCase):
 
 
     # Concolic test case 4: Wrong non-blank answer applies a negative penalty and saves when name is provided.
-    @patch("mcq_types.save_scores")
-    @patch("mcq_types.load_scores", return_value=[])
+    @patch("mcq_types.record_score")
     @patch("builtins.input", side_effect=["B"])
-    def test_concolic_4_wrong_non_blank_penalty_saves(self, m_input, m_load, m_save):
+    def test_concolic_4_wrong_non_blank_penalty_saves(self, m_input, m_save):
         qs = ["Q1"]
         opts = [("A.1", "B.2", "C.3", "D.4")]
         ans = ["A"]
@@ -251,10 +242,9 @@ class TestNegativeMarkQuiz_Concolic(unittest.TestCase):
 
 
     # Concolic test case 5: Wrong non-blank with n=1 clamps percentage to 0 via max
-    @patch("mcq_types.save_scores")
-    @patch("mcq_types.load_scores", return_value=[])
+    @patch("mcq_types.record_score")
     @patch("builtins.input", side_effect=["B"])
-    def test_concolic_5_negative_score_percent_clamped_to_zero(self, m_input, m_load, m_save):
+    def test_concolic_5_negative_score_percent_clamped_to_zero(self, m_input, m_save):
         qs = ["Q1"]
         opts = [("A.1", "B.2", "C.3", "D.4")]
         ans = ["A"]
@@ -263,10 +253,9 @@ class TestNegativeMarkQuiz_Concolic(unittest.TestCase):
 
 
     # Concolic test case 6: Mixed path across multiple questions hits correct, wrong penalty, and blank branches in one run.
-    @patch("mcq_types.save_scores")
-    @patch("mcq_types.load_scores", return_value=[])
+    @patch("mcq_types.record_score")
     @patch("builtins.input", side_effect=["A", "B", ""])
-    def test_concolic_6_mixed_branches_in_one_execution(self, m_input, m_load, m_save):
+    def test_concolic_6_mixed_branches_in_one_execution(self, m_input, m_save):
         qs = ["Q1", "Q2", "Q3"]
         opts = [("A.1", "B.2", "C.3", "D.4")] * 3
         ans = ["A", "A", "A"]
@@ -278,12 +267,11 @@ class TestNegativeMarkQuiz_Concolic(unittest.TestCase):
 class TestChallengeMode_Concolic(unittest.TestCase):
 
     # Concolic test case 1: Remaining time becomes <= 0 immediately so the challenge exits and saves score
-    @patch("mcq_types.save_scores")
-    @patch("mcq_types.load_scores", return_value=[])
+    @patch("mcq_types.record_score")
     @patch("mcq_types.random.shuffle", side_effect=lambda x: None)
     @patch("builtins.input", side_effect=["3"])
     @patch("mcq_types.time.time", side_effect=[0, 9999])
-    def test_concolic_1_immediate_timeup_saves(self, m_time, m_input, m_shuffle, m_load, m_save):
+    def test_concolic_1_immediate_timeup_saves(self, m_time, m_input, m_shuffle, m_save):
         qs = ["Q1"]
         opts = [("A.1", "B.2", "C.3", "D.4")]
         ans = ["A"]
@@ -292,14 +280,13 @@ class TestChallengeMode_Concolic(unittest.TestCase):
 
 
     # Concolic test case 2: timed quiz returns None, so it exits via 'Time's up while answering' and saves
-    @patch("mcq_types.save_scores")
-    @patch("mcq_types.load_scores", return_value=[])
+    @patch("mcq_types.record_score")
     @patch("mcq_types.random.shuffle", side_effect=lambda x: None)
     @patch("mcq_types.timed_quiz", return_value=None)
     @patch("builtins.input", side_effect=["3"])
     @patch("mcq_types.time.time", side_effect=[0, 0, 1])
     def test_concolic_2_guess_none_branch_saves(
-        self, m_time, m_input, m_timed, m_shuffle, m_load, m_save
+        self, m_time, m_input, m_timed, m_shuffle, m_save
     ):
         qs = ["Q1"]
         opts = [("A.1", "B.2", "C.3", "D.4")]
@@ -309,13 +296,12 @@ class TestChallengeMode_Concolic(unittest.TestCase):
 
 
     # Concolic test case 3: Minutes loop rejects out-of-range and non-numeric inputs before accepting a valid one
-    @patch("mcq_types.save_scores")
-    @patch("mcq_types.load_scores", return_value=[])
+    @patch("mcq_types.record_score")
     @patch("mcq_types.timed_quiz", return_value=None)
     @patch("builtins.input", side_effect=["10", "abc", "3"])
     @patch("mcq_types.time.time", side_effect=[0, 0, 1])
     def test_concolic_3_minutes_validation_loop_then_run(
-        self, m_time, m_input, m_timed, m_load, m_save
+        self, m_time, m_input, m_timed, m_save
     ):
         qs = ["Q1"]
         opts = [("A.1", "B.2", "C.3", "D.4")]
@@ -325,14 +311,13 @@ class TestChallengeMode_Concolic(unittest.TestCase):
 
 
     # Concolic test case 4: One correct answer path is taken before timed_quiz becomes None and exits
-    @patch("mcq_types.save_scores")
-    @patch("mcq_types.load_scores", return_value=[])
+    @patch("mcq_types.record_score")
     @patch("mcq_types.random.shuffle", side_effect=lambda x: None)
     @patch("mcq_types.timed_quiz", side_effect=["A", None])
     @patch("builtins.input", side_effect=["3"])
     @patch("mcq_types.time.time", side_effect=[0, 0, 0, 1])
     def test_concolic_4_one_correct_then_guess_none(
-        self, m_time, m_input, m_timed, m_shuffle, m_load, m_save
+        self, m_time, m_input, m_timed, m_shuffle, m_save
     ):
         qs = ["Q1"]
         opts = [("A.1", "B.2", "C.3", "D.4")]
@@ -342,14 +327,13 @@ class TestChallengeMode_Concolic(unittest.TestCase):
 
 
     # Concolic test case 5: One incorrect answer path is taken before timed_quiz becomes None and exits
-    @patch("mcq_types.save_scores")
-    @patch("mcq_types.load_scores", return_value=[])
+    @patch("mcq_types.record_score")
     @patch("mcq_types.random.shuffle", side_effect=lambda x: None)
     @patch("mcq_types.timed_quiz", side_effect=["B", None])
     @patch("builtins.input", side_effect=["3"])
     @patch("mcq_types.time.time", side_effect=[0, 0, 0, 1])
     def test_concolic_5_one_wrong_then_guess_none(
-        self, m_time, m_input, m_timed, m_shuffle, m_load, m_save
+        self, m_time, m_input, m_timed, m_shuffle, m_save
     ):
         qs = ["Q1"]
         opts = [("A.1", "B.2", "C.3", "D.4")]
@@ -359,14 +343,13 @@ class TestChallengeMode_Concolic(unittest.TestCase):
 
 
     # Concolic test case 6: i hits len(indices), triggering the reshuffle branch before exiting.
-    @patch("mcq_types.save_scores")
-    @patch("mcq_types.load_scores", return_value=[])
+    @patch("mcq_types.record_score")
     @patch("mcq_types.random.shuffle", side_effect=lambda x: None)
     @patch("mcq_types.timed_quiz", side_effect=["A", "A", None])
     @patch("builtins.input", side_effect=["3"])
     @patch("mcq_types.time.time", side_effect=[0, 0, 0, 0, 1])
     def test_concolic_6_wraparound_shuffle_branch(
-        self, m_time, m_input, m_timed, m_shuffle, m_load, m_save
+        self, m_time, m_input, m_timed, m_shuffle, m_save
     ):
         qs = ["Q1"]
         opts = [("A.1", "B.2", "C.3", "D.4")]
@@ -379,11 +362,10 @@ class TestChallengeMode_Concolic(unittest.TestCase):
 class TestStreakMode_Concolic(unittest.TestCase):
 
     # Concolic test case 1: All answers correct triggers the 'Amazing!' branch and saves when name is set
-    @patch("mcq_types.save_scores")
-    @patch("mcq_types.load_scores", return_value=[])
+    @patch("mcq_types.record_score")
     @patch("mcq_types.random.shuffle", side_effect=lambda x: None)
     @patch("builtins.input", side_effect=["A"])
-    def test_concolic_1_all_correct_amazing_saves(self, m_input, m_shuffle, m_load, m_save):
+    def test_concolic_1_all_correct_amazing_saves(self, m_input, m_shuffle, m_save):
         qs = ["Q1"]
         opts = [("A.1", "B.2", "C.3", "D.4")]
         ans = ["A"]
@@ -392,11 +374,10 @@ class TestStreakMode_Concolic(unittest.TestCase):
 
 
     # Concolic test case 2: First answer wrong and non-blank hits the incorrect branch, breaks early and saves
-    @patch("mcq_types.save_scores")
-    @patch("mcq_types.load_scores", return_value=[])
+    @patch("mcq_types.record_score")
     @patch("mcq_types.random.shuffle", side_effect=lambda x: None)
     @patch("builtins.input", side_effect=["B"])
-    def test_concolic_2_wrong_non_blank_breaks_and_saves(self, m_input, m_shuffle, m_load, m_save):
+    def test_concolic_2_wrong_non_blank_breaks_and_saves(self, m_input, m_shuffle, m_save):
         qs = ["Q1"]
         opts = [("A.1", "B.2", "C.3", "D.4")]
         ans = ["A"]
@@ -405,11 +386,10 @@ class TestStreakMode_Concolic(unittest.TestCase):
 
 
     # Concolic test case 3: Blank input hits the 'No answer selected' branch, breaks early and saves
-    @patch("mcq_types.save_scores")
-    @patch("mcq_types.load_scores", return_value=[])
+    @patch("mcq_types.record_score")
     @patch("mcq_types.random.shuffle", side_effect=lambda x: None)
     @patch("builtins.input", side_effect=[""])
-    def test_concolic_3_blank_input_breaks_and_saves(self, m_input, m_shuffle, m_load, m_save):
+    def test_concolic_3_blank_input_breaks_and_saves(self, m_input, m_shuffle, m_save):
         qs = ["Q1"]
         opts = [("A.1", "B.2", "C.3", "D.4")]
         ans = ["A"]
@@ -418,11 +398,10 @@ class TestStreakMode_Concolic(unittest.TestCase):
 
 
     # Concolic test case 4: One correct then one wrong proves the loop continues before breaking on the first wrong answer
-    @patch("mcq_types.save_scores")
-    @patch("mcq_types.load_scores", return_value=[])
+    @patch("mcq_types.record_score")
     @patch("mcq_types.random.shuffle", side_effect=lambda x: None)
     @patch("builtins.input", side_effect=["A", "B"])
-    def test_concolic_4_correct_then_wrong_breaks_and_saves(self, m_input, m_shuffle, m_load, m_save):
+    def test_concolic_4_correct_then_wrong_breaks_and_saves(self, m_input, m_shuffle, m_save):
         qs = ["Q1", "Q2"]
         opts = [("A.1", "B.2", "C.3", "D.4")] * 2
         ans = ["A", "A"]
@@ -431,10 +410,9 @@ class TestStreakMode_Concolic(unittest.TestCase):
 
 
     # Concolic test case 5: Empty question list forces asked==0 and percent==0 without saving when name is None
-    @patch("mcq_types.save_scores")
-    @patch("mcq_types.load_scores", return_value=[])
+    @patch("mcq_types.record_score")
     @patch("mcq_types.random.shuffle", side_effect=lambda x: None)
-    def test_concolic_5_zero_questions_no_save(self, m_shuffle, m_load, m_save):
+    def test_concolic_5_zero_questions_no_save(self, m_shuffle, m_save):
         mcq_types.take_quiz_until_wrong([], [], [], name=None)
         m_save.assert_not_called()
 
@@ -507,10 +485,9 @@ class TestCreateAssessment_Concolic(unittest.TestCase):
 
     # Concolic test case 1: Take-now is 'n' so assessment saves but quiz is not started
     @patch("manage_assessment.take_quiz")
-    @patch("manage_assessment.save_custom_assessments")
-    @patch("manage_assessment.load_custom_assessments", return_value=[])
+    @patch("manage_assessment.add_custom_assessment")
     @patch("builtins.input", side_effect=["Assess1", "1", "Q1", "o1", "o2", "o3", "o4","A", "n" ])
-    def test_concolic_1_take_now_no(self, m_in, m_load, m_save, m_take):
+    def test_concolic_1_take_now_no(self, m_in, m_save, m_take):
         manage_assessment.create_assessment()
         m_save.assert_called_once()
         m_take.assert_not_called()
@@ -518,10 +495,9 @@ class TestCreateAssessment_Concolic(unittest.TestCase):
 
     # Concolic test case 2: Take-now is 'y' so assessment saves and quiz starts immediately
     @patch("manage_assessment.take_quiz")
-    @patch("manage_assessment.save_custom_assessments")
-    @patch("manage_assessment.load_custom_assessments", return_value=[])
+    @patch("manage_assessment.add_custom_assessment")
     @patch("builtins.input", side_effect=["Assess2","1","Q1", "o1", "o2", "o3", "o4","A", "y"])
-    def test_concolic_2_take_now_yes(self, m_in, m_load, m_save, m_take):
+    def test_concolic_2_take_now_yes(self, m_in, m_save, m_take):
         manage_assessment.create_assessment()
         m_save.assert_called_once()
         m_take.assert_called_once()
@@ -531,14 +507,14 @@ class TestCreateAssessment_Concolic(unittest.TestCase):
 class TestListAssessments_Concolic(unittest.TestCase):
 
     # Concolic test case 1: Empty assessments list returns None after printing the 'no assessments' message
-    @patch("manage_assessment.load_custom_assessments", return_value=[])
+    @patch("manage_assessment.stored_assessments", return_value=[])
     def test_concolic_1_list_empty_returns_none(self, m_load):
         with patch("sys.stdout", new_callable=io.StringIO):
             self.assertIsNone(manage_assessment.list_assessments())
 
 
     # Concolic test case 2: Non-empty assessments list is printed and returned as is
-    @patch("manage_assessment.load_custom_assessments", return_value=[{"name": "A", "questions": [], "options": [], "answers": []}])
+    @patch("manage_assessment.stored_assessments", return_value=stored([{"name": "A", "questions": [], "options": [], "answers": []}]))
     def test_concolic_2_list_non_empty_returns_list(self, m_load):
         with patch("sys.stdout", new_callable=io.StringIO):
             out = manage_assessment.list_assessments()
@@ -555,16 +531,16 @@ class TestAddQuestion_Concolic(unittest.TestCase):
 
 
     # Concolic test case 2: Non-numeric selection triggers the exception path and prints 'Invalid input'
-    @patch("manage_assessment.list_assessments", return_value=[{"name": "A", "questions": [], "options": [], "answers": []}])
+    @patch("manage_assessment.list_assessments", return_value=stored([{"name": "A", "questions": [], "options": [], "answers": []}]))
     @patch("builtins.input", side_effect=["abc"])
     def test_concolic_2_add_question_invalid_selection_string(self, m_in, m_list):
         with patch("sys.stdout", new_callable=io.StringIO):
             manage_assessment.add_question_to_assessment()
 
 
-    # Concolic test case 3: Valid selection adds a question and calls save_custom_assessments once
-    @patch("manage_assessment.save_custom_assessments")
-    @patch("manage_assessment.list_assessments", return_value=[{"name": "A", "questions": [], "options": [], "answers": []}])
+    # Concolic test case 3: Valid selection adds a question and calls save_assessment once
+    @patch("manage_assessment.save_assessment")
+    @patch("manage_assessment.list_assessments", return_value=stored([{"name": "A", "questions": [], "options": [], "answers": []}]))
     @patch("builtins.input", side_effect=["1", "New Q", "oA", "oB", "oC", "oD", "A"])
     def test_concolic_3_add_question_valid_path_saves(self, m_in, m_list, m_save):
         manage_assessment.add_question_to_assessment()
@@ -580,7 +556,7 @@ class TestEditQuestion_Concolic(unittest.TestCase):
 
 
     # Concolic test case 2: Non-numeric assessment selection triggers the invalid selection branch
-    @patch("manage_assessment.list_assessments", return_value=[{"name": "A", "questions": ["Q1"], "options": [("A.1","B.2","C.3","D.4")], "answers": ["A"]}])
+    @patch("manage_assessment.list_assessments", return_value=stored([{"name": "A", "questions": ["Q1"], "options": [("A.1","B.2","C.3","D.4")], "answers": ["A"]}]))
     @patch("builtins.input", side_effect=["abc"])
     def test_concolic_2_edit_invalid_assessment_selection(self, m_in, m_list):
         with patch("sys.stdout", new_callable=io.StringIO):
@@ -588,7 +564,7 @@ class TestEditQuestion_Concolic(unittest.TestCase):
 
 
     # Concolic test case 3: Non-numeric question number triggers the invalid input branch
-    @patch("manage_assessment.list_assessments", return_value=[{"name": "A", "questions": ["Q1"], "options": [("A.1","B.2","C.3","D.4")], "answers": ["A"]}])
+    @patch("manage_assessment.list_assessments", return_value=stored([{"name": "A", "questions": ["Q1"], "options": [("A.1","B.2","C.3","D.4")], "answers": ["A"]}]))
     @patch("builtins.input", side_effect=["1", "abc"])
     def test_concolic_3_edit_invalid_question_number_input(self, m_in, m_list):
         with patch("sys.stdout", new_callable=io.StringIO):
@@ -596,7 +572,7 @@ class TestEditQuestion_Concolic(unittest.TestCase):
 
 
     # Concolic test case 4: Out-of-range question index triggers the invalid selection branch
-    @patch("manage_assessment.list_assessments", return_value=[{"name": "A", "questions": ["Q1"], "options": [("A.1","B.2","C.3","D.4")], "answers": ["A"]}])
+    @patch("manage_assessment.list_assessments", return_value=stored([{"name": "A", "questions": ["Q1"], "options": [("A.1","B.2","C.3","D.4")], "answers": ["A"]}]))
     @patch("builtins.input", side_effect=["1", "99"])
     def test_concolic_4_edit_question_index_out_of_range(self, m_in, m_list):
         with patch("sys.stdout", new_callable=io.StringIO):
@@ -604,8 +580,8 @@ class TestEditQuestion_Concolic(unittest.TestCase):
 
 
     # Concolic test case 5: Valid edit where user keeps question and answer unchanged but still saves
-    @patch("manage_assessment.save_custom_assessments")
-    @patch("manage_assessment.list_assessments", return_value=[{"name": "A", "questions": ["Q1"], "options": [("A.1","B.2","C.3","D.4")], "answers": ["A"]}])
+    @patch("manage_assessment.save_assessment")
+    @patch("manage_assessment.list_assessments", return_value=stored([{"name": "A", "questions": ["Q1"], "options": [("A.1","B.2","C.3","D.4")], "answers": ["A"]}]))
     @patch("builtins.input", side_effect=["1", "1", "", "", "", "", "", ""])
     def test_concolic_5_edit_keep_existing_fields_saves(self, m_in, m_list, m_save):
         manage_assessment.edit_question_in_assessment()
@@ -613,8 +589,8 @@ class TestEditQuestion_Concolic(unittest.TestCase):
 
 
     # Concolic test case 6: Valid edit where question and answer are both updated and saved
-    @patch("manage_assessment.save_custom_assessments")
-    @patch("manage_assessment.list_assessments", return_value=[{"name": "A", "questions": ["Q1"], "options": [("A.1","B.2","C.3","D.4")], "answers": ["A"]}])
+    @patch("manage_assessment.save_assessment")
+    @patch("manage_assessment.list_assessments", return_value=stored([{"name": "A", "questions": ["Q1"], "options": [("A.1","B.2","C.3","D.4")], "answers": ["A"]}]))
     @patch("builtins.input", side_effect=["1", "1", "New Q1", "", "", "", "", "B"])
     def test_concolic_6_edit_updates_question_and_answer(self, m_in, m_list, m_save):
         manage_assessment.edit_question_in_assessment()
@@ -630,7 +606,7 @@ class TestDeleteQuestion_Concolic(unittest.TestCase):
 
 
     # Concolic test case 2: Non-numeric assessment selection triggers the invalid input branch
-    @patch("manage_assessment.list_assessments", return_value=[{"name": "A", "questions": ["Q1"], "options": [("A.1","B.2","C.3","D.4")], "answers": ["A"]}])
+    @patch("manage_assessment.list_assessments", return_value=stored([{"name": "A", "questions": ["Q1"], "options": [("A.1","B.2","C.3","D.4")], "answers": ["A"]}]))
     @patch("builtins.input", side_effect=["abc"])
     def test_concolic_2_delete_invalid_assessment_selection(self, m_in, m_list):
         with patch("sys.stdout", new_callable=io.StringIO):
@@ -638,7 +614,7 @@ class TestDeleteQuestion_Concolic(unittest.TestCase):
 
 
     # Concolic test case 3: Non-numeric question selection triggers the invalid input branch
-    @patch("manage_assessment.list_assessments", return_value=[{"name": "A", "questions": ["Q1"], "options": [("A.1","B.2","C.3","D.4")], "answers": ["A"]}])
+    @patch("manage_assessment.list_assessments", return_value=stored([{"name": "A", "questions": ["Q1"], "options": [("A.1","B.2","C.3","D.4")], "answers": ["A"]}]))
     @patch("builtins.input", side_effect=["1", "abc"])
     def test_concolic_3_delete_invalid_question_number_input(self, m_in, m_list):
         with patch("sys.stdout", new_callable=io.StringIO):
@@ -646,7 +622,7 @@ class TestDeleteQuestion_Concolic(unittest.TestCase):
 
 
     # Concolic test case 4: Out-of-range question index triggers the invalid selection branch
-    @patch("manage_assessment.list_assessments", return_value=[{"name": "A", "questions": ["Q1"], "options": [("A.1","B.2","C.3","D.4")], "answers": ["A"]}])
+    @patch("manage_assessment.list_assessments", return_value=stored([{"name": "A", "questions": ["Q1"], "options": [("A.1","B.2","C.3","D.4")], "answers": ["A"]}]))
     @patch("builtins.input", side_effect=["1", "99"])
     def test_concolic_4_delete_question_index_out_of_range(self, m_in, m_list):
         with patch("sys.stdout", new_callable=io.StringIO):
@@ -654,8 +630,8 @@ class TestDeleteQuestion_Concolic(unittest.TestCase):
 
 
     # Concolic test case 5: Valid delete removes the question and saves the updated assessment list
-    @patch("manage_assessment.save_custom_assessments")
-    @patch("manage_assessment.list_assessments", return_value=[{"name": "A", "questions": ["Q1"], "options": [("A.1","B.2","C.3","D.4")], "answers": ["A"]}])
+    @patch("manage_assessment.save_assessment")
+    @patch("manage_assessment.list_assessments", return_value=stored([{"name": "A", "questions": ["Q1"], "options": [("A.1","B.2","C.3","D.4")], "answers": ["A"]}]))
     @patch("builtins.input", side_effect=["1", "1"])
     def test_concolic_5_delete_valid_path_saves(self, m_in, m_list, m_save):
         manage_assessment.delete_question_from_assessment()
@@ -666,7 +642,7 @@ class TestDeleteQuestion_Concolic(unittest.TestCase):
 class TestViewQuestions_Concolic(unittest.TestCase):
 
     # Concolic test case 1: No saved assessments triggers the early 'No assessments saved yet' return.
-    @patch("manage_assessment.load_custom_assessments", return_value=[])
+    @patch("manage_assessment.stored_assessments", return_value=[])
     def test_concolic_1_no_assessments_returns_early(self, m_load):
         with patch("sys.stdout", new_callable=io.StringIO) as buf:
             manage_assessment.view_questions_in_assessment()
@@ -674,7 +650,7 @@ class TestViewQuestions_Concolic(unittest.TestCase):
 
 
     # Concolic test case 2: Non-numeric selection causes ValueError and prints 'Invalid input'
-    @patch("manage_assessment.load_custom_assessments", return_value=[{"name": "A"}])
+    @patch("manage_assessment.stored_assessments", return_value=stored([{"name": "A"}]))
     @patch("builtins.input", side_effect=["abc"])
     def test_concolic_2_invalid_input_value_error(self, m_in, m_load):
         with patch("sys.stdout", new_callable=io.StringIO) as buf:
@@ -683,7 +659,7 @@ class TestViewQuestions_Concolic(unittest.TestCase):
 
 
     # Concolic test case 3: Out-of-range positive selection prints 'Invalid selection'
-    @patch("manage_assessment.load_custom_assessments", return_value=[{"name": "A"}])
+    @patch("manage_assessment.stored_assessments", return_value=stored([{"name": "A"}]))
     @patch("builtins.input", side_effect=["99"])
     def test_concolic_3_out_of_range_selection_high(self, m_in, m_load):
         with patch("sys.stdout", new_callable=io.StringIO) as buf:
@@ -692,7 +668,7 @@ class TestViewQuestions_Concolic(unittest.TestCase):
 
 
     # Concolic test case 4: Selection “0” produces k=-1 and prints 'Invalid selection'
-    @patch("manage_assessment.load_custom_assessments", return_value=[{"name": "A"}])
+    @patch("manage_assessment.stored_assessments", return_value=stored([{"name": "A"}]))
     @patch("builtins.input", side_effect=["0"])
     def test_concolic_4_out_of_range_selection_negative(self, m_in, m_load):
         with patch("sys.stdout", new_callable=io.StringIO) as buf:
@@ -701,7 +677,7 @@ class TestViewQuestions_Concolic(unittest.TestCase):
 
 
     # Concolic test case 5: Valid assessment but empty questions prints 'This assessment has no questions yet'
-    @patch("manage_assessment.load_custom_assessments", return_value=[{"name": "A", "questions": [], "options": [], "answers": []}])
+    @patch("manage_assessment.stored_assessments", return_value=stored([{"name": "A", "questions": [], "options": [], "answers": []}]))
     @patch("builtins.input", side_effect=["1"])
     def test_concolic_5_valid_selection_but_no_questions(self, m_in, m_load):
         with patch("sys.stdout", new_callable=io.StringIO) as buf:
@@ -710,7 +686,7 @@ class TestViewQuestions_Concolic(unittest.TestCase):
 
 
     # Concolic test case 6: Normal path prints question text and correct answer when lists exist
-    @patch("manage_assessment.load_custom_assessments", return_value=[{"name": "A", "questions": ["Q1"], "options": [("A.1","B.2","C.3","D.4")], "answers": ["A"]}])
+    @patch("manage_assessment.stored_assessments", return_value=stored([{"name": "A", "questions": ["Q1"], "options": [("A.1","B.2","C.3","D.4")], "answers": ["A"]}]))
     @patch("builtins.input", side_effect=["1"])
     def test_concolic_6_prints_questions_and_answers(self, m_in, m_load):
         with patch("sys.stdout", new_callable=io.StringIO) as buf:
@@ -721,7 +697,7 @@ class TestViewQuestions_Concolic(unittest.TestCase):
 
 
     # Concolic test case 7: Options list shorter than questions skips option printing for later questions safely
-    @patch("manage_assessment.load_custom_assessments", return_value=[{"name": "A", "questions": ["Q1", "Q2"], "options": [("A.1","B.2","C.3","D.4")], "answers": ["A", "B"]}])
+    @patch("manage_assessment.stored_assessments", return_value=stored([{"name": "A", "questions": ["Q1", "Q2"], "options": [("A.1","B.2","C.3","D.4")], "answers": ["A", "B"]}]))
     @patch("builtins.input", side_effect=["1"])
     def test_concolic_7_options_shorter_than_questions(self, m_in, m_load):
         with patch("sys.stdout", new_callable=io.StringIO) as buf:
@@ -734,7 +710,7 @@ class TestViewQuestions_Concolic(unittest.TestCase):
 
 
     # Concolic test case 8: Answers list shorter than questions skips answer printing for later questions safely
-    @patch("manage_assessment.load_custom_assessments", return_value=[{"name": "A", "questions": ["Q1", "Q2"], "options": [("A.1","B.2","C.3","D.4"), ("A.x","B.y","C.z","D.w")], "answers": ["A"]}])
+    @patch("manage_assessment.stored_assessments", return_value=stored([{"name": "A", "questions": ["Q1", "Q2"], "options": [("A.1","B.2","C.3","D.4"), ("A.x","B.y","C.z","D.w")], "answers": ["A"]}]))
     @patch("builtins.input", side_effect=["1"])
     def test_concolic_8_answers_shorter_than_questions(self, m_in, m_load):
         with patch("sys.stdout", new_callable=io.StringIO) as buf:
@@ -4,48 +4,49 @@ import unittest
 from unittest.mock import patch
 import mcq_types
 import manage_assessment
+from assessment_storage import StoredAssessment
+
+
+#Catalog entries for in-memory assessments; load() returns the dict itself
+def stored(data):
+    return [StoredAssessment({"id": f"a{i + 1}", "name": a["name"]}, lambda a=a: a) for i, a in enumerate(data)]
 
 
 class TestTakeQuizConditions(unittest.TestCase):
 
     #Saves score for a named user in untimed mode after a correct answer
-    @patch("mcq_types.save_scores")
-    @patch("mcq_types.load_scores", return_value=[])
+    @patch("mcq_types.record_score")
     @patch("mcq_types.print_results")
     @patch("builtins.input", side_effect=["A"])
-    def test_take_quiz_untimed_correct_named(self, mock_input, mock_print_results, mock_load, mock_save):
+    def test_take_quiz_untimed_correct_named(self, mock_input, mock_print_results, mock_save):
         questions = ["Q1"]
         options = [("A. 1", "B. 2", "C. 3", "D. 4")]
         answers = ["A"]
         mcq_types.take_quiz(questions, options, answers, name="Alice", timed=False)
         mock_print_results.assert_called_once()
-        mock_load.assert_called_once()
         mock_save.assert_called_once()
 
 
     #Does not save score when the user is anonymous in untimed mode
-    @patch("mcq_types.save_scores")
-    @patch("mcq_types.load_scores")
+    @patch("mcq_types.record_score")
     @patch("mcq_types.print_results")
     @patch("builtins.input", side_effect=["B"])
     def test_take_quiz_untimed_incorrect_anonymous(
-        self, mock_input, mock_print_results, mock_load, mock_save
+        self, mock_input, mock_print_results, mock_save
     ):
         questions = ["Q1"]
         options = [("A. 1", "B. 2", "C. 3", "D. 4")]
         answers = ["A"]
         mcq_types.take_quiz(questions, options, answers, name=None, timed=False)
         mock_print_results.assert_called_once()
-        mock_load.assert_not_called()
         mock_save.assert_not_called()
 
 
     # Saves score in timed mode when an answer arrives before timeout
-    @patch("mcq_types.save_scores")
-    @patch("mcq_types.load_scores", return_value=[])
+    @patch("mcq_types.record_score")
     @patch("mcq_types.print_results")
     @patch("mcq_types.timed_quiz", return_value="C")
-    def test_take_quiz_timed_no_timeout(self, mock_timed, mock_print_results, mock_load, mock_save):
+    def test_take_quiz_timed_no_timeout(self, mock_timed, mock_print_results, mock_save):
         questions = ["Q1"]
         options = [("A. 1", "B. 2", "C. 3", "D. 4")]
         answers = ["C"]
@@ -54,17 +55,15 @@ class TestTakeQuizConditions(unittest.TestCase):
 
         mock_timed.assert_called_once()
         mock_print_results.assert_called_once()
-        mock_load.assert_called_once()
         mock_save.assert_called_once()
 
 
     #Treats a timed-out response as a wrong/blank attempt but still records the attempt for a named user
-    @patch("mcq_types.save_scores")
-    @patch("mcq_types.load_scores", return_value=[])
+    @patch("mcq_types.record_score")
     @patch("mcq_types.print_results")
     @patch("mcq_types.timed_quiz", return_value=None)
     def test_take_quiz_timed_timeout(
-        self, mock_timed, mock_print_results, mock_load, mock_save
+        self, mock_timed, mock_print_results, mock_save
     ):
         questions = ["Q1"]
         options = [("A. 1", "B. 2", "C. 3", "D. 4")]
@@ -72,7 +71,6 @@ class TestTakeQuizConditions(unittest.TestCase):
         mcq_types.take_quiz(questions, options, answers, name="Eve", timed=True)
         mock_timed.assert_called_once()
         mock_print_results.assert_called_once()
-        mock_load.assert_called_once()
         mock_save.assert_called_once()
 
 
@@ -100,10 +98,9 @@ class TestTimedQuizConditions(unittest.TestCase):
 class TestNegativeMarkConditions(unittest.TestCase):
 
     #Applies +1 for correct, penalty for wrong, and 0 for blank, then saves for a named user
-    @patch("mcq_types.save_scores")
-    @patch("mcq_types.load_scores", return_value=[])
+    @patch("mcq_types.record_score")
     @patch("builtins.input", side_effect=["A", "B", ""])
-    def test_negative_mark_all_branches(self, mock_input, mock_load, mock_save):
+    def test_negative_mark_all_branches(self, mock_input, mock_save):
         questions = ["Q1", "Q2", "Q3"]
         options = [
             ("A. 1", "B. 2", "C. 3", "D. 4"),
@@ -118,11 +115,10 @@ class TestNegativeMarkConditions(unittest.TestCase):
 class TestChallengeModeConditions(unittest.TestCase):
 
     #Saves accuracy when the challenge ends due to timed_quiz returning None mid-question
-    @patch("mcq_types.save_scores")
-    @patch("mcq_types.load_scores", return_value=[])
+    @patch("mcq_types.record_score")
     @patch("mcq_types.timed_quiz", return_value=None)
     @patch("builtins.input", side_effect=["3"])
-    def test_challenge_valid_time_then_timeout(self, mock_input, mock_timed, mock_load, mock_save):
+    def test_challenge_valid_time_then_timeout(self, mock_input, mock_timed, mock_save):
         questions = ["Q1", "Q2"]
         options = [
             ("A. 1", "B. 2", "C. 3", "D. 4"),
@@ -130,7 +126,6 @@ class TestChallengeModeConditions(unittest.TestCase):
         ]
         answers = ["A", "B"]
         mcq_types.take_quiz_challenge(questions, options, answers, name="TestUser")
-        mock_load.assert_called_once()
         mock_save.assert_called_once()
 
 
@@ -141,8 +136,7 @@ class TestChallengeModeConditions(unittest.TestCase):
         options = [("A. 1", "B. 2", "C. 3", "D. 4")]
         answers = ["A"]
         with patch("mcq_types.timed_quiz", return_value=None), \
-             patch("mcq_types.load_scores", return_value=[]), \
-             patch("mcq_types.save_scores"), \
+             patch("mcq_types.record_score"), \
              patch("time.time", side_effect=[0, 1000]):
             mcq_types.take_quiz_challenge(questions, options, answers, name="Dan")
 
@@ -151,10 +145,9 @@ class TestStreakModeConditions(unittest.TestCase):
 
     #Saves score after the first wrong answer ends the streak
     @patch("mcq_types.random.shuffle", side_effect=lambda x: x)
-    @patch("mcq_types.save_scores")
-    @patch("mcq_types.load_scores", return_value=[])
+    @patch("mcq_types.record_score")
     @patch("builtins.input", side_effect=["A", "B"])
-    def test_streak_first_correct_second_wrong(self, mock_input, mock_load, mock_save, mock_shuffle):
+    def test_streak_first_correct_second_wrong(self, mock_input, mock_save, mock_shuffle):
         questions = ["Q1", "Q2"]
         options = [
             ("A. 1", "B. 2", "C. 3", "D. 4"),
@@ -167,11 +160,10 @@ class TestStreakModeConditions(unittest.TestCase):
 
     #Saves score even when the first answer is blank and the streak ends immediately
     @patch("mcq_types.random.shuffle", side_effect=lambda x: x)
-    @patch("mcq_types.save_scores")
-    @patch("mcq_types.load_scores", return_value=[])
+    @patch("mcq_types.record_score")
     @patch("builtins.input", side_effect=["", ""])
     def test_streak_empty_answer_branch(
-        self, mock_input, mock_load, mock_save, mock_shuffle
+        self, mock_input, mock_save, mock_shuffle
     ):
         questions = ["Q1"]
         options = [("A. 1", "B. 2", "C. 3", "D. 4")]
@@ -202,8 +194,7 @@ class TestLearningModeConditions(unittest.TestCase):
 class TestAssessmentConditions(unittest.TestCase):
 
     # Creates and saves an assessment without starting the quiz when the user selects 'n'
-    @patch("manage_assessment.save_custom_assessments")
-    @patch("manage_assessment.load_custom_assessments", return_value=[])
+    @patch("manage_assessment.add_custom_assessment")
     @patch("mcq_types.take_quiz")
     @patch(
         "builtins.input",
@@ -216,22 +207,22 @@ class TestAssessmentConditions(unittest.TestCase):
             "n"
         ],
     )
-    def test_create_assessment_not_taken_now(self, mock_input, mock_take_quiz, mock_load, mock_save):
+    def test_create_assessment_not_taken_now(self, mock_input, mock_take_quiz, mock_save):
         manage_assessment.create_assessment()
         mock_save.assert_called_once()
         mock_take_quiz.assert_not_called()
 
 
     #Returns None from list_assessments when there are no stored assessments
-    @patch("manage_assessment.load_custom_assessments", return_value=[])
+    @patch("manage_assessment.stored_assessments", return_value=[])
     def test_list_assessments_none(self, mock_load):
         result = manage_assessment.list_assessments()
         self.assertIsNone(result)
 
 
     #Adds a new question into the selected assessment and maintains the update
-    @patch("manage_assessment.list_assessments", return_value=[{"name": "A", "questions": [], "options": [], "answers": []}])
-    @patch("manage_assessment.save_custom_assessments")
+    @patch("manage_assessment.list_assessments", return_value=stored([{"name": "A", "questions": [], "options": [], "answers": []}]))
+    @patch("manage_assessment.save_assessment")
     @patch("builtins.input",
         side_effect=[
             "1",
@@ -247,14 +238,14 @@ class TestAssessmentConditions(unittest.TestCase):
 
     #Keeps existing values during edit when the user presses 'Enter' for all fields
     @patch("manage_assessment.list_assessments",
-        return_value=[{
+        return_value=stored([{
             "name": "A",
             "questions": ["Q1"],
             "options": [("A.1", "B.2", "C.3", "D.4")],
             "answers": ["A"],
-        }],
+        }]),
     )
-    @patch("manage_assessment.save_custom_assessments")
+    @patch("manage_assessment.save_assessment")
     @patch("builtins.input",
         side_effect=[
             "1",
@@ -273,14 +264,14 @@ class TestAssessmentConditions(unittest.TestCase):
 
     #Deletes the chosen question from the assessment and maintains the change
     @patch("manage_assessment.list_assessments",
-        return_value=[{
+        return_value=stored([{
             "name": "A",
             "questions": ["Q1"],
             "options": [("A.1", "B.2", "C.3", "D.4")],
             "answers": ["A"]
-        }],
+        }]),
     )
-    @patch("manage_assessment.save_custom_assessments")
+    @patch("manage_assessment.save_assessment")
     @patch(
         "builtins.input",
         side_effect=["1", "1"],
@@ -291,13 +282,13 @@ class TestAssessmentConditions(unittest.TestCase):
 
 
     #Prints the selected assessment’s questions, options, and answers
-    @patch("manage_assessment.load_custom_assessments",
-        return_value=[{
+    @patch("manage_assessment.stored_assessments",
+        return_value=stored([{
             "name": "A",
             "questions": ["Q1"],
             "options": [("A.1", "B.2", "C.3", "D.4")],
             "answers": ["A"],
-        }],
+        }]),
     )
     @patch("sys.stdout", new_callable=io.StringIO)
     @patch("builtins.input", side_effect=["1"])
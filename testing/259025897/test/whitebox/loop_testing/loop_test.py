@@ -3,16 +3,21 @@ import unittest
 from unittest.mock import patch
 import mcq_types
 import manage_assessment
+from assessment_storage import StoredAssessment
+
+
+#Catalog entries for in-memory assessments; load() returns the dict itself
+def stored(data):
+    return [StoredAssessment({"id": f"a{i + 1}", "name": a["name"]}, lambda a=a: a) for i, a in enumerate(data)]
 
 
 class TestTakeQuizLoops(unittest.TestCase):
 
     #Loop testing for take_quiz
     @patch("mcq_types.print_results")
-    @patch("mcq_types.save_scores")
-    @patch("mcq_types.load_scores", return_value=[])
+    @patch("mcq_types.record_score")
     @patch("builtins.input", side_effect=["A"])
-    def test_take_quiz_one_question(self, mock_input, mock_load, mock_save, mock_pr):
+    def test_take_quiz_one_question(self, mock_input, mock_save, mock_pr):
     #one iteration of the question loop
         qs = ["Q1"]
         opts = [("A.1", "B.2", "C.3", "D.4")]
@@ -23,11 +28,10 @@ class TestTakeQuizLoops(unittest.TestCase):
 
 
     @patch("mcq_types.print_results")
-    @patch("mcq_types.save_scores")
-    @patch("mcq_types.load_scores", return_value=[])
+    @patch("mcq_types.record_score")
     @patch("builtins.input", side_effect=["A", "B", "C"])
     def test_take_quiz_multiple_questions(
-        self, mock_input, mock_load, mock_save, mock_pr
+        self, mock_input, mock_save, mock_pr
     ):
     #multiple iterations of the question loop
         qs = ["Q1", "Q2", "Q3"]
@@ -44,10 +48,9 @@ class TestTakeQuizLoops(unittest.TestCase):
 class TestNegativeQuizLoops(unittest.TestCase):
 
     #Loop testing for take_negative_mark_quiz with one question
-    @patch("mcq_types.save_scores")
-    @patch("mcq_types.load_scores", return_value=[])
+    @patch("mcq_types.record_score")
     @patch("builtins.input", side_effect=["A"])
-    def test_negative_quiz_one_question(self, mock_input, mock_load, mock_save):
+    def test_negative_quiz_one_question(self, mock_input, mock_save):
         qs = ["Q1"]
         opts = [("A.1", "B.2", "C.3", "D.4")]
         ans = ["A"]
@@ -55,11 +58,10 @@ class TestNegativeQuizLoops(unittest.TestCase):
 
 
     #Loop testing for take_negative_mark_quiz with multiple question
-    @patch("mcq_types.save_scores")
-    @patch("mcq_types.load_scores", return_value=[])
+    @patch("mcq_types.record_score")
     @patch("builtins.input", side_effect=["A", "B", ""])
     def test_negative_quiz_multiple_questions(
-        self, mock_input, mock_load, mock_save
+        self, mock_input, mock_save
     ):
         qs = ["Q1", "Q2", "Q3"]
         opts = [
@@ -74,13 +76,12 @@ class TestNegativeQuizLoops(unittest.TestCase):
 class TestChallengeLoops(unittest.TestCase):
 
     #Loop testing for take_quiz_challenge with one iteration
-    @patch("mcq_types.save_scores")
-    @patch("mcq_types.load_scores", return_value=[])
+    @patch("mcq_types.record_score")
     @patch("mcq_types.timed_quiz", return_value=None)
     @patch("builtins.input", side_effect=["2"])
     @patch("time.time", side_effect=[0, 1])
     def test_challenge_one_iteration_then_timeout(
-        self, mock_time, mock_input, mock_timed, mock_load, mock_save
+        self, mock_time, mock_input, mock_timed, mock_save
     ):
         qs = ["Q1"]
         opts = [("A.1", "B.2", "C.3", "D.4")]
@@ -89,13 +90,12 @@ class TestChallengeLoops(unittest.TestCase):
 
 
     #Loop testing for take_quiz_challenge with multiple iteration
-    @patch("mcq_types.save_scores")
-    @patch("mcq_types.load_scores", return_value=[])
+    @patch("mcq_types.record_score")
     @patch("mcq_types.timed_quiz", side_effect=["A", "B", None])
     @patch("builtins.input", side_effect=["2"])
     @patch("time.time", side_effect=[0, 1, 2, 3])
     def test_challenge_multiple_iterations_then_timeout(
-        self, mock_time, mock_input, mock_timed, mock_load, mock_save
+        self, mock_time, mock_input, mock_timed, mock_save
     ):
         qs = ["Q1", "Q2"]
         opts = [
@@ -110,10 +110,9 @@ class TestStreakLoops(unittest.TestCase):
 
     #Loop testing for take_quiz_until_wrong with one question
     @patch("mcq_types.random.shuffle", side_effect=lambda x: x)
-    @patch("mcq_types.save_scores")
-    @patch("mcq_types.load_scores", return_value=[])
+    @patch("mcq_types.record_score")
     @patch("builtins.input", side_effect=["A"])
-    def test_streak_one_question(self, mock_input, mock_load, mock_save, mock_shuf):
+    def test_streak_one_question(self, mock_input, mock_save, mock_shuf):
         qs = ["Q1"]
         opts = [("A.1", "B.2", "C.3", "D.4")]
         ans = ["A"]
@@ -122,11 +121,10 @@ class TestStreakLoops(unittest.TestCase):
 
     #Loop testing for take_quiz_until_wrong with multiple question
     @patch("mcq_types.random.shuffle", side_effect=lambda x: x)
-    @patch("mcq_types.save_scores")
-    @patch("mcq_types.load_scores", return_value=[])
+    @patch("mcq_types.record_score")
     @patch("builtins.input", side_effect=["A", "B"])
     def test_streak_multiple_questions_break_second(
-        self, mock_input, mock_load, mock_save, mock_shuf
+        self, mock_input, mock_save, mock_shuf
     ):
         qs = ["Q1", "Q2"]
         opts = [
@@ -170,8 +168,7 @@ class TestLearningModeLoops(unittest.TestCase):
 class TestAssessmentLoops(unittest.TestCase):
 
     #Loop testing for assessment functions with zero questions
-    @patch("manage_assessment.save_custom_assessments")
-    @patch("manage_assessment.load_custom_assessments", return_value=[])
+    @patch("manage_assessment.add_custom_assessment")
     @patch("mcq_types.take_quiz")
     @patch(
         "builtins.input",
@@ -181,16 +178,13 @@ class TestAssessmentLoops(unittest.TestCase):
             "n"
         ],
     )
-    def test_create_assessment_zero_questions(
-        self, mock_input, mock_take, mock_load, mock_save
-    ):
+    def test_create_assessment_zero_questions(self, mock_input, mock_take, mock_save):
         manage_assessment.create_assessment()
         mock_save.assert_called_once()
 
 
     #Loop testing for assessment functions with one question
-    @patch("manage_assessment.save_custom_assessments")
-    @patch("manage_assessment.load_custom_assessments", return_value=[])
+    @patch("manage_assessment.add_custom_assessment")
     @patch("mcq_types.take_quiz")
     @patch(
         "builtins.input",
@@ -203,9 +197,7 @@ class TestAssessmentLoops(unittest.TestCase):
             "n",
         ],
     )
-    def test_create_assessment_one_question(
-        self, mock_input, mock_take, mock_load, mock_save
-    ):
+    def test_create_assessment_one_question(self, mock_input, mock_take, mock_save):
         manage_assessment.create_assessment()
         mock_save.assert_called_once()
 
@@ -213,9 +205,9 @@ class TestAssessmentLoops(unittest.TestCase):
     #Loop testing for add question option functions
     @patch(
         "manage_assessment.list_assessments",
-        return_value=[{"name": "A", "questions": [], "options": [], "answers": []}],
+        return_value=stored([{"name": "A", "questions": [], "options": [], "answers": []}]),
     )
-    @patch("manage_assessment.save_custom_assessments")
+    @patch("manage_assessment.save_assessment")
     @patch(
         "builtins.input",
         side_effect=[
@@ -233,8 +225,8 @@ class TestAssessmentLoops(unittest.TestCase):
 
 
     @patch(
-        "manage_assessment.load_custom_assessments",
-        return_value=[{
+        "manage_assessment.stored_assessments",
+        return_value=stored([{
             "name": "A",
             "questions": ["Q1", "Q2"],
             "options": [
@@ -242,7 +234,7 @@ class TestAssessmentLoops(unittest.TestCase):
                 ("A2", "B2", "C2", "D2"),
             ],
             "answers": ["A", "B"],
-        }],
+        }]),
     )
     @patch("sys.stdout", new_callable=io.StringIO)
     @patch("builtins.input", side_effect=["1"])
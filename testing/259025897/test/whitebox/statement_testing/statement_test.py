@@ -1,8 +1,16 @@
+import os
+import tempfile
 import unittest
 from unittest.mock import patch, mock_open
 import sys
 import mcq_types
 import manage_assessment
+from assessment_storage import StoredAssessment
+
+
+#Catalog entries for in-memory assessments; load() returns the dict itself
+def stored(data):
+    return [StoredAssessment({"id": f"a{i + 1}", "name": a["name"]}, lambda a=a: a) for i, a in enumerate(data)]
 
 
 class TestTakeQuizStatements(unittest.TestCase):
@@ -17,12 +25,11 @@ class TestTakeQuizStatements(unittest.TestCase):
 
 
     #Tests the untimed quiz flow where answer is wrong and saving the score should occur
-    @patch("mcq_types.save_scores")
-    @patch("mcq_types.load_scores", return_value=[])
+    @patch("mcq_types.record_score")
     @patch("mcq_types.print")
     @patch("mcq_types.input", side_effect=["B"])
     def test_take_quiz_not_timed_wrong_with_name(
-        self, mock_input, mock_print, mock_load, mock_save
+        self, mock_input, mock_print, mock_save
     ):
         questions = ["Q1"]
         options = [("A. 1", "B. 2", "C. 3", "D. 4")]
@@ -84,11 +91,10 @@ class TestNegativeMarkStatements(unittest.TestCase):
         mcq_types.take_negative_mark_quiz(questions, options, answers, name=None)
 
     #Tests negative mark mode saves score when a name is provided
-    @patch("mcq_types.save_scores")
-    @patch("mcq_types.load_scores", return_value=[])
+    @patch("mcq_types.record_score")
     @patch("mcq_types.print")
     @patch("mcq_types.input", side_effect=["B"])
-    def test_negative_mark_with_name(self, mock_input, mock_print, mock_load, mock_save):
+    def test_negative_mark_with_name(self, mock_input, mock_print, mock_save):
         questions = ["Q1"]
         options = [("A.1", "B.2", "C.3", "D.4")]
         answers = ["A"]
@@ -111,8 +117,7 @@ class TestChallengeModeStatements(unittest.TestCase):
 
 
     #Tests challenge mode when exactly one question is answered before time runs out and score is saved
-    @patch("mcq_types.save_scores")
-    @patch("mcq_types.load_scores", return_value=[])
+    @patch("mcq_types.record_score")
     @patch("mcq_types.random.shuffle", side_effect=lambda lst: None)
     @patch("mcq_types.timed_quiz", return_value="A")
     @patch("mcq_types.time.time", side_effect=[0, 0, 9999])
@@ -125,7 +130,6 @@ class TestChallengeModeStatements(unittest.TestCase):
         mock_time,
         mock_timed,
         mock_shuffle,
-        mock_load,
         mock_save,
     ):
         questions = ["Q1", "Q2"]
@@ -149,13 +153,12 @@ class TestStreakModeStatements(unittest.TestCase):
 
 
     #Tests streak mode where the user gets the first question correct, second wrong, and score is saved
-    @patch("mcq_types.save_scores")
-    @patch("mcq_types.load_scores", return_value=[])
+    @patch("mcq_types.record_score")
     @patch("mcq_types.random.shuffle", side_effect=lambda lst: None)
     @patch("mcq_types.print")
     @patch("mcq_types.input", side_effect=["A", "B"])
     def test_streak_all_correct_then_wrong_with_name(
-        self, mock_input, mock_print, mock_shuffle, mock_load, mock_save
+        self, mock_input, mock_print, mock_shuffle, mock_save
     ):
         questions = ["Q1", "Q2"]
         options = [("A.1", "B.2", "C.3", "D.4")] * 2
@@ -194,35 +197,41 @@ class TestAssessmentStatements(unittest.TestCase):
 
 
     #To test assessments are correctly loaded from file when one exists
-    @patch("assessment_storage.os.path.exists", return_value=True)
-    @patch("assessment_storage.open", new_callable=mock_open, read_data='[{"name": "A"}]')
-    def test_load_custom_assessments_with_file(self, mock_file, mock_exists):
+    def test_load_custom_assessments_with_file(self):
         from assessment_storage import load_custom_assessments as storage_load
-        data = storage_load()
-        self.assertEqual(data, [{"name": "A"}])
-
-
-    #Tests saving assessments triggers a file write
-    @patch("assessment_storage.open", new_callable=mock_open)
-    def test_save_custom_assessments(self, mock_file):
+        with tempfile.TemporaryDirectory() as d, \
+                patch.dict(os.environ, {"MCQ_STORAGE_BACKEND": "json"}), \
+                patch("assessment_storage.ASSESSMENT_FILE", os.path.join(d, "custom_assessment.json")), \
+                patch("assessment_storage.ASSESSMENT_DIR", os.path.join(d, "custom_assessments")):
+            with open(os.path.join(d, "custom_assessment.json"), "w") as f:
+                f.write('[{"name": "A"}]')
+            data = storage_load()
+            self.assertEqual(data, [{"name": "A"}])
+
+
+    #Tests saving assessments writes the assessment's shard
+    def test_save_custom_assessments(self):
         from assessment_storage import save_custom_assessments as storage_save
-        storage_save([{"name": "A"}])
-        mock_file.assert_called_once()
+        with tempfile.TemporaryDirectory() as d, \
+                patch.dict(os.environ, {"MCQ_STORAGE_BACKEND": "json"}), \
+                patch("assessment_storage.ASSESSMENT_FILE", os.path.join(d, "missing.json")), \
+                patch("assessment_storage.ASSESSMENT_DIR", d):
+            storage_save([{"name": "A"}])
+            self.assertTrue(os.path.exists(os.path.join(d, "a1.json")))
 
 
     #Tests creating an assessment from user inputs and ensures it is saved
-    @patch("manage_assessment.save_custom_assessments")
-    @patch("manage_assessment.load_custom_assessments", return_value=[])
+    @patch("manage_assessment.add_custom_assessment")
     @patch("manage_assessment.input", side_effect=["MyTest", "1", "Q1", "1", "2", "3", "4", "A", "n"])
     @patch("manage_assessment.print")
-    def test_create_assessment(self, mock_print, mock_input, mock_load, mock_save):
+    def test_create_assessment(self, mock_print, mock_input, mock_save):
         manage_assessment.create_assessment()
         mock_save.assert_called_once()
 
 
     #Ensures that listing assessments returns None when there are no stored assessments
     @patch("manage_assessment.print")
-    @patch("manage_assessment.load_custom_assessments", return_value=[])
+    @patch("manage_assessment.stored_assessments", return_value=[])
     def test_list_assessments_empty(self, mock_load, mock_print):
         result = manage_assessment.list_assessments()
         self.assertIsNone(result)
@@ -230,7 +239,7 @@ class TestAssessmentStatements(unittest.TestCase):
 
     #testing list_assessments returns a list when assessments exist
     @patch("manage_assessment.print")
-    @patch("manage_assessment.load_custom_assessments", return_value=[{"name": "A", "questions": [], "options": [], "answers": []}])
+    @patch("manage_assessment.stored_assessments", return_value=stored([{"name": "A", "questions": [], "options": [], "answers": []}]))
     def test_list_assessments_non_empty(self, mock_load, mock_print):
         result = manage_assessment.list_assessments()
         self.assertIsInstance(result, list)
@@ -238,8 +247,8 @@ class TestAssessmentStatements(unittest.TestCase):
 
 
     #To test whether adding a question updates the assessment and triggers save
-    @patch("manage_assessment.save_custom_assessments")
-    @patch("manage_assessment.list_assessments",return_value=[{"name": "A", "questions": [], "options": [], "answers": []}])
+    @patch("manage_assessment.save_assessment")
+    @patch("manage_assessment.list_assessments",return_value=stored([{"name": "A", "questions": [], "options": [], "answers": []}]))
     @patch("manage_assessment.input",side_effect=["1", "New Q?", "1", "2", "3", "4", "A"])
     @patch("manage_assessment.print")
     def test_add_question_to_assessment(self, mock_print, mock_input, mock_list, mock_save):
@@ -248,14 +257,14 @@ class TestAssessmentStatements(unittest.TestCase):
 
 
     #To test editing a question updates the assessment and triggers save
-    @patch("manage_assessment.save_custom_assessments")
+    @patch("manage_assessment.save_assessment")
     @patch("manage_assessment.list_assessments",
-        return_value=[{
+        return_value=stored([{
             "name": "A",
             "questions": ["Q1"],
             "options": [("A.1", "B.2", "C.3", "D.4")],
             "answers": ["A"]
-        }],
+        }]),
     )
     @patch("manage_assessment.input",side_effect=["1", "1", "", "", "", "", "", ""])
     @patch("manage_assessment.print")
@@ -265,14 +274,14 @@ class TestAssessmentStatements(unittest.TestCase):
 
 
     #To test deleting a question removes it and triggers save
-    @patch("manage_assessment.save_custom_assessments")
+    @patch("manage_assessment.save_assessment")
     @patch("manage_assessment.list_assessments",
-        return_value=[{
+        return_value=stored([{
             "name": "A",
             "questions": ["Q1"],
             "options": [("A.1", "B.2", "C.3", "D.4")],
             "answers": ["A"]
-        }],
+        }]),
     )
     @patch("manage_assessment.input", side_effect=["1", "1"])
     @patch("manage_assessment.print")
@@ -282,13 +291,13 @@ class TestAssessmentStatements(unittest.TestCase):
 
 
     #To check view_questions_in_assessment displays questions correctly
-    @patch("manage_assessment.load_custom_assessments",
-        return_value=[{
+    @patch("manage_assessment.stored_assessments",
+        return_value=stored([{
             "name": "A",
             "questions": ["Q1"],
             "options": [("A.1", "B.2", "C.3", "D.4")],
             "answers": ["A"]
-        }],
+        }]),
     )
     @patch("manage_assessment.input", side_effect=["1"])
     @patch("manage_assessment.print")
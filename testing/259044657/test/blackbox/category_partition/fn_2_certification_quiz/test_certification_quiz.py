@@ -34,7 +34,7 @@ class TestCertificationExam(unittest.TestCase):
     @patch("builtins.print")
     def test_attempts_exhausted_single(self, mock_print):
         with patch.object(certification_quiz, "ALL_QUIZ_DATA", self.sample_quiz), \
-             patch.object(certification_quiz, "can_attempt_cert_quiz", return_value=(False, 0)):
+             patch.object(certification_quiz, "try_start_cert_quiz", return_value=(False, 0)):
 
             result = certification_quiz.run_certification_exam("Bob")
 
@@ -47,10 +47,8 @@ class TestCertificationExam(unittest.TestCase):
     @patch("builtins.print")
     def test_run_exam_timed(self, mock_print, _):
         with patch.object(certification_quiz, "ALL_QUIZ_DATA", self.sample_quiz), \
-             patch.object(certification_quiz, "can_attempt_cert_quiz", return_value=(True, 1)), \
-             patch.object(certification_quiz, "record_cert_attempt"), \
-             patch.object(certification_quiz, "load_scores", return_value=[]), \
-             patch.object(certification_quiz, "save_scores"), \
+             patch.object(certification_quiz, "try_start_cert_quiz", return_value=(True, 1)), \
+             patch.object(certification_quiz, "record_score"), \
              patch.object(certification_quiz, "_add_cert_result"), \
              patch("certification_quiz.timed_quiz", return_value="B", create=True):
 
@@ -68,10 +66,8 @@ class TestCertificationExam(unittest.TestCase):
     @patch("builtins.print")
     def test_run_exam_not_timed(self, mock_print, _):
         with patch.object(certification_quiz, "ALL_QUIZ_DATA", self.sample_quiz), \
-             patch.object(certification_quiz, "can_attempt_cert_quiz", return_value=(True, 1)), \
-             patch.object(certification_quiz, "record_cert_attempt"), \
-             patch.object(certification_quiz, "load_scores", return_value=[]), \
-             patch.object(certification_quiz, "save_scores"), \
+             patch.object(certification_quiz, "try_start_cert_quiz", return_value=(True, 1)), \
+             patch.object(certification_quiz, "record_score"), \
              patch.object(certification_quiz, "_add_cert_result"):
 
             result = certification_quiz.run_certification_exam(
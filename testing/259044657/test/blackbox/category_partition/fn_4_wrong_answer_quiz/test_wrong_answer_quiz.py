@@ -38,11 +38,9 @@ class TestWrongAnswerQuiz(unittest.TestCase):
 
         with patch("builtins.input", side_effect=inputs), \
              patch("random.shuffle", side_effect=self._no_shuffle), \
-             patch.object(mod, "load_scores") as p_load, \
-             patch.object(mod, "save_scores") as p_save:
+             patch.object(mod, "record_score") as p_save:
             mod.take_wrong_answer_quiz(name=None)
 
-            p_load.assert_not_called()
             p_save.assert_not_called()
 
     @patch.object(mod, "ALL_QUIZ_DATA", new_callable=lambda: [])
@@ -52,15 +50,13 @@ class TestWrongAnswerQuiz(unittest.TestCase):
 
         with patch("builtins.input", side_effect=inputs), \
              patch("random.shuffle", side_effect=self._no_shuffle), \
-             patch.object(mod, "load_scores", return_value=[]) as p_load, \
-             patch.object(mod, "save_scores") as p_save:
+             patch.object(mod, "record_score") as p_save:
             mod.take_wrong_answer_quiz(name="Alice")
 
-            p_load.assert_called_once()
             p_save.assert_called_once()
-            saved_arg = p_save.call_args[0][0]  
-            self.assertEqual(saved_arg[-1]["name"], "Alice")
-            self.assertEqual(saved_arg[-1]["score"], 100)
+            saved_name, saved_score = p_save.call_args[0][:2]
+            self.assertEqual(saved_name, "Alice")
+            self.assertEqual(saved_score, 100)
 
     @patch.object(mod, "ALL_QUIZ_DATA", new_callable=lambda: [])
     def test_name_prompted_nonblank_saves_score(self, _):
@@ -69,15 +65,13 @@ class TestWrongAnswerQuiz(unittest.TestCase):
 
         with patch("builtins.input", side_effect=inputs), \
              patch("random.shuffle", side_effect=self._no_shuffle), \
-             patch.object(mod, "load_scores", return_value=[]) as p_load, \
-             patch.object(mod, "save_scores") as p_save:
+             patch.object(mod, "record_score") as p_save:
             mod.take_wrong_answer_quiz(name=None)
 
-            p_load.assert_called_once()
             p_save.assert_called_once()
-            saved_arg = p_save.call_args[0][0]
-            self.assertEqual(saved_arg[-1]["name"], "Bob")
-            self.assertEqual(saved_arg[-1]["score"], 0)
+            saved_name, saved_score = p_save.call_args[0][:2]
+            self.assertEqual(saved_name, "Bob")
+            self.assertEqual(saved_score, 0)
 
 
     @patch.object(mod, "ALL_QUIZ_DATA", new_callable=lambda: [])
@@ -149,19 +149,18 @@ class TestQuizConditionTesting(unittest.TestCase):
         with patch.object(wrong_answer_quiz, "ALL_QUIZ_DATA", one_q, create=True), \
              patch("builtins.input", side_effect=["1", "B"]), \
              patch("sys.stdout", new=fake_out), \
-             patch.object(wrong_answer_quiz, "load_scores", return_value=[], create=True), \
-             patch.object(wrong_answer_quiz, "save_scores", create=True) as save_scores:
+             patch.object(wrong_answer_quiz, "record_score", create=True) as record_score:
             wrong_answer_quiz.take_wrong_answer_quiz(name="X")
-            self.assertTrue(save_scores.called)
+            self.assertTrue(record_score.called)
 
 
     def test_16_wrong_mode_available_name_skipped(self):
         one_q = [{"question": "Q1", "options": ["A)1","B)2","C)3","D)4"], "answer": "A"}]
         with patch.object(wrong_answer_quiz, "ALL_QUIZ_DATA", one_q, create=True), \
              patch("builtins.input", side_effect=["", "1", "B"]), \
-             patch.object(wrong_answer_quiz, "save_scores", create=True) as save_scores:
+             patch.object(wrong_answer_quiz, "record_score", create=True) as record_score:
             wrong_answer_quiz.take_wrong_answer_quiz(name=None)
-            self.assertFalse(save_scores.called)
+            self.assertFalse(record_score.called)
 
 
     def test_17_wrong_mode_count_valid(self):
@@ -231,19 +230,18 @@ class TestQuizConditionTesting(unittest.TestCase):
         qs = [{"question": "Q1", "options": ["A)1","B)2","C)3","D)4"], "answer": "A"}]
         with patch.object(wrong_answer_quiz, "ALL_QUIZ_DATA", qs, create=True), \
              patch("builtins.input", side_effect=["1", "B"]), \
-             patch.object(wrong_answer_quiz, "load_scores", return_value=[], create=True), \
-             patch.object(wrong_answer_quiz, "save_scores", create=True) as save_scores:
+             patch.object(wrong_answer_quiz, "record_score", create=True) as record_score:
             wrong_answer_quiz.take_wrong_answer_quiz(name="X")
-            self.assertTrue(save_scores.called)
+            self.assertTrue(record_score.called)
 
 
     def test_24_wrong_mode_no_save_name_skipped(self):
         qs = [{"question": "Q1", "options": ["A)1","B)2","C)3","D)4"], "answer": "A"}]
         with patch.object(wrong_answer_quiz, "ALL_QUIZ_DATA", qs, create=True), \
              patch("builtins.input", side_effect=["", "1", "B"]), \
-             patch.object(wrong_answer_quiz, "save_scores", create=True) as save_scores:
+             patch.object(wrong_answer_quiz, "record_score", create=True) as record_score:
             wrong_answer_quiz.take_wrong_answer_quiz(name=None)
-            self.assertFalse(save_scores.called)
+            self.assertFalse(record_score.called)
 
     
     def test_25_viewer_mcq_unknown_topic_difficulty(self):
@@ -29,8 +29,7 @@ class TestLoopWrongAnswerQuiz(unittest.TestCase):
         user_inputs = iter(["1", "B"]) 
 
         with patch.object(app, "ALL_QUIZ_DATA", one_q), \
-             patch.object(app, "load_scores", return_value=[]), \
-             patch.object(app, "save_scores") as mock_save, \
+             patch.object(app, "record_score") as mock_save, \
              patch("builtins.input", side_effect=lambda _: next(user_inputs)), \
              patch("builtins.print") as mock_print, \
              patch.object(random, "shuffle", side_effect=lambda x: None):
@@ -73,8 +72,7 @@ class TestLoopWrongAnswerQuiz(unittest.TestCase):
         user_inputs = iter(["3", "B", "C", "D"])
 
         with patch.object(app, "ALL_QUIZ_DATA", three_q), \
-             patch.object(app, "load_scores", return_value=[]), \
-             patch.object(app, "save_scores") as mock_save, \
+             patch.object(app, "record_score") as mock_save, \
              patch("builtins.input", side_effect=lambda _: next(user_inputs)), \
              patch("builtins.print") as mock_print, \
              patch.object(random, "shuffle", side_effect=lambda x: None):
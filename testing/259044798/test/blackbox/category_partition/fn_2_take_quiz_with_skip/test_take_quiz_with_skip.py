@@ -22,20 +22,19 @@ def run_quiz_capture_output(mod, questions, options, answers, name=None, inputs=
 
     buf = StringIO()
 
-    has_scores = hasattr(mod, "load_scores") and hasattr(mod, "save_scores")
+    has_scores = hasattr(mod, "record_score")
 
     patches = [
         patch("builtins.input", side_effect=inputs),
     ]
     if has_scores:
         patches += [
-            patch.object(mod, "load_scores", return_value=[]),
-            patch.object(mod, "save_scores", return_value=None),
+            patch.object(mod, "record_score", return_value=None),
         ]
 
     with patches[0]:
         if has_scores:
-            with patches[1], patches[2]:
+            with patches[1]:
                 with redirect_stdout(buf):
                     mod.take_quiz_with_skip(questions, options, answers, name=name)
         else:
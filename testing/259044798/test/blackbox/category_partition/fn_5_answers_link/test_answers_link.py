@@ -94,29 +94,29 @@ class TestAnswerReferenceLinks(unittest.TestCase):
             self.assertEqual(data, json.load(f))
 
     def test_05_get_mcq_defaults_only(self):
-        self.m.DEFAULT_MCQ_LINKS = {1: ["d1"]}
+        self.m.DEFAULT_MCQ_LINKS = {self.m._mcq_id(1): ["d1"]}
         self.assertEqual(["d1"], self.m.get_links_for_mcq(1))
 
     def test_06_get_mcq_no_links(self):
-        self.m.DEFAULT_MCQ_LINKS = {1: []}
+        self.m.DEFAULT_MCQ_LINKS = {self.m._mcq_id(1): []}
         self.assertEqual([], self.m.get_links_for_mcq(1))
 
     def test_07_get_mcq_merged_defaults_and_user(self):
-        self.m.DEFAULT_MCQ_LINKS = {1: ["d1"]}
-        self.write_links_dict({"MCQ-1": ["u1", "d1"]})  
+        self.m.DEFAULT_MCQ_LINKS = {self.m._mcq_id(1): ["d1"]}
+        self.write_links_dict({self.m._key_for_mcq(1): ["u1", "d1"]})  
         self.assertEqual(["d1", "u1"], self.m.get_links_for_mcq(1))
 
     def test_08_get_fill_defaults_only(self):
-        self.m.DEFAULT_FILL_LINKS = {1: ["fd1"]}
+        self.m.DEFAULT_FILL_LINKS = {self.m._fill_id(1): ["fd1"]}
         self.assertEqual(["fd1"], self.m.get_links_for_fill(1))
 
     def test_09_get_fill_no_links(self):
-        self.m.DEFAULT_FILL_LINKS = {1: []}
+        self.m.DEFAULT_FILL_LINKS = {self.m._fill_id(1): []}
         self.assertEqual([], self.m.get_links_for_fill(1))
 
     def test_10_get_fill_merged_defaults_and_user(self):
-        self.m.DEFAULT_FILL_LINKS = {1: ["fd1"]}
-        self.write_links_dict({"FILL-1": ["fu1", "fd1"]})
+        self.m.DEFAULT_FILL_LINKS = {self.m._fill_id(1): ["fd1"]}
+        self.write_links_dict({self.m._key_for_fill(1): ["fu1", "fd1"]})
         self.assertEqual(["fd1", "fu1"], self.m.get_links_for_fill(1))
 
     def test_11_add_mcq_empty_link_no_change_via_menu(self):
@@ -126,12 +126,12 @@ class TestAnswerReferenceLinks(unittest.TestCase):
     def test_12_add_mcq_duplicate_no_change(self):
         self.m.add_link_for_mcq(1, "u1")
         self.m.add_link_for_mcq(1, "u1")  
-        self.assertEqual(["u1"], self.m._load_links().get("MCQ-1"))
+        self.assertEqual(["u1"], self.m._load_links().get(self.m._key_for_mcq(1)))
 
     def test_13_add_mcq_new_link_appends_and_saves(self):
         self.m.add_link_for_mcq(1, "u1")
         self.m.add_link_for_mcq(1, "u2")
-        self.assertEqual(["u1", "u2"], self.m._load_links().get("MCQ-1"))
+        self.assertEqual(["u1", "u2"], self.m._load_links().get(self.m._key_for_mcq(1)))
 
     def test_14_add_fill_empty_link_no_change_via_menu(self):
         self.menu_like_add_fill(1, "")
@@ -140,12 +140,12 @@ class TestAnswerReferenceLinks(unittest.TestCase):
     def test_15_add_fill_duplicate_no_change(self):
         self.m.add_link_for_fill(1, "fu1")
         self.m.add_link_for_fill(1, "fu1")
-        self.assertEqual(["fu1"], self.m._load_links().get("FILL-1"))
+        self.assertEqual(["fu1"], self.m._load_links().get(self.m._key_for_fill(1)))
 
     def test_16_add_fill_new_link_appends_and_saves(self):
         self.m.add_link_for_fill(1, "fu1")
         self.m.add_link_for_fill(1, "fu2")
-        self.assertEqual(["fu1", "fu2"], self.m._load_links().get("FILL-1"))
+        self.assertEqual(["fu1", "fu2"], self.m._load_links().get(self.m._key_for_fill(1)))
 
     def test_17_show_mcq_invalid_index_message(self):
         f = io.StringIO()
@@ -155,8 +155,8 @@ class TestAnswerReferenceLinks(unittest.TestCase):
         self.assertIn("Invalid MCQ number.", out)
 
     def test_18_show_mcq_prints_answer_and_links(self):
-        self.m.DEFAULT_MCQ_LINKS = {1: ["d1"]}
-        self.write_links_dict({"MCQ-1": ["u1"]})
+        self.m.DEFAULT_MCQ_LINKS = {self.m._mcq_id(1): ["d1"]}
+        self.write_links_dict({self.m._key_for_mcq(1): ["u1"]})
 
         f = io.StringIO()
         with redirect_stdout(f):
@@ -177,8 +177,8 @@ class TestAnswerReferenceLinks(unittest.TestCase):
         self.assertIn("Invalid fill-in question number.", out)
 
     def test_20_show_fill_prints_answer_and_links(self):
-        self.m.DEFAULT_FILL_LINKS = {1: ["fd1"]}
-        self.write_links_dict({"FILL-1": ["fu1"]})
+        self.m.DEFAULT_FILL_LINKS = {self.m._fill_id(1): ["fd1"]}
+        self.write_links_dict({self.m._key_for_fill(1): ["fu1"]})
 
         f = io.StringIO()
         with redirect_stdout(f):
@@ -9,10 +9,12 @@ class TestQuizAttemptsFrames(unittest.TestCase):
     def setUp(self):
         self.tmpdir = tempfile.TemporaryDirectory()
         self.attempt_file = os.path.join(self.tmpdir.name, "attempts.json")
+        self.orig_attempt_file = qa.ATTEMPT_FILE
         qa.ATTEMPT_FILE = self.attempt_file
         self.default_max = qa.MAX_ATTEMPTS_PER_DAY
 
     def tearDown(self):
+        qa.ATTEMPT_FILE = self.orig_attempt_file
         self.tmpdir.cleanup()
 
     def _make_file_exist_with_valid_json(self, data=None):
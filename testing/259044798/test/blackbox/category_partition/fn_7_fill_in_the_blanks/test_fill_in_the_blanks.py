@@ -1,6 +1,6 @@
 import io
 import unittest
-from unittest.mock import patch, Mock
+from unittest.mock import patch
 import sys
 import os
 
@@ -22,18 +22,14 @@ def run_quiz_capture(questions, answers, user_inputs, name):
     save_called = False
     saved_payload = None
 
-    def fake_save_scores(payload):
+    def fake_record_score(name, score, **kwargs):
         nonlocal save_called, saved_payload
         save_called = True
-        saved_payload = payload
-
-    
-    fake_load_scores = Mock(return_value=[])
+        saved_payload = [{"name": name, "score": score}]
 
     exc = None
     with patch.object(m, "_normalize_text", side_effect=_norm), \
-         patch.object(m, "load_scores", fake_load_scores), \
-         patch.object(m, "save_scores", side_effect=fake_save_scores), \
+         patch.object(m, "record_score", side_effect=fake_record_score), \
          patch("builtins.input", side_effect=user_inputs), \
          patch("sys.stdout", fake_out):
         try:
@@ -0,0 +1,37 @@
+import pytest
+import answer_links
+import assessment_storage
+import attempt_comparison
+import attempts
+import certification_quiz
+import leaderboard
+import storage_backend
+import utils
+
+# Every file the app reads or writes, so no test run touches the config,
+# score, attempt or assessment files in the working directory. Tests that patch one of these
+# themselves still win, since their patch is applied on top.
+STORAGE_PATHS = [
+    (utils, "SCORE_FILE"),
+    (utils, "SCORE_JOURNAL_FILE"),
+    (leaderboard, "LEADERBOARD_FILE"),
+    (attempt_comparison, "USER_INDEX_FILE"),
+    (attempt_comparison, "USER_SHARD_DIR"),
+    (attempts, "ATTEMPT_FILE"),
+    (attempts, "ATTEMPT_ARCHIVE_FILE"),
+    (certification_quiz, "CERT_ATTEMPT_FILE"),
+    (certification_quiz, "CERT_ATTEMPT_ARCHIVE_FILE"),
+    (certification_quiz, "CERT_RESULT_FILE"),
+    (assessment_storage, "ASSESSMENT_FILE"),
+    (assessment_storage, "ASSESSMENT_DIR"),
+    (answer_links, "LINKS_FILE"),
+    (storage_backend, "DEFAULT_SQLITE_PATH"),
+    (storage_backend, "STORAGE_CONFIG_FILE"),
+]
+
+
+@pytest.fixture(autouse=True)
+def isolated_storage(tmp_path, monkeypatch):
+    for module, name in STORAGE_PATHS:
+        monkeypatch.setattr(module, name, str(tmp_path / getattr(module, name)))
+    monkeypatch.delenv(storage_backend.SQLITE_PATH_ENV, raising=False)
@@ -1,29 +1,213 @@
 import os
 import json
+import tempfile
+from contextlib import contextmanager
+from datetime import datetime
+
+try:
+    import fcntl
+except ImportError:
+    # Not available on Windows; locks become no-ops there.
+    fcntl = None
+
+from storage_backend import use_sqlite, get_sqlite_store
+import score_buffer
+from render import Screen, show
 
 SCORE_FILE = "high_scores.json"
+SCORE_JOURNAL_FILE = "high_scores.jsonl"
+
+
+@contextmanager
+def file_lock(path):
+    """Hold an exclusive advisory lock on path + ".lock" for the block.
+
+    Every process that rewrites or appends to path takes this lock first,
+    so a load -> change -> save cycle cannot interleave with another one.
+    """
+    with open(path + ".lock", "a") as lock_file:
+        if fcntl is not None:
+            fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            if fcntl is not None:
+                fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
+
+
+def _atomic_write(path, write):
+    # A unique temp file in the same directory, renamed over the target:
+    # readers see either the old or the new file, never a partial one.
+    fd, tmp_path = tempfile.mkstemp(
+        dir=os.path.dirname(path) or ".", prefix=os.path.basename(path) + ".", suffix=".tmp"
+    )
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            write(f)
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+
+def atomic_write_json(path, data, **dump_kwargs):
+    _atomic_write(path, lambda f: json.dump(data, f, **dump_kwargs))
+
+
+def _write_journal(records):
+    _atomic_write(SCORE_JOURNAL_FILE, lambda f: f.writelines(json.dumps(r) + "\n" for r in records))
+
+
+def migrate_scores():
+    """Import the legacy high_scores.json array into the JSON Lines journal.
+
+    Runs only once: if the journal already exists nothing is done.
+    Returns the number of records imported.
+    """
+    if os.path.exists(SCORE_JOURNAL_FILE):
+        return 0
+    with file_lock(SCORE_JOURNAL_FILE):
+        # Another process may have migrated while we waited for the lock.
+        if os.path.exists(SCORE_JOURNAL_FILE):
+            return 0
+        legacy = []
+        if os.path.exists(SCORE_FILE):
+            try:
+                with open(SCORE_FILE, "r") as f:
+                    legacy = json.load(f)
+            except (OSError, json.JSONDecodeError):
+                legacy = []
+        _write_journal(legacy)
+    _rebuild_score_indexes()
+    return len(legacy)
+
+
+def iter_scores():
+    """Yield score records one at a time from the configured backend."""
+    score_buffer.flush()
+    if use_sqlite():
+        return get_sqlite_store().iter_scores()
+    return _iter_json_scores()
+
+
+def _iter_json_scores():
+    migrate_scores()
+    with open(SCORE_JOURNAL_FILE, "r", encoding="utf-8") as f:
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                yield json.loads(line)
+            except json.JSONDecodeError:
+                # A torn last line from an interrupted write is skipped.
+                continue
+
+
+def read_scores_from(offset):
+    """Return (records, new_offset) for the complete journal lines after offset.
+
+    Returns None when offset is past the end of the journal, i.e. the
+    journal was rewritten and whoever tracks the offset must rebuild.
+    Does not run migrate_scores(), so it is safe to call under a sidecar lock.
+    """
+    if not os.path.exists(SCORE_JOURNAL_FILE):
+        return ([], 0) if offset == 0 else None
+    records = []
+    with open(SCORE_JOURNAL_FILE, "rb") as f:
+        f.seek(0, os.SEEK_END)
+        if offset > f.tell():
+            return None
+        f.seek(offset)
+        for line in f:
+            if not line.endswith(b"\n"):
+                # Still being appended; pick it up on the next read.
+                break
+            offset += len(line)
+            if not line.strip():
+                continue
+            try:
+                records.append(json.loads(line))
+            except json.JSONDecodeError:
+                continue
+    return records, offset
+
 
 def load_scores():
-    if os.path.exists(SCORE_FILE):
-        with open(SCORE_FILE, "r") as f:
-            return json.load(f)
-    return []
+    return list(iter_scores())
+
 
 def save_scores(scores):
-    with open(SCORE_FILE, "w") as f:
-        json.dump(scores, f)
+    """Rewrite the whole score store. Prefer record_score() for new results."""
+    score_buffer.flush()
+    if use_sqlite():
+        get_sqlite_store().replace_scores(scores)
+        return
+    _save_json_scores(scores)
+
+
+def _save_json_scores(scores):
+    migrate_scores()
+    with file_lock(SCORE_JOURNAL_FILE):
+        _write_journal(scores)
+    _rebuild_score_indexes()
+
+
+def _rebuild_score_indexes():
+    from leaderboard import rebuild_leaderboard
+    from attempt_comparison import rebuild_user_index
+    rebuild_leaderboard()
+    rebuild_user_index()
+
+
+def write_score_batch(records):
+    """Persist several score records with one append and one sidecar sync."""
+    if use_sqlite():
+        # SQLite answers leaderboard and per-user queries from its own
+        # indexes, so there are no sidecar files to update.
+        get_sqlite_store().append_scores(records)
+        return
+    migrate_scores()
+    with file_lock(SCORE_JOURNAL_FILE):
+        with open(SCORE_JOURNAL_FILE, "a", encoding="utf-8") as f:
+            f.write("".join(json.dumps(r) + "\n" for r in records))
+    # The sidecars catch up from the journal under their own locks; when
+    # several processes finish together one of them applies the whole batch.
+    from leaderboard import sync_leaderboard
+    from attempt_comparison import sync_user_index
+    sync_leaderboard()
+    sync_user_index()
+
+
+def record_score(name, score, mode="quiz", **extra):
+    """Append one finished quiz result to the score store.
+
+    The cost does not grow with the number of scores or users: the record
+    is appended to the journal, and only the leaderboard and this user's
+    own index files are updated.
+
+    With write-behind enabled (see score_buffer) the record is queued and
+    written by a background thread, so the caller returns immediately.
+    """
+    record = {
+        "name": name,
+        "score": score,
+        "mode": mode,
+        "timestamp": datetime.now().isoformat(timespec="seconds"),
+    }
+    record.update(extra)
+    buffer = score_buffer.get_score_buffer()
+    if buffer is not None:
+        buffer.add(record)
+    else:
+        write_score_batch([record])
+    return record
+
 
 def print_results(guesses, score, answers):
-    print("----------------------")
-    print("       RESULTS        ")
-    print("----------------------")
-    print("Answers: ", end="")
-    for answer in answers:
-        print(answer, end=" ")
-    print()
-    print("Guesses: ", end="")
-    for guess in guesses:
-        print(guess, end=" ")
-    print()
     percent = int(score / len(answers) * 100)
-    print(f"\nYour score is: {percent}%")
\ No newline at end of file
+    show(Screen("----------------------", "       RESULTS        ", "----------------------")
+         .row("Answers: ", answers)
+         .row("Guesses: ", guesses)
+         .add(f"\nYour score is: {percent}%"))
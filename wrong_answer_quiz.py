@@ -2,7 +2,9 @@
 import random
 
 from quiz_data import ALL_QUIZ_DATA
-from utils import load_scores, save_scores
+from utils import record_score
+from session import QuizSession, WrongAnswer
+from render import Screen, paint, show
 
 
 def _ask_int(prompt, minimum, maximum):
@@ -19,30 +21,30 @@ def _ask_int(prompt, minimum, maximum):
 
 def _print_summary(questions_used, correct_letters, user_guesses, mode_score):
     
-    print("\n================ WRONG-ANSWER MODE RESULTS ================")
-    print("Real answers vs. what you chose:\n")
+    screen = Screen("\n================ WRONG-ANSWER MODE RESULTS ================",
+                    "Real answers vs. what you chose:\n")
 
     for i, (q, real, guess) in enumerate(
         zip(questions_used, correct_letters, user_guesses), start=1
     ):
-        print(f"Q{i}. {q}")
-        print(f"   Real correct answer : {real}")
-        print(f"   You chose           : {guess or 'No valid option'}")
+        screen.add(f"Q{i}. {q}",
+                   f"   Real correct answer : {real}",
+                   f"   You chose           : {guess or 'No valid option'}")
         if guess == "":
-            print("   → This did NOT count as a valid wrong answer.")
+            screen.add("   → This did NOT count as a valid wrong answer.")
         elif guess == real:
-            print("   → In this mode, that is considered a MISTAKE (you picked the real answer).")
+            screen.add("   → In this mode, that is considered a MISTAKE (you picked the real answer).")
         else:
-            print("   → Good! You avoided the real answer.")
-        print()
+            screen.add("   → Good! You avoided the real answer.")
+        screen.add("")
 
     total = len(questions_used)
-    print("===========================================================")
-    print(f"Total questions : {total}")
-    print(f"Mode score      : {mode_score} / {total}")
-    print("  (Score counts how many times you successfully avoided")
-    print("   choosing the actual correct option.)")
-    print("===========================================================\n")
+    show(screen.add("===========================================================",
+                    f"Total questions : {total}",
+                    f"Mode score      : {mode_score} / {total}",
+                    "  (Score counts how many times you successfully avoided",
+                    "   choosing the actual correct option.)",
+                    "===========================================================\n"))
 
 
 def take_wrong_answer_quiz(name=None):
@@ -80,16 +82,15 @@ def take_wrong_answer_quiz(name=None):
     print("  • If you accidentally pick the real correct answer,")
     print("    the game treats it as a mistake.\n")
 
-    user_guesses = []
-    mode_score = 0  
+    session = QuizSession(questions, options, real_answers, WrongAnswer())
 
-    for i, question in enumerate(questions):
-        print("--------------------------------------------------")
-        print(f"Q{i+1}. {question}")
-        for opt in options[i]:
-            print("   " + opt)
-
-        correct_letter = real_answers[i]
+    while True:
+        current = session.next_question()
+        if current is None:
+            break
+        i, question, opts = current
+        paint(Screen("--------------------------------------------------", f"Q{i+1}. {question}",
+                     *("   " + opt for opt in opts)))
 
         while True:
             guess = input("Pick a WRONG option (A/B/C/D): ").strip().upper()
@@ -97,24 +98,22 @@ def take_wrong_answer_quiz(name=None):
                 break
             print("Please enter one of: A, B, C, or D.")
 
-        user_guesses.append(guess)
+        outcome = session.submit(guess)
 
-        if guess == correct_letter:
+        if not outcome["correct"]:
             print("You chose the REAL correct answer! ❌")
             print("In this mode, that counts as a mistake.")
         else:
             print("Nice! You successfully avoided the correct answer ✅")
-            mode_score += 1
 
-        print(f"(Real correct answer was: {correct_letter})")
+        print(f"(Real correct answer was: {outcome['answer']})")
 
-    _print_summary(questions, real_answers, user_guesses, mode_score)
+    result = session.result()
+    _print_summary(questions, real_answers, result["guesses"], result["score"])
 
     if name is not None:
-        percent = int((mode_score / len(questions)) * 100)
-        scores = load_scores()
-        scores.append({"name": name, "score": percent})
-        save_scores(scores)
+        percent = result["percent"]
+        record_score(name, percent, mode="wrong_answer")
         print(f"Your performance has been saved as: {percent}% for {name}.")
 
 